@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Aletheos Context Benchmark
+Times Muse context extraction for a 1-engine and a 10-engine reading: the
+previous walk (every Muse reads the raw engine results), the single-pass
+extractor on a memo miss (normalize once, evaluate all Muses over the view)
+and on a memo hit (insights reused for the same engine results). Also times
+the agent's per-engine pattern, where a 10-engine reading extracts context
+once per engine.
+
+Usage:
+    python scripts/benchmarks/bench_aletheos_context.py --iterations 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from aletheos_muses import AletheosContextExtractor
+from local_engines import MockEngineFactory, SimpleBiorhythmEngine, SimpleNumerologyEngine
+
+
+BIRTH_DATA = {"name": "Alexandra Marie Chen", "date": "1990-05-15", "time": "14:30", "location": "New York"}
+
+MOCK_ENGINES = ("human_design", "gene_keys", "vimshottari", "tarot", "iching",
+                "enneagram", "sacred_geometry", "sigil_forge")
+
+
+def engine_results() -> dict:
+    results = {
+        "numerology": SimpleNumerologyEngine().calculate(
+            {"full_name": BIRTH_DATA["name"], "birth_date": BIRTH_DATA["date"]}),
+        "biorhythm": SimpleBiorhythmEngine().calculate({"birth_date": BIRTH_DATA["date"]})
+    }
+    results.update({engine: MockEngineFactory.create_mock_engine(engine) for engine in MOCK_ENGINES})
+    return results
+
+
+def time_calls(func, iterations: int) -> float:
+    """Mean milliseconds per call"""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Aletheos Context Benchmark")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls timed per variant")
+    args = parser.parse_args()
+
+    results = engine_results()
+    previous = AletheosContextExtractor(cache_size=0)
+    uncached = AletheosContextExtractor(cache_size=0)
+    memoized = AletheosContextExtractor()
+
+    readings = {
+        "1 engine (numerology)": [{"numerology": results["numerology"]}],
+        f"{len(results)} engines": [results],
+        f"{len(results)} engines, per engine": [{engine: result} for engine, result in results.items()],
+    }
+
+    print(f"\n🔮 Muse context extraction (ms per reading, {args.iterations} iterations)")
+    print(f"{'reading':<32}{'previous':>10}{'miss':>10}{'hit':>10}")
+    for label, calls in readings.items():
+        timings = [
+            time_calls(lambda: [previous._evaluate_muses(call, BIRTH_DATA) for call in calls], args.iterations),
+            time_calls(lambda: [uncached.extract_context(call, BIRTH_DATA) for call in calls], args.iterations),
+            time_calls(lambda: [memoized.extract_context(call, BIRTH_DATA) for call in calls], args.iterations),
+        ]
+        print(f"{label:<32}" + "".join(f"{timing:>10.4f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
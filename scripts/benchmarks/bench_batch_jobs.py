@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Batch Job Benchmark
+Runs the agent end to end against a local mock LLM endpoint (a fake
+OpenRouter /chat/completions that addresses the subject by name and fails one
+request in eight), with the engines in process. Compares the previous
+overnight loop (one interpret_single_engine call per subject and engine) with
+a batch job, then interrupts a batch job halfway and resumes it, checking
+that every task ends up on exactly one output line, addressed to its subject.
+
+Subjects share birth dates (and some share names), as subscriber lists do, so
+many prompts are identical.
+
+Usage:
+    python scripts/benchmarks/bench_batch_jobs.py --subjects 100 --port 8768
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from agent_service import WitnessOSAgent
+
+
+ENGINES = ["numerology", "biorhythm"]
+NAMES = ["Alexandra Chen", "Jordan Rivers", "Samira Okafor", "Lena Fischer", "Mateo Silva",
+         "Priya Raman", "Noah Berg", "Yuki Tanaka", "Omar Haddad", "Clara Novak"]
+DATES = ["15.05.1990", "03.11.1985", "22.02.1978", "08.08.1988"]
+
+
+class FakeLLM:
+    """Fake /chat/completions answering after 20 ms; every 8th request fails"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.app = FastAPI()
+        self.app.post("/chat/completions")(self.chat_completions)
+
+    async def chat_completions(self, payload: dict):
+        self.calls["total"] += 1
+        await asyncio.sleep(0.02)
+        if self.calls["total"] % 8 == 0:
+            return JSONResponse({"error": "upstream unavailable"}, status_code=500)
+        prompt = payload["messages"][-1]["content"]
+        name = re.search(r" for (.+?):", prompt).group(1)
+        content = f"Dear {name}, your reading shows a path of growth.\n\nTrust the process."
+        return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+def start_server(app: FastAPI, port: int) -> uvicorn.Server:
+    """Run the fake server in a background thread"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def new_agent() -> WitnessOSAgent:
+    """Agent with in-process engines and an empty, memory-only interpretation cache"""
+    return WitnessOSAgent(openrouter_api_key="benchmark", engine_transport="in_process",
+                          interpretation_cache_options={"cache_dir": None})
+
+
+def write_subjects(path: Path, count: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(count):
+            birth_data = {"name": NAMES[index % len(NAMES)], "date": DATES[index % len(DATES)],
+                          "time": "12:00", "location": "New York"}
+            f.write(json.dumps({"id": f"subscriber-{index}", "birth_data": birth_data}) + "\n")
+
+
+async def previous_loop(fake: FakeLLM, input_path: Path) -> dict:
+    """One interpret_single_engine call per subject and engine"""
+    agent = new_agent()
+    fake.calls.clear()
+    start = time.perf_counter()
+    failed = 0
+    with open(input_path, encoding="utf-8") as f:
+        for line in f:
+            subject = json.loads(line)
+            for engine in ENGINES:
+                response = await agent.interpret_single_engine(engine, subject["birth_data"], use_cache=False)
+                failed += "error" in response
+    await agent.aclose()
+    return {"seconds": time.perf_counter() - start, "llm_requests": fake.calls["total"], "failed": failed}
+
+
+async def batch_job(fake: FakeLLM, input_path: Path, output_path: Path, stop_after: int = None) -> dict:
+    """A batch job, optionally cancelled once stop_after results are written"""
+    agent = new_agent()
+    fake.calls.clear()
+    start = time.perf_counter()
+    job = asyncio.create_task(agent.run_batch_job(
+        str(input_path), str(output_path), engines=ENGINES,
+        requests_per_minute=6000, burst=8, max_in_flight=16, retry_backoff=0.05
+    ))
+    if stop_after is not None:
+        while not job.done() and count_lines(output_path) < stop_after:
+            await asyncio.sleep(0.01)
+        job.cancel()
+    try:
+        summary = await job
+    except asyncio.CancelledError:
+        summary = {"status": "interrupted"}
+    await agent.aclose()
+    return {**summary, "seconds": time.perf_counter() - start, "llm_requests": fake.calls["total"]}
+
+
+def count_lines(path: Path) -> int:
+    return path.read_bytes().count(b"\n") if path.exists() else 0
+
+
+def check_output(output_path: Path, input_path: Path) -> str:
+    """Every task on exactly one line, addressed to its subject"""
+    names = {}
+    with open(input_path, encoding="utf-8") as f:
+        for line in f:
+            subject = json.loads(line)
+            names[subject["id"]] = subject["birth_data"]["name"]
+
+    records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    task_ids = Counter(record["task_id"] for record in records)
+    expected = len(names) * len(ENGINES)
+    misaddressed = sum(
+        names[record["subject_id"]] not in record["response"]["consciousness_interpretation"]["ai_guidance"]
+        for record in records
+    )
+    duplicates = sum(count - 1 for count in task_ids.values())
+    ok = len(task_ids) == expected and not duplicates and not misaddressed
+    return (f"{'ok' if ok else 'MISMATCH'}: {len(task_ids)}/{expected} tasks, "
+            f"{duplicates} duplicate lines, {misaddressed} misaddressed")
+
+
+async def run(fake: FakeLLM, args):
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        input_path = directory / "subjects.jsonl"
+        write_subjects(input_path, args.subjects)
+        tasks = args.subjects * len(ENGINES)
+
+        print(f"\n📦 {args.subjects} subjects x {len(ENGINES)} engines ({tasks} interpretations)")
+        print(f"{'run':<24}{'seconds':>10}{'LLM requests':>14}{'dedup':>8}{'retries':>9}{'failed':>8}")
+
+        result = await previous_loop(fake, input_path)
+        print(f"{'previous loop':<24}{result['seconds']:>10.2f}{result['llm_requests']:>14}{'-':>8}{'-':>9}"
+              f"{result['failed']:>8}")
+
+        output_path = directory / "results.jsonl"
+        result = await batch_job(fake, input_path, output_path)
+        print(f"{'batch job':<24}{result['seconds']:>10.2f}{result['llm_requests']:>14}{result['deduplicated']:>8}"
+              f"{result['retries']:>9}{result['failed']:>8}")
+        print(f"    {check_output(output_path, input_path)}")
+
+        output_path = directory / "resumed.jsonl"
+        first = await batch_job(fake, input_path, output_path, stop_after=tasks // 2)
+        written = count_lines(output_path)
+        second = await batch_job(fake, input_path, output_path)
+        print(f"{'interrupted':<24}{first['seconds']:>10.2f}{first['llm_requests']:>14}{'-':>8}{'-':>9}{'-':>8}"
+              f"  ({written} lines written)")
+        print(f"{'resumed':<24}{second['seconds']:>10.2f}{second['llm_requests']:>14}{second['deduplicated']:>8}"
+              f"{second['retries']:>9}{second['failed']:>8}  ({second['skipped']} skipped)")
+        print(f"    {check_output(output_path, input_path)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Batch Job Benchmark")
+    parser.add_argument("--subjects", type=int, default=100, help="Subjects in the input file")
+    parser.add_argument("--port", type=int, default=8768, help="Port of the mock LLM endpoint")
+    args = parser.parse_args()
+
+    # The agent's OpenRouter client picks the mock endpoint up from the environment
+    os.environ["OPENROUTER_BASE_URL"] = f"http://127.0.0.1:{args.port}"
+    fake = FakeLLM()
+    server = start_server(fake.app, args.port)
+    try:
+        asyncio.run(run(fake, args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
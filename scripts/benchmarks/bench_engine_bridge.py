@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Engine Transport Benchmark
+Compares the agent's two engine transports on the same engines: the HTTP
+hop (request JSON, loopback POST to a local server standing in for the
+production API, response JSON parsed back) and the in-process bridge. Both
+run the engines through the production API's single-engine pipeline, so
+repeated calculations are served from its result cache and the difference
+is the transport itself.
+
+Usage:
+    python scripts/benchmarks/bench_engine_bridge.py --iterations 200 --port 8766
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from agent_service import WitnessOSAgent
+from engine_bridge import InProcessEngineBridge
+
+
+ENGINES = ("numerology", "biorhythm")
+
+REQUEST = {
+    "birth_data": {"name": "Alexandra Marie Chen", "date": "15.05.1990", "time": "14:30",
+                   "location": "New York", "timezone": "America/New_York"},
+    "system": "pythagorean",
+    "current_year": 2025,
+    "target_date": "2025-06-01"
+}
+
+
+def build_server(bridge: InProcessEngineBridge) -> FastAPI:
+    """Stand-in production API serving /calculate/{engine} from the same engines"""
+    app = FastAPI()
+
+    @app.post("/calculate/{engine}")
+    async def calculate(engine: str, payload: dict):
+        return await bridge.calculate(engine, payload)
+
+    return app
+
+
+def start_server(app: FastAPI, port: int) -> uvicorn.Server:
+    """Run the server in a background thread"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def time_calls(call, iterations: int) -> float:
+    """Mean milliseconds per call, after a warm-up call"""
+    await call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+async def run(args):
+    base = f"http://127.0.0.1:{args.port}"
+    http_agent = WitnessOSAgent(production_api_url=base, openrouter_api_key="benchmark",
+                                engine_transport="http", use_local_engines=False)
+    bridge_agent = WitnessOSAgent(openrouter_api_key="benchmark", engine_transport="in_process",
+                                  use_local_engines=False)
+
+    for engine in ENGINES:
+        endpoint = f"/calculate/{engine}"
+        http = await time_calls(lambda: http_agent._call_production_api(endpoint, REQUEST), args.iterations)
+        bridged = await time_calls(lambda: bridge_agent._call_production_api(endpoint, REQUEST), args.iterations)
+        print(f"\n⚙️  {engine} (ms per calculation, {args.iterations} iterations)")
+        print(f"{'HTTP loopback (pooled client)':<34}{http:>10.3f}")
+        print(f"{'in-process bridge':<34}{bridged:>10.3f}")
+
+    async def reading(agent):
+        await asyncio.gather(*(agent._calculate_engine(engine, REQUEST["birth_data"]) for engine in ENGINES))
+
+    print(f"\n🌐 {len(ENGINES)}-engine reading (ms per reading, {args.iterations} readings)")
+    print(f"{'HTTP loopback (pooled client)':<34}{await time_calls(lambda: reading(http_agent), args.iterations):>10.3f}")
+    print(f"{'in-process bridge':<34}{await time_calls(lambda: reading(bridge_agent), args.iterations):>10.3f}")
+
+    await http_agent.aclose()
+    await bridge_agent.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Engine Transport Benchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per measurement")
+    parser.add_argument("--port", type=int, default=8766, help="Port of the local stand-in production API")
+    args = parser.parse_args()
+
+    server = start_server(build_server(InProcessEngineBridge()), args.port)
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+WitnessOS HTTP Client Pool Benchmark
+Compares a new httpx.AsyncClient per request (the previous behavior) with
+the agent's pooled keep-alive clients against a local mock server standing
+in for OpenRouter (/chat/completions) and the production API
+(/calculate/{engine}). The mock serves plain HTTP, so the numbers include
+TCP handshakes and client construction but no TLS; against the real TLS
+endpoints the pooled clients save more.
+
+Usage:
+    python scripts/benchmarks/bench_http_pool.py --requests 200 --port 8765
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from http_pool import AsyncClientPool
+from openrouter_client import OpenRouterClient
+
+
+ENGINES = ("numerology", "biorhythm", "human_design", "vimshottari", "gene_keys", "tarot", "iching")
+
+mock = FastAPI()
+
+
+@mock.post("/chat/completions")
+async def chat_completions(payload: dict):
+    return {"choices": [{"message": {"role": "assistant", "content": "A mock interpretation."}}]}
+
+
+@mock.post("/calculate/{engine}")
+async def calculate(engine: str, payload: dict):
+    return {"status": "success", "engine": engine, "results": {"value": 7}}
+
+
+def start_mock_server(port: int) -> uvicorn.Server:
+    """Run the mock server in a background thread"""
+    server = uvicorn.Server(uvicorn.Config(mock, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def per_request_client(url: str, payload: dict):
+    """One client (and connection) per request, as before pooling"""
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+
+async def pooled_client(pool: AsyncClientPool, url: str, payload: dict):
+    response = await pool.get().post(url, json=payload)
+    response.raise_for_status()
+    return response.json()
+
+
+async def time_sequential(call, count: int) -> float:
+    """Mean latency in milliseconds of count sequential calls"""
+    await call()  # warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        await call()
+    return (time.perf_counter() - start) / count * 1000
+
+
+async def time_fan_out(call, readings: int) -> float:
+    """Mean milliseconds per reading of one concurrent call per engine"""
+    start = time.perf_counter()
+    for _ in range(readings):
+        await asyncio.gather(*(call(engine) for engine in ENGINES))
+    return (time.perf_counter() - start) / readings * 1000
+
+
+async def run(args):
+    base = f"http://127.0.0.1:{args.port}"
+    pool = AsyncClientPool()
+    payload = {"birth_data": {"name": "Alexandra Marie Chen", "date": "15.05.1990"}}
+
+    print(f"\n🔌 Production API hop (ms per call, {args.requests} sequential calls, HTTP/2: {pool.http2})")
+    legacy = await time_sequential(lambda: per_request_client(f"{base}/calculate/numerology", payload), args.requests)
+    pooled = await time_sequential(lambda: pooled_client(pool, f"{base}/calculate/numerology", payload), args.requests)
+    print(f"{'client per request':<32}{legacy:>10.3f}")
+    print(f"{'pooled keep-alive client':<32}{pooled:>10.3f}")
+
+    readings = max(1, args.requests // len(ENGINES))
+    print(f"\n🌐 {len(ENGINES)}-engine fan-out (ms per reading, {readings} readings)")
+    legacy = await time_fan_out(lambda engine: per_request_client(f"{base}/calculate/{engine}", payload), readings)
+    pooled = await time_fan_out(lambda engine: pooled_client(pool, f"{base}/calculate/{engine}", payload), readings)
+    print(f"{'client per request':<32}{legacy:>10.3f}")
+    print(f"{'pooled keep-alive client':<32}{pooled:>10.3f}")
+
+    openrouter = OpenRouterClient(api_key="benchmark")
+    openrouter.base_url = base
+    messages = [{"role": "user", "content": "Interpret my life path."}]
+    print(f"\n🤖 OpenRouterClient.generate_response (ms per call, {args.requests} sequential calls)")
+    legacy = await time_sequential(lambda: per_request_client(f"{base}/chat/completions", {"messages": messages}),
+                                   args.requests)
+    pooled = await time_sequential(lambda: openrouter.generate_response(messages), args.requests)
+    print(f"{'client per request':<32}{legacy:>10.3f}")
+    print(f"{'pooled keep-alive client':<32}{pooled:>10.3f}")
+
+    await pool.aclose()
+    await openrouter.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS HTTP Client Pool Benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per measurement")
+    parser.add_argument("--port", type=int, default=8765, help="Port of the local mock server")
+    args = parser.parse_args()
+
+    server = start_mock_server(args.port)
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Keyword Index Benchmark
+Compares repeated substring scans with the shared keyword index on 10-engine
+readings: archetype matching over engine outputs, and theme/guidance lookups
+over interpretation text for reference (short texts scan faster than they
+index, so the agent formatter keeps its scans).
+
+Usage:
+    python scripts/benchmarks/bench_keyword_index.py --iterations 200
+"""
+
+import argparse
+
+from bench_serialization import build_engine_samples, time_call
+
+from engines.base.features import ARCHETYPE_KEYWORDS, features_of
+from engines.base.keyword_index import KeywordIndex
+
+
+# Keyword lists of the agent response formatter
+THEME_KEYWORDS = ("seeker", "creator", "transformer", "healer", "guide", "warrior",
+                  "sage", "lover", "magician", "innocent", "explorer", "ruler")
+ACTION_WORDS = ("practice", "cultivate", "develop", "integrate", "embrace", "honor", "trust")
+FUTURE_WORDS = ("next", "continue", "develop", "explore", "begin", "start")
+
+
+INTERPRETATION = (
+    "As a natural guide you carry the seeker's restless curiosity. "
+    "Practice daily stillness so the healer within can integrate what you learn. "
+    "Your next cycle asks you to explore creative risks and trust slow progress. "
+    "The warrior energy of this period is best honored through disciplined rest. "
+    "Continue to cultivate the sage's patience as new responsibilities begin. "
+) * 4
+
+
+def legacy_archetypes(samples):
+    """Archetype matching as synthesis did before the index: one scan per archetype and engine"""
+    matches = {}
+    for archetype, keywords in ARCHETYPE_KEYWORDS.items():
+        matches[archetype] = []
+        for name, output in samples.items():
+            text = str(output.raw_data).lower()
+            if any(keyword in text for keyword in keywords):
+                matches[archetype].append(name)
+    return matches
+
+
+def indexed_archetypes(samples):
+    """Archetype matching with one index build per reading"""
+    index = KeywordIndex.build(samples)
+    return {archetype: index.sources_with(keywords) for archetype, keywords in ARCHETYPE_KEYWORDS.items()}
+
+
+def text_scans(interpretations):
+    """Theme, guidance and next-step substring scans as the agent formatter runs them"""
+    for interpretation in interpretations.values():
+        lowered = interpretation.lower()
+        [keyword for keyword in THEME_KEYWORDS if keyword in lowered]
+        for words in (ACTION_WORDS, FUTURE_WORDS):
+            [s.strip() for s in interpretation.split('.') if any(w in s.lower() for w in words)]
+
+
+def indexed_text_lookups(interpretations):
+    """The same lookups on a sentence index per interpretation"""
+    for interpretation in interpretations.values():
+        index = KeywordIndex.build({"sentences": interpretation.split('.')})
+        index.matches(THEME_KEYWORDS, prefix=True)
+        for words in (ACTION_WORDS, FUTURE_WORDS):
+            index.texts("sentences", index.fields(words, prefix=True).get("sentences", []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Keyword Index Benchmark")
+    parser.add_argument("--iterations", type=int, default=100, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    samples = build_engine_samples()
+    for output in samples.values():
+        features_of(output)
+    index = KeywordIndex.build(samples)
+    print(f"\n📚 Reading of {len(samples)} engines: {len(index)} distinct terms")
+
+    print(f"\n🎭 Archetype matching per reading (µs per call, {args.iterations} iterations)")
+    print(f"{'substring scans':<32}{time_call(lambda: legacy_archetypes(samples), args.iterations):>12.1f}")
+    print(f"{'index build + lookups':<32}{time_call(lambda: indexed_archetypes(samples), args.iterations):>12.1f}")
+    print(f"{'lookups on built index':<32}{time_call(lambda: [index.sources_with(k) for k in ARCHETYPE_KEYWORDS.values()], args.iterations):>12.1f}")
+
+    interpretations = {name: INTERPRETATION for name in samples}
+    print(f"\n📝 Interpretation lookups for {len(interpretations)} engines (µs per call)")
+    print(f"{'substring scans':<32}{time_call(lambda: text_scans(interpretations), args.iterations):>12.1f}")
+    print(f"{'sentence index per text':<32}{time_call(lambda: indexed_text_lookups(interpretations), args.iterations):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Model Routing Benchmark
+Runs OpenRouterClient against a local fake OpenRouter server whose models
+misbehave in known ways, comparing the static fallback walk (every request
+tries the models in configured order) with the adaptive router (circuit
+breakers, performance ordering and hedging).
+
+Scenarios:
+    tail    primary answers in 30 ms but every 25th request takes 2 s,
+            fallback1 is rate limited (429 + Retry-After), fallback2 is steady
+    outage  primary returns 500s, fallback1 is rate limited, fallback2 is steady
+
+Usage:
+    python scripts/benchmarks/bench_model_routing.py --requests 200 --port 8767
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from model_router import ModelRouter
+from openrouter_client import OpenRouterClient
+
+
+class FakeOpenRouter:
+    """Fake /chat/completions whose behavior depends on the requested model"""
+
+    def __init__(self):
+        self.scenario = "tail"
+        self.calls = Counter()
+        self.app = FastAPI()
+        self.app.post("/chat/completions")(self.chat_completions)
+
+    async def chat_completions(self, payload: dict):
+        model = payload["model"]
+        self.calls[model] += 1
+        if model.startswith("microsoft/"):  # primary
+            if self.scenario == "outage":
+                return JSONResponse({"error": "upstream unavailable"}, status_code=500)
+            await asyncio.sleep(2.0 if self.calls[model] % 25 == 0 else 0.03)
+        elif model.startswith("google/"):  # fallback1
+            return JSONResponse({"error": "rate limited"}, status_code=429, headers={"Retry-After": "60"})
+        else:  # fallback2 and fallback3
+            await asyncio.sleep(0.08)
+        return {"choices": [{"message": {"role": "assistant", "content": f"Answer from {model}"}}]}
+
+
+class StaticRouter(ModelRouter):
+    """Previous behavior: configured order on every request, no hedging"""
+
+    def rank(self, candidates):
+        return list(dict.fromkeys(candidates))
+
+    def hedge_delay(self, model_type):
+        return None
+
+
+def start_server(app: FastAPI, port: int) -> uvicorn.Server:
+    """Run the fake server in a background thread"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def run_client(fake: FakeOpenRouter, router: ModelRouter, base: str, requests: int):
+    """Latency summary and server calls per request of sequential requests"""
+    client = OpenRouterClient(api_key="benchmark", router=router)
+    client.base_url = base
+    messages = [{"role": "user", "content": "Interpret my life path."}]
+
+    fake.calls.clear()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await client.generate_response(messages, model_type="primary", timeout=10.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+    await client.aclose()
+
+    latencies.sort()
+    return {
+        "mean": statistics.mean(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))],
+        "max": latencies[-1],
+        "calls": sum(fake.calls.values()) / requests
+    }
+
+
+async def run(fake: FakeOpenRouter, args):
+    base = f"http://127.0.0.1:{args.port}"
+    for scenario in ("tail", "outage"):
+        fake.scenario = scenario
+        print(f"\n🧭 {scenario} scenario ({args.requests} sequential requests, ms)")
+        print(f"{'router':<12}{'mean':>10}{'p95':>10}{'max':>10}{'calls/req':>12}")
+        for name, router in (("static", StaticRouter()),
+                             ("adaptive", ModelRouter(min_hedge_delay=0.2))):
+            result = await run_client(fake, router, base, args.requests)
+            print(f"{name:<12}{result['mean']:>10.1f}{result['p95']:>10.1f}{result['max']:>10.1f}"
+                  f"{result['calls']:>12.2f}")
+            if name == "adaptive" and args.verbose:
+                for model, stats in router.snapshot().items():
+                    print(f"    {model:<10} {stats}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Model Routing Benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario and router")
+    parser.add_argument("--port", type=int, default=8767, help="Port of the fake OpenRouter server")
+    parser.add_argument("--verbose", action="store_true", help="Print the adaptive router's telemetry")
+    args = parser.parse_args()
+
+    fake = FakeOpenRouter()
+    server = start_server(fake.app, args.port)
+    try:
+        asyncio.run(run(fake, args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
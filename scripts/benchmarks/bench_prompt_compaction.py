@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Prompt Compaction Benchmark
+Compares prompt sizes before compaction (indented JSON of the whole
+calculation, str() of the whole synthesis input) and after (template-relevant
+fields as compact JSON within the agent's token budgets), and the model each
+prompt is routed to. Numerology and biorhythm are calculated by the agent's local engines; the
+other engines use the agent's mock results.
+
+Usage:
+    python scripts/benchmarks/bench_prompt_compaction.py --interpretation-tokens 1500
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from local_engines import MockEngineFactory, SimpleBiorhythmEngine, SimpleNumerologyEngine
+from openrouter_client import OpenRouterClient
+from prompt_compaction import (
+    TIKTOKEN_AVAILABLE, compact_calculation, compact_synthesis_data, count_tokens
+)
+
+
+BIRTH_DATA = {"name": "Alexandra Marie Chen", "date": "1990-05-15", "time": "14:30", "location": "New York"}
+
+MOCK_ENGINES = ("human_design", "gene_keys", "vimshottari", "tarot", "iching")
+
+
+def engine_results() -> dict:
+    results = {
+        "numerology": SimpleNumerologyEngine().calculate(
+            {"full_name": BIRTH_DATA["name"], "birth_date": BIRTH_DATA["date"]}),
+        "biorhythm": SimpleBiorhythmEngine().calculate({"birth_date": BIRTH_DATA["date"]})
+    }
+    results.update({engine: MockEngineFactory.create_mock_engine(engine) for engine in MOCK_ENGINES})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Prompt Compaction Benchmark")
+    parser.add_argument("--interpretation-tokens", type=int, default=1500,
+                        help="Assumed length of each engine interpretation fed to the synthesis")
+    args = parser.parse_args()
+
+    results = engine_results()
+    client = OpenRouterClient(api_key="benchmark")
+    counter = "tiktoken" if TIKTOKEN_AVAILABLE else "estimate"
+
+    print(f"\n📉 Calculation data per interpretation prompt (tokens, {counter})")
+    print(f"{'engine':<16}{'before':>10}{'after':>10}")
+    for engine, result in results.items():
+        before = count_tokens(json.dumps(result, indent=2, default=str))
+        after = count_tokens(compact_calculation(engine, result))
+        print(f"{engine:<16}{before:>10}{after:>10}")
+
+    interpretations = {engine: "A paragraph of interpretation. " * (args.interpretation_tokens // 6)
+                       for engine in results}
+    before = count_tokens(str({"engine_results": results, "interpretations": interpretations,
+                               "birth_data": BIRTH_DATA}))
+    after = count_tokens(compact_synthesis_data(results, interpretations, 6144, BIRTH_DATA))
+    print(f"\n🌐 {len(results)}-engine synthesis input (tokens)")
+    print(f"{'before':<16}{before:>10}  -> {client.select_model_for_prompt(before)}")
+    print(f"{'after':<16}{after:>10}  -> {client.select_model_for_prompt(after)}")
+
+
+if __name__ == "__main__":
+    main()
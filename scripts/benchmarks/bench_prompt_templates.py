@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Prompt Template Benchmark
+Times prompt rendering before template compilation (system prompt and style
+modifier concatenated and the user template parsed by str.format on every
+call, synthesis system prompt rebuilt each time) and with the compiled
+templates (cached system prompts, pre-parsed user templates).
+
+Usage:
+    python scripts/benchmarks/bench_prompt_templates.py --iterations 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from prompt_templates import InterpretationStyle, PromptTemplateManager
+
+
+CONTEXT = {
+    "name": "Alexandra Marie Chen",
+    "birth_date": "15.05.1990",
+    "birth_time": "14:30",
+    "location": "New York",
+    "calculation_data": '{"core_numbers":{"life_path":3,"expression":7,"soul_urge":11}}' * 8,
+    "aletheos_context": "The 10 Muses have revealed the following consciousness patterns." * 10,
+    "context": "Consciousness guidance for Alexandra Marie Chen with Muse insights"
+}
+
+SYNTHESIS_DATA = '{"engines":{"numerology":{"results":{"life_path":3}}}}' * 100
+
+
+def previous_prompt(manager: PromptTemplateManager, engine_type, style, context):
+    """Rendering before compilation"""
+    template = manager.engine_templates[engine_type]
+    system_prompt = template.system_prompt + "\n\n## Style Guidance\n" + manager.style_modifiers.get(style, "")
+    return {"system": system_prompt.strip(), "user": template.user_template.format(**context).strip()}
+
+
+def previous_synthesis_prompt(manager: PromptTemplateManager, engine_results, style):
+    """Synthesis rendering before compilation"""
+    system_prompt = f"""{manager.base_system_prompt}
+
+## Multi-Engine Synthesis Specialization
+You are synthesizing results from multiple WitnessOS divination engines to create a comprehensive consciousness field analysis. Your role is to identify patterns, correlations, and unified themes across different symbolic systems.
+
+{manager.style_modifiers[style]}"""
+    user_prompt = f"""Synthesize these multi-engine results into unified guidance:
+
+**Results**: {engine_results}
+
+Provide synthesis covering:
+1. **Common Themes** - Patterns across all systems
+2. **Priority Focus** - Which insights to work with first
+3. **Integration Practices** - How to apply the guidance
+
+Present this as unified wisdom that honors each system's insights."""
+    return {"system": system_prompt.strip(), "user": user_prompt.strip()}
+
+
+def time_calls(func, iterations: int) -> float:
+    """Mean microseconds per call"""
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1e6 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Prompt Template Benchmark")
+    parser.add_argument("--iterations", type=int, default=100000, help="Calls timed per variant")
+    args = parser.parse_args()
+
+    manager = PromptTemplateManager()
+    style = InterpretationStyle.BALANCED
+
+    print(f"\n📝 Prompt rendering (µs per prompt, {args.iterations} iterations)")
+    print(f"{'prompt':<16}{'previous':>10}{'compiled':>10}")
+    for engine_type in manager.engine_templates:
+        assert manager.get_prompt(engine_type, style, CONTEXT) == previous_prompt(manager, engine_type, style, CONTEXT)
+        previous = time_calls(lambda: previous_prompt(manager, engine_type, style, CONTEXT), args.iterations)
+        compiled = time_calls(lambda: manager.get_prompt(engine_type, style, CONTEXT), args.iterations)
+        print(f"{engine_type.value:<16}{previous:>10.3f}{compiled:>10.3f}")
+
+    assert manager.get_synthesis_prompt(SYNTHESIS_DATA, style) == previous_synthesis_prompt(manager, SYNTHESIS_DATA, style)
+    previous = time_calls(lambda: previous_synthesis_prompt(manager, SYNTHESIS_DATA, style), args.iterations)
+    compiled = time_calls(lambda: manager.get_synthesis_prompt(SYNTHESIS_DATA, style), args.iterations)
+    print(f"{'synthesis':<16}{previous:>10.3f}{compiled:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
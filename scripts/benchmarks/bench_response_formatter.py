@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Response Formatter Benchmark
+Times AgentResponseFormatter's text extraction on interpretation-sized texts,
+comparing the previous extractors (one split and lowercase of the text per
+field, word counting over every interpretation for correlations) with
+InterpretationFeatures (text segmented once, fields extracted on demand) and
+set intersections for the cross-engine fields.
+
+Usage:
+    python scripts/benchmarks/bench_response_formatter.py --paragraphs 4 --engines 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make the agent modules importable
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "api" / "agent"))
+
+from response_formatter import AgentResponseFormatter, InterpretationFeatures
+
+
+ENGINES = ["numerology", "biorhythm", "human_design", "gene_keys", "tarot",
+           "iching", "enneagram", "vimshottari", "sacred_geometry", "sigil_forge"]
+
+SENTENCES = [
+    "Your {engine} reading reveals the seeker archetype walking a road of steady growth",
+    "Practice daily reflection to integrate these insights into your work and relationships",
+    "The numbers suggest a phase of renewal where you develop new creative capacities",
+    "Next, begin a journal that tracks your energy across the week",
+    "Notice the patterns that emerge when you rest before deciding",
+    "Trust the timing of events even when progress seems slow",
+    "The {engine} cycle marks a stage where old commitments loosen their hold",
+    "Relationships mirror the lessons of this period with unusual clarity",
+]
+
+
+def make_text(engine: str, paragraphs: int) -> str:
+    """Interpretation of a few paragraphs, partly specific to the engine"""
+    body = []
+    for index in range(paragraphs):
+        sentences = SENTENCES[index % 3:] + SENTENCES[:index % 3]
+        body.append(". ".join(s.format(engine=engine.replace("_", " ")) for s in sentences) + ".")
+    return "\n\n".join(body)
+
+
+class PreviousExtractors:
+    """Previous behavior: every extractor splits and lowercases the text itself"""
+
+    def themes(self, text):
+        keywords = ["seeker", "creator", "transformer", "healer", "guide", "warrior",
+                    "sage", "lover", "magician", "innocent", "explorer", "ruler"]
+        text_lower = text.lower()
+        themes = [keyword.title() for keyword in keywords if keyword in text_lower]
+        return themes[:3] if themes else ["Explorer", "Seeker"]
+
+    def sentences(self, text, words, min_length, limit):
+        found = []
+        for sentence in text.split('.'):
+            sentence = sentence.strip()
+            if any(word in sentence.lower() for word in words) and len(sentence) > min_length:
+                found.append(sentence)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def single(self, text):
+        return (self.themes(text),
+                self.sentences(text, ["practice", "cultivate", "develop", "integrate", "embrace", "honor", "trust"], 20, 3),
+                self.sentences(text, ["next", "continue", "develop", "explore", "begin", "start"], 15, 2))
+
+    def multi(self, interpretations, synthesis):
+        all_words = []
+        for interpretation in interpretations.values():
+            all_words.extend([word for word in interpretation.lower().split() if len(word) > 4])
+        word_counts = {}
+        for word in all_words:
+            word_counts[word] = word_counts.get(word, 0) + 1
+        common = [word for word, count in word_counts.items() if count > 1][:5]
+
+        archetype_counts = {}
+        for interpretation in interpretations.values():
+            for archetype in self.themes(interpretation):
+                archetype_counts[archetype] = archetype_counts.get(archetype, 0) + 1
+        convergent = [archetype for archetype, count in archetype_counts.items() if count > 1]
+
+        pathway = self.sentences(synthesis, ["step", "stage", "phase", "develop", "evolve", "progress"], 20, 3)
+        return common, convergent, pathway
+
+
+def time_calls(func, iterations: int) -> float:
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Response Formatter Benchmark")
+    parser.add_argument("--paragraphs", type=int, default=4, help="Paragraphs per interpretation")
+    parser.add_argument("--engines", type=int, default=5, help="Engines in the multi-engine response")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    formatter = AgentResponseFormatter()
+    previous = PreviousExtractors()
+    interpretations = {engine: make_text(engine, args.paragraphs) for engine in ENGINES[:args.engines]}
+    text = interpretations[ENGINES[0]]
+    synthesis = make_text("synthesis", args.paragraphs)
+
+    def single():
+        features = InterpretationFeatures(text)
+        return (formatter._extract_archetypal_themes(features), formatter._extract_integration_guidance(features),
+                formatter._extract_next_steps(features))
+
+    def multi():
+        features = {engine: InterpretationFeatures(t) for engine, t in interpretations.items()}
+        return (formatter._identify_correlations(features), formatter._identify_archetypal_convergence(features),
+                formatter._extract_evolution_pathway(synthesis))
+
+    print(f"\n🧾 Text extraction ({len(text)} characters per interpretation, ms per response)")
+    print(f"{'extraction':<32}{'previous':>10}{'segmented':>13}{'speedup':>9}")
+    for label, before, after in (
+        ("single engine fields", lambda: previous.single(text), single),
+        (f"multi engine ({len(interpretations)} engines)", lambda: previous.multi(interpretations, synthesis), multi),
+    ):
+        before_ms = time_calls(before, args.iterations)
+        after_ms = time_calls(after, args.iterations)
+        print(f"{label:<32}{before_ms:>10.3f}{after_ms:>13.3f}{before_ms / after_ms:>8.1f}x")
+
+    print(f"\n📨 Full responses (ms per response)")
+    for label, func in (
+        ("format_single_engine_response",
+         lambda: formatter.format_single_engine_response(ENGINES[0], {"status": "success"}, text, {})),
+        ("format_multi_engine_response",
+         lambda: formatter.format_multi_engine_response({}, interpretations, synthesis, {})),
+    ):
+        print(f"{label:<32}{time_calls(func, args.iterations):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
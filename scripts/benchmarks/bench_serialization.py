@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+WitnessOS Serialization Benchmark
+Compares FastAPI's default jsonable_encoder path with the engine serializers
+over representative outputs of every engine, plus cache-key hashing.
+
+Usage:
+    python scripts/benchmarks/bench_serialization.py --iterations 500
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import sys
+import time as time_module
+from datetime import date, time
+from pathlib import Path
+
+# Make the engines package importable (engines use both package and base-relative imports)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "engines"))
+sys.path.insert(0, str(project_root / "src"))
+
+from fastapi.encoders import jsonable_encoder
+
+from engines.base.serialization import get_serializer, hash_payload, orjson
+
+
+# engine name -> (engine module, engine class, input class, input kwargs)
+ENGINE_CASES = {
+    "numerology": ("numerology", "NumerologyEngine", "NumerologyInput", dict(
+        full_name="Alexandra Marie Chen", birth_date=date(1990, 5, 15))),
+    "biorhythm": ("biorhythm", "BiorhythmEngine", "BiorhythmInput", dict(
+        birth_date=date(1990, 5, 15), forecast_days=30)),
+    "human_design": ("human_design", "HumanDesignScanner", "HumanDesignInput", dict(
+        birth_date=date(1990, 6, 15), birth_time=time(14, 30),
+        birth_location=(40.7128, -74.0060), timezone="America/New_York")),
+    "vimshottari": ("vimshottari", "VimshottariTimelineMapper", "VimshottariInput", dict(
+        birth_date=date(1985, 3, 20), birth_time=time(10, 15),
+        birth_location=(28.6139, 77.2090), timezone="Asia/Kolkata", years_forecast=10)),
+    "gene_keys": ("gene_keys", "GeneKeysCompass", "GeneKeysInput", dict(
+        birth_date=date(1985, 6, 15), birth_time=time(8, 45),
+        birth_location=(51.5074, -0.1278), timezone="Europe/London", focus_sequence="activation")),
+    "tarot": ("tarot", "TarotSequenceDecoder", "TarotInput", dict(
+        question="What should I focus on for my spiritual growth?", spread_type="celtic_cross")),
+    "iching": ("iching", "IChingMutationOracle", "IChingInput", dict(
+        question="What should I focus on in my personal development?", method="coins")),
+    "enneagram": ("enneagram", "EnneagramResonator", "EnneagramInput", dict(
+        identification_method="self_select", selected_type=4)),
+    "sacred_geometry": ("sacred_geometry", "SacredGeometryMapper", "SacredGeometryInput", dict(
+        intention="Clarity and balance", pattern_type="flower_of_life")),
+    "sigil_forge": ("sigil_forge", "SigilForgeSynthesizer", "SigilForgeInput", dict(
+        intention="I embody creative confidence")),
+}
+
+
+def build_engine_samples():
+    """Run each engine once on representative input and collect its output"""
+    samples = {}
+    for name, (module_name, engine_class, input_class, kwargs) in ENGINE_CASES.items():
+        try:
+            engine_module = importlib.import_module(f"engines.engines.{module_name}")
+            models_module = importlib.import_module(f"engines.engines.{module_name}_models")
+            input_data = getattr(models_module, input_class)(**kwargs)
+            samples[name] = getattr(engine_module, engine_class)().calculate(input_data)
+        except Exception as e:
+            print(f"⚠️  Skipping {name}: {e}")
+    return samples
+
+
+def time_call(func, iterations):
+    """Return mean microseconds per call"""
+    start = time_module.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time_module.perf_counter() - start) / iterations * 1e6
+
+
+def legacy_cache_key(data):
+    """Cache key as production_api generated it before the serializer layer"""
+    return hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS Serialization Benchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    samples = build_engine_samples()
+    serializers = [get_serializer("json")]
+    if orjson is not None:
+        serializers.append(get_serializer("orjson"))
+
+    print(f"\n📊 Engine output serialization (µs per call, {args.iterations} iterations)")
+    header = f"{'engine':<16}{'bytes':>9}{'jsonable_encoder':>18}" + "".join(
+        f"{s.name:>12}" for s in serializers)
+    print(header)
+    print("-" * len(header))
+
+    for name, output in samples.items():
+        size = len(serializers[-1].dumps(output))
+        baseline = time_call(lambda: json.dumps(jsonable_encoder(output)), args.iterations)
+        row = f"{name:<16}{size:>9}{baseline:>18.1f}"
+        for serializer in serializers:
+            row += f"{time_call(lambda: serializer.dumps(output), args.iterations):>12.1f}"
+        print(row)
+
+    print(f"\n🔑 Cache-key hashing (µs per call)")
+    cache_data = {
+        "engines": ["biorhythm", "human_design", "numerology"],
+        "input": {"name": "Alexandra Marie Chen", "date": "15.05.1990", "time": "14:30",
+                  "location": "New York", "timezone": "America/New_York"},
+        "parallel": True,
+        "synthesize": True
+    }
+    print(f"{'md5 + json.dumps(sort_keys)':<32}{time_call(lambda: legacy_cache_key(cache_data), args.iterations * 10):>10.2f}")
+    print(f"{'hash_payload':<32}{time_call(lambda: hash_payload(cache_data), args.iterations * 10):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
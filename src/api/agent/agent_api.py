@@ -7,14 +7,15 @@ interpretation of divination engine calculations.
 
 import os
 import sys
+import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 # Add parent directory to path for config import
@@ -23,9 +24,11 @@ from config import get_config, is_openrouter_configured, get_openrouter_api_key,
 
 try:
     from .agent_service import WitnessOSAgent
+    from .response_formatter import encode_sse
 except ImportError:
     # Fallback for direct execution
     from agent_service import WitnessOSAgent
+    from response_formatter import encode_sse
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +108,20 @@ def get_agent() -> WitnessOSAgent:
 
     return agent
 
+@app.on_event("startup")
+async def open_agent_connections():
+    """Create the agent (and its connection pools) up front when configured"""
+    try:
+        get_agent()
+    except HTTPException:
+        logger.warning("Agent not initialized at startup: OpenRouter API key not configured")
+
+@app.on_event("shutdown")
+async def close_agent_connections():
+    """Close the agent's pooled HTTP connections"""
+    if agent is not None:
+        await agent.aclose()
+
 # Pydantic Models
 class BirthData(BaseModel):
     """Birth data model for agent requests"""
@@ -158,6 +175,8 @@ async def agent_root():
         "endpoints": {
             "single_engine": "/agent/interpret/single",
             "multi_engine": "/agent/interpret/multi",
+            "single_engine_stream": "/agent/interpret/single/stream",
+            "multi_engine_stream": "/agent/interpret/multi/stream",
             "workflow": "/agent/interpret/workflow",
             "status": "/agent/status",
             "models": "/agent/models",
@@ -168,7 +187,8 @@ async def agent_root():
             "Dynamic model selection",
             "WitnessOS consciousness framework",
             "Multi-engine synthesis",
-            "Archetypal pattern analysis"
+            "Archetypal pattern analysis",
+            "Streaming interpretations (server-sent events)"
         ]
     }
 
@@ -282,6 +302,43 @@ async def interpret_multi_engine(
         logger.error(f"Error in multi-engine interpretation: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def sse_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Server-sent events stream of agent events"""
+    return StreamingResponse(
+        encode_sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/agent/interpret/single/stream")
+async def stream_single_engine(
+    request: AgentSingleEngineRequest,
+    agent: WitnessOSAgent = Depends(get_agent)
+):
+    """Stream an AI interpretation for a single engine as server-sent events"""
+    return sse_response(agent.stream_single_engine(
+        engine_name=request.engine_name,
+        birth_data=request.birth_data.model_dump(),
+        interpretation_style=request.interpretation_style,
+        model_type=request.model_type,
+        use_cache=request.use_cache
+    ))
+
+@app.post("/agent/interpret/multi/stream")
+async def stream_multi_engine(
+    request: AgentMultiEngineRequest,
+    agent: WitnessOSAgent = Depends(get_agent)
+):
+    """Stream AI interpretations for multiple engines (and their synthesis) as server-sent events"""
+    return sse_response(agent.stream_multi_engine(
+        engines=request.engines,
+        birth_data=request.birth_data.model_dump(),
+        interpretation_style=request.interpretation_style,
+        model_type=request.model_type,
+        include_synthesis=request.include_synthesis,
+        use_cache=request.use_cache
+    ))
+
 @app.post("/agent/interpret/workflow")
 async def interpret_workflow(
     request: AgentWorkflowRequest,
@@ -5,24 +5,54 @@ Main agent service that wraps the production API and provides natural language
 interpretation of divination engine calculations using OpenRouter LLMs.
 """
 
-import json
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import sys
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import httpx
 
 try:
+    from .batch_jobs import BatchInterpretationJob
+    from .http_pool import AsyncClientPool
+    from .interpretation_cache import (
+        InterpretationCache, StreamPersonalizer, personalize, prompt_fingerprint, subject_placeholders
+    )
+    from .model_router import ModelRouter
     from .openrouter_client import OpenRouterClient
+    from .prompt_compaction import compact_calculation, compact_synthesis_data, count_message_tokens
     from .prompt_templates import PromptTemplateManager, EngineType, InterpretationStyle
-    from .response_formatter import AgentResponseFormatter
+    from .response_formatter import AgentResponseFormatter, IncrementalInterpretation
 except ImportError:
     # Fallback for direct execution
+    from batch_jobs import BatchInterpretationJob
+    from http_pool import AsyncClientPool
+    from interpretation_cache import (
+        InterpretationCache, StreamPersonalizer, personalize, prompt_fingerprint, subject_placeholders
+    )
+    from model_router import ModelRouter
     from openrouter_client import OpenRouterClient
+    from prompt_compaction import compact_calculation, compact_synthesis_data, count_message_tokens
     from prompt_templates import PromptTemplateManager, EngineType, InterpretationStyle
-    from response_formatter import AgentResponseFormatter
+    from response_formatter import AgentResponseFormatter, IncrementalInterpretation
+
+try:
+    from base.canonical import content_hash
+except ImportError:
+    # Make the engines base package importable from the API layer
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "engines"))
+    from base.canonical import content_hash
 
 logger = logging.getLogger(__name__)
 
+# Concurrency limit key of production API calculations (LLM calls are keyed by model type)
+PRODUCTION_API = "production_api"
+
+# Engine transports: the production API over HTTP, or the engines in this process
+ENGINE_TRANSPORTS = ("http", "in_process")
+
 
 class WitnessOSAgent:
     """
@@ -38,7 +68,17 @@ class WitnessOSAgent:
         production_api_url: str = "http://localhost:8002",
         openrouter_api_key: Optional[str] = None,
         default_model_type: str = "balanced",
-        use_local_engines: bool = True
+        use_local_engines: bool = True,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        default_concurrency: int = 4,
+        call_timeout: Optional[float] = 90.0,
+        http_pool_options: Optional[Dict[str, Any]] = None,
+        engine_transport: Optional[str] = None,
+        interpretation_cache_options: Optional[Dict[str, Any]] = None,
+        cache_sections: bool = True,
+        calculation_token_budget: int = 2048,
+        synthesis_token_budget: int = 6144,
+        model_router_options: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize the WitnessOS Agent
@@ -48,9 +88,44 @@ class WitnessOSAgent:
             openrouter_api_key: OpenRouter API key
             default_model_type: Default model type for interpretations
             use_local_engines: Whether to use local engines when API fails
+            concurrency_limits: Maximum concurrent calls per model type (or
+                "production_api" for calculations)
+            default_concurrency: Limit for model types without an entry
+            call_timeout: Deadline in seconds for each calculation, interpretation
+                and synthesis call (None for no deadline)
+            http_pool_options: Connection pool settings (max_connections,
+                max_keepalive_connections, keepalive_expiry, http2) for the
+                production API and OpenRouter clients
+            engine_transport: "http" to calculate through the production API,
+                "in_process" to call the engines directly when they run on this
+                host (defaults to WITNESSOS_ENGINE_TRANSPORT, then "http")
+            interpretation_cache_options: Prompt-fingerprint cache settings (maxsize,
+                maxbytes, ttl, cache_dir, max_disk_bytes); the on-disk tier
+                defaults to WITNESSOS_INTERPRETATION_CACHE_DIR when set
+            cache_sections: Also reuse the per-engine sections of multi-engine
+                readings across readings and subjects
+            calculation_token_budget: Maximum tokens of calculation data in an
+                interpretation prompt
+            synthesis_token_budget: Maximum tokens of results and interpretations
+                in a synthesis prompt
+            model_router_options: Adaptive routing settings (window, min_samples,
+                degraded_failure_rate, failure_threshold, reset_timeout,
+                hedge_after, min_hedge_delay)
+
+        Raises:
+            ValueError: If the engine transport is unknown
         """
         self.production_api_url = production_api_url.rstrip('/')
-        self.openrouter_client = OpenRouterClient(openrouter_api_key)
+        self.engine_transport = engine_transport or os.getenv("WITNESSOS_ENGINE_TRANSPORT", "http")
+        if self.engine_transport not in ENGINE_TRANSPORTS:
+            raise ValueError(f"Unknown engine transport: {self.engine_transport} (expected one of {ENGINE_TRANSPORTS})")
+        pool_options = dict(http_pool_options or {})
+        self.http_pool = AsyncClientPool(**pool_options)
+        self.openrouter_client = OpenRouterClient(
+            openrouter_api_key,
+            http_pool=AsyncClientPool(**pool_options),
+            router=ModelRouter(**(model_router_options or {}))
+        )
         self.prompt_manager = PromptTemplateManager()
         self.response_formatter = AgentResponseFormatter()
         self.default_model_type = default_model_type or "primary"
@@ -60,9 +135,27 @@ class WitnessOSAgent:
         self.response_cache = {}
         self.cache_max_size = 100
 
+        # LLM generations keyed by prompt fingerprint, shared across subjects
+        cache_options = dict(interpretation_cache_options or {})
+        cache_options.setdefault("cache_dir", os.getenv("WITNESSOS_INTERPRETATION_CACHE_DIR"))
+        self.interpretation_cache = InterpretationCache(**cache_options)
+        self.cache_sections = cache_sections
+
+        # Prompt compaction budgets (each prompt then goes to a model whose context fits)
+        self.calculation_token_budget = calculation_token_budget
+        self.synthesis_token_budget = synthesis_token_budget
+
         # Local engine instances (lazy loaded)
         self.local_engines = {}
 
+        # Fan-out limits: one semaphore per model type and event loop
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self.default_concurrency = default_concurrency
+        self.call_timeout = call_timeout
+        self._call_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
         # Initialize Aletheos context extractor
         try:
             from .aletheos_muses import AletheosContextExtractor
@@ -70,6 +163,15 @@ class WitnessOSAgent:
             from aletheos_muses import AletheosContextExtractor
         self.aletheos = AletheosContextExtractor()
 
+        # In-process engine bridge (imports the engines package only when selected)
+        self.engine_bridge = None
+        if self.engine_transport == "in_process":
+            try:
+                from .engine_bridge import InProcessEngineBridge
+            except ImportError:
+                from engine_bridge import InProcessEngineBridge
+            self.engine_bridge = InProcessEngineBridge()
+
         logger.info("WitnessOS Agent initialized with Aletheos + 10 Muses")
     
     async def interpret_single_engine(
@@ -95,12 +197,7 @@ class WitnessOSAgent:
         """
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key({
-                "engine": engine_name,
-                "birth_data": birth_data,
-                "style": interpretation_style,
-                "model": model_type or self.default_model_type
-            })
+            cache_key = self._single_engine_cache_key(engine_name, birth_data, interpretation_style, model_type)
             
             # Check cache
             if use_cache and cache_key in self.response_cache:
@@ -133,14 +230,15 @@ class WitnessOSAgent:
                 calculation_data=calculation_result,
                 birth_data=birth_data,
                 style=interpretation_style,
-                model_type=model_type
+                model_type=model_type,
+                use_cache=use_cache
             )
             
             # Format response
             response = self.response_formatter.format_single_engine_response(
                 engine_name=engine_name,
                 calculation_result=calculation_result,
-                ai_interpretation=interpretation,
+                ai_interpretation=personalize(interpretation, birth_data),
                 birth_data=birth_data
             )
             
@@ -184,42 +282,32 @@ class WitnessOSAgent:
         """
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key({
-                "engines": sorted(engines),
-                "birth_data": birth_data,
-                "style": interpretation_style,
-                "model": model_type or self.default_model_type,
-                "synthesis": include_synthesis
-            })
+            cache_key = self._multi_engine_cache_key(engines, birth_data, interpretation_style,
+                                                     model_type, include_synthesis)
             
             # Check cache
             if use_cache and cache_key in self.response_cache:
                 logger.info(f"Cache hit for multi-engine interpretation")
                 return self.response_cache[cache_key]
             
-            # Get calculations from production API (call each engine separately)
+            # Fan out: each engine is interpreted as soon as its own calculation completes
+            outcomes = await asyncio.gather(*(
+                self._calculate_and_interpret(engine, birth_data, interpretation_style, model_type,
+                                              use_cache and self.cache_sections)
+                for engine in engines
+            ))
+
+            # Assemble partial results: engines that failed or missed their deadline are
+            # reported and left out of the synthesis
             calculation_results = {}
-            for engine in engines:
-                try:
-                    result = await self._call_production_api(
-                        endpoint=f"/calculate/{engine}",
-                        data={
-                            "birth_data": {
-                                "name": birth_data.get("name", ""),
-                                "date": birth_data.get("date", ""),
-                                "time": birth_data.get("time"),
-                                "location": birth_data.get("location"),
-                                "timezone": birth_data.get("timezone")
-                            },
-                            "system": "pythagorean" if engine == "numerology" else None,
-                            "current_year": birth_data.get("current_year"),
-                            "target_date": birth_data.get("target_date")
-                        }
-                    )
-                    calculation_results[engine] = result
-                except Exception as e:
-                    logger.error(f"Error calculating {engine}: {e}")
-                    calculation_results[engine] = {"status": "error", "error": str(e)}
+            engine_interpretations = {}
+            failed_engines = {}
+            for engine_name, (engine_data, interpretation, error) in zip(engines, outcomes):
+                calculation_results[engine_name] = engine_data
+                if interpretation is not None:
+                    engine_interpretations[engine_name] = interpretation
+                else:
+                    failed_engines[engine_name] = error
 
             # Create a combined result structure
             calculation_result = {
@@ -230,42 +318,46 @@ class WitnessOSAgent:
                 "timestamp": datetime.now().isoformat()
             }
             
-            # Generate individual interpretations
-            engine_interpretations = {}
-            for engine_name in engines:
-                if engine_name in calculation_result.get("results", {}).get("engine_outputs", {}):
-                    engine_data = calculation_result["results"]["engine_outputs"][engine_name]
-                    if engine_data.get("status") == "success":
-                        interpretation = await self._generate_interpretation(
-                            engine_name=engine_name,
-                            calculation_data=engine_data,
-                            birth_data=birth_data,
-                            style=interpretation_style,
-                            model_type=model_type
-                        )
-                        engine_interpretations[engine_name] = interpretation
-            
             # Generate synthesis if requested
             synthesis_interpretation = None
             if include_synthesis and len(engine_interpretations) > 1:
-                synthesis_interpretation = await self._generate_synthesis(
-                    engine_results=calculation_result["results"]["engine_outputs"],
-                    interpretations=engine_interpretations,
-                    birth_data=birth_data,
-                    style=interpretation_style,
-                    model_type=model_type or "reasoning"  # Use reasoning model for synthesis
-                )
+                synthesis_model = model_type or "reasoning"  # Use reasoning model for synthesis
+                try:
+                    synthesis_interpretation = await self._limited(
+                        synthesis_model,
+                        lambda: self._generate_synthesis(
+                            # Only interpreted engines: failed ones stay out of the prompt and fingerprint
+                            engine_results={name: calculation_results[name] for name in engine_interpretations},
+                            interpretations=engine_interpretations,
+                            birth_data=birth_data,
+                            style=interpretation_style,
+                            model_type=synthesis_model,
+                            use_cache=use_cache
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Synthesis missed its {self.call_timeout}s deadline")
+                    failed_engines["synthesis"] = f"Synthesis timed out after {self.call_timeout}s"
+                except Exception as e:
+                    logger.error(f"Error generating synthesis: {e}")
+                    failed_engines["synthesis"] = f"Unable to generate synthesis: {e}"
             
-            # Format response
+            # Format response (generations carry placeholder tokens until now)
             response = self.response_formatter.format_multi_engine_response(
                 calculation_result=calculation_result,
-                engine_interpretations=engine_interpretations,
-                synthesis_interpretation=synthesis_interpretation,
+                engine_interpretations={
+                    engine_name: personalize(interpretation, birth_data)
+                    for engine_name, interpretation in engine_interpretations.items()
+                },
+                synthesis_interpretation=(personalize(synthesis_interpretation, birth_data)
+                                          if synthesis_interpretation is not None else None),
                 birth_data=birth_data
             )
+            if failed_engines:
+                response.setdefault("session_metadata", {})["failed_engines"] = failed_engines
             
-            # Cache response
-            if use_cache:
+            # Cache complete responses only, so a retry can fill in the missing engines
+            if use_cache and not failed_engines:
                 self._cache_response(cache_key, response)
             
             return response
@@ -279,6 +371,265 @@ class WitnessOSAgent:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def stream_single_engine(
+        self,
+        engine_name: str,
+        birth_data: Dict[str, Any],
+        interpretation_style: str = "balanced",
+        model_type: Optional[str] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a single engine interpretation as it is generated
+
+        Yields events ({"event": name, "data": {...}}):
+            calculation: the engine calculation finished
+            token: a chunk of interpretation text
+            section: a completed paragraph with its archetypal themes and guidance
+            error: the calculation or interpretation failed
+            complete: the final structured response (as interpret_single_engine returns it)
+        """
+        cache_key = self._single_engine_cache_key(engine_name, birth_data, interpretation_style, model_type)
+        if use_cache and cache_key in self.response_cache:
+            logger.info(f"Cache hit for agent interpretation: {engine_name}")
+            yield self._event("complete", response=self.response_cache[cache_key])
+            return
+
+        calculation_result = await self._calculate_engine(engine_name, birth_data)
+        if calculation_result.get("status") != "success":
+            error = f"Engine calculation failed: {calculation_result.get('error', 'Unknown error')}"
+            yield self._event("error", engine=engine_name, error=error)
+            yield self._event("complete", response={
+                "error": error,
+                "engine": engine_name,
+                "status": "agent_error",
+                "timestamp": datetime.now().isoformat()
+            })
+            return
+        yield self._event("calculation", engine=engine_name, status="success")
+
+        interpretation = IncrementalInterpretation(self.response_formatter, engine_name)
+        error = None
+        async for event in self._stream_interpretation_events(
+                interpretation, calculation_result, birth_data, interpretation_style, model_type, use_cache):
+            if event["event"] == "error":
+                error = event["data"]["error"]
+            yield event
+
+        response = self.response_formatter.format_single_engine_response(
+            engine_name=engine_name,
+            calculation_result=calculation_result,
+            ai_interpretation=interpretation.text,
+            birth_data=birth_data
+        )
+        if use_cache and error is None:
+            self._cache_response(cache_key, response)
+        yield self._event("complete", response=response)
+
+    async def stream_multi_engine(
+        self,
+        engines: List[str],
+        birth_data: Dict[str, Any],
+        interpretation_style: str = "witnessOS",
+        model_type: Optional[str] = None,
+        include_synthesis: bool = True,
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a multi-engine interpretation as it is generated
+
+        Engines are calculated and interpreted concurrently, so their events
+        interleave (each carries its engine name); the synthesis streams once
+        every engine is done, under the engine name "synthesis". Events are
+        those of stream_single_engine plus engine_complete; the closing
+        complete event carries the response interpret_multi_engine returns.
+        """
+        cache_key = self._multi_engine_cache_key(engines, birth_data, interpretation_style,
+                                                 model_type, include_synthesis)
+        if use_cache and cache_key in self.response_cache:
+            logger.info("Cache hit for multi-engine interpretation")
+            yield self._event("complete", response=self.response_cache[cache_key])
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        calculation_results: Dict[str, Any] = {}
+        interpretations: Dict[str, IncrementalInterpretation] = {}
+        # Generations with placeholder tokens, which the synthesis prompt takes
+        generations: Dict[str, str] = {}
+        failed_engines: Dict[str, str] = {}
+
+        async def run(engine_name: str):
+            try:
+                engine_data = await self._calculate_engine(engine_name, birth_data)
+                calculation_results[engine_name] = engine_data
+                if engine_data.get("status") != "success":
+                    failed_engines[engine_name] = engine_data.get("error", "Engine calculation failed")
+                    await queue.put(self._event("error", engine=engine_name, error=failed_engines[engine_name]))
+                    return
+                await queue.put(self._event("calculation", engine=engine_name, status="success"))
+
+                interpretation = IncrementalInterpretation(self.response_formatter, engine_name)
+                async for event in self._stream_interpretation_events(
+                        interpretation, engine_data, birth_data, interpretation_style, model_type,
+                        use_cache and self.cache_sections, generations):
+                    if event["event"] == "error":
+                        failed_engines[engine_name] = event["data"]["error"]
+                    await queue.put(event)
+                if engine_name not in failed_engines:
+                    interpretations[engine_name] = interpretation
+                await queue.put(self._event("engine_complete", engine=engine_name))
+            except Exception as e:
+                logger.error(f"Error streaming {engine_name}: {e}")
+                failed_engines[engine_name] = str(e)
+                await queue.put(self._event("error", engine=engine_name, error=str(e)))
+            finally:
+                await queue.put(None)
+
+        # Fan out, forwarding events as they arrive
+        tasks = [asyncio.create_task(run(engine)) for engine in engines]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await queue.get()
+                if event is None:
+                    remaining -= 1
+                else:
+                    yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        engine_results = {engine: calculation_results.get(engine, {}) for engine in engines}
+        engine_interpretations = {
+            engine: interpretations[engine].text for engine in engines if engine in interpretations
+        }
+
+        synthesis_interpretation = None
+        if include_synthesis and len(engine_interpretations) > 1:
+            synthesis_model = model_type or "reasoning"  # Use reasoning model for synthesis
+            synthesis = IncrementalInterpretation(self.response_formatter, "synthesis")
+            # Only interpreted engines: failed ones stay out of the prompt and fingerprint
+            messages = self._synthesis_messages(
+                {engine: engine_results[engine] for engine in engine_interpretations},
+                {engine: generations[engine] for engine in engine_interpretations},
+                birth_data, interpretation_style
+            )
+            fingerprint = self._synthesis_fingerprint(messages, synthesis_model)
+            async for event in self._stream_text_events(
+                    synthesis, fingerprint, messages, birth_data, synthesis_model, use_cache):
+                if event["event"] == "error":
+                    failed_engines["synthesis"] = event["data"]["error"]
+                yield event
+            if "synthesis" not in failed_engines:
+                synthesis_interpretation = synthesis.text
+
+        response = self.response_formatter.format_multi_engine_response(
+            calculation_result={
+                "status": "success",
+                "results": {"engine_outputs": engine_results},
+                "timestamp": datetime.now().isoformat()
+            },
+            engine_interpretations=engine_interpretations,
+            synthesis_interpretation=synthesis_interpretation,
+            birth_data=birth_data
+        )
+        if failed_engines:
+            response.setdefault("session_metadata", {})["failed_engines"] = failed_engines
+        elif use_cache:
+            self._cache_response(cache_key, response)
+        yield self._event("complete", response=response)
+
+    async def _stream_interpretation_events(
+        self,
+        interpretation: IncrementalInterpretation,
+        calculation_data: Dict[str, Any],
+        birth_data: Dict[str, Any],
+        style: str,
+        model_type: Optional[str],
+        use_cache: bool,
+        generations: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Token and section events of one engine's interpretation"""
+        model_type = model_type or self.default_model_type
+        engine_name = interpretation.engine_name
+        try:
+            messages, aletheos_context = self._interpretation_prompt(engine_name, calculation_data, birth_data, style)
+        except Exception as e:
+            logger.error(f"Error preparing interpretation for {engine_name}: {e}")
+            yield self._event("error", engine=engine_name, error=f"Unable to generate interpretation: {e}")
+            return
+
+        fingerprint = self._interpretation_fingerprint(engine_name, messages, aletheos_context, model_type)
+        async for event in self._stream_text_events(
+                interpretation, fingerprint, messages, birth_data, model_type, use_cache, generations):
+            yield event
+
+    async def _stream_text_events(
+        self,
+        interpretation: IncrementalInterpretation,
+        fingerprint: str,
+        messages: List[Dict[str, str]],
+        birth_data: Dict[str, Any],
+        model_type: str,
+        use_cache: bool,
+        generations: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Token and section events of a streamed generation (errors become an error event)
+
+        The generation streams within its model type's concurrency limit and
+        the call deadline, like non-streamed calls (see _limited). Events
+        carry the personalized text; a completed generation is also recorded
+        with its placeholder tokens in generations, under the engine name.
+        """
+        engine_name = interpretation.engine_name
+        kind = "synthesis" if engine_name == "synthesis" else "interpretation"
+        personalizer = StreamPersonalizer(birth_data)
+        chunks: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            async for chunk in self._stream_generation(fingerprint, messages, model_type, use_cache):
+                chunks.put_nowait(chunk)
+
+        # The generation runs in its own task so the deadline covers it alone,
+        # not the time the client takes to consume the events
+        producer = asyncio.create_task(self._limited(model_type, produce))
+        producer.add_done_callback(lambda _: chunks.put_nowait(None))
+        parts = []
+        try:
+            while (chunk := await chunks.get()) is not None:
+                parts.append(chunk)
+                text = personalizer.feed(chunk)
+                if text:
+                    yield self._event("token", engine=engine_name, text=text)
+                    for section in interpretation.feed(text):
+                        yield self._event("section", **section)
+            await producer
+            text = personalizer.finish()
+            if text:
+                yield self._event("token", engine=engine_name, text=text)
+                for section in interpretation.feed(text):
+                    yield self._event("section", **section)
+            if generations is not None:
+                generations[engine_name] = "".join(parts)
+        except asyncio.TimeoutError:
+            logger.error(f"Streaming {kind} for {engine_name} missed its {self.call_timeout}s deadline")
+            yield self._event("error", engine=engine_name,
+                              error=f"{kind.capitalize()} timed out after {self.call_timeout}s")
+        except Exception as e:
+            logger.error(f"Error streaming {kind} for {engine_name}: {e}")
+            yield self._event("error", engine=engine_name, error=f"Unable to generate {kind}: {e}")
+        finally:
+            producer.cancel()
+        for section in interpretation.finish():
+            yield self._event("section", **section)
+
+    @staticmethod
+    def _event(name: str, **data: Any) -> Dict[str, Any]:
+        """Stream event"""
+        return {"event": name, "data": data}
+
     async def interpret_workflow(
         self,
         workflow_name: str,
@@ -334,15 +685,150 @@ class WitnessOSAgent:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def run_batch_job(
+        self,
+        input_path: str,
+        output_path: str,
+        checkpoint_path: Optional[str] = None,
+        engines: Optional[List[str]] = None,
+        interpretation_style: str = "balanced",
+        model_type: Optional[str] = None,
+        **job_options: Any
+    ) -> Dict[str, Any]:
+        """
+        Pre-generate single-engine interpretations for a JSONL file of subjects
+
+        Identical prompts share one LLM call, LLM calls are rate limited and
+        retried, and progress is checkpointed so a rerun with the same paths
+        resumes the job (see batch_jobs).
+
+        Args:
+            input_path: JSONL file of subjects ({"id", "birth_data", "engines"?,
+                "style"?, "model_type"?} per line)
+            output_path: JSONL file of results, one line per subject and engine
+            checkpoint_path: Progress file (defaults to <output_path>.checkpoint.json)
+            engines: Engines for subjects that do not list their own
+            interpretation_style: Style for subjects that do not set one
+            model_type: LLM model type for subjects that do not set one
+            **job_options: requests_per_minute, burst, max_in_flight, max_retries,
+                retry_backoff, checkpoint_interval, use_cache
+
+        Returns:
+            Job summary (task counts, LLM calls, retries, duration)
+        """
+        job = BatchInterpretationJob(
+            self, input_path, output_path,
+            checkpoint_path=checkpoint_path,
+            engines=engines,
+            style=interpretation_style,
+            model_type=model_type,
+            **job_options
+        )
+        return await job.run()
+
+    def _call_limit(self, key: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent calls for a model type (per event loop)"""
+        limits = self._call_limits.setdefault(asyncio.get_running_loop(), {})
+        if key not in limits:
+            limits[key] = asyncio.Semaphore(self.concurrency_limits.get(key, self.default_concurrency))
+        return limits[key]
+
+    async def _limited(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call within its model type's concurrency limit and the call deadline
+
+        The deadline starts once the call holds a slot, so queueing behind
+        other calls does not count against it.
+
+        Raises:
+            asyncio.TimeoutError: If the call misses its deadline
+        """
+        async with self._call_limit(key):
+            return await asyncio.wait_for(call(), timeout=self.call_timeout)
+
+    async def _calculate_and_interpret(
+        self,
+        engine_name: str,
+        birth_data: Dict[str, Any],
+        style: str,
+        model_type: Optional[str],
+        use_cache: bool = True
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """
+        Calculate and interpret one engine of a multi-engine reading
+
+        Returns:
+            (calculation data, interpretation with placeholder tokens or None, error or None)
+        """
+        engine_data = await self._calculate_engine(engine_name, birth_data)
+        if engine_data.get("status") != "success":
+            return engine_data, None, engine_data.get("error", "Engine calculation failed")
+
+        try:
+            interpretation = await self._limited(
+                model_type or self.default_model_type,
+                lambda: self._generate_interpretation(
+                    engine_name=engine_name,
+                    calculation_data=engine_data,
+                    birth_data=birth_data,
+                    style=style,
+                    model_type=model_type,
+                    use_cache=use_cache
+                )
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Interpretation of {engine_name} missed its {self.call_timeout}s deadline")
+            return engine_data, None, f"Interpretation timed out after {self.call_timeout}s"
+        except Exception as e:
+            logger.error(f"Error generating interpretation for {engine_name}: {e}")
+            return engine_data, None, f"Unable to generate interpretation: {e}"
+        return engine_data, interpretation, None
+
+    async def _calculate_engine(self, engine: str, birth_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate one engine for a multi-engine interpretation, returning errors as results"""
+        try:
+            return await self._limited(PRODUCTION_API, lambda: self._call_production_api(
+                endpoint=f"/calculate/{engine}",
+                data={
+                    "birth_data": {
+                        "name": birth_data.get("name", ""),
+                        "date": birth_data.get("date", ""),
+                        "time": birth_data.get("time"),
+                        "location": birth_data.get("location"),
+                        "timezone": birth_data.get("timezone")
+                    },
+                    "system": "pythagorean" if engine == "numerology" else None,
+                    "current_year": birth_data.get("current_year"),
+                    "target_date": birth_data.get("target_date")
+                }
+            ))
+        except asyncio.TimeoutError:
+            logger.error(f"Calculating {engine} missed its {self.call_timeout}s deadline")
+            return {"status": "error", "error": f"Calculation timed out after {self.call_timeout}s"}
+        except Exception as e:
+            logger.error(f"Error calculating {engine}: {e}")
+            return {"status": "error", "error": str(e)}
+
     async def _call_production_api(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Call the WitnessOS production API with local engine fallback"""
+        """Call the WitnessOS production API (or the in-process engines) with local engine fallback"""
+        if self.engine_bridge is not None and endpoint.startswith("/calculate/"):
+            engine_name = endpoint.split("/")[-1]
+            # Engines the bridge cannot build input for still go to the production API
+            if self.engine_bridge.supports(engine_name):
+                try:
+                    return await self.engine_bridge.calculate(engine_name, data)
+                except Exception as bridge_error:
+                    logger.warning(f"In-process calculation of {engine_name} failed: {bridge_error}")
+                    if not self.use_local_engines:
+                        raise
+                    return await self._call_local_engine(engine_name, data)
+
         try:
             url = f"{self.production_api_url}{endpoint}"
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, json=data)
-                response.raise_for_status()
-                return response.json()
+            response = await self.http_pool.get().post(url, json=data)
+            response.raise_for_status()
+            return response.json()
 
         except Exception as api_error:
             logger.warning(f"Production API call failed: {api_error}")
@@ -377,7 +863,8 @@ class WitnessOSAgent:
                     "current_year": data.get("current_year")
                 }
 
-                return self.local_engines[engine_name].calculate(input_data)
+                # Calculate off the event loop so concurrent requests keep flowing
+                return await asyncio.to_thread(self.local_engines[engine_name].calculate, input_data)
 
             elif engine_name == "biorhythm":
                 if engine_name not in self.local_engines:
@@ -388,7 +875,8 @@ class WitnessOSAgent:
                     "target_date": data.get("target_date")
                 }
 
-                return self.local_engines[engine_name].calculate(input_data)
+                # Calculate off the event loop so concurrent requests keep flowing
+                return await asyncio.to_thread(self.local_engines[engine_name].calculate, input_data)
 
             else:
                 # Use mock factory for other engines
@@ -422,53 +910,35 @@ class WitnessOSAgent:
         calculation_data: Dict[str, Any],
         birth_data: Dict[str, Any],
         style: str,
-        model_type: Optional[str] = None
+        model_type: Optional[str] = None,
+        use_cache: bool = True
     ) -> str:
-        """Generate AI interpretation for a single engine result with Aletheos context"""
-        try:
-            # Extract context through Aletheos and the 10 Muses
-            engine_results = {engine_name: calculation_data}
-            muse_insights = self.aletheos.extract_context(engine_results, birth_data)
-            aletheos_context = self.aletheos.format_context_for_agent(muse_insights)
-
-            # Map engine name to EngineType enum
-            engine_type = EngineType(engine_name)
-            interpretation_style = InterpretationStyle(style)
-
-            # Prepare context for prompt template with Aletheos insights
-            context = {
-                "name": birth_data.get("name", "User"),
-                "birth_date": birth_data.get("date", ""),
-                "birth_time": birth_data.get("time", ""),
-                "location": birth_data.get("location", ""),
-                "calculation_data": json.dumps(calculation_data, indent=2),
-                "aletheos_context": aletheos_context,
-                "context": f"Consciousness guidance for {birth_data.get('name', 'User')} with Muse insights"
-            }
-            
-            # Generate prompt
-            prompt = self.prompt_manager.get_prompt(
-                engine_type=engine_type,
-                style=interpretation_style,
-                context=context
-            )
-            
-            # Generate response using OpenRouter
-            messages = [
-                {"role": "system", "content": prompt["system"]},
-                {"role": "user", "content": prompt["user"]}
-            ]
-            
-            response = await self.openrouter_client.generate_response(
-                messages=messages,
-                model_type=model_type or self.default_model_type
-            )
-            
-            return response["choices"][0]["message"]["content"]
-            
-        except Exception as e:
-            logger.error(f"Error generating interpretation for {engine_name}: {e}")
-            return f"Unable to generate interpretation: {str(e)}"
+        """
+        Generate AI interpretation for a single engine result with Aletheos context
+
+        Returns:
+            The interpretation with placeholder tokens for the subject's details
+            (see interpretation_cache.personalize)
+
+        Raises:
+            Exception: If the prompt cannot be built or no model could generate
+                the interpretation (failures are never returned as text)
+        """
+        model_type = model_type or self.default_model_type
+        messages, aletheos_context = self._interpretation_prompt(engine_name, calculation_data, birth_data, style)
+        fingerprint = self._interpretation_fingerprint(engine_name, messages, aletheos_context, model_type)
+        if use_cache:
+            cached = self.interpretation_cache.get(fingerprint)
+            if cached is not None:
+                logger.info(f"Interpretation cache hit for {engine_name}")
+                return cached
+
+        response = await self._complete(messages, model_type)
+
+        content = response["choices"][0]["message"]["content"]
+        if use_cache:
+            self.interpretation_cache.set(fingerprint, content, model=response.get("_model_name"))
+        return content
 
     async def _generate_synthesis(
         self,
@@ -476,47 +946,196 @@ class WitnessOSAgent:
         interpretations: Dict[str, str],
         birth_data: Dict[str, Any],
         style: str,
-        model_type: str = "reasoning"
+        model_type: str = "reasoning",
+        use_cache: bool = True
     ) -> str:
-        """Generate AI synthesis of multiple engine results"""
-        try:
-            interpretation_style = InterpretationStyle(style)
+        """
+        Generate AI synthesis of multiple engine results
 
-            # Prepare synthesis data
-            synthesis_data = {
-                "engine_results": engine_results,
-                "interpretations": interpretations,
-                "birth_data": birth_data
-            }
+        Args:
+            interpretations: Engine interpretations with placeholder tokens
 
-            # Generate synthesis prompt
-            prompt = self.prompt_manager.get_synthesis_prompt(
-                engine_results=synthesis_data,
-                style=interpretation_style
-            )
+        Returns:
+            The synthesis with placeholder tokens for the subject's details
 
-            # Generate response using OpenRouter
-            messages = [
-                {"role": "system", "content": prompt["system"]},
-                {"role": "user", "content": prompt["user"]}
-            ]
+        Raises:
+            Exception: If no model could generate the synthesis
+        """
+        messages = self._synthesis_messages(engine_results, interpretations, birth_data, style)
+        fingerprint = self._synthesis_fingerprint(messages, model_type)
+        if use_cache:
+            cached = self.interpretation_cache.get(fingerprint)
+            if cached is not None:
+                logger.info("Interpretation cache hit for synthesis")
+                return cached
 
-            response = await self.openrouter_client.generate_response(
-                messages=messages,
-                model_type=model_type
-            )
+        response = await self._complete(messages, model_type)
 
-            return response["choices"][0]["message"]["content"]
+        content = response["choices"][0]["message"]["content"]
+        if use_cache:
+            self.interpretation_cache.set(fingerprint, content, model=response.get("_model_name"))
+        return content
 
-        except Exception as e:
-            logger.error(f"Error generating synthesis: {e}")
-            return f"Unable to generate synthesis: {str(e)}"
+    async def _complete(self, messages: List[Dict[str, str]], model_type: str) -> Dict[str, Any]:
+        """
+        Chat completion on a model whose context window fits the prompt
+
+        Raises:
+            Exception: If no model could generate the response
+        """
+        return await self.openrouter_client.generate_response(
+            messages=messages,
+            model_type=self.openrouter_client.select_model_for_prompt(count_message_tokens(messages), model_type)
+        )
+
+    def _interpretation_prompt(
+        self,
+        engine_name: str,
+        calculation_data: Dict[str, Any],
+        birth_data: Dict[str, Any],
+        style: str
+    ) -> Tuple[List[Dict[str, str]], str]:
+        """
+        Chat messages interpreting one engine result, with Aletheos context
+
+        The subject's details appear as placeholder tokens (see
+        interpretation_cache.subject_placeholders), so neither the prompt nor
+        the generation carries them.
+
+        Returns:
+            The messages and the Aletheos context they were built with, which
+            depends on the birth date and so belongs in the prompt fingerprint
+        """
+        # Extract context through Aletheos and the 10 Muses
+        engine_results = {engine_name: calculation_data}
+        muse_insights = self.aletheos.extract_context(engine_results, birth_data)
+        aletheos_context = self.aletheos.format_context_for_agent(muse_insights)
+
+        # Map engine name to EngineType enum
+        engine_type = EngineType(engine_name)
+        interpretation_style = InterpretationStyle(style)
+
+        # Prepare context for prompt template with Aletheos insights
+        subject = subject_placeholders()
+        context = {
+            "name": subject["name"],
+            "birth_date": subject["date"],
+            "birth_time": subject["time"],
+            "location": subject["location"],
+            "calculation_data": compact_calculation(engine_name, calculation_data,
+                                                    self.calculation_token_budget),
+            "aletheos_context": aletheos_context,
+            "context": f"Consciousness guidance for {subject['name']} with Muse insights"
+        }
+
+        # Generate prompt
+        prompt = self.prompt_manager.get_prompt(
+            engine_type=engine_type,
+            style=interpretation_style,
+            context=context
+        )
+
+        return [
+            {"role": "system", "content": prompt["system"]},
+            {"role": "user", "content": prompt["user"]}
+        ], aletheos_context
+
+    def _synthesis_messages(
+        self,
+        engine_results: Dict[str, Any],
+        interpretations: Dict[str, str],
+        birth_data: Dict[str, Any],
+        style: str
+    ) -> List[Dict[str, str]]:
+        """
+        Chat messages synthesizing several engine results and their interpretations
+
+        Interpretations are passed with their placeholder tokens, and the
+        subject appears as placeholder tokens too.
+        """
+        interpretation_style = InterpretationStyle(style)
+
+        # Prepare synthesis data: template-relevant results and interpretations within budget
+        synthesis_data = compact_synthesis_data(
+            engine_results, interpretations, self.synthesis_token_budget, subject_placeholders(birth_data)
+        )
+
+        # Generate synthesis prompt
+        prompt = self.prompt_manager.get_synthesis_prompt(
+            engine_results=synthesis_data,
+            style=interpretation_style
+        )
+
+        return [
+            {"role": "system", "content": prompt["system"]},
+            {"role": "user", "content": prompt["user"]}
+        ]
 
-    def _generate_cache_key(self, data: Dict[str, Any]) -> str:
-        """Generate cache key from request data"""
-        import hashlib
-        data_str = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.md5(data_str.encode()).hexdigest()
+    def _interpretation_fingerprint(self, engine_name: str, messages: List[Dict[str, str]],
+                                    aletheos_context: str, model_type: str) -> str:
+        return prompt_fingerprint(engine_name, self._model_name(model_type), messages, aletheos_context)
+
+    def _synthesis_fingerprint(self, messages: List[Dict[str, str]], model_type: str) -> str:
+        return prompt_fingerprint("synthesis", self._model_name(model_type), messages)
+
+    async def _stream_generation(
+        self,
+        fingerprint: str,
+        messages: List[Dict[str, str]],
+        model_type: str,
+        use_cache: bool
+    ) -> AsyncIterator[str]:
+        """
+        Stream a generation (with placeholder tokens) from the interpretation cache or the LLM
+
+        Cached generations arrive as a single chunk; streamed generations are
+        cached once complete.
+
+        Raises:
+            Exception: If no model could generate the response
+        """
+        if use_cache:
+            cached = self.interpretation_cache.get(fingerprint)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        async for chunk in self.openrouter_client.stream_response(
+            messages=messages,
+            model_type=self.openrouter_client.select_model_for_prompt(count_message_tokens(messages), model_type)
+        ):
+            parts.append(chunk)
+            yield chunk
+
+        if use_cache and parts:
+            self.interpretation_cache.set(fingerprint, "".join(parts))
+
+    def _model_name(self, model_type: str) -> str:
+        """Model a model type resolves to (prompts for the same model share cache entries)"""
+        model = self.openrouter_client.models.get(model_type)
+        return model.name if model else model_type
+
+    def _single_engine_cache_key(self, engine_name: str, birth_data: Dict[str, Any], style: str,
+                                 model_type: Optional[str]) -> str:
+        return self._generate_cache_key(engine_name, {
+            "birth_data": birth_data,
+            "style": style,
+            "model": model_type or self.default_model_type
+        })
+
+    def _multi_engine_cache_key(self, engines: List[str], birth_data: Dict[str, Any], style: str,
+                                model_type: Optional[str], include_synthesis: bool) -> str:
+        return self._generate_cache_key(",".join(sorted(engines)), {
+            "birth_data": birth_data,
+            "style": style,
+            "model": model_type or self.default_model_type,
+            "synthesis": include_synthesis
+        })
+
+    def _generate_cache_key(self, engine: str, data: Dict[str, Any]) -> str:
+        """Generate cache key from the canonical form of the request data"""
+        return content_hash(engine, data)
 
     def _cache_response(self, cache_key: str, response: Dict[str, Any]):
         """Cache agent response with size limit"""
@@ -547,6 +1166,13 @@ class WitnessOSAgent:
             logger.error(f"Error getting available workflows: {e}")
             return {"error": str(e)}
 
+    async def aclose(self):
+        """Close pooled connections to the production API and OpenRouter"""
+        await self.http_pool.aclose()
+        await self.openrouter_client.aclose()
+        if self.engine_bridge is not None:
+            await self.engine_bridge.aclose()
+
     def get_agent_status(self) -> Dict[str, Any]:
         """Get agent status and configuration"""
         return {
@@ -556,5 +1182,14 @@ class WitnessOSAgent:
             "available_models": list(self.openrouter_client.list_available_models().keys()),
             "cache_size": len(self.response_cache),
             "cache_max_size": self.cache_max_size,
+            "interpretation_cache": self.interpretation_cache.stats(),
+            "aletheos_cache": self.aletheos.cache_stats(),
+            "cache_sections": self.cache_sections,
+            "concurrency_limits": self.concurrency_limits,
+            "default_concurrency": self.default_concurrency,
+            "call_timeout": self.call_timeout,
+            "http2": self.http_pool.http2,
+            "engine_transport": self.engine_transport,
+            "model_routing": self.openrouter_client.router.snapshot(),
             "timestamp": datetime.now().isoformat()
         }
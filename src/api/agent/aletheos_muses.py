@@ -19,12 +19,40 @@ Each Muse specializes in a specific domain of consciousness analysis:
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
+try:
+    from base.cache import TTLCache
+    from base.serialization import hash_payload
+except ImportError:
+    # Make the engines base package importable from the API layer
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "engines"))
+    from base.cache import TTLCache
+    from base.serialization import hash_payload
+
 logger = logging.getLogger(__name__)
 
+# Result fields the Muses read, per engine. Engine results are reduced to
+# these fields once per reading; engines without an entry are not read.
+MUSE_FIELDS: Dict[str, tuple] = {
+    "numerology": ("core_numbers", "karmic_debt", "master_numbers", "life_path", "expression",
+                   "personal_year"),
+    "biorhythm": ("cycles",),
+    "human_design": ("personality_type", "strategy", "incarnation_cross", "authority", "not_self",
+                     "defined_centers", "profile", "type", "gates"),
+    "gene_keys": ("life_work", "gates"),
+    "vimshottari": ("current_dasha", "current_mahadasha", "current_antardasha", "mahadasha_remaining"),
+    "tarot": ("cards",),
+    "iching": ("primary_hexagram", "changing_lines"),
+    "enneagram": ("type",),
+    "sacred_geometry": ("primary_pattern", "patterns", "golden_ratio"),
+    "sigil_forge": (),
+}
+
 
 class MuseDomain(Enum):
     """The 10 Muse domains for consciousness analysis"""
@@ -67,9 +95,21 @@ class AletheosContextExtractor:
     
     Sub-agent that analyzes calculation results and extracts meaningful
     context through the lens of the 10 Muses.
+
+    Engine results are normalized once per reading into a shared view (the
+    fields the Muses read) and all Muses are evaluated over it. Insights
+    are memoized by the hash of the view (for the agent's single-engine
+    readings, per engine and result), so the same results are only
+    evaluated once.
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024, cache_ttl: Optional[float] = None):
+        """
+        Args:
+            cache_size: Maximum readings whose insights are memoized (0 disables)
+            cache_ttl: Seconds memoized insights stay valid (None for no expiry)
+        """
+        self.insight_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_size > 0 else None
         self.muse_specializations = {
             MuseDomain.CALLIOPE: self._extract_life_purpose_context,
             MuseDomain.CLIO: self._extract_karmic_patterns_context,
@@ -95,11 +135,54 @@ class AletheosContextExtractor:
         Returns:
             List of MuseInsight objects with extracted context
         """
+        view, key = self.normalize_results(engine_results, birth_data)
+
+        entries = self.insight_cache.get(key) if self.insight_cache is not None else None
+        if entries is None:
+            entries = self._evaluate_muses(view, birth_data)
+            if self.insight_cache is not None:
+                self.insight_cache[key] = entries
+
+        return [MuseInsight(muse, insight, relevance, dict(supporting_data))
+                for muse, insight, relevance, supporting_data in entries]
+
+    def normalize_results(self, engine_results: Dict[str, Any],
+                          birth_data: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Tuple]:
+        """
+        Shared view of a reading and its memoization key
+
+        Each engine result is reduced to the fields listed in MUSE_FIELDS, and
+        the view is hashed in canonical JSON form (sorted keys), so results
+        differing only in fields the Muses never read share one evaluation.
+
+        Args:
+            engine_results: Raw calculation results from engines
+            birth_data: Birth information for context
+
+        Returns:
+            (view, key): the view has the shape of engine_results; the key
+            is the view hash and the birth date
+        """
+        view = {}
+        for engine_name, result in engine_results.items():
+            fields = MUSE_FIELDS.get(engine_name)
+            if fields is None:
+                continue
+            if isinstance(result, dict):
+                result = {field: result[field] for field in fields if field in result}
+            view[engine_name] = result
+
+        birth_date = (birth_data or {}).get("date")
+        return view, (hash_payload(view), birth_date if isinstance(birth_date, str) else None)
+
+    def _evaluate_muses(self, view: Dict[str, Any],
+                        birth_data: Dict[str, Any]) -> List[Tuple[MuseDomain, str, float, Dict[str, Any]]]:
+        """Evaluate all Muses over a normalized view, highest relevance first"""
         insights = []
         
         for muse_domain, extractor_func in self.muse_specializations.items():
             try:
-                insight = extractor_func(engine_results, birth_data)
+                insight = extractor_func(view, birth_data)
                 if insight:
                     insights.append(insight)
             except Exception as e:
@@ -108,7 +191,12 @@ class AletheosContextExtractor:
         # Sort by relevance (highest first)
         insights.sort(key=lambda x: x.relevance, reverse=True)
         
-        return insights
+        return [(insight.muse, insight.insight, insight.relevance, insight.supporting_data)
+                for insight in insights]
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss counters of the insight memo (None when disabled)"""
+        return self.insight_cache.stats() if self.insight_cache is not None else None
     
     def _extract_life_purpose_context(self, results: Dict[str, Any], 
                                     birth_data: Dict[str, Any]) -> Optional[MuseInsight]:
@@ -846,4 +934,4 @@ class AletheosContextExtractor:
 
 
 # Export the main class
-__all__ = ["AletheosContextExtractor", "MuseInsight", "MuseDomain"]
+__all__ = ["AletheosContextExtractor", "MuseInsight", "MuseDomain", "MUSE_FIELDS"]
@@ -0,0 +1,462 @@
+"""
+Batch interpretation jobs for the WitnessOS Agent
+
+Pre-generates interpretations for many subjects in one run. Subjects are read
+from a JSONL file and expanded into one task per engine. Tasks whose prompts
+are identical (same prompt fingerprint, see interpretation_cache) share one
+LLM call, whose placeholder tokens are filled in for each subject. LLM calls run under a global
+requests-per-minute limit and the agent's per-model concurrency limits, and
+failed calls are retried with exponential backoff. Results are appended to a
+JSONL file and progress is checkpointed, so an interrupted job resumes where
+it stopped without repeating or duplicating finished tasks.
+
+Input lines:
+    {"id": "subscriber-1", "birth_data": {"name": "...", "date": "15.05.1990"},
+     "engines": ["numerology", "biorhythm"], "style": "mystical"}
+
+"engines", "style" and "model_type" default to the job's settings and "id" to
+the line number.
+
+Output lines:
+    {"task_id": "subscriber-1/numerology", "subject_id": "subscriber-1",
+     "engine": "numerology", "status": "success", "deduplicated": false,
+     "cached": false, "response": {...}}
+
+where response is what interpret_single_engine returns.
+
+Usage:
+    python batch_jobs.py subjects.jsonl results.jsonl --engines numerology,biorhythm
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .interpretation_cache import personalize
+except ImportError:
+    # Fallback for direct execution
+    from interpretation_cache import personalize
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchTask:
+    """One engine interpretation for one subject"""
+    subject_id: str
+    engine: str
+    birth_data: Dict[str, Any]
+    style: str
+    model_type: Optional[str]
+
+    @property
+    def task_id(self) -> str:
+        return f"{self.subject_id}/{self.engine}"
+
+
+class BatchTaskError(Exception):
+    """A task that failed for this run (calculation error or retries exhausted)"""
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket shared by all LLM calls of a job
+
+    Allows rate calls per second on average and bursts of up to burst calls.
+    Waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, timer=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.timer = timer
+        self.tokens = float(burst)
+        self.updated = timer()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a call may be made"""
+        async with self._lock:
+            while True:
+                now = self.timer()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BatchInterpretationJob:
+    """
+    Resumable batch of single-engine interpretations
+
+    The checkpoint (JSON, replaced atomically) records the finished task ids,
+    the tasks that failed and the size of the output when it was written. A
+    resumed job truncates the output to that size, skips the finished tasks
+    and retries the failed ones, so every task ends up on exactly one output
+    line.
+    """
+
+    def __init__(
+        self,
+        agent,
+        input_path: str,
+        output_path: str,
+        checkpoint_path: Optional[str] = None,
+        engines: Optional[List[str]] = None,
+        style: str = "balanced",
+        model_type: Optional[str] = None,
+        requests_per_minute: Optional[float] = None,
+        burst: int = 1,
+        max_in_flight: int = 16,
+        max_retries: int = 3,
+        retry_backoff: float = 2.0,
+        checkpoint_interval: float = 5.0,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            agent: WitnessOSAgent calculating and interpreting the tasks
+            input_path: JSONL file of subjects
+            output_path: JSONL file of results (replaced unless the job resumes
+                from a checkpoint)
+            checkpoint_path: Progress file (defaults to <output_path>.checkpoint.json)
+            engines: Engines for subjects that do not list their own
+            style: Interpretation style for subjects that do not set one
+            model_type: LLM model type for subjects that do not set one
+                (defaults to the agent's default model type)
+            requests_per_minute: Global limit on LLM requests (None for no limit
+                beyond the agent's concurrency limits)
+            burst: LLM requests allowed at once before the rate limit applies
+            max_in_flight: Tasks processed concurrently
+            max_retries: Retries of a failed LLM request
+            retry_backoff: Base of the exponential backoff between retries, in
+                seconds (each delay is drawn at random up to base * 2**retry)
+            checkpoint_interval: Minimum seconds between checkpoints
+            use_cache: Reuse and fill the agent's interpretation cache
+        """
+        self.agent = agent
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.checkpoint_path = Path(checkpoint_path or f"{output_path}.checkpoint.json")
+        self.engines = list(engines or [])
+        self.style = style
+        self.model_type = model_type
+        self.rate_limiter = AsyncRateLimiter(requests_per_minute / 60.0, burst) if requests_per_minute else None
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.checkpoint_interval = checkpoint_interval
+        self.use_cache = use_cache
+
+        self.completed: set = set()
+        self.failed: Dict[str, str] = {}
+        self.stats = {key: 0 for key in (
+            "tasks", "succeeded", "failed", "skipped", "duplicate_tasks", "invalid_lines",
+            "deduplicated", "cached", "llm_calls", "retries"
+        )}
+        # Generations (with placeholder tokens) of this run by prompt fingerprint (futures while in flight)
+        self._generations: Dict[str, asyncio.Future] = {}
+        self._output = None
+        self._last_checkpoint = 0.0
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run (or resume) the job
+
+        Returns:
+            Summary with task counts, LLM calls and the output and checkpoint paths
+
+        Raises:
+            FileNotFoundError: If the input file does not exist
+            ValueError: If the checkpoint belongs to a job with another input
+        """
+        if not self.input_path.is_file():
+            raise FileNotFoundError(f"Batch input not found: {self.input_path}")
+        offset = self._load_checkpoint()
+        started = time.monotonic()
+
+        self._output = open(self.output_path, "r+b" if self.output_path.exists() else "wb")
+        try:
+            # Lines written after the last checkpoint belong to tasks that run again
+            self._output.truncate(offset)
+            self._output.seek(offset)
+            self._last_checkpoint = time.monotonic()
+
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_in_flight)
+            workers = [asyncio.create_task(self._work(queue)) for _ in range(self.max_in_flight)]
+            producer = asyncio.create_task(self._produce(queue, len(workers)))
+            try:
+                await asyncio.gather(producer, *workers)
+            finally:
+                for task in (producer, *workers):
+                    task.cancel()
+                await asyncio.gather(producer, *workers, return_exceptions=True)
+        finally:
+            self._write_checkpoint()
+            self._output.close()
+
+        return {
+            "status": "completed" if not self.failed else "completed_with_failures",
+            **self.stats,
+            "duration": round(time.monotonic() - started, 3),
+            "output": str(self.output_path),
+            "checkpoint": str(self.checkpoint_path)
+        }
+
+    def read_tasks(self) -> Iterator[BatchTask]:
+        """Tasks of the input file in order (invalid lines are logged and skipped)"""
+        with open(self.input_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    subject = json.loads(line)
+                except ValueError as e:
+                    subject = None
+                    logger.error(f"{self.input_path}:{line_number}: invalid JSON: {e}")
+                if not isinstance(subject, dict) or not isinstance(subject.get("birth_data"), dict):
+                    if subject is not None:
+                        logger.error(f"{self.input_path}:{line_number}: expected an object with birth_data")
+                    self.stats["invalid_lines"] += 1
+                    continue
+
+                engines = subject.get("engines") or self.engines
+                if not engines:
+                    logger.error(f"{self.input_path}:{line_number}: no engines for subject")
+                    self.stats["invalid_lines"] += 1
+                    continue
+
+                subject_id = str(subject.get("id") or f"line-{line_number}")
+                for engine in dict.fromkeys(engines):
+                    yield BatchTask(
+                        subject_id=subject_id,
+                        engine=engine,
+                        birth_data=subject["birth_data"],
+                        style=subject.get("style") or self.style,
+                        model_type=subject.get("model_type") or self.model_type
+                    )
+
+    async def _produce(self, queue: asyncio.Queue, workers: int):
+        seen = set()
+        for task in self.read_tasks():
+            if task.task_id in self.completed:
+                self.stats["skipped"] += 1
+                continue
+            if task.task_id in seen:
+                self.stats["duplicate_tasks"] += 1
+                continue
+            seen.add(task.task_id)
+            self.stats["tasks"] += 1
+            await queue.put(task)
+        for _ in range(workers):
+            await queue.put(None)
+
+    async def _work(self, queue: asyncio.Queue):
+        while True:
+            task = await queue.get()
+            if task is None:
+                return
+            try:
+                record = await self._run_task(task)
+            except Exception as e:
+                logger.warning(f"Batch task {task.task_id} failed: {e}")
+                self.failed[task.task_id] = str(e)
+                self.stats["failed"] += 1
+                continue
+
+            self._output.write((json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+            self.completed.add(task.task_id)
+            self.failed.pop(task.task_id, None)
+            self.stats["succeeded"] += 1
+            if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+                self._write_checkpoint()
+
+    async def _run_task(self, task: BatchTask) -> Dict[str, Any]:
+        """
+        Calculate and interpret one task
+
+        Raises:
+            BatchTaskError: If the calculation or the interpretation failed
+        """
+        agent = self.agent
+        calculation = await agent._calculate_engine(task.engine, task.birth_data)
+        if calculation.get("status") != "success":
+            raise BatchTaskError(f"Calculation failed: {calculation.get('error', 'unknown error')}")
+
+        model_type = task.model_type or agent.default_model_type
+        messages, aletheos_context = agent._interpretation_prompt(
+            task.engine, calculation, task.birth_data, task.style)
+        fingerprint = agent._interpretation_fingerprint(task.engine, messages, aletheos_context, model_type)
+        cached = deduplicated = False
+        generation = None
+
+        pending = self._generations.get(fingerprint)
+        if pending is not None:
+            # Identical prompt generated (or being generated) for another subject
+            generation = await asyncio.shield(pending)
+            deduplicated = True
+            self.stats["deduplicated"] += 1
+        elif self.use_cache:
+            generation = agent.interpretation_cache.get(fingerprint)
+            cached = generation is not None
+            self.stats["cached"] += cached
+
+        if generation is None:
+            generation = await self._generate_once(fingerprint, task, messages, model_type)
+
+        return {
+            "task_id": task.task_id,
+            "subject_id": task.subject_id,
+            "engine": task.engine,
+            "status": "success",
+            "deduplicated": deduplicated,
+            "cached": cached,
+            "response": agent.response_formatter.format_single_engine_response(
+                engine_name=task.engine,
+                calculation_result=calculation,
+                ai_interpretation=personalize(generation, task.birth_data),
+                birth_data=task.birth_data
+            )
+        }
+
+    async def _generate_once(self, fingerprint: str, task: BatchTask, messages: List[Dict[str, str]],
+                             model_type: str) -> str:
+        """Generate a prompt's interpretation, sharing it with tasks of the same fingerprint"""
+        generation = asyncio.get_running_loop().create_future()
+        self._generations[fingerprint] = generation
+        try:
+            interpretation, model_name = await self._generate(task, messages, model_type)
+        except BaseException as e:
+            # Tasks waiting on this prompt fail with it; later ones generate it again
+            del self._generations[fingerprint]
+            if isinstance(e, asyncio.CancelledError):
+                generation.cancel()
+            else:
+                generation.set_exception(e)
+                generation.exception()  # retrieved: waiting tasks are optional
+            raise
+
+        generation.set_result(interpretation)
+        if self.use_cache:
+            self.agent.interpretation_cache.set(fingerprint, interpretation, model=model_name)
+        return interpretation
+
+    async def _generate(self, task: BatchTask, messages: List[Dict[str, str]],
+                        model_type: str) -> Tuple[str, Optional[str]]:
+        """
+        LLM interpretation of a task, within the rate limit and with retries
+
+        Returns:
+            (interpretation with placeholder tokens, name of the model that generated it)
+
+        Raises:
+            BatchTaskError: If every attempt failed
+        """
+        agent = self.agent
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                # Full jitter keeps retries of a failed burst from arriving together
+                self.stats["retries"] += 1
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** (attempt - 1)))
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+
+            self.stats["llm_calls"] += 1
+            try:
+                response = await agent._limited(model_type, lambda: agent._complete(messages, model_type))
+                return response["choices"][0]["message"]["content"], response.get("_model_name")
+            except asyncio.TimeoutError:
+                last_error = f"timed out after {agent.call_timeout}s"
+            except Exception as e:
+                last_error = str(e)
+            logger.warning(f"Interpretation of {task.task_id} failed (attempt {attempt + 1}): {last_error}")
+
+        raise BatchTaskError(f"Interpretation failed after {self.max_retries + 1} attempts: {last_error}")
+
+    def _load_checkpoint(self) -> int:
+        """Restore progress from the checkpoint, returning the output size to resume at"""
+        try:
+            state = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+
+        if state.get("input") != str(self.input_path):
+            raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a job with input {state.get('input')}")
+        self.completed = set(state.get("completed", []))
+        self.failed = dict(state.get("failed", {}))
+        logger.info(f"Resuming batch job: {len(self.completed)} tasks done, {len(self.failed)} to retry")
+        return state.get("output_offset", 0)
+
+    def _write_checkpoint(self):
+        """Atomically record progress (after making the output durable)"""
+        self._output.flush()
+        os.fsync(self._output.fileno())
+        state = {
+            "input": str(self.input_path),
+            "output": str(self.output_path),
+            "output_offset": self._output.tell(),
+            "completed": sorted(self.completed),
+            "failed": self.failed,
+            "stats": self.stats,
+            "updated": datetime.now().isoformat()
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.checkpoint_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.checkpoint_path)
+        self._last_checkpoint = time.monotonic()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WitnessOS batch interpretation job")
+    parser.add_argument("input", help="JSONL file of subjects")
+    parser.add_argument("output", help="JSONL file of results")
+    parser.add_argument("--checkpoint", help="Progress file (defaults to <output>.checkpoint.json)")
+    parser.add_argument("--engines", default="", help="Comma-separated engines for subjects without their own")
+    parser.add_argument("--style", default="balanced", help="Interpretation style")
+    parser.add_argument("--model-type", help="LLM model type")
+    parser.add_argument("--requests-per-minute", type=float, help="Global limit on LLM requests")
+    parser.add_argument("--max-in-flight", type=int, default=16, help="Tasks processed concurrently")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retries of a failed LLM request")
+    parser.add_argument("--log-level", default="info", help="Log level")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()),
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    try:
+        from .agent_service import WitnessOSAgent
+    except ImportError:
+        from agent_service import WitnessOSAgent
+
+    async def run() -> Dict[str, Any]:
+        agent = WitnessOSAgent()
+        try:
+            return await agent.run_batch_job(
+                args.input, args.output, checkpoint_path=args.checkpoint,
+                engines=[engine for engine in args.engines.split(",") if engine],
+                interpretation_style=args.style, model_type=args.model_type,
+                requests_per_minute=args.requests_per_minute, max_in_flight=args.max_in_flight,
+                max_retries=args.max_retries
+            )
+        finally:
+            await agent.aclose()
+
+    print(json.dumps(asyncio.run(run()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
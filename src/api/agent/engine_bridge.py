@@ -0,0 +1,110 @@
+"""
+In-process engine bridge for the WitnessOS Agent
+
+When the agent runs on the same host as the engines, calculations can skip
+the loopback HTTP hop: the bridge runs the agent's calculation request
+through the production API's own single-engine pipeline (birth data
+conversion, engine loading, result cache and thread pool) and returns the
+result as JSON-compatible data without serializing it to JSON text and
+parsing it back. Every engine the production API serves is available
+in-process, with the same result the API would return.
+
+The HTTP transport stays the default for remote deployments; select the
+bridge with WitnessOSAgent(engine_transport="in_process") or the
+WITNESSOS_ENGINE_TRANSPORT environment variable.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+from fastapi import HTTPException
+from pydantic_core import to_jsonable_python
+
+try:
+    from base.canonical import normalize_date
+    from base.data_models import EngineError
+    from base.serialization import encode_default
+except ImportError:
+    # Make the engines base package importable from the API layer
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "engines"))
+    from base.canonical import normalize_date
+    from base.data_models import EngineError
+    from base.serialization import encode_default
+
+try:
+    import production_api
+except ImportError:
+    # The production API imports the engines through the same base package
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "production"))
+    import production_api
+
+
+def build_engine_request(engine_name: str, data: Dict[str, Any]) -> "production_api.EngineRequest":
+    """
+    Production API request for an agent calculation request
+
+    Args:
+        engine_name: Engine to run
+        data: Request body the agent would POST to /calculate/{engine_name}
+
+    Raises:
+        ValueError: If the birth data is missing or invalid
+    """
+    birth_data = dict(data.get("birth_data") or {})
+    if birth_data.get("date"):
+        # The production API takes DD.MM.YYYY; the agent accepts any canonical date format
+        birth_data["date"] = datetime.fromisoformat(normalize_date(birth_data["date"])).strftime("%d.%m.%Y")
+    return production_api.EngineRequest(
+        engine_name=engine_name,
+        input_data=birth_data,
+        config=data.get("config"),
+        format="standard"
+    )
+
+
+class InProcessEngineBridge:
+    """
+    Engine transport calling the production API's engine pipeline directly
+
+    Results are the production API's /v1/engines/run results in the standard
+    format (engine, result, status, timestamp), converted to JSON-compatible
+    data as the API's JSON response would carry them.
+    """
+
+    def supports(self, engine_name: str) -> bool:
+        """Whether the production API serves the engine"""
+        return engine_name in production_api.AVAILABLE_ENGINES
+
+    async def calculate(self, engine_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calculate an engine for an agent request
+
+        Args:
+            engine_name: Engine to run
+            data: Request body the agent would POST to /calculate/{engine_name}
+
+        Raises:
+            EngineError: If the engine is not supported in-process, its input is
+                invalid or the calculation fails
+        """
+        if not self.supports(engine_name):
+            raise EngineError(f"Engine {engine_name} is not available in-process")
+
+        try:
+            request = build_engine_request(engine_name, data)
+            result = await production_api.calculate_single_engine(request)
+        except (TypeError, ValueError) as e:
+            raise EngineError(f"Invalid input for {engine_name}: {str(e)}")
+        except HTTPException as e:
+            raise EngineError(f"Invalid input for {engine_name}: {e.detail}")
+
+        if result.get("status") != "success":
+            raise EngineError(f"Engine {engine_name} failed: {result.get('error', 'unknown error')}")
+
+        # JSON-mode conversion with the API serializer's fallback (dates become strings)
+        return to_jsonable_python(result, fallback=encode_default)
+
+    async def aclose(self):
+        """Nothing to release: the engine thread pool is shared with the production API"""
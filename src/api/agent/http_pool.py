@@ -0,0 +1,88 @@
+"""
+Pooled HTTP clients for the WitnessOS Agent
+
+Long-lived httpx.AsyncClient instances with keep-alive connection pools, so
+interpretations and production API calls reuse TCP/TLS connections instead of
+handshaking on every request. HTTP/2 is negotiated when the optional h2
+package is installed (pip install 'httpx[http2]').
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from typing import Any
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AsyncClientPool:
+    """
+    One pooled AsyncClient per event loop
+
+    httpx connections belong to the event loop that opened them, so a client
+    is created lazily for each running loop and reused for every request made
+    on it. Call aclose() on shutdown (e.g. from a FastAPI shutdown hook).
+    """
+
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        **client_options: Any
+    ):
+        """
+        Args:
+            timeout: Default request timeout in seconds (requests may override it)
+            max_connections: Maximum concurrent connections per client
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection stays open
+            http2: Negotiate HTTP/2 when h2 is installed
+            **client_options: Further httpx.AsyncClient options (headers, base_url, ...)
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.debug("h2 is not installed, pooled clients use HTTP/1.1")
+        self.client_options = client_options
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> httpx.AsyncClient:
+        """Pooled client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                **self.client_options
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Close the running loop's client (clients of other loops die with their loop)"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def open_clients(self) -> int:
+        """Number of live clients across event loops"""
+        return sum(1 for client in self._clients.values() if not client.is_closed)
@@ -0,0 +1,272 @@
+"""
+Prompt-fingerprint interpretation cache for the WitnessOS Agent
+
+LLM interpretations are keyed by a fingerprint of what the prompt asks rather
+than who asks it: the rendered prompt (template, interpretation style,
+compacted calculation data and Aletheos context) and the model. Prompts never
+carry the subject's name, birth date, birth time or location, only
+placeholder tokens ({{name}}, {{birth_date}}, {{birth_time}}, {{location}}),
+so generations are stored with the tokens and no personal details. Two people
+with the same life path, or the same Human Design type and profile, share one
+generation, and the tokens are filled in for whoever it is served to.
+
+Entries live in a bounded in-memory tier and, optionally, in an on-disk tier
+(one JSON file per fingerprint) that survives restarts. Both tiers expire
+entries after a TTL and are bounded in size.
+"""
+
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+try:
+    from base.cache import TTLCache
+    from base.canonical import content_hash
+except ImportError:
+    # Make the engines base package importable from the API layer
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "engines"))
+    from base.cache import TTLCache
+    from base.canonical import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Placeholder tokens standing in for the subject's details in prompts and
+# generations, by birth data field
+SUBJECT_PLACEHOLDERS = {
+    "name": "{{name}}",
+    "date": "{{birth_date}}",
+    "time": "{{birth_time}}",
+    "location": "{{location}}",
+}
+
+# Served in place of details the subject did not give
+PLACEHOLDER_FALLBACKS = {
+    "name": "you",
+    "date": "your birth date",
+    "time": "your birth time",
+    "location": "your birthplace",
+}
+
+_PLACEHOLDER_PATTERN = re.compile("|".join(re.escape(token) for token in SUBJECT_PLACEHOLDERS.values()))
+_MAX_PLACEHOLDER_LENGTH = max(len(token) for token in SUBJECT_PLACEHOLDERS.values())
+
+
+def subject_placeholders(birth_data: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Birth data with the subject's details replaced by placeholder tokens, for prompts"""
+    return {**(birth_data or {}), **SUBJECT_PLACEHOLDERS}
+
+
+def personalize(text: str, birth_data: Optional[Mapping[str, Any]]) -> str:
+    """Fill the placeholder tokens of a generation with the subject's details"""
+    birth_data = birth_data or {}
+    values = {
+        token: str(birth_data.get(key) or "").strip() or PLACEHOLDER_FALLBACKS[key]
+        for key, token in SUBJECT_PLACEHOLDERS.items()
+    }
+    # One pass, so details are never themselves searched for tokens
+    return _PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(0)], text)
+
+
+class StreamPersonalizer:
+    """
+    Personalizes a streamed generation chunk by chunk
+
+    A placeholder token split across chunks is held back until it is complete.
+    """
+
+    def __init__(self, birth_data: Optional[Mapping[str, Any]]):
+        self.birth_data = birth_data
+        self.pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Personalized text of a chunk that can be sent on"""
+        text = self.pending + chunk
+        cut = len(text)
+        for start in range(max(0, len(text) - _MAX_PLACEHOLDER_LENGTH + 1), len(text)):
+            tail = text[start:]
+            if any(token.startswith(tail) and token != tail for token in SUBJECT_PLACEHOLDERS.values()):
+                cut = start
+                break
+        self.pending = text[cut:]
+        return personalize(text[:cut], self.birth_data)
+
+    def finish(self) -> str:
+        """Personalized text held back at the end of the stream"""
+        text, self.pending = self.pending, ""
+        return personalize(text, self.birth_data)
+
+
+def prompt_fingerprint(
+    template_id: str,
+    model: str,
+    messages: List[Mapping[str, str]],
+    context: Optional[str] = None
+) -> str:
+    """
+    Fingerprint of a rendered prompt
+
+    Prompts carry placeholder tokens instead of the subject's details (see
+    subject_placeholders), so subjects whose prompts agree on everything else
+    (results, style, Aletheos context) share a fingerprint.
+
+    Args:
+        template_id: Prompt template (engine name, or "synthesis")
+        model: Model the prompt is sent to
+        messages: Chat messages as sent
+        context: Rendered context the prompt was built with, such as the
+            Aletheos context derived from the subject's birth date
+
+    Returns:
+        32-character hex digest
+    """
+    return content_hash(template_id, {"model": model, "messages": messages, "context": context})
+
+
+class InterpretationCache:
+    """
+    Two-tier cache of LLM generations keyed by prompt fingerprint
+
+    The memory tier is a TTLCache bounded by entry count and text size; the
+    disk tier (enabled by cache_dir) is bounded by total file size, evicting
+    the least recently written files first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        maxbytes: int = 32 * 1024 * 1024,
+        ttl: Optional[float] = 7 * 24 * 3600,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Args:
+            maxsize: Maximum generations kept in memory
+            maxbytes: Maximum total size of the generations kept in memory
+            ttl: Seconds a generation stays valid in either tier (None for no expiry)
+            cache_dir: Directory of the on-disk tier (None for memory only)
+            max_disk_bytes: Maximum total size of the on-disk tier
+        """
+        self.ttl = ttl
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl, maxbytes=maxbytes,
+                               sizeof=lambda entry: len(entry["text"]))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Cached generation for a fingerprint (with placeholder tokens, see personalize)"""
+        entry = self.memory.get(fingerprint)
+        if entry is None and self.cache_dir is not None:
+            entry = self._read(fingerprint)
+            if entry is not None:
+                # Promoted entries keep their original expiry
+                remaining = None if self.ttl is None else self.ttl - (time.time() - entry.get("created", 0))
+                self.memory.set(fingerprint, entry, ttl=remaining)
+        if entry is None:
+            return None
+        return entry["text"]
+
+    def set(self, fingerprint: str, text: str, **metadata: Any):
+        """Store a generation (with placeholder tokens) under its fingerprint"""
+        entry = {"text": text, "created": time.time(), **metadata}
+        self.memory[fingerprint] = entry
+        if self.cache_dir is not None:
+            self._write(fingerprint, entry)
+
+    def clear(self):
+        """Drop all generations from both tiers"""
+        self.memory.clear()
+        if self.cache_dir is not None:
+            with self._disk_lock:
+                for path, _, _ in self._disk_entries():
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes of both tiers"""
+        stats = {"memory": self.memory.stats(), "ttl": self.ttl}
+        if self.cache_dir is not None:
+            stats["disk"] = {
+                "directory": str(self.cache_dir),
+                "hits": self.disk_hits,
+                "misses": self.disk_misses,
+                "bytes": self._disk_bytes,
+                "max_bytes": self.max_disk_bytes
+            }
+        return stats
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.cache_dir / fingerprint[:2] / f"{fingerprint}.json"
+
+    def _disk_entries(self):
+        """(path, size, mtime) of the on-disk entries"""
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def _read(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        path = self._path(fingerprint)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            self.disk_misses += 1
+            return None
+
+        if self.ttl is not None and time.time() - entry.get("created", 0) > self.ttl:
+            with self._disk_lock:
+                self._unlink(path)
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        return entry
+
+    def _write(self, fingerprint: str, entry: Dict[str, Any]):
+        path = self._path(fingerprint)
+        data = json.dumps(entry, default=str).encode("utf-8")
+        with self._disk_lock:
+            try:
+                path.parent.mkdir(exist_ok=True)
+                self._unlink(path)
+                # Atomic replace so concurrent readers never see a partial entry
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+                self._disk_bytes += len(data)
+            except OSError as e:
+                logger.warning(f"Could not write interpretation cache entry {fingerprint}: {e}")
+                return
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+
+    def _unlink(self, path: Path):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            self._disk_bytes -= size
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Remove the oldest files until the disk tier fits its budget"""
+        for path, _, _ in sorted(self._disk_entries(), key=lambda entry: entry[2]):
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._unlink(path)
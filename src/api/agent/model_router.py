@@ -0,0 +1,280 @@
+"""
+Adaptive model routing for the WitnessOS Agent
+
+Tracks rolling latency (p50/p95) and timeout, rate-limit and error rates for
+every model, opens a circuit breaker on models that keep failing so requests
+stop paying for them, and orders the models of a request by observed
+performance. The OpenRouter client uses the router to pick the attempt order
+and to decide when to hedge a slow request to a second model.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a model call
+SUCCESS = "success"
+TIMEOUT = "timeout"
+RATE_LIMITED = "rate_limited"
+ERROR = "error"
+OUTCOMES = (SUCCESS, TIMEOUT, RATE_LIMITED, ERROR)
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ModelStats:
+    """Rolling window of call latencies and outcomes for one model"""
+
+    def __init__(self, window: int = 100):
+        self.samples: Deque[Tuple[float, str]] = deque(maxlen=window)
+
+    def record(self, latency: float, outcome: str):
+        self.samples.append((latency, outcome))
+
+    def rate(self, outcome: str) -> float:
+        """Share of the window's calls that ended with outcome"""
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, result in self.samples if result == outcome) / len(self.samples)
+
+    @property
+    def failure_rate(self) -> float:
+        return 1.0 - self.rate(SUCCESS) if self.samples else 0.0
+
+    def latency(self, fraction: float) -> Optional[float]:
+        """Latency percentile of successful calls"""
+        return _percentile(sorted(latency for latency, result in self.samples if result == SUCCESS), fraction)
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.latency(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.latency(0.95)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        p50, p95 = self.p50, self.p95
+        return {
+            "calls": len(self.samples),
+            "p50": round(p50, 4) if p50 is not None else None,
+            "p95": round(p95, 4) if p95 is not None else None,
+            "timeout_rate": round(self.rate(TIMEOUT), 4),
+            "rate_limit_rate": round(self.rate(RATE_LIMITED), 4),
+            "error_rate": round(self.rate(ERROR), 4)
+        }
+
+
+class CircuitBreaker:
+    """
+    Per-model circuit breaker
+
+    Opens after failure_threshold consecutive failures (or for the
+    Retry-After period of a rate limit), rejects calls while open, and after
+    reset_timeout lets a single probe through (half-open): a successful probe
+    closes the breaker, a failed one opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 timer: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timer = timer
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_until = 0.0
+
+    def ready(self) -> bool:
+        """Whether a call would be allowed now (without claiming the probe)"""
+        return self.state == CLOSED or self.timer() >= self.open_until
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (claims the probe when half-opening)"""
+        if self.state == CLOSED:
+            return True
+        now = self.timer()
+        if now < self.open_until:
+            return False
+        # One probe per reset_timeout until a probe reports back
+        self.state = HALF_OPEN
+        self.open_until = now + self.reset_timeout
+        return True
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold or retry_after:
+            self.trip(retry_after or self.reset_timeout)
+
+    def trip(self, duration: float):
+        self.state = OPEN
+        self.opened_at = self.timer()
+        self.open_until = self.opened_at + duration
+
+
+class ModelRouter:
+    """
+    Routes requests across models by observed performance
+
+    Ordering: models with an open breaker are skipped; the preferred (first)
+    candidate keeps its place while healthy; the rest are ordered healthy
+    first, then by observed p50 latency (models without enough samples after
+    measured ones), then by their configured order.
+
+    Ranking does not claim a half-open breaker's probe: the caller claims it
+    with acquire() when it actually calls the model, so models ranked below
+    the one that answers keep their probe for a later request.
+    """
+
+    def __init__(
+        self,
+        window: int = 100,
+        min_samples: int = 5,
+        degraded_failure_rate: float = 0.25,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        hedge_after: Optional[float] = 8.0,
+        min_hedge_delay: float = 1.0,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            window: Calls per model kept for latency and rate statistics
+            min_samples: Calls needed before a model's statistics affect routing
+            degraded_failure_rate: Failure rate above which a model is unhealthy
+            failure_threshold: Consecutive failures that open a model's breaker
+            reset_timeout: Seconds a breaker stays open before a probe
+            hedge_after: Seconds before a slow request is hedged to a second model
+                when the model has too few samples (None disables hedging)
+            min_hedge_delay: Lower bound of the p95-based hedge delay
+            timer: Monotonic clock, injectable for tests
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.degraded_failure_rate = degraded_failure_rate
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_after = hedge_after
+        self.min_hedge_delay = min_hedge_delay
+        self.timer = timer
+        self.stats: Dict[str, ModelStats] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _model(self, model_type: str) -> Tuple[ModelStats, CircuitBreaker]:
+        if model_type not in self.stats:
+            self.stats[model_type] = ModelStats(self.window)
+            self.breakers[model_type] = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.timer)
+        return self.stats[model_type], self.breakers[model_type]
+
+    def record(self, model_type: str, latency: float, outcome: str, retry_after: Optional[float] = None):
+        """
+        Record the outcome of a call
+
+        Args:
+            model_type: Model called
+            latency: Seconds the call took
+            outcome: One of SUCCESS, TIMEOUT, RATE_LIMITED, ERROR
+            retry_after: Seconds the provider asked to wait (rate limits)
+        """
+        with self._lock:
+            stats, breaker = self._model(model_type)
+            stats.record(latency, outcome)
+            if outcome == SUCCESS:
+                breaker.record_success()
+            else:
+                was_open = breaker.state == OPEN
+                breaker.record_failure(retry_after)
+                if breaker.state == OPEN and not was_open:
+                    logger.warning(f"Circuit opened for {model_type} after {outcome} "
+                                   f"({breaker.open_until - breaker.opened_at:.0f}s)")
+
+    def healthy(self, model_type: str) -> bool:
+        """Whether a model's recent failure rate is acceptable"""
+        stats, _ = self._model(model_type)
+        return len(stats.samples) < self.min_samples or stats.failure_rate <= self.degraded_failure_rate
+
+    def _score(self, model_type: str, position: int) -> Tuple:
+        stats, _ = self._model(model_type)
+        measured = len(stats.samples) >= self.min_samples and stats.p50 is not None
+        return (not self.healthy(model_type), not measured, stats.p50 if measured else 0.0, position)
+
+    def rank(self, candidates: Iterable[str]) -> List[str]:
+        """
+        Order candidate models for a request
+
+        Args:
+            candidates: Model types in configured order, preferred first
+
+        Returns:
+            Models to try in order; if every breaker is open, the model whose
+            breaker opened first (failing open rather than refusing the request)
+        """
+        candidates = list(dict.fromkeys(candidates))
+        with self._lock:
+            allowed = [m for m in candidates if self._model(m)[1].ready()]
+            if not allowed:
+                return sorted(candidates, key=lambda m: self.breakers[m].opened_at)[:1]
+
+            position = {model: index for index, model in enumerate(candidates)}
+            preferred = allowed[0] if allowed[0] == candidates[0] and self.healthy(allowed[0]) else None
+            rest = sorted((m for m in allowed if m != preferred), key=lambda m: self._score(m, position[m]))
+            return ([preferred] if preferred else []) + rest
+
+    def acquire(self, model_type: str) -> bool:
+        """
+        Claim a call to a model, just before making it
+
+        Claims the probe of a breaker that is due to half-open. A call is
+        refused while the model's breaker is open or its probe is in flight,
+        unless every model's breaker is (failing open, as rank does).
+
+        Returns:
+            Whether the call may be made
+        """
+        with self._lock:
+            _, breaker = self._model(model_type)
+            if breaker.allow():
+                return True
+            return not any(other.ready() for other in self.breakers.values())
+
+    def hedge_delay(self, model_type: str) -> Optional[float]:
+        """
+        Seconds to wait on a model before hedging to a second one
+
+        The model's p95 latency once it has enough samples (a response slower
+        than that is an outlier worth racing), otherwise hedge_after.
+        """
+        if self.hedge_after is None:
+            return None
+        stats, _ = self._model(model_type)
+        p95 = stats.p95
+        if len(stats.samples) >= self.min_samples and p95 is not None:
+            return max(self.min_hedge_delay, p95)
+        return self.hedge_after
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-model statistics and breaker state"""
+        with self._lock:
+            return {
+                model: {**self.stats[model].summary(), "circuit": self.breakers[model].state}
+                for model in self.stats
+            }
@@ -2,19 +2,37 @@
 OpenRouter API Client for WitnessOS Agent
 
 Handles communication with OpenRouter API for accessing various language models.
-Supports dynamic model selection and response streaming.
+Supports dynamic model selection and response streaming over a pooled,
+keep-alive HTTP client. Models are tried in the order chosen by the adaptive
+model router (observed latency and failures, circuit breakers), and slow
+requests are hedged to a second model.
 """
 
+import asyncio
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional, AsyncGenerator
+import time
+from typing import Dict, List, Any, Optional, AsyncGenerator, AsyncIterator, Tuple
 from dataclasses import dataclass
 import httpx
 
+try:
+    from .http_pool import AsyncClientPool
+    from .model_router import ModelRouter, SUCCESS, TIMEOUT, RATE_LIMITED, ERROR
+    from .prompt_compaction import count_message_tokens
+except ImportError:
+    # Fallback for direct execution
+    from http_pool import AsyncClientPool
+    from model_router import ModelRouter, SUCCESS, TIMEOUT, RATE_LIMITED, ERROR
+    from prompt_compaction import count_message_tokens
+
 
 logger = logging.getLogger(__name__)
 
+# Smallest completion worth sending a request for
+MIN_COMPLETION_TOKENS = 256
+
 
 @dataclass
 class ModelConfig:
@@ -36,18 +54,28 @@ class OpenRouterClient:
     based on task requirements and cost considerations.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_pool: Optional[AsyncClientPool] = None,
+        router: Optional[ModelRouter] = None,
+        base_url: Optional[str] = None
+    ):
         """
         Initialize OpenRouter client
         
         Args:
             api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
+            http_pool: Pooled HTTP client to use (defaults to a dedicated pool)
+            router: Adaptive model router (defaults to a dedicated router)
+            base_url: API base URL (defaults to OPENROUTER_BASE_URL env var, then
+                OpenRouter; point it at a local mock endpoint for testing)
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             raise ValueError("OpenRouter API key not provided. Set OPENROUTER_API_KEY environment variable.")
         
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = (base_url or os.getenv("OPENROUTER_BASE_URL") or "https://openrouter.ai/api/v1").rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -55,6 +83,12 @@ class OpenRouterClient:
             "X-Title": "WitnessOS Consciousness Agent"
         }
         
+        # Connections to OpenRouter are kept alive across requests and fallbacks
+        self.http_pool = http_pool or AsyncClientPool()
+
+        # Latency/error telemetry, circuit breakers and hedging across models
+        self.router = router or ModelRouter()
+        
         # Available free models with fallback order
         self.models = {
             "primary": ModelConfig(
@@ -109,90 +143,250 @@ class OpenRouterClient:
         """
         Generate response using specified model with automatic fallback
 
+        Models are tried in the router's order (models with an open circuit
+        are skipped). When a model has not answered within its hedge delay,
+        the next model is raced against it and the first answer wins.
+
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             model_type: Type of model to use (defaults to 'primary')
-            stream: Whether to stream the response
+            stream: Whether to stream the response (returns stream_response's
+                async iterator of text chunks instead of a dictionary)
             **kwargs: Additional parameters to override model config
 
         Returns:
             Response dictionary with generated content
         """
-        # If specific model type requested, try it first, then fallback
-        if model_type in self.models:
-            models_to_try = [model_type] + [m for m in self.fallback_order if m != model_type]
-        else:
-            # Use fallback order if unknown model type
-            models_to_try = self.fallback_order
+        if stream:
+            return self.stream_response(messages, model_type=model_type, timeout=timeout, **kwargs)
+
+        models_to_try, prompt_tokens = self._models_for(messages, model_type)
 
         last_error = None
+        attempts = 0
+        next_model = 0
+        tasks: Dict[asyncio.Task, str] = {}
 
-        for attempt, current_model_type in enumerate(models_to_try):
-            model_config = self.models[current_model_type]
+        try:
+            while next_model < len(models_to_try):
+                current_model_type = models_to_try[next_model]
+                next_model += 1
+                attempts += 1
+                task = asyncio.create_task(self._attempt(
+                    current_model_type, messages, prompt_tokens, timeout, kwargs))
+                tasks = {task: current_model_type}
+                hedge_delay = self.router.hedge_delay(current_model_type)
 
-            # Prepare request payload
-            payload = {
-                "model": model_config.name,
-                "messages": messages,
-                "max_tokens": kwargs.get("max_tokens", model_config.max_tokens),
-                "temperature": kwargs.get("temperature", model_config.temperature),
-                "top_p": kwargs.get("top_p", model_config.top_p),
-                "stream": stream
-            }
+                pending = {task}
+                while pending:
+                    # Race the next model whenever a single request is left in flight
+                    can_hedge = hedge_delay is not None and len(pending) == 1 and next_model < len(models_to_try)
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=hedge_delay if can_hedge else None,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
 
-            try:
-                logger.info(f"Attempting request with {current_model_type} model: {model_config.name}")
-
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    if stream:
-                        return await self._stream_response(client, payload)
-                    else:
-                        response = await client.post(
-                            f"{self.base_url}/chat/completions",
-                            headers=self.headers,
-                            json=payload
-                        )
-                        response.raise_for_status()
-                        result = response.json()
-
-                        # Add metadata about which model was used
-                        result["_model_used"] = current_model_type
-                        result["_model_name"] = model_config.name
-                        result["_attempt"] = attempt + 1
-
-                        logger.info(f"Successfully generated response with {current_model_type} model")
+                    if not done:
+                        hedge_model_type = models_to_try[next_model]
+                        next_model += 1
+                        attempts += 1
+                        logger.info(f"No response from {current_model_type} after {hedge_delay:.1f}s, "
+                                    f"hedging with {hedge_model_type}")
+                        hedge = asyncio.create_task(self._attempt(
+                            hedge_model_type, messages, prompt_tokens, timeout, kwargs))
+                        tasks[hedge] = hedge_model_type
+                        pending.add(hedge)
+                        continue
+
+                    for finished in done:
+                        try:
+                            result = finished.result()
+                        except Exception as e:
+                            last_error = str(e)
+                            continue
+
+                        result["_attempt"] = attempts
+                        result["_hedged"] = len(tasks) > 1
                         return result
 
-            except (httpx.TimeoutException, httpx.ConnectTimeout, httpx.ReadTimeout) as e:
-                last_error = f"Timeout with {current_model_type}: {e}"
-                logger.warning(f"Timeout with {current_model_type} model, trying next fallback...")
-                continue
+                logger.warning(f"{' and '.join(tasks.values())} failed, trying next fallback...")
+        finally:
+            # Losing (or abandoned) hedges are cancelled, not left running
+            outstanding = [task for task in tasks if not task.done()]
+            for task in outstanding:
+                task.cancel()
+            if outstanding:
+                await asyncio.gather(*outstanding, return_exceptions=True)
+
+        # If all models failed
+        raise Exception(f"All models failed. Last error: {last_error}")
+
+    async def _attempt(
+        self,
+        model_type: str,
+        messages: List[Dict[str, str]],
+        prompt_tokens: int,
+        timeout: float,
+        overrides: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        One request to one model, recorded in the router's telemetry
+
+        Raises:
+            Exception: Describing the failure (circuit open, timeout, HTTP status or other error)
+        """
+        model_config = self.models[model_type]
+        payload = self._payload(model_type, messages, prompt_tokens, overrides, stream=False)
+
+        if not self.router.acquire(model_type):
+            # Another request claimed the model's probe (or its breaker opened) since ranking
+            raise Exception(f"Circuit open for {model_type}")
+
+        logger.info(f"Attempting request with {model_type} model: {model_config.name}")
+        started = time.monotonic()
+        try:
+            client = self.http_pool.get()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload,
+                timeout=timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+
+        except Exception as e:
+            raise self._failure(model_type, started, e)
+
+        self.router.record(model_type, time.monotonic() - started, SUCCESS)
+
+        # Add metadata about which model was used
+        result["_model_used"] = model_type
+        result["_model_name"] = model_config.name
+
+        logger.info(f"Successfully generated response with {model_type} model")
+        return result
+
+    async def stream_response(
+        self,
+        messages: List[Dict[str, str]],
+        model_type: str = "primary",
+        timeout: float = 30.0,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response as text chunks, with automatic fallback
+
+        Models are tried in the router's order until one starts answering;
+        after the first chunk the stream is committed to that model.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model_type: Type of model to use (defaults to 'primary')
+            timeout: Seconds to wait for the connection and between chunks
+            **kwargs: Additional parameters to override model config
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in [429, 503, 502, 504]:  # Rate limit or server errors
-                    last_error = f"Server error {e.response.status_code} with {current_model_type}: {e}"
-                    logger.warning(f"Server error {e.response.status_code} with {current_model_type} model, trying next fallback...")
-                    continue
-                else:
-                    last_error = f"HTTP error {e.response.status_code} with {current_model_type}: {e}"
-                    logger.error(f"HTTP error {e.response.status_code} with {current_model_type} model: {e}")
-                    continue
+        Yields:
+            Content chunks as the model generates them
+        """
+        models_to_try, prompt_tokens = self._models_for(messages, model_type)
+        last_error = None
 
+        for current_model_type in models_to_try:
+            if not self.router.acquire(current_model_type):
+                last_error = f"Circuit open for {current_model_type}"
+                continue
+            payload = self._payload(current_model_type, messages, prompt_tokens, kwargs, stream=True)
+            logger.info(f"Streaming with {current_model_type} model: {payload['model']}")
+            started = time.monotonic()
+            streamed = False
+            try:
+                async for chunk in self._stream_response(self.http_pool.get(), payload, timeout):
+                    streamed = True
+                    yield chunk
             except Exception as e:
-                last_error = f"Unexpected error with {current_model_type}: {e}"
-                logger.error(f"Unexpected error with {current_model_type} model: {e}")
+                failure = self._failure(current_model_type, started, e)
+                if streamed:
+                    raise failure
+                last_error = str(failure)
                 continue
 
-        # If all models failed
+            self.router.record(current_model_type, time.monotonic() - started, SUCCESS)
+            return
+
         raise Exception(f"All models failed. Last error: {last_error}")
-    
-    async def _stream_response(self, client: httpx.AsyncClient, payload: Dict) -> AsyncGenerator[str, None]:
+
+    def _models_for(self, messages: List[Dict[str, str]], model_type: str) -> Tuple[List[str], int]:
+        """Models to try for a prompt, in routing order, and the prompt's token count"""
+        # If specific model type requested, try it first, then fallback
+        if model_type in self.models:
+            models_to_try = [model_type] + [m for m in self.fallback_order if m != model_type]
+        else:
+            # Use fallback order if unknown model type
+            models_to_try = self.fallback_order
+
+        # Skip models whose context window cannot hold the prompt (they would only fail)
+        prompt_tokens = count_message_tokens(messages)
+        fitting = [m for m in models_to_try if self._fits(m, prompt_tokens)]
+        if len(fitting) < len(models_to_try):
+            logger.info(f"Prompt of ~{prompt_tokens} tokens skips models: "
+                        f"{[m for m in models_to_try if m not in fitting]}")
+        return self.router.rank(fitting or [self.select_model_for_prompt(prompt_tokens, model_type)]), prompt_tokens
+
+    def _payload(self, model_type: str, messages: List[Dict[str, str]], prompt_tokens: int,
+                 overrides: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+        """Chat completion request body for a model"""
+        model_config = self.models[model_type]
+        return {
+            "model": model_config.name,
+            "messages": messages,
+            "max_tokens": min(overrides.get("max_tokens", model_config.max_tokens),
+                              max(1, model_config.context_window - prompt_tokens)),
+            "temperature": overrides.get("temperature", model_config.temperature),
+            "top_p": overrides.get("top_p", model_config.top_p),
+            "stream": stream
+        }
+
+    def _failure(self, model_type: str, started: float, error: Exception) -> Exception:
+        """Record a failed call in the router and describe it"""
+        elapsed = time.monotonic() - started
+        if isinstance(error, httpx.TimeoutException):
+            self.router.record(model_type, elapsed, TIMEOUT)
+            logger.warning(f"Timeout with {model_type} model")
+            return Exception(f"Timeout with {model_type}: {error}")
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status == 429:
+                self.router.record(model_type, elapsed, RATE_LIMITED,
+                                   retry_after=self._retry_after(error.response))
+            else:
+                self.router.record(model_type, elapsed, ERROR)
+            logger.warning(f"HTTP error {status} with {model_type} model: {error}")
+            return Exception(f"HTTP error {status} with {model_type}: {error}")
+
+        self.router.record(model_type, elapsed, ERROR)
+        logger.error(f"Unexpected error with {model_type} model: {error}")
+        return Exception(f"Unexpected error with {model_type}: {error}")
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds from a Retry-After header, if given as a number"""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    async def _stream_response(self, client: httpx.AsyncClient, payload: Dict,
+                               timeout: float = 30.0) -> AsyncGenerator[str, None]:
         """Stream response from OpenRouter API"""
         async with client.stream(
             "POST",
             f"{self.base_url}/chat/completions",
             headers=self.headers,
-            json=payload
+            json=payload,
+            timeout=timeout
         ) as response:
             response.raise_for_status()
             async for line in response.aiter_lines():
@@ -209,6 +403,10 @@ class OpenRouterClient:
                     except json.JSONDecodeError:
                         continue
     
+    async def aclose(self):
+        """Close pooled connections (call on application shutdown)"""
+        await self.http_pool.aclose()
+    
     def get_model_info(self, model_type: str) -> ModelConfig:
         """Get information about a specific model"""
         if model_type not in self.models:
@@ -219,6 +417,29 @@ class OpenRouterClient:
         """List all available models"""
         return self.models.copy()
     
+    def _fits(self, model_type: str, prompt_tokens: int) -> bool:
+        """Whether the prompt leaves room for a useful completion in the model's context window"""
+        return prompt_tokens + MIN_COMPLETION_TOKENS <= self.models[model_type].context_window
+
+    def select_model_for_prompt(self, prompt_tokens: int, model_type: str = "primary") -> str:
+        """
+        Model type whose context window fits a prompt
+
+        Args:
+            prompt_tokens: Prompt size in tokens (see prompt_compaction.count_message_tokens)
+            model_type: Preferred model type, kept when it fits
+
+        Returns:
+            The preferred model type if it fits, else the first fitting model in
+            fallback order, else the model with the largest context window
+        """
+        if model_type in self.models and self._fits(model_type, prompt_tokens):
+            return model_type
+        for candidate in self.fallback_order:
+            if self._fits(candidate, prompt_tokens):
+                return candidate
+        return max(self.models, key=lambda m: self.models[m].context_window)
+
     def select_optimal_model(self, task_type: str = "interpretation", complexity: str = "medium") -> str:
         """
         Select optimal model based on task type and complexity
@@ -230,7 +451,7 @@ class OpenRouterClient:
         Returns:
             Model type string
         """
-        # Always use primary model first (Microsoft Phi-4) with automatic fallback
+        # The best-performing model of the fallback chain, as observed by the router
         # Parameters kept for API compatibility but not used since we have a single fallback chain
         _ = task_type, complexity  # Acknowledge parameters to avoid warnings
-        return "primary"
+        return self.router.rank(self.fallback_order)[0]
@@ -0,0 +1,199 @@
+"""
+Prompt compaction for the WitnessOS Agent
+
+Calculation payloads are large (formatted engine reports, letter-by-letter
+name analysis, request echoes) while the prompt templates only need the
+results. This stage keeps the template-relevant fields of each engine,
+encodes them as compact JSON, counts tokens up front and shrinks the data to
+a token budget, so prompts fit the context windows of the configured models
+instead of failing over to larger ones.
+
+Token counts use tiktoken when it is installed (pip install tiktoken) and a
+conservative characters-per-token estimate otherwise.
+"""
+
+import importlib.util
+import json
+import math
+from typing import Any, Dict, List, Mapping, Optional
+
+TIKTOKEN_AVAILABLE = importlib.util.find_spec("tiktoken") is not None
+
+# JSON and symbol-heavy text averages well under 4 characters per token
+CHARS_PER_TOKEN = 3
+
+# Per-message framing tokens added by chat formats
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Fields never worth prompt tokens: request echoes, bookkeeping and the
+# engine's own formatted report (a long restatement of the results)
+NOISE_FIELDS = frozenset({
+    "input", "birth_data", "timestamp", "status", "engine", "engine_name",
+    "calculation_time", "transport", "interpretation", "formatted_output",
+    "name_analysis", "session_id", "user_id", "mock_data", "note"
+})
+
+# Fields the interpretation templates work with, most important first.
+# Engines without an entry (or whose payload has none of these) keep all
+# non-noise fields.
+ENGINE_PROMPT_FIELDS: Dict[str, tuple] = {
+    "numerology": ("core_numbers", "life_path", "expression", "soul_urge", "personality",
+                   "personal_year", "maturity", "master_numbers", "karmic_debt", "bridge_numbers",
+                   "system", "calculation_year", "recommendations", "archetypal_themes"),
+    "biorhythm": ("snapshot", "cycles", "physical", "emotional", "intellectual", "critical_days",
+                  "best_days", "challenging_days", "recommendations", "archetypal_themes", "forecast"),
+    "human_design": ("type", "personality_type", "strategy", "authority", "profile", "definition",
+                     "incarnation_cross", "centers", "defined_centers", "channels", "gates",
+                     "recommendations", "archetypal_themes"),
+    "gene_keys": ("activation_sequence", "life_work", "evolution", "radiance", "purpose",
+                  "venus_sequence", "pearl_sequence", "gene_keys", "recommendations",
+                  "archetypal_themes"),
+    "vimshottari": ("current_dasha", "current_mahadasha", "sub_period", "current_antardasha", "duration",
+                    "upcoming_periods", "nakshatra", "recommendations", "archetypal_themes"),
+    "tarot": ("spread_type", "cards_drawn", "spread", "cards", "question", "recommendations",
+              "archetypal_themes"),
+    "iching": ("hexagram", "hexagram_name", "changing_lines", "changing_hexagram", "question",
+               "recommendations", "archetypal_themes"),
+    "enneagram": ("type", "primary_type", "wing", "instinctual_variant", "tritype",
+                  "growth_direction", "stress_direction", "recommendations", "archetypal_themes"),
+}
+
+# Shrinking steps tried in order until the data fits: (max list items, max string length)
+_SHRINK_STEPS = ((20, 600), (8, 240), (4, 120), (2, 60))
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text (exact with tiktoken, estimated otherwise)"""
+    global _encoding
+    if TIKTOKEN_AVAILABLE:
+        if _encoding is None:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        return len(_encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """Prompt tokens of a chat message list"""
+    return sum(count_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+
+def compact_json(data: Any) -> str:
+    """Compact JSON encoding (no indentation or padding, unicode kept as is)"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _clean(value: Any) -> Any:
+    """Drop noise fields and empty values, round floats"""
+    if isinstance(value, Mapping):
+        cleaned = {key: _clean(item) for key, item in value.items() if key not in NOISE_FIELDS}
+        return {key: item for key, item in cleaned.items() if item not in (None, "", [], {})}
+    if isinstance(value, (list, tuple)):
+        return [_clean(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 3)
+    return value
+
+
+def _shrink(value: Any, max_items: int, max_chars: int) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _shrink(item, max_items, max_chars) for key, item in value.items()}
+    if isinstance(value, list):
+        shrunk = [_shrink(item, max_items, max_chars) for item in value[:max_items]]
+        if len(value) > max_items:
+            shrunk.append(f"... {len(value) - max_items} more")
+        return shrunk
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "..."
+    return value
+
+
+def extract_prompt_fields(engine_name: str, calculation_data: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Template-relevant fields of an engine result, most important first
+
+    Results nested under "result"/"results" (production API shapes) are
+    unwrapped first.
+    """
+    data = calculation_data
+    for wrapper in ("result", "results"):
+        if isinstance(data.get(wrapper), Mapping):
+            data = data[wrapper]
+            break
+
+    data = _clean(data)
+    fields = ENGINE_PROMPT_FIELDS.get(engine_name, ())
+    selected = {field: data[field] for field in fields if field in data}
+    return selected or data
+
+
+def _fit(data: Dict[str, Any], max_tokens: int) -> Any:
+    text = compact_json(data)
+    if count_tokens(text) <= max_tokens:
+        return data
+
+    for max_items, max_chars in _SHRINK_STEPS:
+        shrunk = _shrink(data, max_items, max_chars)
+        if count_tokens(compact_json(shrunk)) <= max_tokens:
+            return shrunk
+
+    fields = dict(shrunk)
+    while len(fields) > 1 and count_tokens(compact_json(fields)) > max_tokens:
+        fields.popitem()
+    return fields
+
+
+def fit_to_budget(data: Dict[str, Any], max_tokens: int) -> str:
+    """
+    Compact JSON of data within a token budget
+
+    Long lists and strings are shortened step by step; if the data still does
+    not fit, the least important (last) fields are dropped.
+    """
+    return compact_json(_fit(data, max_tokens))
+
+
+def compact_calculation(engine_name: str, calculation_data: Mapping[str, Any],
+                        max_tokens: int = 2048) -> str:
+    """Prompt-ready compact encoding of one engine result within a token budget"""
+    return fit_to_budget(extract_prompt_fields(engine_name, calculation_data), max_tokens)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens, at a paragraph or sentence break when possible"""
+    if count_tokens(text) <= max_tokens:
+        return text
+    cut = text[:max_tokens * CHARS_PER_TOKEN]
+    for separator in ("\n\n", "\n", ". "):
+        index = cut.rfind(separator)
+        if index > len(cut) // 2:
+            return cut[:index + 1].rstrip() + " ..."
+    return cut.rstrip() + " ..."
+
+
+def compact_synthesis_data(
+    engine_results: Mapping[str, Any],
+    interpretations: Mapping[str, str],
+    max_tokens: int = 6144,
+    birth_data: Optional[Mapping[str, Any]] = None
+) -> str:
+    """
+    Prompt-ready compact encoding of a multi-engine reading
+
+    The budget is split evenly between the engines; within each engine's
+    share, results get a third and its interpretation the rest.
+    """
+    share = max(64, max_tokens // max(1, len(engine_results)))
+    engines = {}
+    for engine_name, result in engine_results.items():
+        entry = {"results": _fit(extract_prompt_fields(engine_name, result or {}), share // 3)}
+        if engine_name in interpretations:
+            entry["interpretation"] = truncate_to_tokens(interpretations[engine_name], share - share // 3)
+        engines[engine_name] = entry
+
+    data = {"engines": engines}
+    if birth_data:
+        data["subject"] = {key: birth_data[key] for key in ("name", "date") if birth_data.get(key)}
+    return compact_json(data)
@@ -5,10 +5,18 @@ Contains scaffolding system prompts and templates for different types of
 divination engine interpretations, maintaining WitnessOS's mystical-technical balance.
 """
 
-from typing import Dict, List, Any, Optional
+import operator
+import string
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from .prompt_compaction import compact_json
+except ImportError:
+    # Fallback for direct execution
+    from prompt_compaction import compact_json
+
 
 class EngineType(Enum):
     """Types of divination engines"""
@@ -41,18 +49,112 @@ class PromptTemplate:
     style: InterpretationStyle
 
 
+SYNTHESIS_USER_TEMPLATE = """Synthesize these multi-engine results into unified guidance:
+
+**Results**: {engine_results}
+
+Provide synthesis covering:
+1. **Common Themes** - Patterns across all systems
+2. **Priority Focus** - Which insights to work with first
+3. **Integration Practices** - How to apply the guidance
+
+Present this as unified wisdom that honors each system's insights."""
+
+
+class CompiledTemplate:
+    """
+    User template parsed once into literal pieces and placeholder slots
+
+    Rendering fills the slots with the formatted context values and joins
+    the pieces, giving the same (stripped) text as str.format without parsing
+    the template on every call. Templates with format specs, conversions or
+    attribute/index placeholders are rendered with str.format.
+    """
+
+    def __init__(self, template: str):
+        self.template = template.strip()
+        self.fields: Optional[Tuple[str, ...]] = ()
+        self.pieces: List[str] = []
+        for literal, field, spec, conversion in string.Formatter().parse(self.template):
+            self.pieces.append(literal)
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                self.fields = None
+                break
+            # Placeholder slots sit at the odd indices
+            self.pieces.append("")
+            self.fields += (field,)
+        self._values = operator.itemgetter(*self.fields) if self.fields else None
+        # Values at either end of the template may carry whitespace to strip
+        self.needs_strip = not self.template or self.template[0] == "{" or self.template[-1] == "}"
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """
+        Substitute context values into the template
+
+        Raises:
+            KeyError: If a placeholder has no context value
+        """
+        if self.fields is None:
+            text = self.template.format(**context)
+        elif not self.fields:
+            return self.template
+        else:
+            values = self._values(context)
+            pieces = self.pieces.copy()
+            pieces[1::2] = map(format, values) if len(self.fields) > 1 else (format(values),)
+            text = "".join(pieces)
+        return text.strip() if self.needs_strip else text
+
+
 class PromptTemplateManager:
     """
     Manages prompt templates for different engines and interpretation styles
     
     Provides the scaffolding system that gives the agent context about
     WitnessOS's spiritual/metaphysical nature and calculation engines.
+
+    Templates are compiled once: system prompts are built per (engine, style)
+    and per synthesis style, and user templates are pre-parsed. Every request
+    for the same engine and style therefore starts with the identical system
+    message, a stable prefix for provider-side prompt caching. Call compile()
+    after changing engine_templates, style_modifiers or base_system_prompt.
     """
     
     def __init__(self):
         self.base_system_prompt = self._create_base_system_prompt()
         self.engine_templates = self._create_engine_templates()
         self.style_modifiers = self._create_style_modifiers()
+        self.compile()
+
+    def compile(self):
+        """Build the cached system prompts and parsed user templates"""
+        # Per engine: parsed user template and system prompt per style
+        self.compiled_templates: Dict[EngineType, Tuple[CompiledTemplate, Dict[InterpretationStyle, str]]] = {
+            engine_type: (
+                CompiledTemplate(template.user_template),
+                {style: self._system_prompt(template, style) for style in InterpretationStyle}
+            )
+            for engine_type, template in self.engine_templates.items()
+        }
+        self.synthesis_system_prompts: Dict[InterpretationStyle, str] = {
+            style: self._synthesis_system_prompt(style) for style in self.style_modifiers
+        }
+        self.synthesis_user_template = CompiledTemplate(SYNTHESIS_USER_TEMPLATE)
+
+    def _system_prompt(self, template: PromptTemplate, style: InterpretationStyle) -> str:
+        """System prompt of an engine template combined with a style modifier"""
+        style_modifier = self.style_modifiers.get(style, "")
+        return (template.system_prompt + "\n\n## Style Guidance\n" + style_modifier).strip()
+
+    def _synthesis_system_prompt(self, style: InterpretationStyle) -> str:
+        return f"""{self.base_system_prompt}
+
+## Multi-Engine Synthesis Specialization
+You are synthesizing results from multiple WitnessOS divination engines to create a comprehensive consciousness field analysis. Your role is to identify patterns, correlations, and unified themes across different symbolic systems.
+
+{self.style_modifiers[style]}""".strip()
     
     def _create_base_system_prompt(self) -> str:
         """Create the foundational system prompt for WitnessOS consciousness"""
@@ -70,6 +172,7 @@ You interpret 10 divination systems: Numerology, Biorhythm, Human Design, Vimsho
 - Present insights as invitations, not absolute truths
 - Honor the user's sovereignty and free will
 - Keep responses clear, practical, and actionable
+- The person's name, birth date, birth time and birthplace appear as placeholders ({{name}}, {{birth_date}}, {{birth_time}}, {{location}}); refer to them only through these placeholders, written exactly as given
 
 Remember: You're facilitating consciousness exploration that genuinely supports awakening."""
 
@@ -250,54 +353,47 @@ Make complex concepts accessible without losing depth.
         Returns:
             Dictionary with 'system' and 'user' prompts
         """
-        if engine_type not in self.engine_templates:
+        compiled = self.compiled_templates.get(engine_type)
+        if compiled is None:
             raise ValueError(f"No template found for engine type: {engine_type}")
         
-        template = self.engine_templates[engine_type]
-        style_modifier = self.style_modifiers.get(style, "")
-        
-        # Combine system prompt with style modifier
-        system_prompt = template.system_prompt + "\n\n## Style Guidance\n" + style_modifier
+        user_template, system_prompts = compiled
+        system_prompt = system_prompts.get(style)
+        if system_prompt is None:
+            system_prompt = self._system_prompt(self.engine_templates[engine_type], style)
         
         # Substitute context variables in user template
-        user_prompt = template.user_template
+        user_prompt = user_template.template
         if context:
             try:
-                user_prompt = user_prompt.format(**context)
+                user_prompt = user_template.render(context)
             except KeyError as e:
                 raise ValueError(f"Missing context variable: {e}")
         
         return {
-            "system": system_prompt.strip(),
-            "user": user_prompt.strip()
+            "system": system_prompt,
+            "user": user_prompt
         }
     
     def get_synthesis_prompt(
         self,
-        engine_results: Dict[str, Any],
+        engine_results: Union[str, Dict[str, Any]],
         style: InterpretationStyle = InterpretationStyle.WITNESSOS
     ) -> Dict[str, str]:
-        """Generate prompt for synthesizing multiple engine results"""
-        
-        system_prompt = f"""{self.base_system_prompt}
-
-## Multi-Engine Synthesis Specialization
-You are synthesizing results from multiple WitnessOS divination engines to create a comprehensive consciousness field analysis. Your role is to identify patterns, correlations, and unified themes across different symbolic systems.
+        """
+        Generate prompt for synthesizing multiple engine results
 
-{self.style_modifiers[style]}"""
+        engine_results is either prompt-ready text (see
+        prompt_compaction.compact_synthesis_data) or a dict, encoded as compact JSON
+        """
+        if not isinstance(engine_results, str):
+            engine_results = compact_json(engine_results)
         
-        user_prompt = f"""Synthesize these multi-engine results into unified guidance:
-
-**Results**: {engine_results}
-
-Provide synthesis covering:
-1. **Common Themes** - Patterns across all systems
-2. **Priority Focus** - Which insights to work with first
-3. **Integration Practices** - How to apply the guidance
-
-Present this as unified wisdom that honors each system's insights."""
+        system_prompt = self.synthesis_system_prompts.get(style)
+        if system_prompt is None:
+            system_prompt = self._synthesis_system_prompt(style)
         
         return {
-            "system": system_prompt.strip(),
-            "user": user_prompt.strip()
+            "system": system_prompt,
+            "user": self.synthesis_user_template.render({"engine_results": engine_results})
         }
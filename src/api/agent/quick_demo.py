@@ -17,6 +17,7 @@ engines_dir = current_dir.parent
 sys.path.insert(0, str(engines_dir))
 
 from agent.agent_service import WitnessOSAgent
+from agent.interpretation_cache import personalize
 
 # Your actual birth data from the chart
 YOUR_BIRTH_DATA = {
@@ -81,7 +82,7 @@ async def test_human_design_interpretation():
 
         print("✅ AI Interpretation Generated!")
         print("=" * 70)
-        print(interpretation)
+        print(personalize(interpretation, YOUR_BIRTH_DATA))
         print("=" * 70)
 
         return True
@@ -5,9 +5,89 @@ Formats agent responses to maintain WitnessOS consciousness framework
 and provide consistent output structure across different interpretation types.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
+from functools import cached_property
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Keywords the extractors look for, matched as substrings of the lowercased text
+ARCHETYPAL_KEYWORDS = (
+    "seeker", "creator", "transformer", "healer", "guide", "warrior",
+    "sage", "lover", "magician", "innocent", "explorer", "ruler"
+)
+ACTION_WORDS = ("practice", "cultivate", "develop", "integrate", "embrace", "honor", "trust")
+FUTURE_WORDS = ("next", "continue", "develop", "explore", "begin", "start")
+PATHWAY_WORDS = ("step", "stage", "phase", "develop", "evolve", "progress")
+
+# Keyword and display title, so matching does not title-case on every call
+_ARCHETYPES = tuple((keyword, keyword.title()) for keyword in ARCHETYPAL_KEYWORDS)
+
+
+class InterpretationFeatures:
+    """
+    Interpretation text segmented once for all extractors
+
+    The text is lowercased, split into sentences and split into words at most
+    once, shared by every field; each field is extracted the first time it is
+    read, so a response only pays for the fields it uses, and sentence scans
+    stop at their limit.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lowered = text.lower()
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentences of the text, split on '.'"""
+        return self.text.split('.')
+
+    def sentences_with(self, words: Tuple[str, ...], min_length: int, limit: int) -> List[str]:
+        """Stripped sentences longer than min_length that contain any of words"""
+        found = []
+        for sentence in self.sentences:
+            sentence = sentence.strip()
+            if len(sentence) > min_length:
+                sentence_lower = sentence.lower()
+                if any(word in sentence_lower for word in words):
+                    found.append(sentence)
+                    if len(found) >= limit:
+                        break
+        return found
+
+    @cached_property
+    def themes(self) -> List[str]:
+        """Archetypal theme keywords present in the text"""
+        return [title for keyword, title in _ARCHETYPES if keyword in self.lowered]
+
+    @cached_property
+    def guidance(self) -> List[str]:
+        """Action-oriented sentences"""
+        return self.sentences_with(ACTION_WORDS, 20, 3)
+
+    @cached_property
+    def next_steps(self) -> List[str]:
+        """Future-oriented sentences"""
+        return self.sentences_with(FUTURE_WORDS, 15, 2)
+
+    @cached_property
+    def pathway(self) -> List[str]:
+        """Evolution pathway sentences"""
+        return self.sentences_with(PATHWAY_WORDS, 20, 3)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Lowercased words in order"""
+        return self.lowered.split()
+
+    @cached_property
+    def words(self) -> Set[str]:
+        """Distinct lowercased words"""
+        return set(self.tokens)
 
 
 class AgentResponseFormatter:
@@ -38,6 +118,8 @@ class AgentResponseFormatter:
         Returns:
             Formatted response dictionary
         """
+        features = InterpretationFeatures(ai_interpretation)
+
         return {
             "consciousness_session": {
                 "session_type": "single_engine_interpretation",
@@ -56,8 +138,8 @@ class AgentResponseFormatter:
             "consciousness_interpretation": {
                 "ai_guidance": ai_interpretation,
                 "interpretation_confidence": self._calculate_interpretation_confidence(calculation_result),
-                "archetypal_resonance": self._extract_archetypal_themes(ai_interpretation),
-                "integration_pathway": self._extract_integration_guidance(ai_interpretation)
+                "archetypal_resonance": self._extract_archetypal_themes(features),
+                "integration_pathway": self._extract_integration_guidance(features)
             },
             "witness_protocol": {
                 "awareness_cultivation": [
@@ -66,7 +148,7 @@ class AgentResponseFormatter:
                     "Allow insights to integrate naturally over time"
                 ],
                 "reality_patches": self._generate_reality_patches(engine_name, ai_interpretation),
-                "next_steps": self._extract_next_steps(ai_interpretation)
+                "next_steps": self._extract_next_steps(features)
             },
             "session_metadata": {
                 "response_format": "witnessOS_agent_v1",
@@ -96,7 +178,11 @@ class AgentResponseFormatter:
             Formatted response dictionary
         """
         engines_deployed = list(engine_interpretations.keys())
-        
+        engine_features = {
+            engine_name: InterpretationFeatures(interpretation)
+            for engine_name, interpretation in engine_interpretations.items()
+        }
+
         return {
             "consciousness_session": {
                 "session_type": "multi_engine_comprehensive_analysis",
@@ -117,8 +203,8 @@ class AgentResponseFormatter:
             },
             "consciousness_synthesis": {
                 "unified_field_analysis": synthesis_interpretation if synthesis_interpretation else "Synthesis not generated",
-                "cross_engine_correlations": self._identify_correlations(engine_interpretations),
-                "archetypal_convergence": self._identify_archetypal_convergence(engine_interpretations),
+                "cross_engine_correlations": self._identify_correlations(engine_features),
+                "archetypal_convergence": self._identify_archetypal_convergence(engine_features),
                 "integration_priority": self._determine_integration_priority(engine_interpretations)
             },
             "witness_protocol": {
@@ -181,38 +267,16 @@ class AgentResponseFormatter:
         
         return round(successful_engines / total_engines, 3) if total_engines > 0 else 0.0
     
-    def _extract_archetypal_themes(self, interpretation: str) -> List[str]:
+    def _extract_archetypal_themes(self, features: InterpretationFeatures) -> List[str]:
         """Extract archetypal themes from AI interpretation"""
         # Simple keyword extraction - could be enhanced with NLP
-        archetypal_keywords = [
-            "seeker", "creator", "transformer", "healer", "guide", "warrior",
-            "sage", "lover", "magician", "innocent", "explorer", "ruler"
-        ]
-        
-        themes = []
-        interpretation_lower = interpretation.lower()
-        for keyword in archetypal_keywords:
-            if keyword in interpretation_lower:
-                themes.append(keyword.title())
-        
+        themes = features.themes
         return themes[:3] if themes else ["Explorer", "Seeker"]
     
-    def _extract_integration_guidance(self, interpretation: str) -> List[str]:
+    def _extract_integration_guidance(self, features: InterpretationFeatures) -> List[str]:
         """Extract integration guidance from AI interpretation"""
-        # Look for action-oriented sentences
-        sentences = interpretation.split('.')
-        guidance = []
-        
-        action_words = ["practice", "cultivate", "develop", "integrate", "embrace", "honor", "trust"]
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(word in sentence.lower() for word in action_words) and len(sentence) > 20:
-                guidance.append(sentence)
-                if len(guidance) >= 3:
-                    break
-        
-        return guidance if guidance else ["Trust your inner guidance", "Practice conscious awareness", "Integrate insights gradually"]
+        guidance = features.guidance
+        return list(guidance) if guidance else ["Trust your inner guidance", "Practice conscious awareness", "Integrate insights gradually"]
     
     def _generate_reality_patches(self, engine_name: str, interpretation: str) -> List[Dict[str, Any]]:
         """Generate reality patches from interpretation"""
@@ -231,40 +295,37 @@ class AgentResponseFormatter:
             }
         ]
     
-    def _extract_next_steps(self, interpretation: str) -> List[str]:
+    def _extract_next_steps(self, features: InterpretationFeatures) -> List[str]:
         """Extract next steps from AI interpretation"""
         # Look for future-oriented guidance
-        sentences = interpretation.split('.')
-        next_steps = []
-        
-        future_words = ["next", "continue", "develop", "explore", "begin", "start"]
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(word in sentence.lower() for word in future_words) and len(sentence) > 15:
-                next_steps.append(sentence)
-                if len(next_steps) >= 2:
-                    break
-        
-        return next_steps if next_steps else ["Continue exploring your consciousness patterns", "Practice daily awareness cultivation"]
+        next_steps = features.next_steps
+        return list(next_steps) if next_steps else ["Continue exploring your consciousness patterns", "Practice daily awareness cultivation"]
 
-    def _identify_correlations(self, engine_interpretations: Dict[str, str]) -> List[str]:
+    def _identify_correlations(self, engine_features: Dict[str, InterpretationFeatures]) -> List[str]:
         """Identify correlations between engine interpretations"""
         # Simple correlation detection - could be enhanced with semantic analysis
         common_themes = []
 
-        # Look for common words across interpretations
-        all_words = []
-        for interpretation in engine_interpretations.values():
-            words = interpretation.lower().split()
-            all_words.extend([word for word in words if len(word) > 4])
-
-        # Find words that appear in multiple interpretations
-        word_counts = {}
-        for word in all_words:
-            word_counts[word] = word_counts.get(word, 0) + 1
+        # Words that appear in at least two interpretations: each engine's
+        # words intersected with the words of the engines before it
+        seen = set()
+        recurring = set()
+        for features in engine_features.values():
+            recurring |= features.words & seen
+            seen |= features.words
+        recurring = {word for word in recurring if len(word) > 4}
 
-        common_words = [word for word, count in word_counts.items() if count > 1]
+        # Report the first five in order of first appearance
+        common_words = []
+        for features in engine_features.values():
+            if len(common_words) >= 5 or not recurring:
+                break
+            for word in features.tokens:
+                if word in recurring:
+                    common_words.append(word)
+                    recurring.discard(word)
+                    if len(common_words) >= 5:
+                        break
 
         if common_words:
             common_themes.append(f"Recurring themes: {', '.join(common_words[:5])}")
@@ -274,19 +335,17 @@ class AgentResponseFormatter:
 
         return common_themes
 
-    def _identify_archetypal_convergence(self, engine_interpretations: Dict[str, str]) -> List[str]:
+    def _identify_archetypal_convergence(self, engine_features: Dict[str, InterpretationFeatures]) -> List[str]:
         """Identify archetypal convergence across engines"""
-        all_archetypes = []
-        for interpretation in engine_interpretations.values():
-            archetypes = self._extract_archetypal_themes(interpretation)
-            all_archetypes.extend(archetypes)
+        # Archetypes shared by at least two engines, in order of first appearance
+        seen = {}
+        convergent = set()
+        for features in engine_features.values():
+            archetypes = self._extract_archetypal_themes(features)
+            convergent.update(seen.keys() & archetypes)
+            seen.update(dict.fromkeys(archetypes))
 
-        # Find most common archetypes
-        archetype_counts = {}
-        for archetype in all_archetypes:
-            archetype_counts[archetype] = archetype_counts.get(archetype, 0) + 1
-
-        convergent_archetypes = [archetype for archetype, count in archetype_counts.items() if count > 1]
+        convergent_archetypes = [archetype for archetype in seen if archetype in convergent]
 
         if convergent_archetypes:
             return [f"Convergent archetypal pattern: {', '.join(convergent_archetypes)}"]
@@ -353,20 +412,80 @@ class AgentResponseFormatter:
             ]
 
         # Extract pathway steps from synthesis
-        sentences = synthesis_interpretation.split('.')
-        pathway_steps = []
-
-        pathway_words = ["step", "stage", "phase", "develop", "evolve", "progress"]
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(word in sentence.lower() for word in pathway_words) and len(sentence) > 20:
-                pathway_steps.append(sentence)
-                if len(pathway_steps) >= 3:
-                    break
+        pathway_steps = InterpretationFeatures(synthesis_interpretation).pathway
 
         return pathway_steps if pathway_steps else [
             "Integrate current insights into daily awareness",
             "Develop deeper understanding through practice",
             "Allow natural consciousness evolution to unfold"
         ]
+
+
+class IncrementalInterpretation:
+    """
+    Incremental formatting of a streamed interpretation
+
+    Collects text chunks as they arrive and turns every completed paragraph
+    into a section carrying the archetypal themes it introduces and its
+    integration guidance, so clients can render structure before the
+    interpretation (and the final structured response) is complete.
+    """
+
+    def __init__(self, formatter: AgentResponseFormatter, engine_name: str):
+        self.formatter = formatter
+        self.engine_name = engine_name
+        self.parts: List[str] = []
+        self.pending = ""
+        self.sections = 0
+        self.themes: List[str] = []
+
+    @property
+    def text(self) -> str:
+        """Interpretation received so far"""
+        return "".join(self.parts)
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Add a chunk, returning the sections it completes"""
+        self.parts.append(chunk)
+        self.pending += chunk
+        *completed, self.pending = self.pending.split("\n\n")
+        return [section for section in map(self._section, completed) if section]
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Flush the trailing paragraph as the last section"""
+        section = self._section(self.pending)
+        self.pending = ""
+        return [section] if section else []
+
+    def _section(self, paragraph: str) -> Optional[Dict[str, Any]]:
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return None
+
+        features = InterpretationFeatures(paragraph)
+        new_themes = [theme for theme in features.themes if theme not in self.themes]
+        self.themes.extend(new_themes)
+        section = {
+            "engine": self.engine_name,
+            "index": self.sections,
+            "text": paragraph,
+            "archetypal_themes": new_themes,
+            "integration_guidance": features.guidance
+        }
+        self.sections += 1
+        return section
+
+
+async def encode_sse(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    """
+    Server-sent events encoding of agent stream events
+
+    A stream that fails part way ends with an error event instead of
+    breaking the connection.
+    """
+    try:
+        async for event in events:
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+    except Exception as e:
+        logger.error(f"Error in interpretation stream: {e}")
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
@@ -21,6 +21,7 @@ parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 
 from integration.orchestrator import EngineOrchestrator
+from integration.async_orchestrator import AsyncEngineOrchestrator
 from integration.workflows import WorkflowManager
 from integration.field_analyzer import FieldAnalyzer
 from integration.synthesis import ResultSynthesizer
@@ -41,7 +42,8 @@ setup_middleware(app)
 
 # Initialize components
 orchestrator = EngineOrchestrator()
-workflow_manager = WorkflowManager()
+async_orchestrator = AsyncEngineOrchestrator(orchestrator)
+workflow_manager = WorkflowManager(orchestrator, async_orchestrator=async_orchestrator)
 field_analyzer = FieldAnalyzer()
 synthesizer = ResultSynthesizer()
 mystical_formatter = MysticalFormatter()
@@ -49,6 +51,11 @@ witnessOS_formatter = WitnessOSFormatter()
 
 logger = logging.getLogger(__name__)
 
+@app.on_event("shutdown")
+async def shutdown_engines():
+    """Release the engine thread pool"""
+    await async_orchestrator.aclose()
+
 # Pydantic models for API
 class BirthData(BaseModel):
     name: str = Field(..., description="Full birth name")
@@ -118,7 +125,7 @@ async def run_single_engine(request: EngineRequest):
     try:
         # Convert input data to appropriate format
         # This would need proper input model conversion based on engine type
-        result = orchestrator.run_single_engine(
+        result = await async_orchestrator.run_engine(
             request.engine_name, 
             request.input_data, 
             request.config
@@ -158,10 +165,7 @@ async def run_multiple_engines(request: MultiEngineRequest):
             })
         
         # Run engines
-        if request.parallel:
-            results = orchestrator.run_parallel_engines(engine_configs)
-        else:
-            results = orchestrator.run_sequential_engines(engine_configs)
+        results = await async_orchestrator.run_many(engine_configs, sequential=not request.parallel)
         
         # Synthesize if requested
         synthesis = None
@@ -219,7 +223,7 @@ async def run_workflow(request: WorkflowRequest):
         birth_data_dict = request.birth_data.dict()
         
         # Run workflow
-        result = workflow_manager.run_workflow(
+        result = await workflow_manager.run_workflow_async(
             request.workflow_name,
             birth_data_dict,
             request.options
@@ -250,10 +254,14 @@ async def analyze_consciousness_field(request: FieldAnalysisRequest):
         birth_data_dict = request.birth_data.dict()
         engines = request.engines or ['numerology', 'biorhythm', 'human_design', 'vimshottari', 'gene_keys']
         
-        comprehensive_reading = orchestrator.create_comprehensive_reading(birth_data_dict, engines)
+        comprehensive_reading = await async_orchestrator.create_comprehensive_reading(birth_data_dict, engines)
         
-        # Analyze field signature
-        field_signature = field_analyzer.analyze_field_signature(comprehensive_reading['results'])
+        # Analyze field signature; natal pair relationships are reused for returning subjects
+        field_signature = field_analyzer.analyze_field_signature(
+            comprehensive_reading['results'],
+            subject=birth_data_dict,
+            engine_versions=orchestrator.get_engine_versions(engines)
+        )
         
         # Format for WitnessOS
         formatted_analysis = witnessOS_formatter.format_field_analysis(
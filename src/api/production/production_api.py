@@ -18,11 +18,9 @@ Features:
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, Iterable
 from datetime import datetime, date, time
 import logging
-import hashlib
-import json
 from functools import lru_cache
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -32,16 +30,22 @@ import traceback
 current_dir = Path(__file__).parent
 engines_dir = current_dir.parent
 sys.path.insert(0, str(engines_dir))
+sys.path.insert(0, str(engines_dir.parent / "engines"))
 
 # FastAPI and Pydantic imports
-from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, field_validator
 import uvicorn
 
+from base.serialization import dumps, dumps_str, hash_payload
+from base.canonical import content_hash
+# Determinism class per engine, shared with the orchestrator and workflow caches
+from base.determinism import STATIC, DAILY, VOLATILE, determinism_class
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -91,9 +95,27 @@ security = HTTPBearer(auto_error=False)
 RESULT_CACHE = {}
 CACHE_MAX_SIZE = 1000
 
+# Versions of the loaded engine implementations, folded into cache keys
+ENGINE_VERSIONS: Dict[str, Optional[str]] = {}
+
 # Thread pool for engine execution
 executor = ThreadPoolExecutor(max_workers=4)
 
+# Default per-engine deadline for multi-engine requests
+ENGINE_TIMEOUT_SECONDS = 30.0
+
+# Streaming response media types
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream"
+}
+
+class EngineJSONResponse(JSONResponse):
+    """JSON response rendered with the engine serializer instead of jsonable_encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
 # Pydantic Models for API
 class BirthData(BaseModel):
     """Birth data model with comprehensive validation"""
@@ -140,6 +162,10 @@ class MultiEngineRequest(BaseModel):
     synthesize: bool = Field(True, description="Include synthesis")
     format: Optional[str] = Field("witnessOS", pattern="^(standard|mystical|witnessOS)$")
     use_cache: bool = Field(True, description="Whether to use cached results")
+    engine_timeout: float = Field(ENGINE_TIMEOUT_SECONDS, gt=0, le=300,
+                                  description="Per-engine deadline in seconds")
+    stream: Optional[str] = Field(None, pattern="^(ndjson|sse)$",
+                                  description="Stream each engine result as it completes (ndjson or sse)")
 
 class WorkflowRequest(BaseModel):
     """Workflow execution request model"""
@@ -147,6 +173,8 @@ class WorkflowRequest(BaseModel):
     birth_data: BirthData = Field(..., description="Birth data")
     format: Optional[str] = Field("witnessOS", pattern="^(standard|mystical|witnessOS)$")
     use_cache: bool = Field(True, description="Whether to use cached results")
+    stream: Optional[str] = Field(None, pattern="^(ndjson|sse)$",
+                                  description="Stream engine results, synthesis and sections as events (ndjson or sse)")
 
 class FieldAnalysisRequest(BaseModel):
     """Consciousness field analysis request model"""
@@ -155,6 +183,8 @@ class FieldAnalysisRequest(BaseModel):
     analysis_depth: str = Field("standard", pattern="^(basic|standard|deep)$",
                                description="Analysis depth")
     use_cache: bool = Field(True, description="Whether to use cached results")
+    stream: Optional[str] = Field(None, pattern="^(ndjson|sse)$",
+                                  description="Stream engine results, synthesis and sections as events (ndjson or sse)")
 
 # Available engines mapping
 AVAILABLE_ENGINES = {
@@ -170,6 +200,8 @@ AVAILABLE_ENGINES = {
     "sigil_forge": "SigilForgeSynthesizer"
 }
 
+STATIC_MAX_AGE_SECONDS = 86400
+
 # Available workflows
 AVAILABLE_WORKFLOWS = [
     "complete_natal", "relationship_compatibility", "career_guidance",
@@ -233,6 +265,9 @@ def load_engine_class(engine_name: str):
 
     except Exception as e:
         logger.error(f"Failed to load engine {engine_name}: {e}")
+        # The exception variable is cleared when the except block ends
+        load_error = str(e)
+
         # Return mock engine as fallback
         class MockEngine:
             def __init__(self, config=None):
@@ -243,7 +278,7 @@ def load_engine_class(engine_name: str):
                 return {
                     "engine": engine_name,
                     "result": f"Mock {engine_name} calculation (engine load failed)",
-                    "error": str(e),
+                    "error": load_error,
                     "status": "fallback_mode",
                     "timestamp": datetime.now().isoformat()
                 }
@@ -251,11 +286,32 @@ def load_engine_class(engine_name: str):
         return MockEngine
 
 # Cache utilities
-def generate_cache_key(data: Dict) -> str:
-    """Generate cache key from input data"""
-    # Create deterministic hash from input data
-    data_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.md5(data_str.encode()).hexdigest()
+def engine_version(engine_name: str) -> Optional[str]:
+    """
+    Version of an engine's implementation
+
+    The loaded engine's _version, as EngineOrchestrator.get_engine_versions
+    reports it, so an engine upgrade invalidates cached results and ETags.
+    None for engines without a version (such as the mock fallback); a failed
+    load is not remembered, so a later successful load is picked up.
+    """
+    if engine_name not in ENGINE_VERSIONS:
+        try:
+            engine = load_engine_class(engine_name)()
+        except Exception as e:
+            logger.warning(f"Could not determine version of {engine_name}: {e}")
+            return None
+        ENGINE_VERSIONS[engine_name] = getattr(engine, "_version", None)
+    return ENGINE_VERSIONS[engine_name]
+
+def generate_cache_key(engines: List[str], data: Dict) -> str:
+    """Generate cache key from the canonical form of the input data"""
+    engines = sorted(engines)
+    versions = ",".join(f"{engine}={engine_version(engine)}" for engine in engines)
+    # Equivalent birth data (formatting, whitespace, case, key order) shares a key;
+    # results of date-dependent engines are only reused within the day
+    return content_hash(",".join(engines), {"input": data, "day": date_bucket(engines)},
+                        engine_version=versions)
 
 def get_cached_result(cache_key: str) -> Optional[Dict]:
     """Get result from cache"""
@@ -274,6 +330,51 @@ def cache_result(cache_key: str, result: Dict):
         "cached": True
     }
 
+def date_bucket(engines: List[str], now: Optional[datetime] = None) -> str:
+    """Period results of the engines are valid for: the UTC day for date-dependent engines"""
+    if determinism_class(engines) == DAILY:
+        return (now or datetime.utcnow()).date().isoformat()
+    return STATIC
+
+# Conditional response utilities
+def build_cache_headers(engines: List[str], cache_key: str) -> Dict[str, str]:
+    """Build ETag and Cache-Control headers for a request's determinism class"""
+    determinism = determinism_class(engines)
+    if determinism == VOLATILE:
+        return {"Cache-Control": "no-store"}
+
+    now = datetime.utcnow()
+    if determinism == DAILY:
+        # Valid until the end of the current UTC day
+        max_age = 86400 - (now.hour * 3600 + now.minute * 60 + now.second)
+    else:
+        max_age = STATIC_MAX_AGE_SECONDS
+
+    # cache_key already covers canonical input and engine version
+    etag = f'"{hash_payload([cache_key, date_bucket(engines, now)])}"'
+    return {"ETag": etag, "Cache-Control": f"private, max-age={max_age}, must-revalidate"}
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Check an If-None-Match header against an ETag"""
+    if not if_none_match or not etag:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def not_modified_response(cache_headers: Dict[str, str]) -> Response:
+    """Empty 304 response carrying the validators"""
+    return Response(status_code=304, headers=cache_headers)
+
+def cacheable_headers(cache_headers: Dict[str, str], successful: bool) -> Dict[str, str]:
+    """Drop validators from failed or partial results so clients do not keep them"""
+    return cache_headers if successful else {"Cache-Control": "no-store"}
+
+def reading_succeeded(response: Dict) -> bool:
+    """Check that every engine in a multi-engine response succeeded"""
+    outputs = response.get("engine_diagnostics") or response.get("results", {}).get("engine_outputs", {})
+    return (find_consciousness_scan(response).get("debug_status") == "COMPLETE"
+            and all(output.get("status") == "success" for output in outputs.values()))
+
 # Middleware setup
 app.add_middleware(
     CORSMiddleware,
@@ -281,6 +382,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Request logging middleware
@@ -432,8 +534,12 @@ def convert_birth_data_to_engine_input(birth_data: BirthData, engine_name: str)
             "name": birth_data.name
         }
 
-async def run_engine_calculation(engine_name: str, input_data: Dict, config: Optional[Dict] = None) -> Dict:
-    """Run engine calculation with proper error handling"""
+async def run_engine_calculation(engine_name: str, input_data: Dict, config: Optional[Dict] = None,
+                                 started: Optional[asyncio.Event] = None) -> Dict:
+    """Run engine calculation with proper error handling
+
+    started, if given, is set once a worker thread picks the calculation up.
+    """
     try:
         # Load engine class
         engine_class = load_engine_class(engine_name)
@@ -441,9 +547,15 @@ async def run_engine_calculation(engine_name: str, input_data: Dict, config: Opt
         # Create engine instance
         engine = engine_class(config)
 
+        loop = asyncio.get_running_loop()
+
+        def calculate():
+            if started is not None:
+                loop.call_soon_threadsafe(started.set)
+            return engine.calculate(input_data)
+
         # Run calculation in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(executor, engine.calculate, input_data)
+        result = await loop.run_in_executor(executor, calculate)
 
         return {
             "engine": engine_name,
@@ -462,6 +574,84 @@ async def run_engine_calculation(engine_name: str, input_data: Dict, config: Opt
             "timestamp": datetime.now().isoformat()
         }
 
+async def run_engine_with_deadline(engine_name: str, input_data: Dict, timeout: float,
+                                   config: Optional[Dict] = None) -> Dict:
+    """Run engine calculation, turning a missed deadline into a timeout result
+
+    The deadline starts when a worker thread starts the engine, so time spent
+    queued behind other engines of a fan-out does not count against it. The
+    executor thread itself cannot be interrupted, so a timed-out calculation
+    finishes in the background; only the awaiting coroutine is cancelled.
+    """
+    started = asyncio.Event()
+    calculation = asyncio.create_task(run_engine_calculation(engine_name, input_data, config, started))
+    waiting = asyncio.create_task(started.wait())
+    try:
+        # Calculations that fail before reaching a worker never start
+        await asyncio.wait({calculation, waiting}, return_when=asyncio.FIRST_COMPLETED)
+        return await asyncio.wait_for(calculation, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Engine {engine_name} exceeded {timeout}s deadline")
+        return {
+            "engine": engine_name,
+            "error": f"Engine exceeded {timeout}s deadline",
+            "status": "timeout",
+            "timestamp": datetime.now().isoformat()
+        }
+    finally:
+        waiting.cancel()
+        calculation.cancel()
+
+def prepare_engine_inputs(engines: List[str], birth_data: BirthData) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Convert birth data for each engine, separating preparation failures"""
+    engine_inputs = {}
+    preparation_errors = {}
+
+    for engine_name in engines:
+        try:
+            engine_inputs[engine_name] = convert_birth_data_to_engine_input(birth_data, engine_name)
+        except Exception as e:
+            logger.error(f"Error preparing {engine_name}: {e}")
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            preparation_errors[engine_name] = {
+                "engine": engine_name,
+                "error": detail,
+                "status": "preparation_error"
+            }
+
+    return engine_inputs, preparation_errors
+
+async def iter_engine_results(engine_inputs: Dict[str, Dict], parallel: bool, timeout: float):
+    """
+    Yield engine results in completion order
+
+    In parallel mode every engine is started at once and results are yielded as
+    soon as each one finishes. Engines still pending when the consumer stops
+    (client disconnect, request cancellation) are cancelled.
+    """
+    if not parallel:
+        for engine_name, engine_input in engine_inputs.items():
+            yield await run_engine_with_deadline(engine_name, engine_input, timeout)
+        return
+
+    tasks = [
+        asyncio.create_task(run_engine_with_deadline(engine_name, engine_input, timeout))
+        for engine_name, engine_input in engine_inputs.items()
+    ]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+def format_stream_event(event: str, data: Any, stream_format: str) -> str:
+    """Encode a single streaming event as an NDJSON line or SSE frame"""
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {dumps_str(data)}\n\n"
+    return dumps_str({"event": event, "data": data}) + "\n"
+
 # API Endpoints
 
 @app.get("/")
@@ -566,49 +756,76 @@ async def list_engines():
         logger.error(f"Error listing engines: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/v1/engines/run")
-async def run_single_engine(request: EngineRequest):
-    """Run a single divination engine"""
-    try:
-        # Validate engine name
-        if request.engine_name not in AVAILABLE_ENGINES:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Engine '{request.engine_name}' not available. Available engines: {list(AVAILABLE_ENGINES.keys())}"
-            )
+def single_engine_cache_key(request: EngineRequest) -> str:
+    """Cache key of a single engine request's input, config and format"""
+    cache_data = {
+        "input": request.input_data,
+        "config": request.config,
+        "format": request.format
+    }
+    return generate_cache_key([request.engine_name], cache_data)
+
+async def calculate_single_engine(request: EngineRequest, cache_key: Optional[str] = None) -> Dict:
+    """
+    Run a single engine request through the result cache
+
+    Shared by /v1/engines/run and in-process callers (the agent's engine
+    bridge), so both return the same result for the same request.
+
+    Raises:
+        HTTPException: If the engine is unknown or the birth data cannot be converted
+    """
+    # Validate engine name
+    if request.engine_name not in AVAILABLE_ENGINES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Engine '{request.engine_name}' not available. Available engines: {list(AVAILABLE_ENGINES.keys())}"
+        )
 
-        # Generate cache key
-        cache_data = {
-            "engine": request.engine_name,
-            "input": request.input_data.model_dump(),
-            "config": request.config
-        }
-        cache_key = generate_cache_key(cache_data)
+    cache_key = cache_key or single_engine_cache_key(request)
+
+    # Check cache if enabled
+    if request.use_cache:
+        cached_result = get_cached_result(cache_key)
+        if cached_result:
+            logger.info(f"Cache hit for {request.engine_name}")
+            return cached_result["result"]
+
+    # Convert birth data to engine input
+    engine_input = convert_birth_data_to_engine_input(request.input_data, request.engine_name)
 
-        # Check cache if enabled
-        if request.use_cache:
-            cached_result = get_cached_result(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {request.engine_name}")
-                return cached_result["result"]
+    # Run engine calculation
+    result = await run_engine_calculation(request.engine_name, engine_input, request.config)
 
-        # Convert birth data to engine input
-        engine_input = convert_birth_data_to_engine_input(request.input_data, request.engine_name)
+    # Apply formatting if requested
+    if request.format == "mystical":
+        result = apply_mystical_formatting(result)
+    elif request.format == "witnessOS":
+        result = apply_witnessOS_formatting(result, request.input_data)
 
-        # Run engine calculation
-        result = await run_engine_calculation(request.engine_name, engine_input, request.config)
+    # Cache result if successful
+    if request.use_cache and result.get("status") == "success":
+        cache_result(cache_key, result)
 
-        # Apply formatting if requested
-        if request.format == "mystical":
-            result = apply_mystical_formatting(result)
-        elif request.format == "witnessOS":
-            result = apply_witnessOS_formatting(result, request.input_data)
+    return result
+
+@app.post("/v1/engines/run")
+async def run_single_engine(request: EngineRequest, if_none_match: Optional[str] = Header(None)):
+    """Run a single divination engine"""
+    try:
+        cache_key = single_engine_cache_key(request)
 
-        # Cache result if successful
-        if request.use_cache and result.get("status") == "success":
-            cache_result(cache_key, result)
+        # Answer conditional requests without running the engine
+        cache_headers = build_cache_headers([request.engine_name], cache_key)
+        if etag_matches(if_none_match, cache_headers.get("ETag")):
+            return not_modified_response(cache_headers)
 
-        return result
+        result = await calculate_single_engine(request, cache_key)
+
+        # Formatted single-engine results carry status inside engine_diagnostics
+        successful = result.get("status") == "success" or result.get(
+            "engine_diagnostics", {}).get(request.engine_name, {}).get("status") == "success"
+        return EngineJSONResponse(result, headers=cacheable_headers(cache_headers, successful))
 
     except HTTPException:
         raise
@@ -617,7 +834,7 @@ async def run_single_engine(request: EngineRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/v1/engines/multi")
-async def run_multiple_engines(request: MultiEngineRequest):
+async def run_multiple_engines(request: MultiEngineRequest, if_none_match: Optional[str] = Header(None)):
     """Run multiple engines simultaneously"""
     try:
         # Validate all engine names
@@ -628,90 +845,19 @@ async def run_multiple_engines(request: MultiEngineRequest):
                 detail=f"Invalid engines: {invalid_engines}. Available: {list(AVAILABLE_ENGINES.keys())}"
             )
 
-        # Generate cache key for multi-engine request
-        cache_data = {
-            "engines": sorted(request.engines),
-            "input": request.birth_data.model_dump(),
-            "parallel": request.parallel,
-            "synthesize": request.synthesize
-        }
-        cache_key = generate_cache_key(cache_data)
-
-        # Check cache if enabled
-        if request.use_cache:
-            cached_result = get_cached_result(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for multi-engine request")
-                return cached_result["result"]
-
-        # Prepare engine tasks
-        engine_tasks = []
-        for engine_name in request.engines:
-            try:
-                engine_input = convert_birth_data_to_engine_input(request.birth_data, engine_name)
-                if request.parallel:
-                    # Create async task for parallel execution
-                    task = run_engine_calculation(engine_name, engine_input)
-                    engine_tasks.append((engine_name, task))
-                else:
-                    # Run sequentially
-                    result = await run_engine_calculation(engine_name, engine_input)
-                    engine_tasks.append((engine_name, result))
-            except Exception as e:
-                logger.error(f"Error preparing {engine_name}: {e}")
-                engine_tasks.append((engine_name, {
-                    "engine": engine_name,
-                    "error": str(e),
-                    "status": "preparation_error"
-                }))
-
-        # Execute engines
-        results = {}
-        if request.parallel:
-            # Wait for all parallel tasks
-            for engine_name, task in engine_tasks:
-                if asyncio.iscoroutine(task):
-                    results[engine_name] = await task
-                else:
-                    results[engine_name] = task
-        else:
-            # Results already computed sequentially
-            for engine_name, result in engine_tasks:
-                results[engine_name] = result
-
-        # Prepare response
-        response = {
-            "engines": request.engines,
-            "birth_data": request.birth_data.model_dump(),
-            "results": {
-                "consciousness_scan": {
-                    "subject_id": request.birth_data.name,
-                    "scan_timestamp": datetime.now().isoformat(),
-                    "engines_deployed": request.engines,
-                    "field_coherence": calculate_field_coherence(results),
-                    "debug_status": "COMPLETE"
-                },
-                "engine_outputs": results
-            },
-            "execution_mode": "parallel" if request.parallel else "sequential",
-            "timestamp": datetime.now().isoformat()
-        }
-
-        # Add synthesis if requested
-        if request.synthesize:
-            response["results"]["synthesis"] = generate_synthesis(results, request.birth_data)
-
-        # Apply formatting
-        if request.format == "mystical":
-            response = apply_mystical_formatting(response)
-        elif request.format == "witnessOS":
-            response = apply_witnessOS_formatting(response, request.birth_data)
+        if request.stream:
+            return StreamingResponse(
+                stream_reading_events(request),
+                media_type=STREAM_MEDIA_TYPES[request.stream]
+            )
 
-        # Cache result
-        if request.use_cache:
-            cache_result(cache_key, response)
+        # Answer conditional requests without running engines
+        cache_headers = build_cache_headers(request.engines, multi_engine_cache_key(request))
+        if etag_matches(if_none_match, cache_headers.get("ETag")):
+            return not_modified_response(cache_headers)
 
-        return response
+        response = await execute_multiple_engines(request)
+        return EngineJSONResponse(response, headers=cacheable_headers(cache_headers, reading_succeeded(response)))
 
     except HTTPException:
         raise
@@ -719,6 +865,169 @@ async def run_multiple_engines(request: MultiEngineRequest):
         logger.error(f"Error running multi-engine request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def execute_multiple_engines(request: MultiEngineRequest) -> Dict:
+    """Run a validated multi-engine request and return the assembled response"""
+    # Check cache if enabled
+    cache_key = multi_engine_cache_key(request)
+    cached_result = get_cached_result(cache_key) if request.use_cache else None
+    if cached_result:
+        logger.info(f"Cache hit for multi-engine request")
+        return cached_result["result"]
+
+    # Prepare engine inputs
+    engine_inputs, preparation_errors = prepare_engine_inputs(request.engines, request.birth_data)
+
+    # Execute engines (parallel fan-out or sequential)
+    results = dict(preparation_errors)
+    async for result in iter_engine_results(engine_inputs, request.parallel, request.engine_timeout):
+        results[result["engine"]] = result
+
+    response = build_multi_engine_response(request, results)
+
+    # Cache result (partial responses are not cached)
+    if request.use_cache and not response_is_partial(results):
+        cache_result(cache_key, response)
+
+    return response
+
+def multi_engine_cache_key(request: MultiEngineRequest) -> str:
+    """Generate cache key for multi-engine request"""
+    cache_data = {
+        "input": request.birth_data,
+        "parallel": request.parallel,
+        "synthesize": request.synthesize,
+        "format": request.format
+    }
+    return generate_cache_key(request.engines, cache_data)
+
+async def stream_reading_events(request: MultiEngineRequest,
+                                extra_sections: Optional[Callable[[Dict], Iterable[Tuple[str, Any]]]] = None):
+    """
+    Stream a multi-engine reading as NDJSON/SSE events.
+
+    Events are emitted as soon as they are available: one ``engine_result`` per
+    engine in completion order, then ``synthesis``, then one ``section`` event per
+    formatted section (plus any ``extra_sections`` derived from the consciousness
+    scan), and finally a small ``complete`` summary. The combined response body is
+    never assembled, so streamed readings are served from the cache but not
+    written to it.
+    """
+    stream_format = request.stream
+    cached_result = get_cached_result(multi_engine_cache_key(request)) if request.use_cache else None
+
+    if cached_result:
+        # Replay the cached response section by section
+        response = cached_result["result"]
+        section_names = []
+        for name, content in response.items():
+            section_names.append(name)
+            yield format_stream_event("section", {"name": name, "content": content}, stream_format)
+        scan = find_consciousness_scan(response)
+        timed_out_engines = scan.get("timed_out_engines", [])
+    else:
+        engine_inputs, preparation_errors = prepare_engine_inputs(request.engines, request.birth_data)
+
+        results = dict(preparation_errors)
+        for result in preparation_errors.values():
+            yield format_stream_event("engine_result", result, stream_format)
+
+        async for result in iter_engine_results(engine_inputs, request.parallel, request.engine_timeout):
+            results[result["engine"]] = result
+            yield format_stream_event("engine_result", result, stream_format)
+
+        results = {name: results[name] for name in request.engines if name in results}
+        scan = build_consciousness_scan(request, results)
+        timed_out_engines = scan["timed_out_engines"]
+
+        synthesis = None
+        if request.synthesize:
+            synthesis = generate_synthesis(results, request.birth_data)
+            yield format_stream_event("synthesis", synthesis, stream_format)
+
+        section_names = []
+        for name, content in iter_formatted_sections(request, scan, results, synthesis):
+            section_names.append(name)
+            yield format_stream_event("section", {"name": name, "content": content}, stream_format)
+
+    for name, content in (extra_sections(scan) if extra_sections else ()):
+        section_names.append(name)
+        yield format_stream_event("section", {"name": name, "content": content}, stream_format)
+
+    yield format_stream_event("complete", {
+        "engines": request.engines,
+        "sections": section_names,
+        "partial": bool(timed_out_engines),
+        "timed_out_engines": timed_out_engines,
+        "cached": cached_result is not None,
+        "timestamp": datetime.now().isoformat()
+    }, stream_format)
+
+def response_is_partial(results: Dict[str, Dict]) -> bool:
+    """Check whether any engine missed its deadline"""
+    return any(result.get("status") == "timeout" for result in results.values())
+
+def build_consciousness_scan(request: MultiEngineRequest, results: Dict[str, Dict]) -> Dict:
+    """Summarise a multi-engine run for the consciousness_scan section"""
+    timed_out_engines = [name for name, result in results.items() if result.get("status") == "timeout"]
+    return {
+        "subject_id": request.birth_data.name,
+        "scan_timestamp": datetime.now().isoformat(),
+        "engines_deployed": request.engines,
+        "field_coherence": calculate_field_coherence(results),
+        "debug_status": "PARTIAL" if timed_out_engines else "COMPLETE",
+        "timed_out_engines": timed_out_engines
+    }
+
+def find_consciousness_scan(response: Dict) -> Dict:
+    """Locate the consciousness_scan in a standard or witnessOS formatted response"""
+    if "consciousness_scan" in response:
+        return response["consciousness_scan"]
+    return response["results"]["consciousness_scan"]
+
+def build_multi_engine_response(request: MultiEngineRequest, results: Dict[str, Dict]) -> Dict:
+    """Assemble the multi-engine response from per-engine results"""
+    # Report results in request order regardless of completion order
+    results = {name: results[name] for name in request.engines if name in results}
+
+    # Prepare response
+    response = {
+        "engines": request.engines,
+        "birth_data": request.birth_data.model_dump(),
+        "results": {
+            "consciousness_scan": build_consciousness_scan(request, results),
+            "engine_outputs": results
+        },
+        "execution_mode": "parallel" if request.parallel else "sequential",
+        "timestamp": datetime.now().isoformat()
+    }
+
+    # Add synthesis if requested
+    if request.synthesize:
+        response["results"]["synthesis"] = generate_synthesis(results, request.birth_data)
+
+    # Apply formatting
+    if request.format == "mystical":
+        response = apply_mystical_formatting(response)
+    elif request.format == "witnessOS":
+        response = apply_witnessOS_formatting(response, request.birth_data)
+
+    return response
+
+def iter_formatted_sections(request: MultiEngineRequest, scan: Dict, results: Dict[str, Dict],
+                            synthesis: Optional[Dict]) -> Iterable[Tuple[str, Any]]:
+    """Yield the formatted sections of a multi-engine response one at a time"""
+    if request.format == "witnessOS":
+        yield from iter_witnessOS_sections(request.engines, scan, results, request.birth_data)
+        yield "timestamp", datetime.now().isoformat()
+        return
+
+    # Standard and mystical readings: engine outputs and synthesis were already streamed
+    yield "consciousness_scan", scan
+    yield "engines", request.engines
+    yield "birth_data", request.birth_data.model_dump()
+    yield "execution_mode", "parallel" if request.parallel else "sequential"
+    yield "timestamp", datetime.now().isoformat()
+
 # Helper functions for formatting and synthesis
 def apply_mystical_formatting(result: Dict) -> Dict:
     """Apply mystical formatting to engine results"""
@@ -747,59 +1056,11 @@ def apply_witnessOS_formatting(result: Dict, birth_data: BirthData) -> Dict:
     """Apply WitnessOS consciousness debugging format"""
     if isinstance(result, dict) and "results" in result:
         # Multi-engine response
-        witnessOS_result = {
-            "consciousness_scan": result["results"]["consciousness_scan"],
-            "debug_session": {
-                "subject_profile": {
-                    "identity_matrix": birth_data.name,
-                    "incarnation_timestamp": birth_data.date,
-                    "consciousness_anchor": birth_data.location,
-                    "temporal_coordinates": birth_data.time
-                },
-                "field_analysis": {
-                    "engines_deployed": result["engines"],
-                    "scan_depth": "comprehensive",
-                    "field_coherence": result["results"]["consciousness_scan"]["field_coherence"],
-                    "debug_status": "COMPLETE"
-                }
-            },
-            "engine_diagnostics": {},
-            "reality_patches": [],
-            "witness_protocol": {
-                "awareness_cultivation": [
-                    "Observe patterns without attachment",
-                    "Witness the play of consciousness",
-                    "Trust the intelligence of awareness"
-                ],
-                "integration_practices": [
-                    "Daily consciousness debugging",
-                    "Pattern recognition meditation",
-                    "Archetypal integration work"
-                ]
-            },
-            "timestamp": result.get("timestamp")
-        }
-
-        # Process engine outputs
-        for engine_name, engine_result in result["results"]["engine_outputs"].items():
-            witnessOS_result["engine_diagnostics"][engine_name] = {
-                "consciousness_debug": {
-                    f"{engine_name}_field_analysis": f"Consciousness patterns identified through {engine_name}",
-                    "reality_creation_codes": f"{engine_name.title()} algorithms extracted",
-                    "field_signature": f"{engine_name.upper()}_FIELD_ACTIVE"
-                },
-                "debug_output": engine_result.get("result", {}),
-                "status": engine_result.get("status", "unknown")
-            }
-
-            # Add reality patches
-            witnessOS_result["reality_patches"].append({
-                "patch_id": f"{engine_name}_optimization_001",
-                "description": f"Optimize {engine_name} field alignment",
-                "priority": "medium",
-                "implementation": f"Integrate {engine_name} insights into daily awareness practice"
-            })
-
+        witnessOS_result = dict(iter_witnessOS_sections(
+            result["engines"], result["results"]["consciousness_scan"],
+            result["results"]["engine_outputs"], birth_data
+        ))
+        witnessOS_result["timestamp"] = result.get("timestamp")
         return witnessOS_result
 
     elif isinstance(result, dict) and "engine" in result:
@@ -842,6 +1103,63 @@ def apply_witnessOS_formatting(result: Dict, birth_data: BirthData) -> Dict:
 
     return result
 
+def iter_witnessOS_sections(engines: List[str], scan: Dict, engine_outputs: Dict[str, Dict],
+                            birth_data: BirthData) -> Iterable[Tuple[str, Any]]:
+    """Yield the WitnessOS multi-engine sections in response order"""
+    yield "consciousness_scan", scan
+    yield "debug_session", {
+        "subject_profile": {
+            "identity_matrix": birth_data.name,
+            "incarnation_timestamp": birth_data.date,
+            "consciousness_anchor": birth_data.location,
+            "temporal_coordinates": birth_data.time
+        },
+        "field_analysis": {
+            "engines_deployed": engines,
+            "scan_depth": "comprehensive",
+            "field_coherence": scan["field_coherence"],
+            "debug_status": "COMPLETE"
+        }
+    }
+
+    # Process engine outputs
+    yield "engine_diagnostics", {
+        engine_name: {
+            "consciousness_debug": {
+                f"{engine_name}_field_analysis": f"Consciousness patterns identified through {engine_name}",
+                "reality_creation_codes": f"{engine_name.title()} algorithms extracted",
+                "field_signature": f"{engine_name.upper()}_FIELD_ACTIVE"
+            },
+            "debug_output": engine_result.get("result", {}),
+            "status": engine_result.get("status", "unknown")
+        }
+        for engine_name, engine_result in engine_outputs.items()
+    }
+
+    # Add reality patches
+    yield "reality_patches", [
+        {
+            "patch_id": f"{engine_name}_optimization_001",
+            "description": f"Optimize {engine_name} field alignment",
+            "priority": "medium",
+            "implementation": f"Integrate {engine_name} insights into daily awareness practice"
+        }
+        for engine_name in engine_outputs
+    ]
+
+    yield "witness_protocol", {
+        "awareness_cultivation": [
+            "Observe patterns without attachment",
+            "Witness the play of consciousness",
+            "Trust the intelligence of awareness"
+        ],
+        "integration_practices": [
+            "Daily consciousness debugging",
+            "Pattern recognition meditation",
+            "Archetypal integration work"
+        ]
+    }
+
 def calculate_field_coherence(results: Dict) -> float:
     """Calculate consciousness field coherence from engine results"""
     try:
@@ -926,7 +1244,7 @@ async def list_workflows():
     }
 
 @app.post("/v1/workflows/run")
-async def run_workflow(request: WorkflowRequest):
+async def run_workflow(request: WorkflowRequest, if_none_match: Optional[str] = Header(None)):
     """Execute a predefined workflow"""
     try:
         if request.workflow_name not in AVAILABLE_WORKFLOWS:
@@ -956,21 +1274,33 @@ async def run_workflow(request: WorkflowRequest):
             parallel=True,
             synthesize=True,
             format=request.format,
-            use_cache=request.use_cache
+            use_cache=request.use_cache,
+            stream=request.stream
         )
 
+        if request.stream:
+            return StreamingResponse(
+                stream_reading_events(
+                    multi_request,
+                    extra_sections=lambda scan: [("workflow", build_workflow_metadata(request.workflow_name, engines))]
+                ),
+                media_type=STREAM_MEDIA_TYPES[request.stream]
+            )
+
+        # Answer conditional requests without running engines
+        cache_headers = build_cache_headers(
+            engines, f"{multi_engine_cache_key(multi_request)}:workflow:{request.workflow_name}"
+        )
+        if etag_matches(if_none_match, cache_headers.get("ETag")):
+            return not_modified_response(cache_headers)
+
         # Execute workflow
-        result = await run_multiple_engines(multi_request)
+        result = await execute_multiple_engines(multi_request)
 
         # Add workflow metadata
-        result["workflow"] = {
-            "name": request.workflow_name,
-            "description": f"Executed {request.workflow_name} workflow",
-            "engines_used": engines,
-            "execution_timestamp": datetime.now().isoformat()
-        }
+        result["workflow"] = build_workflow_metadata(request.workflow_name, engines)
 
-        return result
+        return EngineJSONResponse(result, headers=cacheable_headers(cache_headers, reading_succeeded(result)))
 
     except HTTPException:
         raise
@@ -978,8 +1308,59 @@ async def run_workflow(request: WorkflowRequest):
         logger.error(f"Error running workflow {request.workflow_name}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def build_workflow_metadata(workflow_name: str, engines: List[str]) -> Dict:
+    """Describe an executed workflow"""
+    return {
+        "name": workflow_name,
+        "description": f"Executed {workflow_name} workflow",
+        "engines_used": engines,
+        "execution_timestamp": datetime.now().isoformat()
+    }
+
+def build_field_analysis_sections(request: FieldAnalysisRequest, engines: List[str],
+                                  scan: Dict) -> List[Tuple[str, Dict]]:
+    """Build the field_analysis and analysis_metadata sections from a consciousness scan"""
+    field_coherence = scan["field_coherence"]
+
+    # Enhance with field-specific analysis
+    field_analysis = {
+        "field_diagnostic": {
+            "analysis_depth": request.analysis_depth,
+            "field_coherence": field_coherence,
+            "consciousness_level": {
+                "awareness": "expanding" if field_coherence > 0.7 else "developing",
+                "integration": "active" if len(engines) > 2 else "beginning"
+            },
+            "evolution_vector": {
+                "direction": "ascending" if field_coherence > 0.6 else "stabilizing",
+                "velocity": "moderate"
+            },
+            "diagnostic_timestamp": datetime.now().isoformat()
+        },
+        "consciousness_map": {
+            "primary_patterns": ["Seeker", "Creator"] if field_coherence > 0.7 else ["Explorer"],
+            "secondary_influences": ["Transformer", "Healer"],
+            "integration_points": ["Heart-Mind", "Intuition-Logic"]
+        },
+        "field_recommendations": [
+            "Cultivate witness consciousness through daily practice",
+            "Observe patterns without attachment",
+            "Trust the intelligence of awareness",
+            f"Focus on {engines[0]} insights for immediate integration"
+        ]
+    }
+
+    analysis_metadata = {
+        "analysis_type": "consciousness_field_diagnostic",
+        "depth": request.analysis_depth,
+        "engines_analyzed": engines,
+        "timestamp": datetime.now().isoformat()
+    }
+
+    return [("field_analysis", field_analysis), ("analysis_metadata", analysis_metadata)]
+
 @app.post("/v1/field-analysis")
-async def analyze_consciousness_field(request: FieldAnalysisRequest):
+async def analyze_consciousness_field(request: FieldAnalysisRequest, if_none_match: Optional[str] = Header(None)):
     """Perform consciousness field analysis"""
     try:
         # Use specified engines or default set
@@ -1000,50 +1381,33 @@ async def analyze_consciousness_field(request: FieldAnalysisRequest):
             parallel=True,
             synthesize=True,
             format="witnessOS",
-            use_cache=request.use_cache
+            use_cache=request.use_cache,
+            stream=request.stream
         )
 
+        if request.stream:
+            return StreamingResponse(
+                stream_reading_events(
+                    multi_request,
+                    extra_sections=lambda scan: build_field_analysis_sections(request, engines, scan)
+                ),
+                media_type=STREAM_MEDIA_TYPES[request.stream]
+            )
+
+        # Answer conditional requests without running engines
+        cache_headers = build_cache_headers(
+            engines, f"{multi_engine_cache_key(multi_request)}:field:{request.analysis_depth}"
+        )
+        if etag_matches(if_none_match, cache_headers.get("ETag")):
+            return not_modified_response(cache_headers)
+
         # Execute analysis
-        result = await run_multiple_engines(multi_request)
-
-        # Enhance with field-specific analysis
-        field_analysis = {
-            "field_diagnostic": {
-                "analysis_depth": request.analysis_depth,
-                "field_coherence": result["results"]["consciousness_scan"]["field_coherence"],
-                "consciousness_level": {
-                    "awareness": "expanding" if result["results"]["consciousness_scan"]["field_coherence"] > 0.7 else "developing",
-                    "integration": "active" if len(engines) > 2 else "beginning"
-                },
-                "evolution_vector": {
-                    "direction": "ascending" if result["results"]["consciousness_scan"]["field_coherence"] > 0.6 else "stabilizing",
-                    "velocity": "moderate"
-                },
-                "diagnostic_timestamp": datetime.now().isoformat()
-            },
-            "consciousness_map": {
-                "primary_patterns": ["Seeker", "Creator"] if result["results"]["consciousness_scan"]["field_coherence"] > 0.7 else ["Explorer"],
-                "secondary_influences": ["Transformer", "Healer"],
-                "integration_points": ["Heart-Mind", "Intuition-Logic"]
-            },
-            "field_recommendations": [
-                "Cultivate witness consciousness through daily practice",
-                "Observe patterns without attachment",
-                "Trust the intelligence of awareness",
-                f"Focus on {engines[0]} insights for immediate integration"
-            ]
-        }
+        result = await execute_multiple_engines(multi_request)
 
         # Merge field analysis with engine results
-        result["field_analysis"] = field_analysis
-        result["analysis_metadata"] = {
-            "analysis_type": "consciousness_field_diagnostic",
-            "depth": request.analysis_depth,
-            "engines_analyzed": engines,
-            "timestamp": datetime.now().isoformat()
-        }
+        result.update(build_field_analysis_sections(request, engines, find_consciousness_scan(result)))
 
-        return result
+        return EngineJSONResponse(result, headers=cacheable_headers(cache_headers, reading_succeeded(result)))
 
     except HTTPException:
         raise
@@ -546,6 +546,258 @@ class TestPerformance:
         # Should respond within 30 seconds (generous limit for testing)
         assert response_time < 30.0
 
+def _slow_engine(delays):
+    """Build an async engine stub that sleeps for a per-engine delay"""
+    async def run(engine_name, input_data, config=None, started=None):
+        if started is not None:
+            started.set()
+        await asyncio.sleep(delays.get(engine_name, 0.0))
+        return {
+            "engine": engine_name,
+            "result": {"engine": engine_name},
+            "status": "success",
+            "timestamp": datetime.now().isoformat(),
+            "cached": False
+        }
+    return run
+
+class TestConcurrentFanOut:
+    """Test concurrent multi-engine fan-out with deadlines and streaming"""
+
+    def test_parallel_engines_run_concurrently(self):
+        """Parallel engines should take roughly the slowest engine, not the sum"""
+        delays = {"numerology": 0.3, "biorhythm": 0.3, "tarot": 0.3}
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            start_time = datetime.now()
+            response = client.post("/v1/engines/multi", json={
+                "engines": list(delays),
+                "birth_data": TEST_BIRTH_DATA,
+                "format": "standard",
+                "use_cache": False
+            })
+            elapsed = (datetime.now() - start_time).total_seconds()
+
+        assert response.status_code == 200
+        assert elapsed < 0.8
+        outputs = response.json()["results"]["engine_outputs"]
+        assert list(outputs) == list(delays)
+
+    def test_engine_timeout_returns_partial_result(self):
+        """Engines missing their deadline are reported without failing the request"""
+        delays = {"numerology": 0.0, "biorhythm": 2.0}
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            response = client.post("/v1/engines/multi", json={
+                "engines": list(delays),
+                "birth_data": TEST_BIRTH_DATA,
+                "format": "standard",
+                "engine_timeout": 0.2,
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        data = response.json()["results"]
+        assert data["engine_outputs"]["numerology"]["status"] == "success"
+        assert data["engine_outputs"]["biorhythm"]["status"] == "timeout"
+        assert data["consciousness_scan"]["debug_status"] == "PARTIAL"
+        assert data["consciousness_scan"]["timed_out_engines"] == ["biorhythm"]
+
+    def test_queued_engines_do_not_spend_their_deadline(self):
+        """The deadline starts when a worker starts the engine, not at submission"""
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+
+        class Engine:
+            def __init__(self, config=None):
+                pass
+
+            def calculate(self, input_data):
+                time.sleep(0.2)
+                return {"engine": "slow"}
+
+        engines = ["numerology", "biorhythm", "tarot"]
+        with ThreadPoolExecutor(max_workers=1) as single_worker, \
+                patch('api.production_api.executor', single_worker), \
+                patch('api.production_api.load_engine_class', lambda engine_name: Engine):
+            response = client.post("/v1/engines/multi", json={
+                "engines": engines,
+                "birth_data": TEST_BIRTH_DATA,
+                "format": "standard",
+                "engine_timeout": 0.35,
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        outputs = response.json()["results"]["engine_outputs"]
+        assert [outputs[engine]["status"] for engine in engines] == ["success"] * 3
+
+    def test_ndjson_stream_emits_results_in_completion_order(self):
+        """Fast engines are streamed before slow ones, followed by formatted sections"""
+        delays = {"numerology": 0.3, "biorhythm": 0.0}
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            response = client.post("/v1/engines/multi", json={
+                "engines": list(delays),
+                "birth_data": TEST_BIRTH_DATA,
+                "format": "standard",
+                "stream": "ndjson",
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines() if line]
+        assert [event["event"] for event in events[:3]] == ["engine_result", "engine_result", "synthesis"]
+        assert events[0]["data"]["engine"] == "biorhythm"
+        assert events[-1]["event"] == "complete"
+        assert events[-1]["data"]["partial"] is False
+
+class TestStreamingReadings:
+    """Test streaming mode for workflow and field analysis readings"""
+
+    def test_workflow_stream_event_order(self):
+        """Workflows stream engine results, synthesis, sections and a summary"""
+        delays = {"numerology": 0.0, "human_design": 0.0, "enneagram": 0.0}
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            response = client.post("/v1/workflows/run", json={
+                "workflow_name": "relationship_compatibility",
+                "birth_data": TEST_BIRTH_DATA,
+                "stream": "ndjson",
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines() if line]
+        names = [event["event"] for event in events]
+        assert names[:4] == ["engine_result"] * 3 + ["synthesis"]
+        assert names[-1] == "complete"
+
+        sections = [event["data"]["name"] for event in events if event["event"] == "section"]
+        assert sections[0] == "consciousness_scan"
+        assert "engine_diagnostics" in sections
+        assert sections[-1] == "workflow"
+        assert events[-1]["data"]["sections"] == sections
+
+    def test_field_analysis_sse_stream(self):
+        """Field analysis streams as server-sent events ending with its diagnostic"""
+        delays = {"numerology": 0.0, "biorhythm": 0.0}
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            response = client.post("/v1/field-analysis", json={
+                "birth_data": TEST_BIRTH_DATA,
+                "engines": list(delays),
+                "stream": "sse",
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        blocks = [block for block in response.text.split("\n\n") if block]
+        events = [block.split("\n")[0][len("event: "):] for block in blocks]
+        assert events[0] == "engine_result"
+        assert events[-1] == "complete"
+
+        field_block = next(block for block in blocks if '"name":"field_analysis"' in block)
+        payload = json.loads(field_block.split("\n")[1][len("data: "):])
+        assert "field_diagnostic" in payload["content"]
+
+    def test_stream_rejects_invalid_workflow_before_streaming(self):
+        """Validation errors are still returned as regular error responses"""
+        response = client.post("/v1/workflows/run", json={
+            "workflow_name": "invalid_workflow",
+            "birth_data": TEST_BIRTH_DATA,
+            "stream": "ndjson"
+        })
+        assert response.status_code == 400
+
+class TestConditionalResponses:
+    """Test ETag / If-None-Match handling and Cache-Control per determinism class"""
+
+    def test_static_engine_returns_304_without_running(self):
+        """A matching If-None-Match skips the engine entirely"""
+        request_data = {
+            "engine_name": "human_design",
+            "input_data": TEST_BIRTH_DATA,
+            "format": "standard",
+            "use_cache": False
+        }
+        with patch('api.production_api.run_engine_calculation', _slow_engine({"human_design": 0.0})):
+            first = client.post("/v1/engines/run", json=request_data)
+
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, max-age=86400, must-revalidate"
+
+        with patch('api.production_api.run_engine_calculation') as mock_run:
+            second = client.post("/v1/engines/run", json=request_data, headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        mock_run.assert_not_called()
+
+    def test_volatile_engine_is_not_cacheable(self):
+        """Random-draw engines get no ETag and no-store"""
+        with patch('api.production_api.run_engine_calculation', _slow_engine({"tarot": 0.0})):
+            response = client.post("/v1/engines/run", json={
+                "engine_name": "tarot",
+                "input_data": TEST_BIRTH_DATA,
+                "format": "standard",
+                "use_cache": False
+            })
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert response.headers["cache-control"] == "no-store"
+
+    def test_daily_engine_etag_and_mismatch(self):
+        """Date-dependent engines expire with the day; stale ETags get a full response"""
+        delays = {"numerology": 0.0, "biorhythm": 0.0}
+        request_data = {
+            "engines": list(delays),
+            "birth_data": TEST_BIRTH_DATA,
+            "format": "standard",
+            "use_cache": False
+        }
+        with patch('api.production_api.run_engine_calculation', _slow_engine(delays)):
+            response = client.post("/v1/engines/multi", json=request_data,
+                                   headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        max_age = int(response.headers["cache-control"].split("max-age=")[1].split(",")[0])
+        assert 0 < max_age <= 86400
+        assert response.headers["etag"] != '"stale"'
+
+    def test_personal_year_engine_expires_with_the_day(self):
+        """Numerology depends on the current year, so neither its ETag nor its cache key outlives the day"""
+        from api.production_api import date_bucket, generate_cache_key
+        new_years_eve, new_year = datetime(2026, 12, 31, 23, 59), datetime(2027, 1, 1, 0, 1)
+        assert date_bucket(["numerology"], new_years_eve) != date_bucket(["numerology"], new_year)
+
+        with patch('api.production_api.date_bucket', lambda engines, now=None: "2026-12-31"):
+            before = generate_cache_key(["numerology"], {"input": TEST_BIRTH_DATA})
+        with patch('api.production_api.date_bucket', lambda engines, now=None: "2027-01-01"):
+            after = generate_cache_key(["numerology"], {"input": TEST_BIRTH_DATA})
+        assert before != after
+
+    def test_engine_upgrade_changes_cache_key_and_etag(self):
+        """Cache keys and ETags carry the loaded engine's version"""
+        from api.production_api import ENGINE_VERSIONS, build_cache_headers, generate_cache_key
+
+        def engine_class(version):
+            class Engine:
+                def __init__(self, config=None):
+                    self._version = version
+            return lambda engine_name: Engine
+
+        keys = []
+        for version in ("1.0.0", "1.1.0"):
+            ENGINE_VERSIONS.clear()
+            with patch('api.production_api.load_engine_class', engine_class(version)):
+                keys.append(generate_cache_key(["human_design"], {"input": TEST_BIRTH_DATA}))
+        ENGINE_VERSIONS.clear()
+
+        assert keys[0] != keys[1]
+        assert build_cache_headers(["human_design"], keys[0])["ETag"] != \
+            build_cache_headers(["human_design"], keys[1])["ETag"]
+
 class TestIntegration:
     """Integration tests for complete workflows"""
 
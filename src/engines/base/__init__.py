@@ -40,6 +40,50 @@ from .utils import (
     load_engine_config,
     get_config_value
 )
+from .serialization import (
+    JSONSerializer,
+    OrjsonSerializer,
+    register_serializer,
+    get_serializer,
+    set_serializer,
+    get_model_encoder,
+    dumps,
+    dumps_str,
+    loads,
+    canonical_dumps,
+    hash_payload
+)
+from .canonical import (
+    canonicalize,
+    canonicalize_birth_data,
+    normalize_text,
+    normalize_date,
+    normalize_time,
+    normalize_coordinates,
+    to_utc_instant,
+    content_hash,
+    subject_hash
+)
+from .cache import TTLCache, identity_memo
+from .determinism import (
+    STATIC,
+    DAILY,
+    VOLATILE,
+    DETERMINISM_ORDER,
+    ENGINE_DETERMINISM,
+    engine_determinism,
+    determinism_class,
+    is_reusable
+)
+from .features import (
+    FeatureVector,
+    ARCHETYPE_KEYWORDS,
+    ARCHETYPE_MASKS,
+    extract_features,
+    features_of,
+    keyword_mask
+)
+from .keyword_index import KeywordIndex, index_terms
 
 __all__ = [
     # Core classes
@@ -91,5 +135,55 @@ __all__ = [
     # Text utilities
     "extract_letters_only",
     "extract_vowels",
-    "extract_consonants"
+    "extract_consonants",
+
+    # Serialization utilities
+    "JSONSerializer",
+    "OrjsonSerializer",
+    "register_serializer",
+    "get_serializer",
+    "set_serializer",
+    "get_model_encoder",
+    "dumps",
+    "dumps_str",
+    "loads",
+    "canonical_dumps",
+    "hash_payload",
+
+    # Canonicalization utilities
+    "canonicalize",
+    "canonicalize_birth_data",
+    "normalize_text",
+    "normalize_date",
+    "normalize_time",
+    "normalize_coordinates",
+    "to_utc_instant",
+    "content_hash",
+    "subject_hash",
+
+    # Caching utilities
+    "TTLCache",
+    "identity_memo",
+
+    # Determinism registry
+    "STATIC",
+    "DAILY",
+    "VOLATILE",
+    "DETERMINISM_ORDER",
+    "ENGINE_DETERMINISM",
+    "engine_determinism",
+    "determinism_class",
+    "is_reusable",
+
+    # Feature vectors
+    "FeatureVector",
+    "ARCHETYPE_KEYWORDS",
+    "ARCHETYPE_MASKS",
+    "extract_features",
+    "features_of",
+    "keyword_mask",
+
+    # Keyword index
+    "KeywordIndex",
+    "index_terms"
 ]
@@ -0,0 +1,185 @@
+"""
+In-memory result caching for WitnessOS Divination Engines
+
+Provides a thread-safe mapping bounded by size (least recently used entries
+are evicted first), optionally by the approximate memory of its values, with
+an optional per-entry time-to-live.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache(MutableMapping):
+    """
+    Bounded LRU mapping with optional expiry.
+
+    Behaves like a dict (so it can replace plain dict caches) while keeping
+    at most ``maxsize`` entries, each valid for ``ttl`` seconds. With
+    ``maxbytes`` the values' total size (as measured by ``sizeof``) is
+    bounded too.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic,
+                 maxbytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None for no expiry)
+            timer: Monotonic clock, injectable for tests
+            maxbytes: Maximum total size of the values (None for no bound)
+            sizeof: Size of a value in bytes; the default is shallow, so pass
+                a deep measure for nested values
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if maxbytes is not None and maxbytes < 1:
+            raise ValueError("maxbytes must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._timer = timer
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and self._timer() >= expires_at
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Find a live entry, dropping it if expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if self._expired(expires_at):
+            self._drop(key)
+            return False, None
+        return True, value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            found, value = self._lookup(key)
+            if not found:
+                self.misses += 1
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _drop(self, key: Hashable):
+        """Remove an entry and its size accounting"""
+        del self._data[key]
+        self.bytes -= self._sizes.pop(key, 0)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value, optionally with its own lifetime
+
+        Args:
+            key: Entry key
+            value: Entry value
+            ttl: Seconds this entry stays valid (None for the cache's ttl)
+        """
+        if ttl is None:
+            ttl = self.ttl
+        with self._lock:
+            expires_at = self._timer() + ttl if ttl is not None else None
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (expires_at, value)
+            if self.maxbytes is not None:
+                self._sizes[key] = self._sizeof(value)
+                self.bytes += self._sizes[key]
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.bytes > self.maxbytes and len(self._data) > 1
+            ):
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    def __delitem__(self, key: Hashable):
+        with self._lock:
+            self._drop(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._lookup(key)[0]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            self.purge_expired()
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.purge_expired()
+            return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"TTLCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)})"
+
+    def purge_expired(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._data.items() if self._expired(expires_at)]
+            for key in expired:
+                self._drop(key)
+            return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {
+                'size': len(self),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'bytes': self.bytes,
+                'maxbytes': self.maxbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+def identity_memo(cache: MutableMapping, key: Hashable, objects: Tuple[Any, ...],
+                  compute: Callable[[], Any]) -> Any:
+    """
+    Memoize a value derived from specific objects (e.g. engine outputs)
+
+    Entries are keyed by the objects' identities and hold references to them,
+    so an id cannot be reused by a new object while its entry is cached, and a
+    new (changed) object always misses.
+
+    Args:
+        cache: Mapping holding the entries (normally a TTLCache)
+        key: Name of the derived value, e.g. ('coherence', 'tarot')
+        objects: Objects the value is derived from
+        compute: Computes the value on a miss
+    """
+    full_key = (key, tuple(id(obj) for obj in objects))
+    entry = cache.get(full_key)
+    if entry is not None:
+        return entry[1]
+    value = compute()
+    cache[full_key] = (objects, value)
+    return value
@@ -0,0 +1,224 @@
+"""
+Canonical input normalization for WitnessOS Divination Engines
+
+Normalizes birth data and request payloads so that equivalent inputs
+("1990-1-5" vs "1990-01-05", coordinate float noise, name whitespace/case,
+key order) produce the same stable 128-bit content hash. Every result cache
+keys on content_hash so hit rates reflect real reuse.
+"""
+
+import dataclasses
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional
+
+import pytz
+from pydantic import BaseModel
+
+from .serialization import hash_payload
+from .utils import parse_date_flexible, parse_time_flexible
+
+
+# Rounding applied to coordinates (4 decimals is roughly 11 m) and other floats
+COORDINATE_PRECISION = 4
+FLOAT_PRECISION = 6
+
+# Request metadata that never influences a calculation
+VOLATILE_FIELDS = frozenset({"timestamp", "session_id", "user_id"})
+
+# Field names recognized across production API, agent and engine input models
+TEXT_FIELDS = frozenset({"name", "full_name", "preferred_name", "location"})
+DATE_FIELDS = frozenset({"date", "birth_date", "target_date", "current_date"})
+TIME_FIELDS = frozenset({"time", "birth_time"})
+COORDINATE_FIELDS = frozenset({"birth_location", "coordinates"})
+
+# Date formats not covered by parse_date_flexible (production API uses DD.MM.YYYY)
+_EXTRA_DATE_FORMATS = ("%d.%m.%Y", "%Y.%m.%d")
+
+
+def normalize_text(value: str) -> str:
+    """Collapse whitespace and case-fold a name or place string."""
+    return " ".join(value.split()).casefold()
+
+
+def normalize_date(value: Any) -> str:
+    """
+    Normalize a date to ISO format (YYYY-MM-DD).
+
+    Raises:
+        ValueError: If the date cannot be parsed
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        for fmt in _EXTRA_DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).date().isoformat()
+            except ValueError:
+                continue
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    return parse_date_flexible(value).isoformat()
+
+
+def normalize_time(value: Any) -> Optional[str]:
+    """Normalize a time to HH:MM:SS, or None if it cannot be parsed."""
+    if isinstance(value, str):
+        value = value.strip()
+    parsed = parse_time_flexible(value)
+    return parsed.replace(microsecond=0).isoformat() if parsed else None
+
+
+def normalize_coordinates(value: Any) -> Any:
+    """Round a (latitude, longitude) pair to COORDINATE_PRECISION decimals."""
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return [round(float(component), COORDINATE_PRECISION) for component in value]
+    return canonicalize(value)
+
+
+def to_utc_instant(birth_date: str, birth_time: str, timezone: str) -> Optional[str]:
+    """
+    Convert a normalized local birth date/time in a named timezone to a UTC instant.
+
+    Returns:
+        ISO timestamp in UTC, or None if the timezone is unknown
+    """
+    try:
+        tz = pytz.timezone(timezone.strip())
+    except (pytz.UnknownTimeZoneError, AttributeError):
+        return None
+
+    local_dt = datetime.combine(date.fromisoformat(birth_date), time.fromisoformat(birth_time))
+    return tz.localize(local_dt).astimezone(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def canonicalize(value: Any, key: Optional[str] = None) -> Any:
+    """
+    Convert a payload into its canonical JSON-compatible form.
+
+    Models and dataclasses become dicts, known birth-data fields are normalized
+    by name, floats are rounded and sets are sorted. Mappings drop volatile
+    metadata and fuse local birth time and timezone into a UTC instant (the
+    local date is kept).
+
+    Args:
+        value: Payload to canonicalize
+        key: Field name the value was found under, if any
+
+    Returns:
+        Canonical representation suitable for hashing
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+
+    if isinstance(value, Mapping):
+        return canonicalize_mapping(value)
+
+    if value is None:
+        return None
+    if key in TEXT_FIELDS and isinstance(value, str):
+        return normalize_text(value)
+    if key in DATE_FIELDS:
+        try:
+            return normalize_date(value)
+        except (ValueError, TypeError):
+            pass
+    if key in TIME_FIELDS:
+        normalized = normalize_time(value)
+        if normalized is not None:
+            return normalized
+    if key in COORDINATE_FIELDS:
+        return normalize_coordinates(value)
+
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        return round(value, FLOAT_PRECISION)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonicalize(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    return value
+
+
+def canonicalize_mapping(data: Mapping) -> Dict[str, Any]:
+    """Canonicalize a mapping, dropping volatile fields and fusing the birth instant."""
+    result = {
+        str(key): canonicalize(value, key)
+        for key, value in data.items()
+        if key not in VOLATILE_FIELDS
+    }
+    _fuse_birth_instant(result)
+    return result
+
+
+def _fuse_birth_instant(data: Dict[str, Any]) -> None:
+    """
+    Replace local time and timezone with a single UTC instant when date, time
+    and timezone are all known.
+
+    The normalized local date is kept next to the instant: engines such as
+    numerology read the local calendar date, which the instant alone does not
+    determine.
+    """
+    for date_key, time_key in (("birth_date", "birth_time"), ("date", "time")):
+        birth_date, birth_time = data.get(date_key), data.get(time_key)
+        timezone = data.get("timezone")
+        if not (isinstance(birth_date, str) and isinstance(birth_time, str) and isinstance(timezone, str)):
+            continue
+
+        try:
+            instant = to_utc_instant(birth_date, birth_time, timezone)
+        except ValueError:
+            instant = None
+
+        if instant is not None:
+            del data[time_key], data["timezone"]
+            data["birth_instant"] = instant
+        return
+
+
+def canonicalize_birth_data(birth_data: Any) -> Dict[str, Any]:
+    """
+    Normalize birth data (local date plus UTC instant, rounded coordinates, cleaned name).
+
+    Accepts production API BirthData models, agent birth-data dicts and engine
+    input models.
+    """
+    return canonicalize(birth_data)
+
+
+def content_hash(engine: str, payload: Any, engine_version: Optional[str] = None) -> str:
+    """
+    Stable 128-bit content hash for an (engine, engine-version, canonical input) triple.
+
+    Args:
+        engine: Engine name (or another stable identifier of the computation)
+        payload: Input payload; canonicalized before hashing
+        engine_version: Version of the engine implementation, if known
+
+    Returns:
+        32-character hex digest
+    """
+    return hash_payload({
+        "engine": engine,
+        "engine_version": engine_version,
+        "input": canonicalize(payload)
+    })
+
+
+def subject_hash(birth_data: Any) -> str:
+    """
+    Stable hash identifying a person by their canonical birth data.
+
+    Shared by the per-subject caches (workflow results, pairwise field
+    relationships), so the same person maps to the same key everywhere.
+    """
+    return content_hash("subject", birth_data)
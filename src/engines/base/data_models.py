@@ -7,7 +7,7 @@ and validation across all engines.
 
 from datetime import date, time, datetime
 from typing import Optional, List, Dict, Tuple, Any, Union
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, ConfigDict
 import time as time_module
 
 
@@ -52,8 +52,20 @@ class BaseEngineOutput(BaseModel):
     reality_patches: List[str] = Field(default_factory=list, description="Suggested reality patches")
     archetypal_themes: List[str] = Field(default_factory=list, description="Identified archetypal patterns")
 
+    # Typed feature vector exported at calculation time (see base.features); never serialized
+    _features: Any = PrivateAttr(default=None)
+
     model_config = ConfigDict(validate_assignment=True)
 
+    @property
+    def features(self) -> Any:
+        """Feature vector summarizing raw_data for synthesis, if extracted."""
+        return self._features
+
+    @features.setter
+    def features(self, value: Any):
+        self._features = value
+
 
 # Specialized input models for common data types
 
@@ -132,14 +144,17 @@ def validate_date_range(birth_date: date, min_year: int = 1900, max_year: Option
 
 
 def create_field_signature(*args) -> str:
-    """Create a unique field signature from input parameters."""
-    import hashlib
+    """
+    Create a stable field signature from input parameters.
 
-    # Convert all arguments to strings and join
-    signature_data = "|".join(str(arg) for arg in args if arg is not None)
+    Arguments are canonicalized first, so equivalent inputs share a signature
+    and request timestamps do not make every signature unique.
+    """
+    from .canonical import canonicalize
+    from .serialization import hash_payload
 
-    # Create hash
-    return hashlib.md5(signature_data.encode()).hexdigest()[:12]
+    # Hash the canonical form of all arguments
+    return hash_payload([canonicalize(arg) for arg in args if arg is not None])[:12]
 
 
 # Common response structures
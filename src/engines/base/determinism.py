@@ -0,0 +1,50 @@
+"""
+Engine determinism registry for WitnessOS Divination Engines
+
+Classifies every engine by what besides its input its output depends on, so
+every cache layer (orchestrator and workflow result reuse, production API
+ETags and Cache-Control) agrees on which results may be reused and for how
+long.
+"""
+
+from typing import Iterable
+
+
+# Identical output for identical input
+STATIC = "static"
+# Depends on the current date; reusable within a day
+DAILY = "daily"
+# Random draws or generated, timestamped artifacts; never reused
+VOLATILE = "volatile"
+
+# Classes from most to least deterministic
+DETERMINISM_ORDER = (STATIC, DAILY, VOLATILE)
+
+ENGINE_DETERMINISM = {
+    # Personal year (and its cycles) follow the current year
+    "numerology": DAILY,
+    "human_design": STATIC,
+    "gene_keys": STATIC,
+    "biorhythm": DAILY,
+    "vimshottari": DAILY,
+    "tarot": VOLATILE,
+    "iching": VOLATILE,
+    "enneagram": VOLATILE,
+    "sacred_geometry": VOLATILE,
+    "sigil_forge": VOLATILE
+}
+
+
+def engine_determinism(engine_name: str) -> str:
+    """Determinism class of an engine (unknown engines are volatile)."""
+    return ENGINE_DETERMINISM.get(engine_name, VOLATILE)
+
+
+def determinism_class(engines: Iterable[str]) -> str:
+    """Least deterministic class among the engines (static for none)."""
+    return max((engine_determinism(engine) for engine in engines), key=DETERMINISM_ORDER.index, default=STATIC)
+
+
+def is_reusable(engine_name: str) -> bool:
+    """Whether an engine's results may be cached and reused at all."""
+    return engine_determinism(engine_name) != VOLATILE
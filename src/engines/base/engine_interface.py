@@ -7,7 +7,7 @@ specialized functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 import logging
 from datetime import datetime
 
@@ -19,6 +19,7 @@ from .data_models import (
     end_timer,
     create_field_signature
 )
+from .features import FeatureVector, extract_features
 
 
 class BaseEngine(ABC):
@@ -28,6 +29,9 @@ class BaseEngine(ABC):
     This class defines the common interface and shared functionality
     that all engines must implement.
     """
+
+    # Shared intermediate products this engine builds on (see integration.dag)
+    shared_products: Tuple[str, ...] = ()
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -194,6 +198,22 @@ class BaseEngine(ABC):
         """
         return []
     
+    def _extract_features(self, calculation_results: Dict[str, Any], input_data: BaseEngineInput) -> FeatureVector:
+        """
+        Extract the feature vector synthesis correlates across engines.
+        
+        Override to export engine-specific features more cheaply or precisely
+        than the generic scan of the calculation results.
+        
+        Args:
+            calculation_results: Results from _calculate method
+            input_data: Original input data
+            
+        Returns:
+            Feature vector of the calculation results
+        """
+        return extract_features(calculation_results)
+    
     def _calculate_confidence(self, calculation_results: Dict[str, Any], input_data: BaseEngineInput) -> float:
         """
         Calculate confidence score for the results.
@@ -253,8 +273,8 @@ class BaseEngine(ABC):
             # Generate field signature
             field_signature = create_field_signature(
                 self.engine_name,
-                str(validated_input),
-                datetime.now().isoformat()
+                self._version,
+                validated_input
             )
             
             # Create output
@@ -270,6 +290,9 @@ class BaseEngine(ABC):
                 archetypal_themes=archetypal_themes
             )
             
+            # Export the typed feature vector used by synthesis
+            output.features = self._extract_features(calculation_results, validated_input)
+            
             # Update engine statistics
             self._last_calculation_time = calculation_time
             self._total_calculations += 1
@@ -0,0 +1,159 @@
+"""
+Feature vectors for WitnessOS Divination Engines
+
+Each engine output carries a compact, typed summary of its raw data: numeric
+values with occurrence counts, a bitmask of archetypal keywords, the
+temporal markers (dates) it mentions and its index terms (which seed the
+reading's KeywordIndex). Vectors are extracted once when the
+engine calculates, so cross-engine synthesis correlates them with set and
+bitmask operations instead of walking and stringifying raw result graphs.
+"""
+
+import dataclasses
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+from pydantic import BaseModel
+
+from .keyword_index import index_terms
+
+
+# Archetypes correlated across systems and the keywords that signal them
+ARCHETYPE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'leadership': ('manifestor', 'emperor', 'line_1', 'mars'),
+    'wisdom': ('projector', 'hermit', 'line_6', 'jupiter'),
+    'creativity': ('generator', 'empress', 'line_3', 'venus'),
+    'reflection': ('reflector', 'moon', 'line_4', 'neptune'),
+    'transformation': ('death', 'pluto', 'line_5', 'scorpio'),
+    'communication': ('magician', 'mercury', 'line_2', 'gemini')
+}
+
+# Keyword vocabulary; a keyword's position is its bit in FeatureVector.keyword_mask
+KEYWORD_VOCABULARY: Tuple[str, ...] = tuple(sorted({
+    keyword for keywords in ARCHETYPE_KEYWORDS.values() for keyword in keywords
+}))
+KEYWORD_BITS: Dict[str, int] = {keyword: 1 << index for index, keyword in enumerate(KEYWORD_VOCABULARY)}
+
+Number = Union[int, float]
+
+
+def keyword_mask(keywords: Iterable[str]) -> int:
+    """Bitmask for a set of vocabulary keywords (unknown keywords are ignored)."""
+    mask = 0
+    for keyword in keywords:
+        mask |= KEYWORD_BITS.get(keyword.lower(), 0)
+    return mask
+
+
+ARCHETYPE_MASKS: Dict[str, int] = {
+    archetype: keyword_mask(keywords) for archetype, keywords in ARCHETYPE_KEYWORDS.items()
+}
+
+
+@dataclass(frozen=True)
+class FeatureVector:
+    """Compact typed summary of an engine result used for synthesis."""
+
+    numbers: Dict[Number, int] = field(default_factory=dict)
+    keyword_mask: int = 0
+    temporal_markers: FrozenSet[date] = frozenset()
+    terms: FrozenSet[str] = frozenset()
+
+    @property
+    def archetypes(self) -> FrozenSet[str]:
+        """Archetypes with at least one keyword present."""
+        return frozenset(
+            archetype for archetype, mask in ARCHETYPE_MASKS.items() if self.keyword_mask & mask
+        )
+
+    def has_keywords(self, mask: int) -> bool:
+        """Whether any keyword in the mask is present."""
+        return bool(self.keyword_mask & mask)
+
+
+EMPTY_FEATURES = FeatureVector()
+
+
+def _walk(value: Any, numbers: Counter, text: List[str], dates: set):
+    """Collect numbers, text fragments and dates from a result graph in one pass."""
+    if isinstance(value, bool) or value is None:
+        return
+    if isinstance(value, (int, float)):
+        numbers[value] += 1
+    elif isinstance(value, str):
+        text.append(value)
+    elif isinstance(value, datetime):
+        dates.add(value.date())
+    elif isinstance(value, date):
+        dates.add(value)
+    elif isinstance(value, Enum):
+        _walk(value.value, numbers, text, dates)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(key, str):
+                text.append(key)
+            _walk(item, numbers, text, dates)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _walk(item, numbers, text, dates)
+    elif isinstance(value, BaseModel):
+        for name, item in value.__dict__.items():
+            text.append(name)
+            _walk(item, numbers, text, dates)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for dataclass_field in dataclasses.fields(value):
+            text.append(dataclass_field.name)
+            _walk(getattr(value, dataclass_field.name), numbers, text, dates)
+
+
+def extract_features(raw_data: Any) -> FeatureVector:
+    """
+    Extract the feature vector of an engine's raw data.
+
+    Keywords match index terms of field names and string values (so 'moon'
+    matches 'moon_nakshatra'), case-insensitively; see keyword_index.index_terms.
+
+    Args:
+        raw_data: Raw calculation results
+
+    Returns:
+        Feature vector summarizing the data
+    """
+    numbers: Counter = Counter()
+    text: List[str] = []
+    dates: set = set()
+    _walk(raw_data, numbers, text, dates)
+
+    # NUL is never part of a term, so terms cannot span fragments
+    terms = frozenset(index_terms("\0".join(text)))
+    mask = 0
+    for keyword, bit in KEYWORD_BITS.items():
+        if keyword in terms:
+            mask |= bit
+
+    return FeatureVector(numbers=dict(numbers), keyword_mask=mask,
+                         temporal_markers=frozenset(dates), terms=terms)
+
+
+def features_of(result: Any) -> FeatureVector:
+    """
+    Get the feature vector of an engine result.
+
+    Uses the vector exported at calculation time, extracting (and attaching)
+    one for outputs built elsewhere; results without raw data get an empty vector.
+    """
+    features = getattr(result, 'features', None)
+    if features is not None:
+        return features
+
+    raw_data = getattr(result, 'raw_data', None)
+    if not isinstance(raw_data, dict):
+        return EMPTY_FEATURES
+
+    features = extract_features(raw_data)
+    if isinstance(result, BaseModel) and hasattr(type(result), 'features'):
+        result.features = features
+    return features
@@ -0,0 +1,271 @@
+"""
+Keyword index for WitnessOS Divination Engines
+
+Indexes a reading's engine outputs (or any text) by term, mapping keywords to
+the sources (engines) and fields containing them. Engine outputs reuse the
+terms tokenized with their feature vector, so archetype lookups across a
+reading become set operations instead of repeated substring scans of
+stringified result graphs.
+"""
+
+import dataclasses
+import re
+from bisect import bisect_left
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+
+# Words, with snake_case identifiers kept whole (e.g. 'moon_nakshatra', 'line_1')
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+
+def index_terms(text: str) -> Set[str]:
+    """
+    Index terms of a text fragment.
+
+    Snake_case tokens contribute the whole identifier, each part and each pair
+    of adjacent parts, so 'profile_line_1' is found by 'profile', 'line_1' and
+    'profile_line_1'.
+    """
+    terms = set(_TOKEN_PATTERN.findall(text.lower()))
+    for token in [token for token in terms if '_' in token]:
+        parts = token.split('_')
+        terms.update(parts)
+        terms.update(f"{first}_{second}" for first, second in zip(parts, parts[1:]))
+    return terms
+
+
+@lru_cache(maxsize=1024)
+def _query_terms(keyword: str) -> Tuple[str, ...]:
+    """Terms a keyword must match; multi-word keywords need all words in one field."""
+    return tuple(_TOKEN_PATTERN.findall(keyword.lower()))
+
+
+def _collect(value: Any, path: str, fragments: List[Tuple[str, str, bool]]):
+    """Collect (field path, text, is value) fragments; dict keys sit at their value's path"""
+    if isinstance(value, str):
+        fragments.append((path, value, True))
+    elif isinstance(value, Enum):
+        _collect(value.value, path, fragments)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            child = f"{path}.{key}" if path else str(key)
+            if isinstance(key, str):
+                fragments.append((child, key, False))
+            _collect(item, child, fragments)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for position, item in enumerate(value):
+            _collect(item, f"{path}[{position}]", fragments)
+    elif isinstance(value, BaseModel):
+        _collect(value.__dict__, path, fragments)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        _collect({f.name: getattr(value, f.name) for f in dataclasses.fields(value)}, path, fragments)
+
+
+class KeywordIndex:
+    """
+    Term index of sources, with per-field resolution.
+
+    Sources are engine names (or any label); a field path locates a string in
+    the source's data, e.g. 'core_numbers.life_path' or 'cards[2]'. Dictionary
+    keys are indexed at the path of their value, so a field is found by its
+    name as well as its content.
+
+    Source lookups intersect keyword terms with each source's term set (for
+    engine outputs, the one tokenized with its feature vector), so they cost
+    no pass over the data; a source's fields are tokenized the first time a
+    field lookup reaches that source.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, Any] = {}
+        self._terms: Dict[str, FrozenSet[str]] = {}
+        # source -> [(field path, text of string fields, terms)], built on demand
+        self._fields: Dict[str, List[Tuple[str, Optional[str], FrozenSet[str]]]] = {}
+        self._sorted_terms: Optional[List[str]] = None
+
+    @classmethod
+    def build(cls, sources: Mapping[str, Any]) -> "KeywordIndex":
+        """
+        Build an index over several sources in one pass.
+
+        Engine outputs are indexed by their raw data (as for feature vectors);
+        dicts, lists, models and plain strings are indexed as they are.
+        """
+        index = cls()
+        for source, data in sources.items():
+            index.add(source, data)
+        return index
+
+    def add(self, source: str, data: Any):
+        """
+        Tokenize a source's data and add it to the index
+
+        Raises:
+            ValueError: If the source is already indexed
+        """
+        if source in self._sources:
+            raise ValueError(f"Source already indexed: {source}")
+
+        terms = None
+        if isinstance(data, BaseModel) and hasattr(data, 'raw_data'):
+            terms = getattr(getattr(data, 'features', None), 'terms', None)
+            data = data.raw_data if isinstance(data.raw_data, dict) else None
+        if terms is None:
+            fragments: List[Tuple[str, str, bool]] = []
+            _collect(data, "", fragments)
+            # NUL is never part of a term, so terms cannot span fragments
+            terms = index_terms("\0".join(text for _, text, _ in fragments))
+
+        self._sources[source] = data
+        self._terms[source] = frozenset(terms)
+        self._sorted_terms = None
+
+    def _source_fields(self, source: str) -> List[Tuple[str, Optional[str], FrozenSet[str]]]:
+        """A source's fields in document order, tokenized on first use"""
+        fields = self._fields.get(source)
+        if fields is None:
+            fragments: List[Tuple[str, str, bool]] = []
+            _collect(self._sources[source], "", fragments)
+
+            merged: Dict[str, List] = {}
+            for path, text, is_value in fragments:
+                field = merged.setdefault(path, [None, []])
+                if is_value:
+                    field[0] = text
+                field[1].append(text)
+
+            fields = [
+                (path, value, frozenset(index_terms("\0".join(texts))))
+                for path, (value, texts) in merged.items()
+            ]
+            self._fields[source] = fields
+        return fields
+
+    @property
+    def sources(self) -> List[str]:
+        """Indexed sources, in insertion order"""
+        return list(self._sources)
+
+    def _expand(self, term: str, prefix: bool) -> List[str]:
+        """Index terms equal to (or, for prefix lookups, starting with) a term"""
+        if not prefix:
+            return [term]
+
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(set().union(*self._terms.values()))
+        terms = []
+        position = bisect_left(self._sorted_terms, term)
+        while position < len(self._sorted_terms) and self._sorted_terms[position].startswith(term):
+            terms.append(self._sorted_terms[position])
+            position += 1
+        return terms
+
+    def _term_groups(self, keyword: str, prefix: bool) -> Optional[List[FrozenSet[str]]]:
+        """Index terms each word of a keyword may match, or None if a prefix matches no term"""
+        groups = []
+        for term in _query_terms(keyword):
+            expanded = self._expand(term, prefix)
+            if not expanded:
+                return None
+            groups.append(frozenset(expanded))
+        return groups or None
+
+    def _split_keywords(self, keywords: Iterable[str],
+                        prefix: bool) -> Tuple[FrozenSet[str], List[List[FrozenSet[str]]]]:
+        """Merge single-word keywords into one term set (checked once per source or field) and keep phrases"""
+        terms: Set[str] = set()
+        phrases: List[List[FrozenSet[str]]] = []
+        for keyword in keywords:
+            groups = self._term_groups(keyword, prefix)
+            if groups is None:
+                continue
+            if len(groups) == 1:
+                terms |= groups[0]
+            else:
+                phrases.append(groups)
+        return frozenset(terms), phrases
+
+    def _any_sources(self, terms: FrozenSet[str], phrases: List[List[FrozenSet[str]]]) -> Set[str]:
+        """Sources containing any of the terms or phrases"""
+        found = {source for source, source_terms in self._terms.items() if not terms.isdisjoint(source_terms)}
+        for groups in phrases:
+            found |= self._keyword_sources(groups)
+        return found
+
+    def _keyword_sources(self, groups: List[FrozenSet[str]]) -> Set[str]:
+        """Sources containing a keyword (all of its words in one field for multi-word keywords)"""
+        sources = {
+            source for source, terms in self._terms.items()
+            if all(not group.isdisjoint(terms) for group in groups)
+        }
+        if len(groups) > 1:
+            sources = {source for source in sources if self._matching_paths(source, frozenset(), [groups])}
+        return sources
+
+    def _matching_paths(self, source: str, terms: FrozenSet[str],
+                        phrases: List[List[FrozenSet[str]]]) -> List[str]:
+        """Paths of fields containing any of the terms or every word group of a phrase"""
+        return [
+            path for path, _, field_terms in self._source_fields(source)
+            if not terms.isdisjoint(field_terms)
+            or any(all(not group.isdisjoint(field_terms) for group in groups) for groups in phrases)
+        ]
+
+    def fields(self, keywords: Iterable[str], source: Optional[str] = None,
+               prefix: bool = False) -> Dict[str, List[str]]:
+        """
+        Fields containing any of the keywords.
+
+        Args:
+            keywords: Keywords to look up (every word of a multi-word keyword must share a field)
+            source: Restrict the lookup to one source
+            prefix: Match terms starting with a keyword ('practice' finds 'practices')
+
+        Returns:
+            Source -> matching field paths in document order, sources in insertion order
+        """
+        terms, phrases = self._split_keywords(keywords, prefix)
+        candidates = self._any_sources(terms, phrases)
+
+        return {
+            matched_source: self._matching_paths(matched_source, terms, phrases)
+            for matched_source in self._sources
+            if matched_source in candidates and (source is None or matched_source == source)
+        }
+
+    def sources_with(self, keywords: Iterable[str], prefix: bool = False) -> List[str]:
+        """Sources containing any of the keywords, in insertion order"""
+        found = self._any_sources(*self._split_keywords(keywords, prefix))
+        return [source for source in self._sources if source in found]
+
+    def matches(self, keywords: Iterable[str], source: Optional[str] = None,
+                prefix: bool = False) -> List[str]:
+        """Keywords present in the index (or one source), in the order given"""
+        present = []
+        for keyword in keywords:
+            groups = self._term_groups(keyword, prefix)
+            if groups is None:
+                continue
+            sources = self._keyword_sources(groups)
+            if (source in sources) if source is not None else sources:
+                present.append(keyword)
+        return present
+
+    def texts(self, source: str, paths: Iterable[str]) -> List[str]:
+        """Text of string fields at the given paths (key-only paths are skipped)"""
+        if source not in self._sources:
+            return []
+        values = {path: value for path, value, _ in self._source_fields(source)}
+        return [values[path] for path in paths if values.get(path) is not None]
+
+    def __contains__(self, keyword: str) -> bool:
+        groups = self._term_groups(keyword, False)
+        return groups is not None and bool(self._keyword_sources(groups))
+
+    def __len__(self) -> int:
+        """Number of distinct terms"""
+        return len(set().union(*self._terms.values()))
@@ -0,0 +1,187 @@
+"""
+Serialization layer for WitnessOS Divination Engines
+
+Provides pluggable JSON serializers for engine outputs and API responses,
+precompiled per-model encoders for Pydantic output models and calculation
+dataclasses, and a canonical fast path for hashing cache keys.
+
+orjson is used when installed; the standard library json module is the fallback.
+"""
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def get_model_encoder(model_class: Type) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the precompiled encoder for a Pydantic model or dataclass type.
+
+    Pydantic models use their compiled core serializer; dataclasses get a
+    field-name list resolved once per class instead of on every instance.
+
+    Args:
+        model_class: Class of the object being encoded
+
+    Returns:
+        Encoder returning JSON-compatible Python data, or None if the type
+        has no dedicated encoder
+    """
+    if isinstance(model_class, type) and issubclass(model_class, BaseModel):
+        # Python mode leaves dates and nested dataclasses to the JSON backend
+        return model_class.__pydantic_serializer__.to_python
+
+    if dataclasses.is_dataclass(model_class):
+        field_names = tuple(field.name for field in dataclasses.fields(model_class))
+        return lambda obj: {name: getattr(obj, name) for name in field_names}
+
+    return None
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Fallback encoder for objects the JSON backend cannot handle natively.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        JSON-compatible representation of the object
+    """
+    encoder = get_model_encoder(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+
+class JSONSerializer:
+    """Standard library JSON serializer"""
+
+    name = "json"
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json.dumps(
+            obj, default=encode_default, sort_keys=sort_keys,
+            separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+    def loads(self, data: Any) -> Any:
+        """Deserialize JSON bytes or text."""
+        return json.loads(data)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """orjson-backed serializer (dates, dataclasses and numpy handled natively)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        options = self._options | orjson.OPT_SORT_KEYS if sort_keys else self._options
+        try:
+            return orjson.dumps(obj, default=encode_default, option=options)
+        except TypeError:
+            # Integer overflow or cyclic data: let the stdlib path report or handle it
+            return super().dumps(obj, sort_keys=sort_keys)
+
+    def loads(self, data: Any) -> Any:
+        """Deserialize JSON bytes or text."""
+        return orjson.loads(data)
+
+
+# Serializer registry
+_SERIALIZERS: Dict[str, Type[JSONSerializer]] = {
+    JSONSerializer.name: JSONSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+}
+_active_serializer: Optional[JSONSerializer] = None
+
+
+def register_serializer(name: str, serializer_class: Type[JSONSerializer]) -> None:
+    """Register a serializer implementation under a name."""
+    _SERIALIZERS[name] = serializer_class
+
+
+def get_serializer(name: Optional[str] = None) -> JSONSerializer:
+    """
+    Get a serializer by name, or the active serializer if no name is given.
+
+    The active serializer defaults to orjson when it is installed.
+    """
+    global _active_serializer
+
+    if name is not None:
+        if name not in _SERIALIZERS:
+            raise ValueError(f"Unknown serializer '{name}'. Available: {list(_SERIALIZERS)}")
+        return _SERIALIZERS[name]()
+
+    if _active_serializer is None:
+        _active_serializer = OrjsonSerializer() if orjson is not None else JSONSerializer()
+    return _active_serializer
+
+
+def set_serializer(name: str) -> JSONSerializer:
+    """Select the serializer used by dumps/loads and cache-key hashing."""
+    global _active_serializer
+    _active_serializer = get_serializer(name)
+    return _active_serializer
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes with the active serializer."""
+    return get_serializer().dumps(obj)
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize an object to a JSON string with the active serializer."""
+    return get_serializer().dumps(obj).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON with the active serializer."""
+    return get_serializer().loads(data)
+
+
+def canonical_dumps(obj: Any) -> bytes:
+    """Serialize an object to canonical JSON bytes (sorted keys, compact)."""
+    return get_serializer().dumps(obj, sort_keys=True)
+
+
+def hash_payload(obj: Any) -> str:
+    """
+    Hash an object's canonical JSON form.
+
+    Args:
+        obj: JSON-serializable object (models, dataclasses and dates allowed)
+
+    Returns:
+        128-bit hex digest
+    """
+    return hashlib.blake2b(canonical_dumps(obj), digest_size=16).hexdigest()
@@ -6,8 +6,10 @@ and other systems requiring precise planetary positions.
 """
 
 import swisseph as swe
+import threading
+from collections import OrderedDict
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Callable
 import pytz
 from base.data_models import ValidationError
 
@@ -48,6 +50,44 @@ HUMAN_DESIGN_GATES = {
 }
 
 
+# Shared intermediate products (ephemerides, design times) keyed by their inputs,
+# so engines built on the same astronomical base compute them only once
+PRODUCT_CACHE_SIZE = 256
+_product_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+_product_cache_lock = threading.Lock()
+
+
+def cached_product(key: Tuple, compute: Callable[[], Any]) -> Any:
+    """
+    Return a shared intermediate product, computing it on first use.
+
+    Args:
+        key: Hashable key identifying the product and its inputs
+        compute: Function producing the product
+
+    Returns:
+        The cached or freshly computed product
+    """
+    with _product_cache_lock:
+        if key in _product_cache:
+            _product_cache.move_to_end(key)
+            return _product_cache[key]
+
+    value = compute()
+
+    with _product_cache_lock:
+        _product_cache[key] = value
+        while len(_product_cache) > PRODUCT_CACHE_SIZE:
+            _product_cache.popitem(last=False)
+    return value
+
+
+def clear_product_cache():
+    """Drop all shared astronomical products."""
+    with _product_cache_lock:
+        _product_cache.clear()
+
+
 class AstrologyCalculator:
     """Core astronomical calculation engine using Swiss Ephemeris."""
 
@@ -103,6 +143,17 @@ class AstrologyCalculator:
         """
         julian_day = self._datetime_to_julian(birth_datetime, timezone_str)
 
+        # Positions are geocentric, so the Julian day and zodiac fully determine them
+        positions = cached_product(
+            ("planetary_positions", julian_day, sidereal),
+            lambda: self._compute_planetary_positions(julian_day, sidereal)
+        )
+
+        # Copy so callers can annotate positions without touching the shared product
+        return {planet: dict(position) for planet, position in positions.items()}
+
+    def _compute_planetary_positions(self, julian_day: float, sidereal: bool) -> Dict[str, Dict[str, float]]:
+        """Calculate planetary positions for a Julian day."""
         # Set ayanamsa for sidereal calculations (Vedic astrology)
         if sidereal:
             # Use Lahiri ayanamsa (most common in Vedic astrology)
@@ -276,12 +327,23 @@ class AstrologyCalculator:
         Returns:
             Design datetime (88 degrees of solar arc before birth)
         """
+        return cached_product(
+            ("design_time", birth_datetime, timezone_str),
+            lambda: self._compute_design_time_solar_arc(birth_datetime, timezone_str)
+        )
+
+    def _compute_design_time_solar_arc(self, birth_datetime: datetime,
+                                       timezone_str: Optional[str] = None) -> datetime:
+        """Search for the design time (see _calculate_design_time_solar_arc)."""
         # Convert birth time to Julian Day for Swiss Ephemeris
         birth_jd = self._datetime_to_julian(birth_datetime, timezone_str)
 
-        # Get Sun position at birth
-        birth_sun_pos, _ = swe.calc_ut(birth_jd, swe.SUN)
-        birth_sun_longitude = birth_sun_pos[0]
+        # Get Sun position at birth from the shared natal ephemeris
+        natal_positions = cached_product(
+            ("planetary_positions", birth_jd, False),
+            lambda: self._compute_planetary_positions(birth_jd, False)
+        )
+        birth_sun_longitude = natal_positions['sun']['longitude']
 
         # Calculate target Sun longitude (88 degrees earlier)
         target_sun_longitude = (birth_sun_longitude - 88.0) % 360
@@ -5,7 +5,9 @@ Provides core numerology calculations using both Pythagorean and Chaldean system
 Handles life path, expression, soul urge, personality numbers, and personal year calculations.
 """
 
+import copy
 from datetime import date
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from ..base.utils import reduce_to_single_digit, extract_vowels, extract_consonants, extract_letters_only
 
@@ -263,7 +265,12 @@ class NumerologyCalculator:
         """
         if current_year is None:
             current_year = date.today().year
-        
+
+        # The core profile is a shared product; copy so callers can extend it
+        return copy.deepcopy(_shared_core_profile(self.system, full_name, birth_date, current_year))
+
+    def _compute_complete_profile(self, full_name: str, birth_date: date, current_year: int) -> Dict[str, any]:
+        """Calculate the complete profile (see calculate_complete_profile)."""
         # Core numbers
         life_path = self.calculate_life_path(birth_date)
         expression = self.calculate_expression(full_name)
@@ -306,6 +313,12 @@ class NumerologyCalculator:
         }
 
 
+@lru_cache(maxsize=256)
+def _shared_core_profile(system: str, full_name: str, birth_date: date, current_year: int) -> Dict[str, any]:
+    """Compute a numerology core profile once per (system, name, birth date, year)."""
+    return NumerologyCalculator(system)._compute_complete_profile(full_name, birth_date, current_year)
+
+
 # Convenience functions for quick calculations
 
 def quick_life_path(birth_date: date) -> int:
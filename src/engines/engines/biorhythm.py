@@ -400,8 +400,8 @@ embodiment and optimal energy management in your reality field.
             # Generate field signature
             field_signature = create_field_signature(
                 self.engine_name,
-                str(validated_input),
-                datetime.now().isoformat()
+                self._version,
+                validated_input
             )
 
             # Extract data from calculation results
@@ -478,6 +478,9 @@ embodiment and optimal energy management in your reality field.
                 cycle_synchronization=self._get_cycle_synchronization(snapshot)
             )
 
+            # Export the typed feature vector used by synthesis
+            output.features = self._extract_features(calculation_results, validated_input)
+
             # Update engine statistics
             self._last_calculation_time = calculation_time
             self._total_calculations += 1
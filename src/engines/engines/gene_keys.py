@@ -26,6 +26,9 @@ class GeneKeysCompass(BaseEngine):
     Provides Gene Keys archetypal analysis based on birth data,
     calculating the Activation, Venus, and Pearl sequences.
     """
+
+    # Shared intermediate products computed once per reading by the DAG scheduler
+    shared_products = ("natal_ephemeris", "design_ephemeris")
     
     def __init__(self):
         super().__init__()
@@ -32,6 +32,9 @@ class HumanDesignScanner(BaseEngine):
     - Detailed interpretations
     """
 
+    # Shared intermediate products computed once per reading by the DAG scheduler
+    shared_products = ("natal_ephemeris", "design_ephemeris")
+
     def __init__(self, config=None):
         """Initialize the Human Design Scanner."""
         super().__init__(config)
@@ -627,8 +630,8 @@ Your unique energetic blueprint has been mapped and integrated into the WitnessO
             # Generate field signature
             field_signature = create_field_signature(
                 self.engine_name,
-                str(validated_input),
-                datetime.now().isoformat()
+                self._version,
+                validated_input
             )
 
             # Create Human Design specific output
@@ -647,6 +650,9 @@ Your unique energetic blueprint has been mapped and integrated into the WitnessO
                 design_info=calculation_results['design_info']
             )
 
+            # Export the typed feature vector used by synthesis
+            output.features = self._extract_features(calculation_results, validated_input)
+
             # Update engine statistics
             self._last_calculation_time = calculation_time
             self._total_calculations += 1
@@ -23,6 +23,9 @@ class NumerologyEngine(BaseEngine):
     Provides life path analysis, personal year guidance, and archetypal pattern recognition.
     """
 
+    # Shared intermediate products computed once per reading by the DAG scheduler
+    shared_products = ("numerology_core",)
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the Numerology engine."""
         super().__init__(config)
@@ -357,8 +360,8 @@ Remember: These are not predictions—they are pattern recognitions for consciou
             # Generate field signature
             field_signature = create_field_signature(
                 self.engine_name,
-                str(validated_input),
-                datetime.now().isoformat()
+                self._version,
+                validated_input
             )
 
             # Extract core numbers
@@ -404,6 +407,9 @@ Remember: These are not predictions—they are pattern recognitions for consciou
                 life_purpose=self.life_path_meanings.get(core["life_path"], "Unique purpose")
             )
 
+            # Export the typed feature vector used by synthesis
+            output.features = self._extract_features(calculation_results, validated_input)
+
             # Update engine statistics
             self._last_calculation_time = calculation_time
             self._total_calculations += 1
@@ -29,6 +29,9 @@ class VimshottariTimelineMapper(BaseEngine):
     - Karmic themes and guidance
     """
 
+    # Shared intermediate products computed once per reading by the DAG scheduler
+    shared_products = ("sidereal_moon_nakshatra",)
+
     def __init__(self, config=None):
         """Initialize the Vimshottari Timeline Mapper."""
         super().__init__(config)
@@ -524,8 +527,8 @@ The cosmic clock of your soul's journey is now synchronized with the field.
             # Generate field signature
             field_signature = create_field_signature(
                 self.engine_name,
-                str(validated_input),
-                datetime.now().isoformat()
+                self._version,
+                validated_input
             )
 
             # Create timeline object
@@ -556,6 +559,9 @@ The cosmic clock of your soul's journey is now synchronized with the field.
                 calculation_date=calculation_results['calculation_date']
             )
 
+            # Export the typed feature vector used by synthesis
+            output.features = self._extract_features(calculation_results, validated_input)
+
             # Update engine statistics
             self._last_calculation_time = calculation_time
             self._total_calculations += 1
@@ -6,13 +6,24 @@ Enables complex multi-engine readings and consciousness field analysis.
 """
 
 from .orchestrator import EngineOrchestrator
+from .async_orchestrator import AsyncEngineOrchestrator
 from .synthesis import ResultSynthesizer
 from .workflows import WorkflowManager
 from .field_analyzer import FieldAnalyzer
+from .cohort import CohortMatrix, build_cohort_matrix, register_grouping
+from .dag import DAGScheduler, DAGExecution, SharedProduct, register_shared_product
 
 __all__ = [
     "EngineOrchestrator",
+    "AsyncEngineOrchestrator",
     "ResultSynthesizer", 
     "WorkflowManager",
-    "FieldAnalyzer"
+    "FieldAnalyzer",
+    "CohortMatrix",
+    "build_cohort_matrix",
+    "register_grouping",
+    "DAGScheduler",
+    "DAGExecution",
+    "SharedProduct",
+    "register_shared_product"
 ]
@@ -0,0 +1,206 @@
+"""
+Async Engine Orchestrator - asyncio-Native Engine Scheduling
+
+Schedules engine calculations from coroutines so FastAPI endpoints and the
+agent service can await multi-engine readings without blocking the event
+loop. Calculations run on the wrapped EngineOrchestrator's thread pool (one
+hop from the loop, never nested) and share its engines and result cache.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    from ..base.data_models import BaseEngineOutput, EngineError
+    from .orchestrator import EngineOrchestrator, DEFAULT_READING_ENGINES
+except ImportError:
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from base.data_models import BaseEngineOutput, EngineError
+    from integration.orchestrator import EngineOrchestrator, DEFAULT_READING_ENGINES
+
+
+class AsyncEngineOrchestrator:
+    """
+    Runs engines concurrently under asyncio with per-engine timeouts and
+    concurrency limits.
+
+    Cancelling a run cancels every engine still waiting for a slot; an engine
+    already calculating finishes in its worker thread (threads cannot be
+    interrupted) but its result is discarded.
+    """
+
+    def __init__(self, orchestrator: Optional[EngineOrchestrator] = None,
+                 max_concurrency: Optional[int] = None,
+                 engine_concurrency: Optional[Dict[str, int]] = None,
+                 default_timeout: Optional[float] = None,
+                 engine_timeouts: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            orchestrator: Synchronous orchestrator providing engines, cache and thread pool
+            max_concurrency: Maximum engines calculating at once (default: pool size)
+            engine_concurrency: Maximum concurrent calculations per engine name
+            default_timeout: Seconds before an engine run is abandoned (None for no limit)
+            engine_timeouts: Per-engine timeout overrides
+        """
+        self.orchestrator = orchestrator or EngineOrchestrator()
+        self.max_concurrency = max_concurrency or self.orchestrator.max_workers
+        self.engine_concurrency = engine_concurrency or {}
+        self.default_timeout = default_timeout
+        self.engine_timeouts = engine_timeouts or {}
+        self.logger = logging.getLogger(__name__)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._engine_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _global_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _engine_semaphore(self, engine_name: str) -> Optional[asyncio.Semaphore]:
+        limit = self.engine_concurrency.get(engine_name)
+        if limit is None:
+            return None
+        if engine_name not in self._engine_semaphores:
+            self._engine_semaphores[engine_name] = asyncio.Semaphore(limit)
+        return self._engine_semaphores[engine_name]
+
+    def get_timeout(self, engine_name: str, timeout: Optional[float] = None) -> Optional[float]:
+        """Effective timeout for an engine run"""
+        if timeout is not None:
+            return timeout
+        return self.engine_timeouts.get(engine_name, self.default_timeout)
+
+    async def run_engine(self, engine_name: str, input_data: Any, config: Optional[Dict] = None,
+                         timeout: Optional[float] = None, subject: Optional[str] = None) -> BaseEngineOutput:
+        """
+        Run a single engine without blocking the event loop
+
+        Args:
+            engine_name: Engine to run
+            input_data: Engine input
+            config: Engine configuration
+            timeout: Timeout overriding the configured one
+            subject: subject_hash of the birth data the input was prepared from
+
+        Raises:
+            EngineError: If the engine fails or exceeds its timeout
+        """
+        timeout = self.get_timeout(engine_name, timeout)
+        try:
+            return await asyncio.wait_for(self._run_limited(engine_name, input_data, config, subject),
+                                          timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Engine {engine_name} exceeded {timeout}s timeout")
+            raise EngineError(f"Engine {engine_name} timed out after {timeout}s")
+
+    async def _run_limited(self, engine_name: str, input_data: Any, config: Optional[Dict],
+                           subject: Optional[str] = None) -> BaseEngineOutput:
+        """Wait for a global and per-engine slot, then calculate on the thread pool"""
+        engine_semaphore = self._engine_semaphore(engine_name)
+        async with self._global_semaphore():
+            if engine_semaphore is None:
+                return await self._calculate(engine_name, input_data, config, subject)
+            async with engine_semaphore:
+                return await self._calculate(engine_name, input_data, config, subject)
+
+    async def _calculate(self, engine_name: str, input_data: Any, config: Optional[Dict],
+                         subject: Optional[str] = None) -> BaseEngineOutput:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.orchestrator.executor,
+            self.orchestrator.run_single_engine,
+            engine_name,
+            input_data,
+            config,
+            subject
+        )
+
+    async def _run_config(self, config: Dict, timeout: Optional[float]) -> Tuple[str, Any]:
+        """Run one engine config, returning its failure as an EngineError result"""
+        engine_name = config['name']
+        try:
+            result = await self.run_engine(engine_name, config['input'], config.get('config'), timeout,
+                                           config.get('subject'))
+            self.logger.info(f"Completed engine: {engine_name}")
+        except EngineError as e:
+            self.logger.error(f"Engine {engine_name} failed: {str(e)}")
+            result = e
+        except Exception as e:
+            self.logger.error(f"Engine {engine_name} failed: {str(e)}")
+            result = EngineError(f"Engine failed: {str(e)}")
+        return engine_name, result
+
+    async def iter_completed(self, engine_configs: List[Dict],
+                             timeout: Optional[float] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield (engine name, result) pairs in completion order
+
+        Engines still pending when the consumer stops iterating are cancelled.
+        """
+        tasks = [asyncio.create_task(self._run_config(config, timeout)) for config in engine_configs]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def run_many(self, engine_configs: List[Dict], timeout: Optional[float] = None,
+                       sequential: bool = False) -> Dict[str, Any]:
+        """
+        Run multiple engines concurrently
+
+        Args:
+            engine_configs: List of dicts with 'name', 'input', and optional 'config' and 'subject'
+            timeout: Per-engine timeout overriding the configured ones
+            sequential: Run engines one at a time, in order
+
+        Returns:
+            Engine name -> output, or EngineError for failed and timed-out engines
+        """
+        if sequential:
+            results = {}
+            for config in engine_configs:
+                engine_name, result = await self._run_config(config, timeout)
+                results[engine_name] = result
+            return results
+
+        results = {}
+        async for engine_name, result in self.iter_completed(engine_configs, timeout):
+            results[engine_name] = result
+        return results
+
+    async def create_comprehensive_reading(self, birth_data: Dict, engines: Optional[List[str]] = None,
+                                           timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Create a comprehensive reading using multiple engines
+
+        Args:
+            birth_data: Birth information (date, time, location, name)
+            engines: List of engine names to use (default: all available)
+            timeout: Per-engine timeout overriding the configured ones
+        """
+        if engines is None:
+            engines = list(DEFAULT_READING_ENGINES)
+
+        engine_configs = self.orchestrator.prepare_engine_configs(birth_data, engines)
+        results = await self.run_many(engine_configs, timeout)
+        return self.orchestrator.build_reading(birth_data, engines, results, {'mode': 'async'})
+
+    def get_available_engines(self) -> List[str]:
+        """Get list of available engines"""
+        return self.orchestrator.get_available_engines()
+
+    async def aclose(self):
+        """Shut down the wrapped orchestrator's thread pool without blocking the loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.orchestrator.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -0,0 +1,294 @@
+"""
+Cohort Field Analytics - Vectorized Field Metrics Across Many Readings
+
+Turns stored readings into a people x features matrix (one row per reading)
+and computes field metrics for whole cohorts with chunked NumPy reductions,
+optionally grouped by a reading attribute such as Human Design type or life
+path. Matrices can be saved once and re-analyzed without touching the
+readings again.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from ..base.features import ARCHETYPE_KEYWORDS, ARCHETYPE_MASKS, EMPTY_FEATURES, extract_features, features_of
+    from ..base.serialization import loads
+except ImportError:
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from base.features import ARCHETYPE_KEYWORDS, ARCHETYPE_MASKS, EMPTY_FEATURES, extract_features, features_of
+    from base.serialization import loads
+
+
+# Numbers tracked as field frequencies (single digits and master numbers)
+FREQUENCIES: Tuple[int, ...] = (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33)
+ARCHETYPES: Tuple[str, ...] = tuple(ARCHETYPE_KEYWORDS)
+
+# Matrix layout: engine count, engines expressing each archetype, frequency occurrences
+COHORT_COLUMNS: Tuple[str, ...] = (
+    ('engines',)
+    + tuple(f"archetype:{archetype}" for archetype in ARCHETYPES)
+    + tuple(f"frequency:{frequency}" for frequency in FREQUENCIES)
+)
+_ARCHETYPE_SLICE = slice(1, 1 + len(ARCHETYPES))
+_FREQUENCY_SLICE = slice(1 + len(ARCHETYPES), len(COHORT_COLUMNS))
+
+ALL_PEOPLE = "__all__"
+UNKNOWN_GROUP = "unknown"
+
+
+def _get(value: Any, *path: str) -> Any:
+    """Follow a path through dicts and objects, returning None when a step is missing"""
+    for key in path:
+        if value is None:
+            return None
+        value = value.get(key) if isinstance(value, Mapping) else getattr(value, key, None)
+    return value
+
+
+def _raw_data(output: Any) -> Any:
+    return _get(output, 'raw_data')
+
+
+def _hd_type(results: Mapping[str, Any]) -> Any:
+    return _get(_raw_data(results.get('human_design')), 'type_info', 'type_name')
+
+
+def _life_path(results: Mapping[str, Any]) -> Any:
+    return _get(_raw_data(results.get('numerology')), 'core_numbers', 'life_path')
+
+
+# Group key name -> function extracting the label from a reading's results
+COHORT_GROUPINGS: Dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    'hd_type': _hd_type,
+    'life_path': _life_path,
+}
+
+
+def register_grouping(name: str, key: Callable[[Mapping[str, Any]], Any]):
+    """Register a named cohort grouping (label extractor over a reading's results)"""
+    COHORT_GROUPINGS[name] = key
+
+
+def reading_results(reading: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Engine results of a stored reading (a comprehensive reading or a bare results dict)"""
+    results = reading.get('results') if isinstance(reading, Mapping) else None
+    return results if isinstance(results, Mapping) else reading
+
+
+def reading_row(results: Mapping[str, Any]) -> np.ndarray:
+    """Feature row of one reading, laid out as COHORT_COLUMNS"""
+    row = np.zeros(len(COHORT_COLUMNS), dtype=np.float32)
+    archetypes = row[_ARCHETYPE_SLICE]
+    frequencies = row[_FREQUENCY_SLICE]
+
+    for output in results.values():
+        raw_data = _raw_data(output)
+        if not isinstance(raw_data, dict):
+            continue
+        # Engine outputs carry their vector; stored (deserialized) outputs are extracted
+        vector = features_of(output) if not isinstance(output, Mapping) else extract_features(raw_data)
+        if vector is EMPTY_FEATURES:
+            continue
+
+        row[0] += 1
+        for position, archetype in enumerate(ARCHETYPES):
+            if vector.keyword_mask & ARCHETYPE_MASKS[archetype]:
+                archetypes[position] += 1
+        for position, frequency in enumerate(FREQUENCIES):
+            frequencies[position] += vector.numbers.get(frequency, 0)
+
+    return row
+
+
+def _group_label(value: Any) -> str:
+    return UNKNOWN_GROUP if value is None else str(value)
+
+
+@dataclass
+class CohortMatrix:
+    """People x features matrix of a cohort with per-person group labels"""
+
+    matrix: np.ndarray
+    groups: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def chunks(self, chunk_size: int) -> Iterator["CohortMatrix"]:
+        """Row slices of at most chunk_size people (views, not copies)"""
+        for start in range(0, len(self), chunk_size):
+            stop = start + chunk_size
+            yield CohortMatrix(
+                self.matrix[start:stop],
+                {name: labels[start:stop] for name, labels in self.groups.items()}
+            )
+
+    def save(self, path: Union[str, Path]):
+        """Save the matrix and group labels as an .npz archive"""
+        np.savez(
+            path,
+            matrix=self.matrix,
+            columns=np.array(COHORT_COLUMNS),
+            **{f"group:{name}": labels for name, labels in self.groups.items()}
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CohortMatrix":
+        """
+        Load a matrix saved with save()
+
+        Raises:
+            ValueError: If the archive was built with a different column layout
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            if tuple(archive['columns']) != COHORT_COLUMNS:
+                raise ValueError(f"Cohort matrix {path} has an incompatible column layout")
+            groups = {
+                name.split(':', 1)[1]: archive[name]
+                for name in archive.files if name.startswith('group:')
+            }
+            return cls(archive['matrix'], groups)
+
+
+def build_cohort_matrix(readings: Iterable[Mapping[str, Any]],
+                        groupings: Optional[Iterable[str]] = None) -> CohortMatrix:
+    """
+    Build the feature matrix of a cohort
+
+    Args:
+        readings: Stored readings (comprehensive readings or engine results dicts)
+        groupings: Group label columns to record (default: all registered groupings)
+    """
+    groupings = list(COHORT_GROUPINGS) if groupings is None else list(groupings)
+    rows: List[np.ndarray] = []
+    labels: Dict[str, List[str]] = {name: [] for name in groupings}
+
+    for reading in readings:
+        results = reading_results(reading)
+        rows.append(reading_row(results))
+        for name in groupings:
+            labels[name].append(_group_label(COHORT_GROUPINGS[name](results)))
+
+    matrix = np.vstack(rows) if rows else np.zeros((0, len(COHORT_COLUMNS)), dtype=np.float32)
+    return CohortMatrix(matrix, {name: np.array(values, dtype=str) for name, values in labels.items()})
+
+
+def load_readings(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Stream stored readings from a JSON Lines file (one reading per line)"""
+    with open(path, 'rb') as handle:
+        for line in handle:
+            if line.strip():
+                yield loads(line)
+
+
+def iter_cohort_chunks(readings: Iterable[Mapping[str, Any]], chunk_size: int,
+                       groupings: Optional[Iterable[str]] = None) -> Iterator[CohortMatrix]:
+    """Build cohort matrices chunk by chunk, so only chunk_size readings are held at once"""
+    groupings = None if groupings is None else list(groupings)
+    batch: List[Mapping[str, Any]] = []
+    for reading in readings:
+        batch.append(reading)
+        if len(batch) >= chunk_size:
+            yield build_cohort_matrix(batch, groupings)
+            batch = []
+    if batch:
+        yield build_cohort_matrix(batch, groupings)
+
+
+class CohortAccumulator:
+    """
+    Per-group sufficient statistics, reduced chunk by chunk
+
+    Each chunk is reduced with one bincount per column, so memory stays
+    proportional to the chunk and the number of groups, not the cohort.
+    """
+
+    def __init__(self):
+        self._groups: Dict[str, int] = {}
+        self._people = np.zeros(0)
+        self._coherence_sum = np.zeros(0)
+        self._coherence_squares = np.zeros(0)
+        self._column_sums = np.zeros((0, len(COHORT_COLUMNS)))
+        self._archetype_people = np.zeros((0, len(ARCHETYPES)))
+
+    def _codes(self, labels: np.ndarray) -> np.ndarray:
+        """Stable integer codes of group labels, growing the accumulators for new groups"""
+        unique, inverse = np.unique(labels, return_inverse=True)
+        for label in unique:
+            if label not in self._groups:
+                self._groups[label] = len(self._groups)
+        grow = len(self._groups) - len(self._people)
+        if grow:
+            self._people = np.concatenate([self._people, np.zeros(grow)])
+            self._coherence_sum = np.concatenate([self._coherence_sum, np.zeros(grow)])
+            self._coherence_squares = np.concatenate([self._coherence_squares, np.zeros(grow)])
+            self._column_sums = np.vstack([self._column_sums, np.zeros((grow, len(COHORT_COLUMNS)))])
+            self._archetype_people = np.vstack([self._archetype_people, np.zeros((grow, len(ARCHETYPES)))])
+        return np.array([self._groups[label] for label in unique])[inverse]
+
+    def update(self, matrix: np.ndarray, labels: np.ndarray):
+        """Reduce one chunk of people into the per-group statistics"""
+        if not len(matrix):
+            return
+        codes = self._codes(labels)
+        size = len(self._groups)
+        coherence = coherence_scores(matrix)
+
+        self._people += np.bincount(codes, minlength=size)
+        self._coherence_sum += np.bincount(codes, weights=coherence, minlength=size)
+        self._coherence_squares += np.bincount(codes, weights=coherence * coherence, minlength=size)
+        for column in range(matrix.shape[1]):
+            self._column_sums[:, column] += np.bincount(codes, weights=matrix[:, column], minlength=size)
+        expressed = matrix[:, _ARCHETYPE_SLICE] > 0
+        for column in range(expressed.shape[1]):
+            self._archetype_people[:, column] += np.bincount(codes, weights=expressed[:, column], minlength=size)
+
+    def results(self, top_frequencies: int = 5) -> Dict[str, Dict[str, Any]]:
+        """Field metrics per group label"""
+        results = {}
+        for label, code in self._groups.items():
+            people = self._people[code]
+            if not people:
+                continue
+            mean = self._coherence_sum[code] / people
+            std = float(np.sqrt(max(self._coherence_squares[code] / people - mean * mean, 0.0)))
+            frequency_totals = self._column_sums[code, _FREQUENCY_SLICE]
+            total = frequency_totals.sum()
+            order = np.argsort(-frequency_totals, kind='stable')[:top_frequencies]
+
+            results[label] = {
+                'people': int(people),
+                'mean_engines': float(self._column_sums[code, 0] / people),
+                'field_coherence': {'mean': float(mean), 'std': std},
+                # Coherence lies in [0, 1], so its std lies in [0, 0.5]
+                'field_stability': float(1.0 - 2.0 * std),
+                'dominant_frequencies': [
+                    {
+                        'frequency': FREQUENCIES[position],
+                        'strength': float(frequency_totals[position] / total),
+                        'mean_occurrences': float(frequency_totals[position] / people)
+                    }
+                    for position in order if frequency_totals[position] > 0
+                ],
+                'archetype_prevalence': {
+                    archetype: float(self._archetype_people[code, position] / people)
+                    for position, archetype in enumerate(ARCHETYPES)
+                }
+            }
+        return results
+
+
+def coherence_scores(matrix: np.ndarray) -> np.ndarray:
+    """
+    Per-person field coherence: the share of a reading's engines expressing
+    its most widely expressed archetype (0 for readings without engines)
+    """
+    engines = matrix[:, 0]
+    dominant = matrix[:, _ARCHETYPE_SLICE].max(axis=1) if len(ARCHETYPES) else np.zeros(len(matrix))
+    return np.divide(dominant, engines, out=np.zeros(len(matrix)), where=engines > 0)
@@ -0,0 +1,228 @@
+"""
+DAG Scheduler - Dependency-Aware Engine Execution
+
+Runs engines as a dependency graph over shared intermediate products such as
+the natal ephemeris, design-time ephemeris, sidereal Moon nakshatra and
+numerology core profile. Each product is computed once per distinct input and
+every engine starts as soon as the products it builds on are ready.
+"""
+
+import time
+import logging
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from ..base.data_models import EngineError
+except ImportError:
+    from base.data_models import EngineError
+
+
+@dataclass
+class SharedProduct:
+    """
+    Intermediate product shared by several engines.
+
+    ``arguments`` extracts the product's inputs from a validated engine input
+    (None if the input does not carry them); ``compute`` builds the product
+    with the requesting engine's own calculators, so the result lands in the
+    same calculation cache the engine reads from.
+    """
+    name: str
+    arguments: Callable[[Any], Optional[Tuple]]
+    compute: Callable[[Any, Tuple], Any]
+    requires: Tuple[str, ...] = ()
+
+
+@dataclass
+class DAGNode:
+    """Single unit of work in the execution graph"""
+    node_id: str
+    kind: str  # "product" or "engine"
+    func: Callable[[], Any]
+    requires: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class NodeTiming:
+    """Execution timing for a DAG node (offsets relative to the run start)"""
+    node_id: str
+    kind: str
+    status: str
+    started_at: float
+    finished_at: float
+    requires: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind,
+            'status': self.status,
+            'started_at': round(self.started_at, 6),
+            'finished_at': round(self.finished_at, 6),
+            'duration': round(self.duration, 6),
+            'requires': self.requires
+        }
+
+
+@dataclass
+class DAGExecution:
+    """Outcome of a DAG run"""
+    results: Dict[str, Any]
+    products: Dict[str, Any]
+    timings: Dict[str, NodeTiming]
+    total_time: float
+
+    def timing_report(self) -> Dict[str, Any]:
+        """Per-node timings in a JSON-friendly form"""
+        return {
+            'total_time': round(self.total_time, 6),
+            'nodes': {node_id: timing.to_dict() for node_id, timing in self.timings.items()}
+        }
+
+
+def _birth_moment(input_data: Any) -> Optional[Tuple]:
+    """(birth datetime, latitude, longitude, timezone) as the astronomical engines compute it"""
+    birth_date = getattr(input_data, 'birth_date', None)
+    birth_time = getattr(input_data, 'birth_time', None)
+    birth_location = getattr(input_data, 'birth_location', None)
+    if not (birth_date and birth_time and birth_location):
+        return None
+    latitude, longitude = birth_location
+    return (datetime.combine(birth_date, birth_time), latitude, longitude,
+            getattr(input_data, 'timezone', None))
+
+
+def _numerology_arguments(input_data: Any) -> Optional[Tuple]:
+    """(system, full name, birth date, current year) for the numerology core profile"""
+    full_name = getattr(input_data, 'full_name', None)
+    birth_date = getattr(input_data, 'birth_date', None)
+    if not (full_name and birth_date):
+        return None
+    return (getattr(input_data, 'system', 'pythagorean'), full_name, birth_date,
+            getattr(input_data, 'current_year', None) or date.today().year)
+
+
+def _compute_natal_ephemeris(engine: Any, args: Tuple) -> Any:
+    birth_datetime, latitude, longitude, timezone = args
+    return engine.astro_calc.get_planetary_positions(birth_datetime, latitude, longitude, timezone)
+
+
+def _compute_design_ephemeris(engine: Any, args: Tuple) -> Any:
+    birth_datetime, latitude, longitude, timezone = args
+    design_datetime = engine.astro_calc._calculate_design_time_solar_arc(birth_datetime, timezone)
+    return {
+        'design_datetime': design_datetime,
+        'positions': engine.astro_calc.get_planetary_positions(design_datetime, latitude, longitude, timezone)
+    }
+
+
+def _compute_sidereal_moon_nakshatra(engine: Any, args: Tuple) -> Any:
+    birth_datetime, latitude, longitude, timezone = args
+    return engine.astro_calc.calculate_vedic_data(birth_datetime, latitude, longitude, timezone)['moon_nakshatra']
+
+
+def _compute_numerology_core(engine: Any, args: Tuple) -> Any:
+    system, full_name, birth_date, current_year = args
+    calc = engine.chaldean_calc if system.lower() == "chaldean" else engine.pythagorean_calc
+    return calc.calculate_complete_profile(full_name, birth_date, current_year)
+
+
+# Registry of shared intermediate products engines can declare in ``shared_products``
+SHARED_PRODUCTS: Dict[str, SharedProduct] = {
+    'natal_ephemeris': SharedProduct('natal_ephemeris', _birth_moment, _compute_natal_ephemeris),
+    # The solar-arc search starts from the natal Sun
+    'design_ephemeris': SharedProduct('design_ephemeris', _birth_moment, _compute_design_ephemeris,
+                                      requires=('natal_ephemeris',)),
+    'sidereal_moon_nakshatra': SharedProduct('sidereal_moon_nakshatra', _birth_moment,
+                                             _compute_sidereal_moon_nakshatra),
+    'numerology_core': SharedProduct('numerology_core', _numerology_arguments, _compute_numerology_core),
+}
+
+
+def register_shared_product(product: SharedProduct):
+    """Register a shared intermediate product"""
+    SHARED_PRODUCTS[product.name] = product
+
+
+class DAGScheduler:
+    """
+    Executes a graph of nodes on an executor, starting each node as soon as
+    all of the nodes it requires have finished.
+    """
+
+    def __init__(self, executor: Executor, logger: Optional[logging.Logger] = None):
+        self.executor = executor
+        self.logger = logger or logging.getLogger(__name__)
+
+    def run(self, nodes: Dict[str, DAGNode]) -> Tuple[Dict[str, Any], Dict[str, Exception], Dict[str, NodeTiming]]:
+        """
+        Run all nodes respecting dependencies.
+
+        A failed node does not block its dependents: products are an
+        optimization, and engines compute anything missing themselves.
+
+        Returns:
+            (values, errors, timings) keyed by node id
+
+        Raises:
+            EngineError: If the graph references unknown nodes or has a cycle
+        """
+        for node in nodes.values():
+            unknown = node.requires - nodes.keys()
+            if unknown:
+                raise EngineError(f"Node {node.node_id} requires unknown nodes: {sorted(unknown)}")
+
+        run_start = time.perf_counter()
+        pending = dict(nodes)
+        finished: Set[str] = set()
+        running = {}
+        values: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        timings: Dict[str, NodeTiming] = {}
+
+        while pending or running:
+            # Submit every node whose dependencies are done
+            for node_id, node in list(pending.items()):
+                if node.requires <= finished:
+                    running[self.executor.submit(self._timed, node.func)] = node
+                    del pending[node_id]
+
+            if not running:
+                raise EngineError(f"Dependency cycle between nodes: {sorted(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                value, error, started, ended = future.result()
+                timings[node.node_id] = NodeTiming(
+                    node_id=node.node_id,
+                    kind=node.kind,
+                    status="failed" if error else "completed",
+                    started_at=started - run_start,
+                    finished_at=ended - run_start,
+                    requires=sorted(node.requires)
+                )
+                if error:
+                    errors[node.node_id] = error
+                    self.logger.error(f"DAG node {node.node_id} failed: {error}")
+                else:
+                    values[node.node_id] = value
+                    self.logger.info(f"Completed DAG node: {node.node_id}")
+                finished.add(node.node_id)
+
+        return values, errors, timings
+
+    @staticmethod
+    def _timed(func: Callable[[], Any]) -> Tuple[Any, Optional[Exception], float, float]:
+        """Run a node function, capturing its result or error and timing"""
+        started = time.perf_counter()
+        try:
+            return func(), None, started, time.perf_counter()
+        except Exception as e:
+            return None, e, started, time.perf_counter()
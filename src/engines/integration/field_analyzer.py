@@ -5,19 +5,39 @@ Analyzes the overall consciousness field patterns and provides
 reality patch suggestions based on multi-engine synthesis.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, List, Any, Iterable, Iterator, Mapping, Optional, Tuple, Union
+from datetime import date, datetime
+from pathlib import Path
 import numpy as np
 import logging
 from collections import defaultdict
 
 try:
+    from ..base.cache import TTLCache, identity_memo
+    from ..base.canonical import subject_hash
     from ..base.data_models import BaseEngineOutput
+    from ..base.serialization import dumps
+    from .cohort import (
+        ALL_PEOPLE, COHORT_GROUPINGS, CohortAccumulator, CohortMatrix,
+        iter_cohort_chunks, load_readings
+    )
 except ImportError:
     import sys
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from base.cache import TTLCache, identity_memo
+    from base.canonical import subject_hash
     from base.data_models import BaseEngineOutput
+    from base.serialization import dumps
+    from integration.cohort import (
+        ALL_PEOPLE, COHORT_GROUPINGS, CohortAccumulator, CohortMatrix,
+        iter_cohort_chunks, load_readings
+    )
+
+
+# Engines whose results are fixed for a person, so their pairwise
+# relationships can be reused across readings of the same subject
+NATAL_ENGINES = frozenset({'numerology', 'human_design', 'gene_keys'})
 
 
 class FieldAnalyzer:
@@ -25,27 +45,61 @@ class FieldAnalyzer:
     Analyzes consciousness field signatures and patterns
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024, relationship_cache_size: int = 100000,
+                 relationship_cache_bytes: int = 16 * 1024 * 1024,
+                 relationship_cache_ttl: Optional[float] = 86400):
+        """
+        Args:
+            cache_size: Maximum number of per-engine terms (field_patterns) and
+                engine pair relationships (resonance_cache) kept for re-analysis
+            relationship_cache_size: Maximum number of natal engine pair
+                relationships kept per (pair, subject, engine versions, day)
+            relationship_cache_bytes: Approximate memory bound of those
+                relationships (their serialized size)
+            relationship_cache_ttl: Seconds a natal pair relationship stays valid
+        """
         self.logger = logging.getLogger(__name__)
-        self.field_patterns = {}
-        self.resonance_cache = {}
-        
-    def analyze_field_signature(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+        self.field_patterns = TTLCache(maxsize=cache_size)
+        self.resonance_cache = TTLCache(maxsize=cache_size)
+        self.relationship_cache = TTLCache(
+            maxsize=relationship_cache_size,
+            maxbytes=relationship_cache_bytes,
+            ttl=relationship_cache_ttl,
+            sizeof=lambda relationship: len(dumps(relationship))
+        )
+        
+    def analyze_field_signature(self, results: Dict[str, BaseEngineOutput],
+                                subject: Optional[Union[str, Mapping[str, Any]]] = None,
+                                engine_versions: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """
         Analyze the overall consciousness field signature
         
+        Per-engine terms and pairwise relationships are cached per result
+        object, so re-analyzing a reading where one engine changed only
+        recomputes the terms and pairs involving that engine. When the
+        subject and the versions of both engines are known, relationships
+        between natal engines are also cached per (engine pair, subject,
+        engine versions, day), so returning users skip them even with
+        freshly calculated results. The day keeps date-relative parts of
+        natal readings (numerology's personal year) from going stale.
+        
         Args:
             results: Dictionary of engine results
+            subject: Canonical subject hash, or the birth data to derive it from
+            engine_versions: Engine name -> version signature of the engine that
+                produced the result (see EngineOrchestrator.get_engine_versions;
+                an upgrade or config change invalidates cached relationships)
             
         Returns:
             Field signature analysis with patterns and recommendations
         """
+        subject_key = self._subject_key(subject)
         signature = {
             'timestamp': datetime.now().isoformat(),
             'field_coherence': self._calculate_field_coherence(results),
             'dominant_frequencies': self._identify_dominant_frequencies(results),
-            'harmonic_patterns': self._analyze_harmonic_patterns(results),
-            'interference_zones': self._detect_interference_zones(results),
+            'harmonic_patterns': self._analyze_harmonic_patterns(results, subject_key, engine_versions),
+            'interference_zones': self._detect_interference_zones(results, subject_key, engine_versions),
             'resonance_points': self._find_resonance_points(results),
             'field_stability': self._assess_field_stability(results),
             'consciousness_level': self._determine_consciousness_level(results),
@@ -55,6 +109,118 @@ class FieldAnalyzer:
         
         return signature
     
+    def analyze_cohort(self, cohort: Union[CohortMatrix, str, Path, Iterable[Mapping[str, Any]]],
+                       group_by: Optional[str] = None, chunk_size: int = 10000,
+                       output_path: Optional[Union[str, Path]] = None,
+                       top_frequencies: int = 5) -> Dict[str, Any]:
+        """
+        Analyze field metrics across a cohort of readings
+        
+        Metrics are reduced chunk by chunk over the cohort's people x features
+        matrix, so memory stays bounded by chunk_size.
+        
+        Args:
+            cohort: CohortMatrix, path to a saved matrix (.npz) or to stored
+                readings (JSON Lines), or an iterable of readings
+            group_by: Registered grouping (e.g. 'hd_type', 'life_path'); None
+                for whole-cohort metrics only
+            chunk_size: People reduced per chunk
+            output_path: Write the aggregated results here as JSON
+            top_frequencies: Dominant frequencies reported per group
+            
+        Returns:
+            Cohort-wide metrics and, when grouped, metrics per group label
+            
+        Raises:
+            ValueError: If the grouping is unknown or missing from a saved matrix
+        """
+        if group_by is not None and group_by not in COHORT_GROUPINGS:
+            raise ValueError(f"Unknown cohort grouping: {group_by}")
+        
+        overall = CohortAccumulator()
+        grouped = CohortAccumulator()
+        people = 0
+        for chunk in self._cohort_chunks(cohort, group_by, chunk_size):
+            overall.update(chunk.matrix, np.full(len(chunk), ALL_PEOPLE))
+            if group_by is not None:
+                if group_by not in chunk.groups:
+                    raise ValueError(f"Cohort matrix has no '{group_by}' group labels")
+                grouped.update(chunk.matrix, chunk.groups[group_by])
+            people += len(chunk)
+        
+        analysis = {
+            'timestamp': datetime.now().isoformat(),
+            'people': people,
+            'group_by': group_by,
+            'cohort': overall.results(top_frequencies).get(ALL_PEOPLE, {}),
+            'groups': grouped.results(top_frequencies)
+        }
+        self.logger.info(f"Analyzed cohort of {people} readings"
+                         + (f" in {len(analysis['groups'])} '{group_by}' groups" if group_by else ""))
+        
+        if output_path is not None:
+            Path(output_path).write_bytes(dumps(analysis))
+        
+        return analysis
+    
+    def _cohort_chunks(self, cohort: Any, group_by: Optional[str], chunk_size: int) -> Iterator[CohortMatrix]:
+        """Chunks of a cohort given as a matrix, a saved matrix, stored readings or readings"""
+        if isinstance(cohort, CohortMatrix):
+            return cohort.chunks(chunk_size)
+        
+        groupings = [group_by] if group_by is not None else []
+        if isinstance(cohort, (str, Path)):
+            if Path(cohort).suffix == '.npz':
+                return CohortMatrix.load(cohort).chunks(chunk_size)
+            return iter_cohort_chunks(load_readings(cohort), chunk_size, groupings)
+        return iter_cohort_chunks(cohort, chunk_size, groupings)
+    
+    def _engine_term(self, term: str, engine_name: str, result: BaseEngineOutput, compute) -> Any:
+        """A single engine's term, computed once per result object"""
+        return identity_memo(self.field_patterns, (term, engine_name), (result,), compute)
+    
+    def _pair_term(self, term: str, engine1: str, engine2: str,
+                   result1: BaseEngineOutput, result2: BaseEngineOutput, compute,
+                   subject_key: Optional[str] = None,
+                   engine_versions: Optional[Mapping[str, str]] = None) -> Any:
+        """
+        A relationship between two engines
+        
+        Natal engine pairs of a known subject and known engine versions are
+        computed once per subject, engine versions and day; other pairs once
+        per pair of result objects.
+        """
+        versions = engine_versions or {}
+        version1, version2 = versions.get(engine1), versions.get(engine2)
+        if (subject_key is None or version1 is None or version2 is None
+                or engine1 not in NATAL_ENGINES or engine2 not in NATAL_ENGINES):
+            return identity_memo(self.resonance_cache, (term, engine1, engine2), (result1, result2), compute)
+        
+        key = (term, engine1, engine2, subject_key, version1, version2, date.today().isoformat())
+        relationship = self.relationship_cache.get(key)
+        if relationship is None:
+            relationship = compute()
+            self.relationship_cache[key] = relationship
+        return relationship
+    
+    def _subject_key(self, subject: Optional[Union[str, Mapping[str, Any]]]) -> Optional[str]:
+        """Canonical subject hash, or None if the subject is unknown or cannot be hashed"""
+        if subject is None or isinstance(subject, str):
+            return subject
+        try:
+            return subject_hash(subject)
+        except Exception as e:
+            self.logger.debug(f"Subject is not hashable, relationships are not cached: {str(e)}")
+            return None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the natal pair relationship cache"""
+        return self.relationship_cache.stats()
+    
+    def clear_relationship_cache(self):
+        """Drop all cached natal pair relationships (e.g. after an engine upgrade)"""
+        self.relationship_cache.clear()
+    
     def _calculate_field_coherence(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
         """Calculate overall field coherence"""
         coherence = {
@@ -68,7 +234,10 @@ class FieldAnalyzer:
         consistency_scores = []
         for engine_name, result in results.items():
             if hasattr(result, 'raw_data') and isinstance(result.raw_data, dict):
-                engine_coherence = self._calculate_engine_coherence(result.raw_data)
+                engine_coherence = self._engine_term(
+                    'coherence', engine_name, result,
+                    lambda: self._calculate_engine_coherence(result.raw_data)
+                )
                 coherence['engine_alignment'][engine_name] = engine_coherence
                 consistency_scores.append(engine_coherence)
         
@@ -94,7 +263,10 @@ class FieldAnalyzer:
         frequency_map = defaultdict(int)
         
         for engine_name, result in results.items():
-            engine_frequencies = self._extract_engine_frequencies(result, engine_name)
+            engine_frequencies = self._engine_term(
+                'frequencies', engine_name, result,
+                lambda: self._extract_engine_frequencies(result, engine_name)
+            )
             for freq, strength in engine_frequencies.items():
                 frequency_map[freq] += strength
         
@@ -111,7 +283,9 @@ class FieldAnalyzer:
         
         return frequencies
     
-    def _analyze_harmonic_patterns(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+    def _analyze_harmonic_patterns(self, results: Dict[str, BaseEngineOutput],
+                                   subject_key: Optional[str] = None,
+                                   engine_versions: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Analyze harmonic patterns in the field"""
         harmonics = {
             'primary_harmonics': [],
@@ -124,11 +298,15 @@ class FieldAnalyzer:
         engine_names = list(results.keys())
         for i, engine1 in enumerate(engine_names):
             for engine2 in engine_names[i+1:]:
-                harmonic_relationship = self._calculate_harmonic_relationship(
-                    results[engine1], results[engine2], engine1, engine2
+                harmonic_relationship = self._pair_term(
+                    'harmonic', engine1, engine2, results[engine1], results[engine2],
+                    lambda: self._calculate_harmonic_relationship(
+                        results[engine1], results[engine2], engine1, engine2
+                    ),
+                    subject_key, engine_versions
                 )
                 if harmonic_relationship['strength'] > 0.5:
-                    harmonics['primary_harmonics'].append(harmonic_relationship)
+                    harmonics['primary_harmonics'].append(dict(harmonic_relationship))
         
         # Identify resonance chains (3+ engines in harmony)
         harmonics['resonance_chains'] = self._find_resonance_chains(results)
@@ -138,7 +316,9 @@ class FieldAnalyzer:
         
         return harmonics
     
-    def _detect_interference_zones(self, results: Dict[str, BaseEngineOutput]) -> List[Dict]:
+    def _detect_interference_zones(self, results: Dict[str, BaseEngineOutput],
+                                   subject_key: Optional[str] = None,
+                                   engine_versions: Optional[Mapping[str, str]] = None) -> List[Dict]:
         """Detect interference patterns in the field"""
         interference_zones = []
         
@@ -146,9 +326,13 @@ class FieldAnalyzer:
         for engine1_name, result1 in results.items():
             for engine2_name, result2 in results.items():
                 if engine1_name != engine2_name:
-                    interference = self._check_interference(result1, result2, engine1_name, engine2_name)
+                    interference = self._pair_term(
+                        'interference', engine1_name, engine2_name, result1, result2,
+                        lambda: self._check_interference(result1, result2, engine1_name, engine2_name),
+                        subject_key, engine_versions
+                    )
                     if interference['level'] > 0.3:
-                        interference_zones.append(interference)
+                        interference_zones.append(dict(interference))
         
         return interference_zones
     
@@ -186,7 +370,10 @@ class FieldAnalyzer:
         # Calculate stability metrics
         stability_scores = []
         for engine_name, result in results.items():
-            engine_stability = self._calculate_engine_stability(result, engine_name)
+            engine_stability = self._engine_term(
+                'stability', engine_name, result,
+                lambda: self._calculate_engine_stability(result, engine_name)
+            )
             stability['stability_factors'][engine_name] = engine_stability
             stability_scores.append(engine_stability['score'])
         
@@ -213,7 +400,10 @@ class FieldAnalyzer:
         # Analyze consciousness indicators from each engine
         consciousness_indicators = {}
         for engine_name, result in results.items():
-            indicators = self._extract_consciousness_indicators(result, engine_name)
+            indicators = self._engine_term(
+                'consciousness', engine_name, result,
+                lambda: self._extract_consciousness_indicators(result, engine_name)
+            )
             consciousness_indicators[engine_name] = indicators
         
         # Synthesize consciousness level
@@ -237,7 +427,10 @@ class FieldAnalyzer:
         # Analyze evolutionary patterns from engines
         evolution_patterns = {}
         for engine_name, result in results.items():
-            pattern = self._extract_evolution_pattern(result, engine_name)
+            pattern = self._engine_term(
+                'evolution', engine_name, result,
+                lambda: self._extract_evolution_pattern(result, engine_name)
+            )
             evolution_patterns[engine_name] = pattern
         
         # Calculate vector components
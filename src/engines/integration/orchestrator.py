@@ -6,14 +6,21 @@ and consciousness field analysis.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+import threading
+import time
+from typing import Dict, Iterable, List, Any, Optional, Union
+from datetime import date, datetime
+from functools import partial
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from ..base.engine_interface import BaseEngine
     from ..base.data_models import BaseEngineInput, BaseEngineOutput, EngineError
+    from ..base.cache import TTLCache
+    from ..base.canonical import content_hash, subject_hash
+    from ..base.determinism import is_reusable
+    from .dag import DAGExecution, DAGNode, DAGScheduler, SHARED_PRODUCTS
     from .. import get_engine, list_engines
 except ImportError:
     # Fallback for direct execution
@@ -22,6 +29,10 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from base.engine_interface import BaseEngine
     from base.data_models import BaseEngineInput, BaseEngineOutput, EngineError
+    from base.cache import TTLCache
+    from base.canonical import content_hash, subject_hash
+    from base.determinism import is_reusable
+    from integration.dag import DAGExecution, DAGNode, DAGScheduler, SHARED_PRODUCTS
 
     def get_engine(name):
         return None
@@ -30,17 +41,63 @@ except ImportError:
         return ['numerology', 'biorhythm', 'human_design', 'vimshottari', 'gene_keys', 'tarot', 'iching']
 
 
+# Engines used by a comprehensive reading when none are specified
+DEFAULT_READING_ENGINES = ['numerology', 'biorhythm', 'human_design', 'vimshottari',
+                           'gene_keys', 'tarot', 'iching']
+
+
 class EngineOrchestrator:
     """
     Orchestrates multiple engines for complex divination workflows
     """
     
-    def __init__(self, max_workers: int = 4):
-        """Initialize the orchestrator with thread pool for parallel execution"""
+    def __init__(self, max_workers: int = 4, cache_size: int = 256,
+                 cache_ttl: Optional[float] = 3600):
+        """
+        Initialize the orchestrator
+        
+        Args:
+            max_workers: Size of the long-lived engine thread pool
+            cache_size: Maximum number of engine results kept for reuse
+            cache_ttl: Seconds an engine result stays reusable (None for no expiry)
+        """
         self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
         self.active_engines = {}
-        self.workflow_cache = {}
+        # Engine results keyed by canonical inputs, shared by every workflow in the session
+        self.workflow_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by all runs, created on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="witnessos-engine"
+                )
+            return self._executor
+    
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the thread pool
+        
+        Args:
+            wait: Wait for running engines to finish before returning
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+            self.logger.info("Engine executor shut down")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
         
     def load_engine(self, engine_name: str, config: Optional[Dict] = None) -> BaseEngine:
         """Load and cache an engine instance"""
@@ -55,46 +112,87 @@ class EngineOrchestrator:
         return self.active_engines[engine_name]
     
     def run_single_engine(self, engine_name: str, input_data: BaseEngineInput, 
-                         config: Optional[Dict] = None) -> BaseEngineOutput:
-        """Run a single engine with input data"""
+                         config: Optional[Dict] = None, subject: Optional[str] = None) -> BaseEngineOutput:
+        """
+        Run a single engine with input data, reusing an earlier result for the same input
+        
+        Args:
+            engine_name: Engine to run
+            input_data: Engine input
+            config: Engine configuration
+            subject: subject_hash of the birth data the input was prepared from
+        """
         engine = self.load_engine(engine_name, config)
-        return engine.process(input_data)
+        cache_key = self._engine_cache_key(engine_name, engine, input_data, config, subject)
+        
+        if cache_key is not None:
+            try:
+                result = self.workflow_cache[cache_key]
+                self.logger.debug(f"Reusing cached result for engine: {engine_name}")
+                return result
+            except KeyError:
+                pass
+        
+        result = engine.calculate(input_data)
+        
+        if cache_key is not None:
+            self.workflow_cache[cache_key] = result
+        return result
+    
+    def _engine_cache_key(self, engine_name: str, engine: BaseEngine, input_data: Any,
+                          config: Optional[Dict], subject: Optional[str] = None) -> Optional[str]:
+        """Cache key from the engine, its version and the canonical input, or None if not reusable"""
+        # Random draws and timestamped artifacts are fresh on every run
+        if not is_reusable(engine_name):
+            return None
+        try:
+            # The day is part of the key so date-relative engines (biorhythm, dashas) roll over
+            return content_hash(
+                engine_name,
+                # The subject keeps results for different people apart when
+                # prepared inputs do not carry their birth data
+                {'input': input_data, 'config': config, 'day': date.today(), 'subject': subject},
+                getattr(engine, '_version', None)
+            )
+        except Exception as e:
+            self.logger.debug(f"Input for {engine_name} is not cacheable: {str(e)}")
+            return None
     
     def run_parallel_engines(self, engine_configs: List[Dict]) -> Dict[str, BaseEngineOutput]:
         """
         Run multiple engines in parallel
         
         Args:
-            engine_configs: List of dicts with 'name', 'input', and optional 'config'
+            engine_configs: List of dicts with 'name', 'input', and optional 'config' and 'subject'
         """
         results = {}
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all engine tasks
-            future_to_engine = {}
-            for config in engine_configs:
-                engine_name = config['name']
-                input_data = config['input']
-                engine_config = config.get('config')
-                
-                future = executor.submit(
-                    self.run_single_engine, 
-                    engine_name, 
-                    input_data, 
-                    engine_config
-                )
-                future_to_engine[future] = engine_name
+        # Submit all engine tasks
+        future_to_engine = {}
+        for config in engine_configs:
+            engine_name = config['name']
+            input_data = config['input']
+            engine_config = config.get('config')
             
-            # Collect results as they complete
-            for future in as_completed(future_to_engine):
-                engine_name = future_to_engine[future]
-                try:
-                    result = future.result()
-                    results[engine_name] = result
-                    self.logger.info(f"Completed engine: {engine_name}")
-                except Exception as e:
-                    self.logger.error(f"Engine {engine_name} failed: {str(e)}")
-                    results[engine_name] = EngineError(f"Engine failed: {str(e)}")
+            future = self.executor.submit(
+                self.run_single_engine, 
+                engine_name, 
+                input_data, 
+                engine_config,
+                config.get('subject')
+            )
+            future_to_engine[future] = engine_name
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_engine):
+            engine_name = future_to_engine[future]
+            try:
+                result = future.result()
+                results[engine_name] = result
+                self.logger.info(f"Completed engine: {engine_name}")
+            except Exception as e:
+                self.logger.error(f"Engine {engine_name} failed: {str(e)}")
+                results[engine_name] = EngineError(f"Engine failed: {str(e)}")
         
         return results
     
@@ -114,7 +212,7 @@ class EngineOrchestrator:
                 input_data.previous_results = results
             
             try:
-                result = self.run_single_engine(engine_name, input_data, engine_config)
+                result = self.run_single_engine(engine_name, input_data, engine_config, config.get('subject'))
                 results[engine_name] = result
                 self.logger.info(f"Completed sequential engine: {engine_name}")
             except Exception as e:
@@ -124,21 +222,144 @@ class EngineOrchestrator:
         
         return results
     
+    def run_dag_engines(self, engine_configs: List[Dict]) -> DAGExecution:
+        """
+        Run engines as a dependency graph over their shared intermediate products
+        
+        Each product an engine declares in ``shared_products`` (natal ephemeris,
+        design ephemeris, sidereal Moon nakshatra, numerology core) becomes a
+        node computed once per distinct input; engines start as soon as their
+        products are ready and read them from the calculation caches.
+        
+        Args:
+            engine_configs: List of dicts with 'name', 'input', and optional 'config' and 'subject'
+        """
+        start_time = time.perf_counter()
+        nodes: Dict[str, DAGNode] = {}
+        product_nodes: Dict[tuple, str] = {}
+        load_errors = {}
+        
+        for config in engine_configs:
+            engine_name = config['name']
+            input_data = config['input']
+            engine_config = config.get('config')
+            
+            try:
+                engine = self.load_engine(engine_name, engine_config)
+            except Exception as e:
+                self.logger.error(f"Engine {engine_name} failed: {str(e)}")
+                load_errors[engine_name] = EngineError(f"Engine failed: {str(e)}")
+                continue
+            
+            requires = set()
+            for product_name in getattr(engine, 'shared_products', ()):
+                node_id = self._add_product_node(product_name, engine, input_data, nodes, product_nodes)
+                if node_id:
+                    requires.add(node_id)
+            
+            nodes[engine_name] = DAGNode(
+                node_id=engine_name,
+                kind="engine",
+                func=partial(self.run_single_engine, engine_name, input_data, engine_config,
+                             config.get('subject')),
+                requires=requires
+            )
+        
+        values, errors, timings = DAGScheduler(self.executor, self.logger).run(nodes)
+        
+        results = dict(load_errors)
+        products = {}
+        for node_id, node in nodes.items():
+            if node.kind == "engine":
+                if node_id in errors:
+                    results[node_id] = EngineError(f"Engine failed: {str(errors[node_id])}")
+                else:
+                    results[node_id] = values[node_id]
+            elif node_id in values:
+                products[node_id] = values[node_id]
+        
+        return DAGExecution(
+            results=results,
+            products=products,
+            timings=timings,
+            total_time=time.perf_counter() - start_time
+        )
+    
+    def _add_product_node(self, product_name: str, engine: BaseEngine, input_data: Any,
+                          nodes: Dict[str, DAGNode], product_nodes: Dict[tuple, str]) -> Optional[str]:
+        """Add a shared product (and the products it requires) to the graph, deduplicated by input"""
+        spec = SHARED_PRODUCTS.get(product_name)
+        if spec is None:
+            self.logger.warning(f"Unknown shared product: {product_name}")
+            return None
+        
+        try:
+            args = spec.arguments(engine._validate_input(input_data))
+        except Exception:
+            # Invalid input surfaces when the engine itself runs
+            return None
+        if args is None:
+            return None
+        
+        key = (product_name, args)
+        if key in product_nodes:
+            return product_nodes[key]
+        
+        requires = set()
+        for required in spec.requires:
+            node_id = self._add_product_node(required, engine, input_data, nodes, product_nodes)
+            if node_id:
+                requires.add(node_id)
+        
+        # Distinct inputs for the same product get numbered node ids
+        count = sum(1 for name, _ in product_nodes if name == product_name)
+        node_id = product_name if count == 0 else f"{product_name}#{count}"
+        product_nodes[key] = node_id
+        nodes[node_id] = DAGNode(
+            node_id=node_id,
+            kind="product",
+            func=partial(spec.compute, engine, args),
+            requires=requires
+        )
+        return node_id
+    
     def create_comprehensive_reading(self, birth_data: Dict, 
-                                   engines: Optional[List[str]] = None) -> Dict[str, Any]:
+                                   engines: Optional[List[str]] = None,
+                                   execution_mode: str = "parallel") -> Dict[str, Any]:
         """
         Create a comprehensive reading using multiple engines
         
         Args:
             birth_data: Birth information (date, time, location, name)
             engines: List of engine names to use (default: all available)
+            execution_mode: "parallel", "sequential" or "dag" (shared products
+                computed once, per-node timings included in the reading)
         """
+        if execution_mode not in ("parallel", "sequential", "dag"):
+            raise EngineError(f"Unknown execution mode: {execution_mode}")
+        
         if engines is None:
-            engines = ['numerology', 'biorhythm', 'human_design', 'vimshottari', 
-                      'gene_keys', 'tarot', 'iching']
+            engines = list(DEFAULT_READING_ENGINES)
+        
+        engine_configs = self.prepare_engine_configs(birth_data, engines)
         
-        # Prepare engine configurations
+        execution = {'mode': execution_mode}
+        if execution_mode == "dag":
+            dag_execution = self.run_dag_engines(engine_configs)
+            results = dag_execution.results
+            execution['timings'] = dag_execution.timing_report()
+        elif execution_mode == "sequential":
+            results = self.run_sequential_engines(engine_configs)
+        else:
+            # Run engines in parallel for independent calculations
+            results = self.run_parallel_engines(engine_configs)
+        
+        return self.build_reading(birth_data, engines, results, execution)
+    
+    def prepare_engine_configs(self, birth_data: Dict, engines: List[str]) -> List[Dict]:
+        """Prepare engine configurations for a reading, skipping engines without an input mapping"""
         engine_configs = []
+        subject = subject_hash(birth_data)
         
         for engine_name in engines:
             if engine_name in ['numerology', 'biorhythm']:
@@ -158,22 +379,23 @@ class EngineOrchestrator:
             
             engine_configs.append({
                 'name': engine_name,
-                'input': input_data
+                'input': input_data,
+                'subject': subject
             })
         
-        # Run engines in parallel for independent calculations
-        results = self.run_parallel_engines(engine_configs)
-        
-        # Add metadata
-        reading = {
+        return engine_configs
+    
+    def build_reading(self, birth_data: Dict, engines: List[str], results: Dict[str, Any],
+                      execution: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble a comprehensive reading from engine results"""
+        return {
             'timestamp': datetime.now().isoformat(),
             'birth_data': birth_data,
             'engines_used': engines,
             'results': results,
+            'execution': execution,
             'synthesis': None  # Will be filled by ResultSynthesizer
         }
-        
-        return reading
     
     def _prepare_basic_input(self, birth_data: Dict, engine_name: str) -> BaseEngineInput:
         """Prepare input for basic engines (numerology, biorhythm)"""
@@ -194,10 +416,30 @@ class EngineOrchestrator:
         """Prepare input for divination engines"""
         return BaseEngineInput()
     
+    def get_engine_versions(self, engine_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Version signature of each loaded engine
+        
+        Combines the engine's version with its configuration, so caches keyed
+        on it are invalidated by an upgrade or a config change. Engines not
+        loaded yet (or without a version) are left out.
+        """
+        versions = {}
+        for engine_name in engine_names:
+            engine = self.active_engines.get(engine_name)
+            version = getattr(engine, '_version', None)
+            if version is not None:
+                versions[engine_name] = content_hash(engine_name, getattr(engine, 'config', None) or {}, version)
+        return versions
+    
     def get_available_engines(self) -> List[str]:
         """Get list of available engines"""
         return list_engines()
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get engine result cache statistics"""
+        return self.workflow_cache.stats()
+    
     def clear_cache(self):
         """Clear workflow cache"""
         self.workflow_cache.clear()
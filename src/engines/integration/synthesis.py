@@ -5,19 +5,53 @@ Analyzes patterns across different divination systems and creates
 unified consciousness field insights.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import json
 import logging
 from collections import defaultdict
 
 try:
+    from ..base.cache import TTLCache, identity_memo
     from ..base.data_models import BaseEngineOutput
+    from ..base.features import ARCHETYPE_KEYWORDS, FeatureVector, features_of, keyword_mask
+    from ..base.keyword_index import KeywordIndex
 except ImportError:
     import sys
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from base.cache import TTLCache, identity_memo
     from base.data_models import BaseEngineOutput
+    from base.features import ARCHETYPE_KEYWORDS, FeatureVector, features_of, keyword_mask
+    from base.keyword_index import KeywordIndex
+
+
+# Theme -> keywords looked up in each engine's results
+THEME_KEYWORDS = {
+    'purpose': ['life_path', 'incarnation_cross', 'purpose', 'mission'],
+    'relationships': ['compatibility', 'partnership', 'connection', 'love'],
+    'career': ['work', 'career', 'profession', 'calling', 'service'],
+    'growth': ['evolution', 'development', 'learning', 'expansion'],
+    'challenges': ['shadow', 'obstacles', 'lessons', 'karma'],
+    'gifts': ['talents', 'abilities', 'strengths', 'gifts']
+}
+
+# Engines contributing current cycles, in the order they are reported
+TEMPORAL_ENGINES = ('biorhythm', 'vimshottari')
+
+
+@dataclass
+class EngineContribution:
+    """One engine's terms of a synthesis, combined across the reading"""
+    features: FeatureVector
+    archetypes: FrozenSet[str] = frozenset()
+    current_cycles: List[Dict] = field(default_factory=list)
+    energy_centers: List[Dict] = field(default_factory=list)
+    dominant_elements: List[Dict] = field(default_factory=list)
+    themes: Dict[str, str] = field(default_factory=dict)
+    awareness_level: Optional[str] = None
+    guidance: List[Dict] = field(default_factory=list)
 
 
 class ResultSynthesizer:
@@ -25,55 +59,115 @@ class ResultSynthesizer:
     Synthesizes results from multiple engines to find correlations and patterns
     """
     
-    def __init__(self):
+    def __init__(self, contribution_cache_size: int = 256):
+        """
+        Args:
+            contribution_cache_size: Maximum number of engine results whose
+                synthesis contributions are kept for re-synthesis
+        """
         self.logger = logging.getLogger(__name__)
         self.correlation_patterns = {}
-        self.synthesis_cache = {}
+        self.synthesis_cache = TTLCache(maxsize=contribution_cache_size)
         
     def synthesize_reading(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
         """
         Create a synthesized analysis from multiple engine results
         
+        Each engine's contribution is cached per result object, so when a
+        reading is re-synthesized with only some results changed (a live
+        session refreshing biorhythm, current dasha periods or a new draw),
+        only those engines' terms are recomputed before combining.
+        
         Args:
             results: Dictionary of engine_name -> engine_output
             
         Returns:
             Synthesized analysis with correlations and unified insights
         """
+        contributions = self._contributions(results)
+        
         synthesis = {
             'timestamp': datetime.now().isoformat(),
             'engines_analyzed': list(results.keys()),
-            'correlations': self._find_correlations(results),
-            'unified_themes': self._extract_unified_themes(results),
+            'correlations': self._find_correlations(results, contributions),
+            'unified_themes': self._extract_unified_themes(results, contributions),
             'field_signature': self._analyze_field_signature(results),
-            'consciousness_map': self._create_consciousness_map(results),
-            'integration_guidance': self._generate_integration_guidance(results),
+            'consciousness_map': self._create_consciousness_map(results, contributions),
+            'integration_guidance': self._generate_integration_guidance(results, contributions),
             'reality_patches': self._suggest_reality_patches(results)
         }
         
         return synthesis
     
-    def _find_correlations(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+    def _contributions(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, EngineContribution]:
+        """Per-engine contributions, computed only for results not seen before"""
+        return {
+            engine_name: identity_memo(
+                self.synthesis_cache, ('contribution', engine_name), (result,),
+                lambda: self._engine_contribution(engine_name, result)
+            )
+            for engine_name, result in results.items()
+        }
+    
+    def _engine_contribution(self, engine_name: str, result: BaseEngineOutput) -> EngineContribution:
+        """Compute everything a single engine result contributes to a synthesis"""
+        # Single-word archetype keywords only depend on the engine's own terms
+        index = KeywordIndex.build({engine_name: result})
+        contribution = EngineContribution(
+            features=features_of(result),
+            archetypes=frozenset(
+                archetype for archetype, keywords in ARCHETYPE_KEYWORDS.items()
+                if index.sources_with(keywords)
+            )
+        )
+        
+        for theme, keywords in THEME_KEYWORDS.items():
+            theme_content = self._extract_theme_content(result, keywords)
+            if theme_content:
+                contribution.themes[theme] = theme_content
+        
+        data = getattr(result, 'raw_data', None)
+        if not isinstance(data, dict):
+            return contribution
+        
+        contribution.awareness_level = self._map_awareness_level(data)
+        contribution.guidance = self._extract_actionable_insights(data, engine_name)
+        if engine_name == 'biorhythm':
+            contribution.current_cycles = self._extract_biorhythm_cycles(data)
+        elif engine_name == 'vimshottari':
+            contribution.current_cycles = self._extract_dasha_periods(data)
+        elif engine_name == 'human_design':
+            contribution.energy_centers = self._extract_hd_centers(data)
+        elif engine_name == 'numerology':
+            contribution.dominant_elements = self._extract_numerology_vibrations(data)
+        
+        return contribution
+    
+    def _find_correlations(self, results: Dict[str, BaseEngineOutput],
+                           contributions: Optional[Dict[str, EngineContribution]] = None) -> Dict[str, Any]:
         """Find correlations between different engine results"""
+        if contributions is None:
+            contributions = self._contributions(results)
+        features = {engine_name: contribution.features for engine_name, contribution in contributions.items()}
+        
         correlations = {
-            'numerical_patterns': self._find_numerical_correlations(results),
-            'archetypal_resonance': self._find_archetypal_correlations(results),
-            'temporal_alignments': self._find_temporal_correlations(results),
-            'energy_signatures': self._find_energy_correlations(results)
+            'numerical_patterns': self._find_numerical_correlations(features),
+            'archetypal_resonance': self._find_archetypal_correlations(contributions),
+            'temporal_alignments': self._find_temporal_correlations(results, contributions),
+            'energy_signatures': self._find_energy_correlations(results, contributions)
         }
         
         return correlations
     
-    def _find_numerical_correlations(self, results: Dict[str, BaseEngineOutput]) -> List[Dict]:
+    def _find_numerical_correlations(self, features: Dict[str, FeatureVector]) -> List[Dict]:
         """Find numerical patterns across engines"""
         patterns = []
         
-        # Extract numbers from all results
+        # Merge per-engine number counts: number -> one source entry per occurrence
         numbers = defaultdict(list)
-        
-        for engine_name, result in results.items():
-            if hasattr(result, 'raw_data') and isinstance(result.raw_data, dict):
-                self._extract_numbers_recursive(result.raw_data, numbers, engine_name)
+        for engine_name, vector in features.items():
+            for number, count in vector.numbers.items():
+                numbers[number].extend([engine_name] * count)
         
         # Find repeated numbers
         for number, sources in numbers.items():
@@ -87,26 +181,16 @@ class ResultSynthesizer:
         
         return sorted(patterns, key=lambda x: x['frequency'], reverse=True)
     
-    def _find_archetypal_correlations(self, results: Dict[str, BaseEngineOutput]) -> List[Dict]:
+    def _find_archetypal_correlations(self, contributions: Dict[str, EngineContribution]) -> List[Dict]:
         """Find archetypal themes across different systems"""
         archetypes = []
         
-        # Define archetypal mappings between systems
-        archetypal_mappings = {
-            'leadership': ['manifestor', 'emperor', 'line_1', 'mars'],
-            'wisdom': ['projector', 'hermit', 'line_6', 'jupiter'],
-            'creativity': ['generator', 'empress', 'line_3', 'venus'],
-            'reflection': ['reflector', 'moon', 'line_4', 'neptune'],
-            'transformation': ['death', 'pluto', 'line_5', 'scorpio'],
-            'communication': ['magician', 'mercury', 'line_2', 'gemini']
-        }
-        
-        # Analyze each archetype
-        for archetype, keywords in archetypal_mappings.items():
-            matches = []
-            for engine_name, result in results.items():
-                if self._contains_archetypal_keywords(result, keywords):
-                    matches.append(engine_name)
+        # Combine the archetypes each engine expresses
+        for archetype in ARCHETYPE_KEYWORDS:
+            matches = [
+                engine_name for engine_name, contribution in contributions.items()
+                if archetype in contribution.archetypes
+            ]
             
             if len(matches) > 1:
                 archetypes.append({
@@ -118,8 +202,11 @@ class ResultSynthesizer:
         
         return sorted(archetypes, key=lambda x: x['strength'], reverse=True)
     
-    def _find_temporal_correlations(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+    def _find_temporal_correlations(self, results: Dict[str, BaseEngineOutput],
+                                    contributions: Optional[Dict[str, EngineContribution]] = None) -> Dict[str, Any]:
         """Find temporal patterns and timing correlations"""
+        if contributions is None:
+            contributions = self._contributions(results)
         temporal = {
             'current_cycles': [],
             'transition_periods': [],
@@ -127,22 +214,18 @@ class ResultSynthesizer:
             'challenging_periods': []
         }
         
-        # Analyze biorhythm cycles
-        if 'biorhythm' in results:
-            biorhythm_data = results['biorhythm'].raw_data
-            if isinstance(biorhythm_data, dict):
-                temporal['current_cycles'].extend(self._extract_biorhythm_cycles(biorhythm_data))
-
-        # Analyze Vimshottari periods
-        if 'vimshottari' in results:
-            vimshottari_data = results['vimshottari'].raw_data
-            if isinstance(vimshottari_data, dict):
-                temporal['current_cycles'].extend(self._extract_dasha_periods(vimshottari_data))
+        # Biorhythm cycles, then Vimshottari periods
+        for engine_name in TEMPORAL_ENGINES:
+            if engine_name in contributions:
+                temporal['current_cycles'].extend(contributions[engine_name].current_cycles)
         
         return temporal
     
-    def _find_energy_correlations(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+    def _find_energy_correlations(self, results: Dict[str, BaseEngineOutput],
+                                  contributions: Optional[Dict[str, EngineContribution]] = None) -> Dict[str, Any]:
         """Find energy signature correlations"""
+        if contributions is None:
+            contributions = self._contributions(results)
         energy = {
             'dominant_elements': [],
             'energy_centers': [],
@@ -150,43 +233,26 @@ class ResultSynthesizer:
             'blockages': []
         }
         
-        # Analyze Human Design centers
-        if 'human_design' in results:
-            hd_data = results['human_design'].raw_data
-            if isinstance(hd_data, dict):
-                energy['energy_centers'] = self._extract_hd_centers(hd_data)
-
-        # Analyze numerology vibrations
-        if 'numerology' in results:
-            num_data = results['numerology'].raw_data
-            if isinstance(num_data, dict):
-                energy['dominant_elements'].extend(self._extract_numerology_vibrations(num_data))
+        # Human Design centers and numerology vibrations
+        for contribution in contributions.values():
+            energy['energy_centers'].extend(contribution.energy_centers)
+            energy['dominant_elements'].extend(contribution.dominant_elements)
         
         return energy
     
-    def _extract_unified_themes(self, results: Dict[str, BaseEngineOutput]) -> List[Dict]:
+    def _extract_unified_themes(self, results: Dict[str, BaseEngineOutput],
+                                contributions: Optional[Dict[str, EngineContribution]] = None) -> List[Dict]:
         """Extract unified themes across all systems"""
+        if contributions is None:
+            contributions = self._contributions(results)
         themes = []
         
-        # Common themes to look for
-        theme_keywords = {
-            'purpose': ['life_path', 'incarnation_cross', 'purpose', 'mission'],
-            'relationships': ['compatibility', 'partnership', 'connection', 'love'],
-            'career': ['work', 'career', 'profession', 'calling', 'service'],
-            'growth': ['evolution', 'development', 'learning', 'expansion'],
-            'challenges': ['shadow', 'obstacles', 'lessons', 'karma'],
-            'gifts': ['talents', 'abilities', 'strengths', 'gifts']
-        }
-        
-        for theme, keywords in theme_keywords.items():
-            theme_data = []
-            for engine_name, result in results.items():
-                theme_content = self._extract_theme_content(result, keywords)
-                if theme_content:
-                    theme_data.append({
-                        'engine': engine_name,
-                        'content': theme_content
-                    })
+        for theme in THEME_KEYWORDS:
+            theme_data = [
+                {'engine': engine_name, 'content': contribution.themes[theme]}
+                for engine_name, contribution in contributions.items()
+                if theme in contribution.themes
+            ]
             
             if theme_data:
                 themes.append({
@@ -216,8 +282,11 @@ class ResultSynthesizer:
         
         return signature
     
-    def _create_consciousness_map(self, results: Dict[str, BaseEngineOutput]) -> Dict[str, Any]:
+    def _create_consciousness_map(self, results: Dict[str, BaseEngineOutput],
+                                  contributions: Optional[Dict[str, EngineContribution]] = None) -> Dict[str, Any]:
         """Create a consciousness map from all results"""
+        if contributions is None:
+            contributions = self._contributions(results)
         consciousness_map = {
             'awareness_levels': {},
             'integration_points': [],
@@ -227,22 +296,22 @@ class ResultSynthesizer:
         }
         
         # Map consciousness levels from different systems
-        for engine_name, result in results.items():
-            if hasattr(result, 'raw_data') and isinstance(result.raw_data, dict):
-                consciousness_map['awareness_levels'][engine_name] = self._map_awareness_level(result.raw_data)
+        for engine_name, contribution in contributions.items():
+            if contribution.awareness_level is not None:
+                consciousness_map['awareness_levels'][engine_name] = contribution.awareness_level
         
         return consciousness_map
     
-    def _generate_integration_guidance(self, results: Dict[str, BaseEngineOutput]) -> List[Dict]:
+    def _generate_integration_guidance(self, results: Dict[str, BaseEngineOutput],
+                                       contributions: Optional[Dict[str, EngineContribution]] = None) -> List[Dict]:
         """Generate practical integration guidance"""
+        if contributions is None:
+            contributions = self._contributions(results)
         guidance = []
         
-        # Extract actionable insights from each engine
-        for engine_name, result in results.items():
-            if hasattr(result, 'raw_data') and isinstance(result.raw_data, dict):
-                engine_guidance = self._extract_actionable_insights(result.raw_data, engine_name)
-                if engine_guidance:
-                    guidance.extend(engine_guidance)
+        # Actionable insights of each engine
+        for contribution in contributions.values():
+            guidance.extend(contribution.guidance)
         
         # Prioritize and organize guidance
         return self._prioritize_guidance(guidance)
@@ -278,17 +347,6 @@ class ResultSynthesizer:
         return patches
     
     # Helper methods (simplified implementations)
-    def _extract_numbers_recursive(self, data: Any, numbers: Dict, source: str):
-        """Recursively extract numbers from data structure"""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                self._extract_numbers_recursive(value, numbers, source)
-        elif isinstance(data, list):
-            for item in data:
-                self._extract_numbers_recursive(item, numbers, source)
-        elif isinstance(data, (int, float)):
-            numbers[data].append(source)
-    
     def _interpret_number_significance(self, number: float) -> str:
         """Interpret the significance of a repeated number"""
         # Simplified interpretation
@@ -303,10 +361,7 @@ class ResultSynthesizer:
     
     def _contains_archetypal_keywords(self, result: BaseEngineOutput, keywords: List[str]) -> bool:
         """Check if result contains archetypal keywords"""
-        if hasattr(result, 'raw_data'):
-            result_str = str(result.raw_data).lower()
-            return any(keyword.lower() in result_str for keyword in keywords)
-        return False
+        return features_of(result).has_keywords(keyword_mask(keywords))
     
     def _interpret_archetype(self, archetype: str, engines: List[str]) -> str:
         """Interpret archetypal significance"""
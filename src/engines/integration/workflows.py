@@ -8,16 +8,26 @@ and consciousness analysis scenarios.
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date
 import logging
+import threading
 
 try:
     from .orchestrator import EngineOrchestrator
+    from .async_orchestrator import AsyncEngineOrchestrator
     from .synthesis import ResultSynthesizer
+    from ..base.canonical import subject_hash
 except ImportError:
     import sys
     import os
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from orchestrator import EngineOrchestrator
+    from async_orchestrator import AsyncEngineOrchestrator
     from synthesis import ResultSynthesizer
+    from base.canonical import subject_hash
+
+
+# Workflows whose input holds several subjects rather than one person's birth data
+MULTI_SUBJECT_WORKFLOWS = frozenset({'relationship_compatibility'})
 
 
 class WorkflowManager:
@@ -25,11 +35,24 @@ class WorkflowManager:
     Manages predefined workflows for common reading scenarios
     """
     
-    def __init__(self):
-        self.orchestrator = EngineOrchestrator()
+    def __init__(self, orchestrator: Optional[EngineOrchestrator] = None,
+                 async_orchestrator: Optional[AsyncEngineOrchestrator] = None):
+        """
+        Args:
+            orchestrator: Orchestrator to run engines on; workflows sharing one
+                reuse each other's engine results through its result cache
+            async_orchestrator: Async front end for the *_async methods (default:
+                one wrapping ``orchestrator``)
+        """
+        self.orchestrator = orchestrator or EngineOrchestrator()
+        # Async front end sharing the orchestrator's engines, cache and thread pool
+        self.async_orchestrator = async_orchestrator or AsyncEngineOrchestrator(self.orchestrator)
         self.synthesizer = ResultSynthesizer()
         self.logger = logging.getLogger(__name__)
         
+        # Engine results precomputed for the batch running on this thread: subject key -> results
+        self._batch = threading.local()
+        
         # Define workflow templates
         self.workflows = {
             'complete_natal': self._complete_natal_workflow,
@@ -61,6 +84,118 @@ class WorkflowManager:
         workflow_func = self.workflows[workflow_name]
         results = workflow_func(input_data, options or {})
         
+        final_result = self._finalize_workflow(workflow_name, input_data, options, results)
+        
+        self.logger.info(f"Completed workflow: {workflow_name}")
+        return final_result
+    
+    def run_workflows(self, workflow_names: List[str], input_data: Dict,
+                      options: Optional[Dict] = None,
+                      workflow_options: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
+        """
+        Run several workflows for one person, computing each engine only once
+        
+        The union of the workflows' engines runs in a single comprehensive
+        reading per subject; every workflow's insight functions then read from
+        those results. Randomized engines (tarot, iching) are drawn once per batch.
+        
+        Args:
+            workflow_names: Workflows to run
+            input_data: Birth data of the person
+            options: Options shared by all workflows
+            workflow_options: Per-workflow option overrides
+        """
+        resolved_options, plan = self._plan_batch(workflow_names, input_data, options, workflow_options)
+        self.logger.info(f"Starting workflow batch {workflow_names}")
+        
+        batch = {
+            subject: self._run_engines(birth_data, engines)
+            for subject, (birth_data, engines) in plan.items()
+        }
+        return self._run_batch(workflow_names, input_data, resolved_options, plan, batch)
+    
+    async def run_workflow_async(self, workflow_name: str, input_data: Dict,
+                                 options: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Run a predefined workflow from a coroutine
+        
+        Engines are awaited on the async orchestrator, so the event loop is
+        never blocked; the insight functions then run on the precomputed results.
+        """
+        batch = await self.run_workflows_async([workflow_name], input_data,
+                                               workflow_options={workflow_name: options or {}})
+        return batch['workflows'][workflow_name]
+    
+    async def run_workflows_async(self, workflow_names: List[str], input_data: Dict,
+                                  options: Optional[Dict] = None,
+                                  workflow_options: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
+        """Async variant of run_workflows, awaiting engines on the async orchestrator"""
+        resolved_options, plan = self._plan_batch(workflow_names, input_data, options, workflow_options)
+        self.logger.info(f"Starting async workflow batch {workflow_names}")
+        
+        batch = {}
+        for subject, (birth_data, engines) in plan.items():
+            reading = await self.async_orchestrator.create_comprehensive_reading(birth_data, engines)
+            batch[subject] = {name: reading['results'][name] for name in engines if name in reading['results']}
+        
+        return self._run_batch(workflow_names, input_data, resolved_options, plan, batch)
+    
+    def _plan_batch(self, workflow_names: List[str], input_data: Dict, options: Optional[Dict],
+                    workflow_options: Optional[Dict[str, Dict]]):
+        """
+        Resolve per-workflow options and the union of engines per subject
+        
+        Returns:
+            (workflow name -> options, subject key -> (birth data, engines))
+        """
+        unknown = [name for name in workflow_names if name not in self.workflows]
+        if unknown:
+            raise ValueError(f"Unknown workflow(s): {', '.join(unknown)}")
+        
+        workflow_options = workflow_options or {}
+        resolved_options = {
+            name: {**(options or {}), **workflow_options.get(name, {})}
+            for name in workflow_names
+        }
+        
+        plan = {}
+        for name in workflow_names:
+            for birth_data in self._workflow_subjects(name, input_data):
+                subject = self._subject_key(birth_data)
+                if subject is None:
+                    continue
+                _, engines = plan.setdefault(subject, (birth_data, []))
+                for engine_name in self.get_workflow_engines(name, resolved_options[name]):
+                    if engine_name not in engines:
+                        engines.append(engine_name)
+        
+        return resolved_options, plan
+    
+    def _run_batch(self, workflow_names: List[str], input_data: Dict, resolved_options: Dict[str, Dict],
+                   plan: Dict[str, Any], batch: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Run each workflow's insight functions over precomputed engine results"""
+        self._batch.results = batch
+        try:
+            workflows = {}
+            for name in workflow_names:
+                results = self.workflows[name](input_data, resolved_options[name])
+                workflows[name] = self._finalize_workflow(name, input_data, resolved_options[name], results)
+        finally:
+            self._batch.results = None
+        
+        self.logger.info(f"Completed workflow batch: {workflow_names}")
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'input_data': input_data,
+            'engines_used': list(dict.fromkeys(
+                engine for _, engines in plan.values() for engine in engines
+            )),
+            'workflows': workflows
+        }
+    
+    def _finalize_workflow(self, workflow_name: str, input_data: Dict,
+                           options: Optional[Dict], results: Dict[str, Any]) -> Dict[str, Any]:
+        """Synthesize a workflow's engine results and assemble the final result"""
         # Synthesize results
         synthesis = self.synthesizer.synthesize_reading(results['engine_results'])
         
@@ -76,36 +211,112 @@ class WorkflowManager:
             'recommendations': results.get('recommendations', [])
         }
         
-        self.logger.info(f"Completed workflow: {workflow_name}")
         return final_result
     
+    def get_workflow_engines(self, workflow_name: str, options: Optional[Dict] = None) -> List[str]:
+        """
+        Get the engines a workflow runs for each subject
+        
+        Args:
+            workflow_name: Name of the workflow
+            options: Workflow options (some add divination or sacred geometry)
+        """
+        options = options or {}
+        
+        if workflow_name == 'complete_natal':
+            engines = ['numerology', 'biorhythm', 'human_design', 'vimshottari', 'gene_keys']
+            # Add divination engines if requested
+            if options.get('include_divination', True):
+                engines.extend(['tarot', 'iching'])
+        elif workflow_name == 'relationship_compatibility':
+            engines = ['numerology', 'biorhythm', 'human_design', 'gene_keys']
+        elif workflow_name == 'career_guidance':
+            # Focus on engines that provide career insights
+            engines = ['numerology', 'human_design', 'gene_keys', 'vimshottari']
+        elif workflow_name == 'spiritual_development':
+            # Focus on spiritual/consciousness engines
+            engines = ['gene_keys', 'human_design', 'iching', 'vimshottari']
+            # Add sacred geometry if available
+            if 'sacred_geometry' in self.orchestrator.get_available_engines():
+                engines.append('sacred_geometry')
+        elif workflow_name == 'life_transition':
+            # Focus on timing and transition engines
+            engines = ['biorhythm', 'vimshottari', 'tarot', 'iching']
+        elif workflow_name == 'daily_guidance':
+            # Focus on daily/cyclical engines
+            engines = ['biorhythm', 'numerology']
+            # Add divination for daily guidance
+            if options.get('include_divination', True):
+                engines.extend(['tarot', 'iching'])
+        elif workflow_name == 'shadow_work':
+            # Focus on engines that reveal shadow aspects, plus divination for exploration
+            engines = ['gene_keys', 'human_design', 'enneagram', 'tarot', 'iching']
+        elif workflow_name == 'manifestation_timing':
+            # Focus on timing and energy engines
+            engines = ['biorhythm', 'vimshottari', 'numerology']
+            # Add sacred geometry for manifestation support
+            if 'sacred_geometry' in self.orchestrator.get_available_engines():
+                engines.append('sacred_geometry')
+        else:
+            raise ValueError(f"Unknown workflow: {workflow_name}")
+        
+        return engines
+    
+    def _subject_key(self, birth_data: Dict) -> Optional[str]:
+        """Canonical key identifying a person, or None if the data cannot be hashed"""
+        try:
+            return subject_hash(birth_data)
+        except Exception:
+            return None
+    
+    def _workflow_subjects(self, workflow_name: str, input_data: Dict) -> List[Dict]:
+        """Birth data of each person a workflow reads"""
+        if workflow_name in MULTI_SUBJECT_WORKFLOWS:
+            return [input_data['person1'], input_data['person2']]
+        return [input_data]
+    
+    def _run_engines(self, birth_data: Dict, engines: List[str]) -> Dict[str, Any]:
+        """
+        Get engine results for one person
+        
+        Inside a batch the precomputed results are used; engines not in the
+        batch run in one comprehensive reading. Results from earlier runs are
+        reused by the orchestrator's result cache, which rolls daily engines
+        over at midnight and never reuses volatile ones.
+        """
+        batch = getattr(self._batch, 'results', None) or {}
+        subject = self._subject_key(birth_data) if batch else None
+        results = dict(batch.get(subject, {}))
+        
+        missing = [name for name in engines if name not in results]
+        if missing:
+            reading = self.orchestrator.create_comprehensive_reading(birth_data, missing)
+            results.update(reading['results'])
+        
+        # Keep the workflow's engine order
+        return {name: results[name] for name in engines if name in results}
+    
+    
     def _complete_natal_workflow(self, input_data: Dict, options: Dict) -> Dict[str, Any]:
         """
         Complete natal chart analysis using all available engines
         """
         birth_data = input_data
         
-        # Define engines for complete natal reading
-        engines = ['numerology', 'biorhythm', 'human_design', 'vimshottari', 'gene_keys']
-        
-        # Add divination engines if requested
-        if options.get('include_divination', True):
-            engines.extend(['tarot', 'iching'])
-        
-        # Run engines
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        # Run engines for complete natal reading
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('complete_natal', options))
         
         # Workflow-specific insights
         workflow_insights = {
-            'natal_themes': self._extract_natal_themes(engine_results['results']),
-            'life_purpose_synthesis': self._synthesize_life_purpose(engine_results['results']),
-            'personality_integration': self._analyze_personality_integration(engine_results['results'])
+            'natal_themes': self._extract_natal_themes(engine_results),
+            'life_purpose_synthesis': self._synthesize_life_purpose(engine_results),
+            'personality_integration': self._analyze_personality_integration(engine_results)
         }
         
-        recommendations = self._generate_natal_recommendations(engine_results['results'])
+        recommendations = self._generate_natal_recommendations(engine_results)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -116,20 +327,14 @@ class WorkflowManager:
         """
         person1_data = input_data['person1']
         person2_data = input_data['person2']
+        engines = self.get_workflow_engines('relationship_compatibility', options)
         
         # Run engines for both people
-        person1_results = self.orchestrator.create_comprehensive_reading(
-            person1_data, ['numerology', 'biorhythm', 'human_design', 'gene_keys']
-        )
-        person2_results = self.orchestrator.create_comprehensive_reading(
-            person2_data, ['numerology', 'biorhythm', 'human_design', 'gene_keys']
-        )
+        person1_results = self._run_engines(person1_data, engines)
+        person2_results = self._run_engines(person2_data, engines)
         
         # Compatibility analysis
-        compatibility = self._analyze_compatibility(
-            person1_results['results'], 
-            person2_results['results']
-        )
+        compatibility = self._analyze_compatibility(person1_results, person2_results)
         
         workflow_insights = {
             'compatibility_score': compatibility['overall_score'],
@@ -142,8 +347,8 @@ class WorkflowManager:
         
         # Combine results
         combined_results = {
-            'person1': person1_results['results'],
-            'person2': person2_results['results'],
+            'person1': person1_results,
+            'person2': person2_results,
             'compatibility': compatibility
         }
         
@@ -159,13 +364,10 @@ class WorkflowManager:
         """
         birth_data = input_data
         
-        # Focus on engines that provide career insights
-        engines = ['numerology', 'human_design', 'gene_keys', 'vimshottari']
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('career_guidance', options))
         
         # Career-specific analysis
-        career_analysis = self._analyze_career_potential(engine_results['results'])
+        career_analysis = self._analyze_career_potential(engine_results)
         
         workflow_insights = {
             'career_themes': career_analysis['themes'],
@@ -177,7 +379,7 @@ class WorkflowManager:
         recommendations = self._generate_career_recommendations(career_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -188,17 +390,10 @@ class WorkflowManager:
         """
         birth_data = input_data
         
-        # Focus on spiritual/consciousness engines
-        engines = ['gene_keys', 'human_design', 'iching', 'vimshottari']
-        
-        # Add sacred geometry if available
-        if 'sacred_geometry' in self.orchestrator.get_available_engines():
-            engines.append('sacred_geometry')
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('spiritual_development', options))
         
         # Spiritual development analysis
-        spiritual_analysis = self._analyze_spiritual_path(engine_results['results'])
+        spiritual_analysis = self._analyze_spiritual_path(engine_results)
         
         workflow_insights = {
             'current_evolutionary_stage': spiritual_analysis['stage'],
@@ -210,7 +405,7 @@ class WorkflowManager:
         recommendations = self._generate_spiritual_recommendations(spiritual_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -222,14 +417,11 @@ class WorkflowManager:
         birth_data = input_data
         transition_type = options.get('transition_type', 'general')
         
-        # Focus on timing and transition engines
-        engines = ['biorhythm', 'vimshottari', 'tarot', 'iching']
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('life_transition', options))
         
         # Transition-specific analysis
         transition_analysis = self._analyze_transition_timing(
-            engine_results['results'], 
+            engine_results, 
             transition_type
         )
         
@@ -243,7 +435,7 @@ class WorkflowManager:
         recommendations = self._generate_transition_recommendations(transition_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -255,17 +447,10 @@ class WorkflowManager:
         birth_data = input_data
         target_date = options.get('target_date', date.today())
         
-        # Focus on daily/cyclical engines
-        engines = ['biorhythm', 'numerology']
-        
-        # Add divination for daily guidance
-        if options.get('include_divination', True):
-            engines.extend(['tarot', 'iching'])
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('daily_guidance', options))
         
         # Daily guidance analysis
-        daily_analysis = self._analyze_daily_energies(engine_results['results'], target_date)
+        daily_analysis = self._analyze_daily_energies(engine_results, target_date)
         
         workflow_insights = {
             'energy_forecast': daily_analysis['forecast'],
@@ -277,7 +462,7 @@ class WorkflowManager:
         recommendations = self._generate_daily_recommendations(daily_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -288,16 +473,10 @@ class WorkflowManager:
         """
         birth_data = input_data
         
-        # Focus on engines that reveal shadow aspects
-        engines = ['gene_keys', 'human_design', 'enneagram']
-        
-        # Add divination for shadow exploration
-        engines.extend(['tarot', 'iching'])
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('shadow_work', options))
         
         # Shadow work analysis
-        shadow_analysis = self._analyze_shadow_patterns(engine_results['results'])
+        shadow_analysis = self._analyze_shadow_patterns(engine_results)
         
         workflow_insights = {
             'shadow_themes': shadow_analysis['themes'],
@@ -309,7 +488,7 @@ class WorkflowManager:
         recommendations = self._generate_shadow_work_recommendations(shadow_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
@@ -321,18 +500,11 @@ class WorkflowManager:
         birth_data = input_data
         intention = options.get('intention', '')
         
-        # Focus on timing and energy engines
-        engines = ['biorhythm', 'vimshottari', 'numerology']
-        
-        # Add sacred geometry for manifestation support
-        if 'sacred_geometry' in self.orchestrator.get_available_engines():
-            engines.append('sacred_geometry')
-        
-        engine_results = self.orchestrator.create_comprehensive_reading(birth_data, engines)
+        engine_results = self._run_engines(birth_data, self.get_workflow_engines('manifestation_timing', options))
         
         # Manifestation timing analysis
         timing_analysis = self._analyze_manifestation_timing(
-            engine_results['results'], 
+            engine_results, 
             intention
         )
         
@@ -346,11 +518,21 @@ class WorkflowManager:
         recommendations = self._generate_manifestation_recommendations(timing_analysis)
         
         return {
-            'engine_results': engine_results['results'],
+            'engine_results': engine_results,
             'workflow_insights': workflow_insights,
             'recommendations': recommendations
         }
     
+    def shutdown(self, wait: bool = True):
+        """Release the orchestrator's engine thread pool"""
+        self.orchestrator.shutdown(wait=wait)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+    
     def get_available_workflows(self) -> List[str]:
         """Get list of available workflows"""
         return list(self.workflows.keys())
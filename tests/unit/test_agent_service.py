@@ -0,0 +1,307 @@
+"""
+Agent service tests for WitnessOS
+
+Tests how the multi-engine fan-out reports engines whose interpretation failed,
+and the streamed interpretations with their server-sent events encoding.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the agent modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src" / "api" / "agent"))
+
+from agent_service import WitnessOSAgent
+from response_formatter import encode_sse
+
+BIRTH_DATA = {"name": "Test Subject", "birth_date": "1990-05-15", "birth_time": "14:30",
+              "birth_location": [40.7128, -74.0060], "timezone": "America/New_York"}
+
+
+def make_agent(tmp_path, generate):
+    """Agent whose calculations succeed and whose completions come from `generate`."""
+    agent = WitnessOSAgent(openrouter_api_key="test-key", engine_transport="http",
+                           interpretation_cache_options={"cache_dir": str(tmp_path)})
+
+    async def calculate(engine, birth_data):
+        return {"status": "success", "engine": engine, "results": {"value": engine}}
+
+    async def generate_response(messages, model_type="primary", **kwargs):
+        return {"choices": [{"message": {"content": await generate(messages)}}], "_model_name": "fake/model"}
+
+    agent._calculate_engine = calculate
+    agent.openrouter_client.generate_response = generate_response
+    return agent
+
+
+async def calculate_without_biorhythm(engine, birth_data):
+    """Calculations where biorhythm missed its deadline"""
+    if engine == "biorhythm":
+        return {"status": "error", "error": "Calculation timed out after 90.0s"}
+    return {"status": "success", "engine": engine, "results": {"value": engine}}
+
+
+def assert_synthesis_without_biorhythm(synthesis_prompt):
+    assert "synthesis" in synthesis_prompt.lower()
+    assert "human_design" in synthesis_prompt
+    assert "biorhythm" not in synthesis_prompt
+    assert "timed out" not in synthesis_prompt
+
+
+class TestFailedInterpretations:
+    """LLM failures are reported per engine instead of being returned as interpretation text."""
+
+    def test_failed_engines_are_reported_and_not_cached(self, tmp_path):
+        async def generate(messages):
+            raise RuntimeError("all models failed")
+
+        agent = make_agent(tmp_path, generate)
+        response = asyncio.run(agent.interpret_multi_engine(["numerology", "biorhythm"], BIRTH_DATA))
+
+        failed = response["session_metadata"]["failed_engines"]
+        assert set(failed) == {"numerology", "biorhythm"}
+        assert all("all models failed" in error for error in failed.values())
+        assert agent.response_cache == {}
+        assert agent.interpretation_cache.stats()["disk"]["bytes"] == 0
+
+    def test_synthesis_skips_failed_engines(self, tmp_path):
+        prompts = []
+
+        async def generate(messages):
+            prompt = messages[-1]["content"]
+            prompts.append(prompt)
+            if "biorhythm" in prompt and "numerology" not in prompt:
+                raise RuntimeError("model unavailable")
+            return "A steady interpretation."
+
+        agent = make_agent(tmp_path, generate)
+        response = asyncio.run(agent.interpret_multi_engine(
+            ["numerology", "biorhythm", "human_design"], BIRTH_DATA, use_cache=False))
+
+        assert set(response["session_metadata"]["failed_engines"]) == {"biorhythm"}
+        synthesis_prompt = prompts[-1]
+        assert "synthesis" in synthesis_prompt.lower()
+        assert "Unable to generate" not in synthesis_prompt
+        assert agent.response_cache == {}
+
+    def test_failed_engines_stay_out_of_the_synthesis(self, tmp_path):
+        prompts = []
+
+        async def generate(messages):
+            prompts.append(messages[-1]["content"])
+            return "A steady interpretation."
+
+        agent = make_agent(tmp_path, generate)
+        agent._calculate_engine = calculate_without_biorhythm
+        asyncio.run(agent.interpret_multi_engine(
+            ["numerology", "human_design", "biorhythm"], BIRTH_DATA, use_cache=False))
+
+        assert_synthesis_without_biorhythm(prompts[-1])
+
+    def test_failed_synthesis_is_reported(self, tmp_path):
+        async def generate(messages):
+            if "synthesis" in messages[-1]["content"].lower():
+                raise RuntimeError("synthesis model down")
+            return "A steady interpretation."
+
+        agent = make_agent(tmp_path, generate)
+        response = asyncio.run(agent.interpret_multi_engine(["numerology", "biorhythm"], BIRTH_DATA))
+
+        assert set(response["session_metadata"]["failed_engines"]) == {"synthesis"}
+        assert agent.response_cache == {}
+
+    def test_single_engine_failure_is_an_error(self, tmp_path):
+        async def generate(messages):
+            raise RuntimeError("all models failed")
+
+        agent = make_agent(tmp_path, generate)
+        agent._call_production_api = lambda endpoint, data: agent._calculate_engine("numerology", data)
+        response = asyncio.run(agent.interpret_single_engine("numerology", BIRTH_DATA))
+
+        assert "error" in response
+        assert agent.response_cache == {}
+
+
+def make_streaming_agent(tmp_path, stream, **options):
+    """Agent whose calculations succeed and whose streamed completions come from `stream`."""
+    agent = WitnessOSAgent(openrouter_api_key="test-key", engine_transport="http",
+                           interpretation_cache_options={"cache_dir": str(tmp_path)}, **options)
+
+    async def calculate(engine, birth_data):
+        return {"status": "success", "engine": engine, "results": {"value": engine}}
+
+    def stream_response(messages, model_type="primary", **kwargs):
+        return stream(messages)
+
+    agent._calculate_engine = calculate
+    agent.openrouter_client.stream_response = stream_response
+    return agent
+
+
+async def token_stream(messages):
+    """Fake token stream splitting a placeholder and a paragraph break across chunks"""
+    for chunk in ["Dear {{na", "me}}, trust", " your path.\n", "\nPractice patience", " daily."]:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+async def collect_async(events):
+    return [event async for event in events]
+
+
+def collect(events):
+    return asyncio.run(collect_async(events))
+
+
+def parse_sse(body: str):
+    """(event, data) pairs of a server-sent events body"""
+    events = []
+    for block in body.split("\n\n"):
+        if block:
+            name, data = block.split("\n")
+            events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+class TestStreaming:
+    """Streamed interpretations: event order, personalized text and the final response."""
+
+    def test_single_engine_events(self, tmp_path):
+        agent = make_streaming_agent(tmp_path, token_stream)
+        events = collect(agent.stream_single_engine("numerology", BIRTH_DATA))
+
+        names = [event["event"] for event in events]
+        assert names[0] == "calculation"
+        assert names[-1] == "complete"
+        assert names.count("complete") == 1 and "error" not in names
+
+        text = "".join(event["data"]["text"] for event in events if event["event"] == "token")
+        assert text == "Dear Test Subject, trust your path.\n\nPractice patience daily."
+        sections = [event["data"] for event in events if event["event"] == "section"]
+        assert [section["index"] for section in sections] == [0, 1]
+        assert sections[0]["text"] == "Dear Test Subject, trust your path."
+        # The first section is emitted as soon as its paragraph is complete
+        assert names.index("section") < len(names) - 1 - names[::-1].index("token")
+
+        response = events[-1]["data"]["response"]
+        assert response["consciousness_interpretation"]["ai_guidance"] == text
+
+    def test_sse_encoding(self, tmp_path):
+        agent = make_streaming_agent(tmp_path, token_stream)
+
+        async def run():
+            return "".join([chunk async for chunk in encode_sse(agent.stream_single_engine("numerology", BIRTH_DATA))])
+
+        events = parse_sse(asyncio.run(run()))
+        assert events[0] == ("calculation", {"engine": "numerology", "status": "success"})
+        assert events[-1][0] == "complete"
+        guidance = events[-1][1]["response"]["consciousness_interpretation"]["ai_guidance"]
+        assert guidance == "".join(data["text"] for name, data in events if name == "token")
+
+    def test_sse_encoding_reports_a_failing_stream(self):
+        async def events():
+            yield {"event": "token", "data": {"engine": "numerology", "text": "Dear"}}
+            raise RuntimeError("connection lost")
+
+        async def run():
+            return "".join([chunk async for chunk in encode_sse(events())])
+
+        assert parse_sse(asyncio.run(run())) == [
+            ("token", {"engine": "numerology", "text": "Dear"}),
+            ("error", {"error": "connection lost"})
+        ]
+
+    def test_multi_engine_events(self, tmp_path):
+        agent = make_streaming_agent(tmp_path, token_stream)
+        events = collect(agent.stream_multi_engine(["numerology", "biorhythm"], BIRTH_DATA))
+
+        names = [event["event"] for event in events]
+        assert names[-1] == "complete"
+        synthesis = [index for index, event in enumerate(events) if event["data"].get("engine") == "synthesis"]
+        engine_done = [index for index, name in enumerate(names) if name == "engine_complete"]
+        assert len(engine_done) == 2 and synthesis and min(synthesis) > max(engine_done)
+
+        response = events[-1]["data"]["response"]
+        assert "failed_engines" not in response.get("session_metadata", {})
+        assert len(agent.response_cache) == 1
+
+    def test_streams_share_the_concurrency_limit(self, tmp_path):
+        in_flight = peak = 0
+
+        async def stream(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                async for chunk in token_stream(messages):
+                    await asyncio.sleep(0.01)
+                    yield chunk
+            finally:
+                in_flight -= 1
+
+        agent = make_streaming_agent(tmp_path, stream, concurrency_limits={"primary": 1})
+
+        async def run():
+            # One reading's synthesis streams while the other's interpretations are queued
+            return await asyncio.gather(*(
+                collect_async(agent.stream_multi_engine(engines, BIRTH_DATA, model_type="primary", use_cache=False))
+                for engines in (["numerology", "biorhythm"], ["iching", "tarot", "enneagram"])
+            ))
+
+        for events in asyncio.run(run()):
+            assert any(event["data"].get("engine") == "synthesis" for event in events if event["event"] == "token")
+        assert peak == 1
+
+    def test_stream_deadline(self, tmp_path):
+        async def stream(messages):
+            yield "Dear {{name}},"
+            await asyncio.sleep(10)
+            yield " never sent"
+
+        agent = make_streaming_agent(tmp_path, stream, call_timeout=0.05)
+        events = collect(agent.stream_multi_engine(["numerology", "biorhythm"], BIRTH_DATA))
+
+        errors = {event["data"]["engine"]: event["data"]["error"] for event in events if event["event"] == "error"}
+        assert set(errors) == {"numerology", "biorhythm"}
+        assert all("timed out after 0.05s" in error for error in errors.values())
+        response = events[-1]["data"]["response"]
+        assert set(response["session_metadata"]["failed_engines"]) == {"numerology", "biorhythm"}
+        assert agent.response_cache == {}
+
+    def test_failed_engines_stay_out_of_the_streamed_synthesis(self, tmp_path):
+        prompts = []
+
+        async def stream(messages):
+            prompts.append(messages[-1]["content"])
+            yield "A steady interpretation."
+
+        agent = make_streaming_agent(tmp_path, stream)
+        agent._calculate_engine = calculate_without_biorhythm
+        events = collect(agent.stream_multi_engine(
+            ["numerology", "human_design", "biorhythm"], BIRTH_DATA, use_cache=False))
+
+        assert any(event["data"].get("engine") == "synthesis" for event in events if event["event"] == "token")
+        assert_synthesis_without_biorhythm(prompts[-1])
+
+    def test_failed_synthesis_stream_is_reported(self, tmp_path):
+        async def stream(messages):
+            if "synthesis" in messages[-1]["content"].lower():
+                raise RuntimeError("synthesis model down")
+            async for chunk in token_stream(messages):
+                yield chunk
+
+        agent = make_streaming_agent(tmp_path, stream)
+        events = collect(agent.stream_multi_engine(["numerology", "biorhythm"], BIRTH_DATA))
+
+        response = events[-1]["data"]["response"]
+        assert set(response["session_metadata"]["failed_engines"]) == {"synthesis"}
+        assert "synthesis model down" in response["session_metadata"]["failed_engines"]["synthesis"]
+        assert agent.response_cache == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
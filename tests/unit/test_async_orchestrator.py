@@ -0,0 +1,119 @@
+"""
+Async orchestrator tests for WitnessOS Divination Engines
+
+Tests asyncio-native engine scheduling: concurrency limits, timeouts and
+cancellation.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ENGINES.base.data_models import EngineError
+from ENGINES.integration.async_orchestrator import AsyncEngineOrchestrator
+from ENGINES.integration.orchestrator import EngineOrchestrator
+
+
+class SleepingEngine:
+    """Engine stub sleeping for a fixed time and tracking peak concurrency."""
+
+    _version = "1.0.0"
+    shared_products = ()
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def calculate(self, input_data):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return {"input": input_data}
+
+
+def make_orchestrator(engines, **kwargs):
+    orchestrator = EngineOrchestrator(max_workers=4)
+    orchestrator.active_engines.update(engines)
+    return AsyncEngineOrchestrator(orchestrator, **kwargs)
+
+
+class TestAsyncEngineOrchestrator:
+    """Test async engine scheduling."""
+
+    def test_run_many_runs_concurrently(self):
+        """Independent engines overlap instead of running back to back."""
+        engines = {name: SleepingEngine(0.1) for name in ("tarot", "iching", "enneagram")}
+        async_orchestrator = make_orchestrator(engines)
+        configs = [{"name": name, "input": {"q": name}} for name in engines]
+
+        async def run():
+            async with async_orchestrator:
+                start = time.perf_counter()
+                results = await async_orchestrator.run_many(configs)
+                return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(run())
+        assert set(results) == set(engines)
+        assert elapsed < 0.25
+
+    def test_engine_semaphore_limits_concurrency(self):
+        """Per-engine limits cap simultaneous calculations of that engine."""
+        engine = SleepingEngine(0.05)
+        async_orchestrator = make_orchestrator({"tarot": engine}, engine_concurrency={"tarot": 1})
+
+        async def run():
+            async with async_orchestrator:
+                await asyncio.gather(*(
+                    async_orchestrator.run_engine("tarot", {"q": i}) for i in range(3)
+                ))
+
+        asyncio.run(run())
+        assert engine.calls == 3
+        assert engine.peak == 1
+
+    def test_timeout_becomes_engine_error(self):
+        """Engines exceeding their timeout are reported as errors, others complete."""
+        engines = {"tarot": SleepingEngine(0.5), "iching": SleepingEngine(0.01)}
+        async_orchestrator = make_orchestrator(engines, engine_timeouts={"tarot": 0.05})
+        configs = [{"name": name, "input": {}} for name in engines]
+
+        async def run():
+            async with async_orchestrator:
+                return await async_orchestrator.run_many(configs)
+
+        results = asyncio.run(run())
+        assert isinstance(results["tarot"], EngineError)
+        assert "timed out" in str(results["tarot"])
+        assert results["iching"] == {"input": {}}
+
+    def test_cancellation_skips_queued_engines(self):
+        """Cancelling a run stops engines still waiting for a slot."""
+        engine = SleepingEngine(0.1)
+        async_orchestrator = make_orchestrator({"tarot": engine}, max_concurrency=1)
+
+        async def run():
+            async with async_orchestrator:
+                task = asyncio.create_task(async_orchestrator.run_many(
+                    [{"name": "tarot", "input": {"q": i}} for i in range(5)]
+                ))
+                await asyncio.sleep(0.02)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+        assert engine.calls == 1
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
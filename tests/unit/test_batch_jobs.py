@@ -0,0 +1,190 @@
+"""
+Batch job tests for WitnessOS
+
+Runs batch jobs against a fake OpenRouter endpoint (OPENROUTER_BASE_URL) and
+checks prompt deduplication, retries and failures, and that an interrupted
+job resumes with every task on exactly one output line.
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+# Make the agent modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src" / "api" / "agent"))
+
+from agent_service import WitnessOSAgent
+
+ENGINES = ["numerology", "biorhythm"]
+NAMES = ["Will Smith", "Eve Adams", "Bob Stone"]
+DATES = ["15.05.1990", "03.11.1985"]
+
+
+class FakeOpenRouter:
+    """Fake /chat/completions addressing the subject through its placeholder"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail_next = 0
+        self.fail_all = False
+        self.delay = 0.0
+        self.app = FastAPI()
+        self.app.post("/chat/completions")(self.chat_completions)
+
+    async def chat_completions(self, payload: dict):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail_all or self.fail_next > 0:
+            self.fail_next -= 1
+            return JSONResponse({"error": "upstream unavailable"}, status_code=500)
+        content = "Dear {{name}}, your reading shows a path of growth.\n\nTrust the process."
+        return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+@pytest.fixture(scope="module")
+def server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    fake = FakeOpenRouter()
+    uvicorn_server = uvicorn.Server(uvicorn.Config(fake.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=uvicorn_server.run, daemon=True)
+    thread.start()
+    while not uvicorn_server.started:
+        time.sleep(0.01)
+    yield fake, f"http://127.0.0.1:{port}"
+    uvicorn_server.should_exit = True
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def fake(server, monkeypatch):
+    fake, base_url = server
+    monkeypatch.setenv("OPENROUTER_BASE_URL", base_url)
+    fake.calls, fake.fail_next, fake.fail_all, fake.delay = 0, 0, False, 0.0
+    return fake
+
+
+def new_agent() -> WitnessOSAgent:
+    """Agent with deterministic calculations and an empty, memory-only interpretation cache"""
+    agent = WitnessOSAgent(openrouter_api_key="test-key", engine_transport="http",
+                           interpretation_cache_options={"cache_dir": None},
+                           model_router_options={"failure_threshold": 1000, "hedge_after": None})
+
+    async def calculate(engine, birth_data):
+        return {"status": "success", "engine": engine, "birth_day": int(birth_data["date"][:2])}
+
+    agent._calculate_engine = calculate
+    return agent
+
+
+def write_subjects(path: Path, count: int, dates=DATES):
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(count):
+            birth_data = {"name": NAMES[index % len(NAMES)], "date": dates[index % len(dates)],
+                          "time": "12:00", "location": "New York"}
+            f.write(json.dumps({"id": f"subscriber-{index}", "birth_data": birth_data}) + "\n")
+
+
+def read_records(path: Path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+async def run_job(input_path: Path, output_path: Path, **options):
+    agent = new_agent()
+    try:
+        return await agent.run_batch_job(str(input_path), str(output_path), engines=ENGINES,
+                                         retry_backoff=0.01, **options)
+    finally:
+        await agent.aclose()
+
+
+def assert_complete(records, count):
+    """Every task on exactly one line, addressed to its own subject"""
+    task_ids = [record["task_id"] for record in records]
+    assert sorted(task_ids) == sorted(f"subscriber-{i}/{engine}" for i in range(count) for engine in ENGINES)
+    for record in records:
+        index = int(record["subject_id"].split("-")[1])
+        interpretation = record["response"]["consciousness_interpretation"]["ai_guidance"]
+        assert f"Dear {NAMES[index % len(NAMES)]}," in interpretation
+        assert "{{name}}" not in interpretation
+
+
+class TestBatchInterpretationJob:
+    """Batch jobs against a fake LLM endpoint."""
+
+    def test_identical_prompts_share_a_call(self, fake, tmp_path):
+        write_subjects(tmp_path / "subjects.jsonl", 6)
+        summary = asyncio.run(run_job(tmp_path / "subjects.jsonl", tmp_path / "results.jsonl"))
+
+        # Names differ but prompts only depend on the date and the engine
+        assert summary["status"] == "completed"
+        assert summary["llm_calls"] == fake.calls == len(DATES) * len(ENGINES)
+        assert summary["deduplicated"] == 6 * len(ENGINES) - fake.calls
+        assert_complete(read_records(tmp_path / "results.jsonl"), 6)
+
+    def test_failed_requests_are_retried(self, fake, tmp_path):
+        write_subjects(tmp_path / "subjects.jsonl", 1)
+        # Every model of the first attempt fails
+        fake.fail_next = 4
+        summary = asyncio.run(run_job(tmp_path / "subjects.jsonl", tmp_path / "results.jsonl",
+                                      max_in_flight=1))
+
+        assert summary["status"] == "completed"
+        assert summary["retries"] == 1
+        assert_complete(read_records(tmp_path / "results.jsonl"), 1)
+
+    def test_failed_tasks_are_retried_on_resume(self, fake, tmp_path):
+        write_subjects(tmp_path / "subjects.jsonl", 3)
+        fake.fail_all = True
+        summary = asyncio.run(run_job(tmp_path / "subjects.jsonl", tmp_path / "results.jsonl", max_retries=1))
+
+        assert summary["status"] == "completed_with_failures"
+        assert summary["failed"] == 3 * len(ENGINES)
+        checkpoint = json.loads((tmp_path / "results.jsonl.checkpoint.json").read_text())
+        assert len(checkpoint["failed"]) == 3 * len(ENGINES)
+        assert read_records(tmp_path / "results.jsonl") == []
+
+        fake.fail_all = False
+        summary = asyncio.run(run_job(tmp_path / "subjects.jsonl", tmp_path / "results.jsonl"))
+
+        assert summary["status"] == "completed"
+        assert_complete(read_records(tmp_path / "results.jsonl"), 3)
+
+    def test_interrupted_job_resumes(self, fake, tmp_path):
+        # Distinct dates so every task needs its own call
+        write_subjects(tmp_path / "subjects.jsonl", 12, [f"{day:02d}.05.1992" for day in range(10, 22)])
+        output_path = tmp_path / "results.jsonl"
+        fake.delay = 0.01
+
+        async def interrupted():
+            job = asyncio.create_task(run_job(tmp_path / "subjects.jsonl", output_path,
+                                              max_in_flight=2, checkpoint_interval=0))
+            while not job.done() and (not output_path.exists() or len(read_records(output_path)) < 5):
+                await asyncio.sleep(0.005)
+            job.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+        asyncio.run(interrupted())
+        done = json.loads((tmp_path / "results.jsonl.checkpoint.json").read_text())["completed"]
+        assert 0 < len(done) < 12 * len(ENGINES)
+
+        summary = asyncio.run(run_job(tmp_path / "subjects.jsonl", output_path))
+
+        assert summary["skipped"] == len(done)
+        assert_complete(read_records(output_path), 12)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
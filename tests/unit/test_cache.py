@@ -0,0 +1,186 @@
+"""
+Caching tests for WitnessOS Divination Engines
+
+Tests the bounded TTL cache and engine result reuse in the orchestrator.
+"""
+
+import pytest
+
+from ENGINES.base import TTLCache
+from ENGINES.integration.orchestrator import EngineOrchestrator
+from ENGINES.integration.workflows import WorkflowManager
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingEngine:
+    """Minimal engine stub counting its calculations."""
+
+    _version = "1.0.0"
+    shared_products = ()
+
+    def __init__(self):
+        self.calls = 0
+
+    def calculate(self, input_data):
+        self.calls += 1
+        return {"call": self.calls, "input": input_data}
+
+
+class TestTTLCache:
+    """Test the bounded TTL cache."""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"]
+        cache["c"] = 3
+
+        assert set(cache) == {"a", "c"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_memory_bound(self):
+        """Least recently used entries are evicted to stay within maxbytes."""
+        cache = TTLCache(maxsize=10, maxbytes=10, sizeof=len)
+        cache["a"] = "xxxx"
+        cache["b"] = "yyyy"
+        cache["a"]
+        cache["c"] = "zzzz"
+
+        assert set(cache) == {"a", "c"}
+        assert cache.stats()["bytes"] == 8
+        del cache["a"]
+        assert cache.bytes == 4
+
+    def test_entries_expire(self):
+        """Entries disappear once their TTL has passed."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+        cache["a"] = 1
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_entry_ttl_overrides_cache_ttl(self):
+        """Entries stored with their own TTL expire on it."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+        cache.set("short", 1, ttl=2)
+        cache["default"] = 2
+
+        clock.now = 2.0
+        assert "short" not in cache
+        assert cache["default"] == 2
+
+    def test_behaves_like_dict(self):
+        """The cache compares and clears like a plain dict."""
+        cache = TTLCache()
+        assert cache == {}
+        cache["key"] = "data"
+        assert cache == {"key": "data"}
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestOrchestratorReuse:
+    """Test engine result reuse and the shared executor."""
+
+    def setup_method(self):
+        self.orchestrator = EngineOrchestrator(max_workers=2)
+
+    def teardown_method(self):
+        self.orchestrator.shutdown()
+
+    def test_equivalent_inputs_reuse_result(self):
+        """Canonically equal inputs compute the engine once."""
+        engine = CountingEngine()
+        self.orchestrator.active_engines["numerology"] = engine
+
+        first = self.orchestrator.run_single_engine("numerology", {"full_name": "Jane Doe", "birth_date": "1990-5-15"})
+        second = self.orchestrator.run_single_engine("numerology", {"birth_date": "1990-05-15", "full_name": " jane  doe"})
+
+        assert first is second
+        assert engine.calls == 1
+        assert self.orchestrator.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.parametrize("engine_name", ["tarot", "sacred_geometry", "sigil_forge"])
+    def test_volatile_engines_are_not_reused(self, engine_name):
+        """Random draws and generated artifacts are never replayed from the cache."""
+        engine = CountingEngine()
+        self.orchestrator.active_engines[engine_name] = engine
+
+        self.orchestrator.run_single_engine(engine_name, {"question": "What now?"})
+        self.orchestrator.run_single_engine(engine_name, {"question": "What now?"})
+
+        assert engine.calls == 2
+
+    def test_engine_versions_follow_version_and_config(self):
+        """Version signatures change with the engine version or its config; unloaded engines have none."""
+        engine = CountingEngine()
+        self.orchestrator.active_engines["numerology"] = engine
+        first = self.orchestrator.get_engine_versions(["numerology", "biorhythm"])
+
+        engine.config = {"system": "chaldean"}
+        configured = self.orchestrator.get_engine_versions(["numerology"])
+        engine._version = "2.0.0"
+        upgraded = self.orchestrator.get_engine_versions(["numerology"])
+
+        assert list(first) == ["numerology"]
+        assert len({first["numerology"], configured["numerology"], upgraded["numerology"]}) == 3
+
+    def test_workflows_share_engine_results(self):
+        """Parallel runs from different workflows reuse results on one executor."""
+        engine = CountingEngine()
+        self.orchestrator.active_engines["numerology"] = engine
+        configs = [{"name": "numerology", "input": {"full_name": "Jane Doe"}}]
+
+        self.orchestrator.run_parallel_engines(configs)
+        executor = self.orchestrator.executor
+        self.orchestrator.run_parallel_engines(configs)
+
+        assert self.orchestrator.executor is executor
+        assert engine.calls == 1
+
+    def test_readings_for_different_subjects_are_not_shared(self):
+        """Prepared inputs are keyed on their subject, not only on the input model."""
+        engine = CountingEngine()
+        self.orchestrator.active_engines["numerology"] = engine
+        jane = {"name": "Jane Doe", "date": "1990-05-15"}
+        john = {"name": "John Roe", "date": "1985-11-03"}
+
+        first = self.orchestrator.create_comprehensive_reading(jane, ["numerology"])
+        second = self.orchestrator.create_comprehensive_reading(john, ["numerology"])
+        again = self.orchestrator.create_comprehensive_reading(jane, ["numerology"], execution_mode="sequential")
+
+        assert first["results"]["numerology"] is not second["results"]["numerology"]
+        assert again["results"]["numerology"] is first["results"]["numerology"]
+        assert engine.calls == 2
+
+    def test_shutdown_releases_executor(self):
+        """Shutdown stops the pool; the next run starts a fresh one."""
+        manager = WorkflowManager(orchestrator=self.orchestrator)
+        executor = self.orchestrator.executor
+
+        with manager:
+            pass
+
+        assert executor._shutdown
+        assert self.orchestrator.executor is not executor
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
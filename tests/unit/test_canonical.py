@@ -0,0 +1,99 @@
+"""
+Canonicalization tests for WitnessOS Divination Engines
+
+Tests that equivalent inputs normalize to the same canonical form and share
+a stable content hash across caches.
+"""
+
+import pytest
+from datetime import date
+
+from ENGINES.base import (
+    BirthDataInput,
+    canonicalize,
+    canonicalize_birth_data,
+    content_hash,
+    create_field_signature,
+    normalize_date
+)
+
+
+class TestNormalization:
+    """Test field-level normalization."""
+
+    def test_date_formats(self):
+        """Padded, unpadded and dotted dates normalize to ISO."""
+        assert normalize_date("1990-1-5") == "1990-01-05"
+        assert normalize_date("1990-01-05") == "1990-01-05"
+        assert normalize_date("05.01.1990") == "1990-01-05"
+        assert normalize_date(date(1990, 1, 5)) == "1990-01-05"
+
+    def test_birth_data_utc_instant(self):
+        """Local time and timezone fuse into a UTC instant next to the local date."""
+        canonical = canonicalize_birth_data({
+            "name": "  Jane   DOE ",
+            "date": "15.05.1990",
+            "time": "14:30",
+            "location": "Mumbai,  India",
+            "timezone": "Asia/Kolkata"
+        })
+
+        assert canonical == {
+            "name": "jane doe",
+            "location": "mumbai, india",
+            "date": "1990-05-15",
+            "birth_instant": "1990-05-15T09:00:00Z"
+        }
+
+    def test_same_instant_different_local_date(self):
+        """Births at the same instant on different local dates stay distinct."""
+        tokyo = canonicalize_birth_data({"date": "1990-05-16", "time": "01:00", "timezone": "Asia/Tokyo"})
+        new_york = canonicalize_birth_data({"date": "1990-05-15", "time": "12:00", "timezone": "America/New_York"})
+
+        assert tokyo["birth_instant"] == new_york["birth_instant"] == "1990-05-15T16:00:00Z"
+        assert content_hash("numerology", tokyo) != content_hash("numerology", new_york)
+
+    def test_unknown_timezone_keeps_local_time(self):
+        """Without a valid timezone the local date and time are kept."""
+        canonical = canonicalize_birth_data({"date": "1990-5-15", "time": "14:30", "timezone": "Nowhere/City"})
+        assert canonical["date"] == "1990-05-15"
+        assert canonical["time"] == "14:30:00"
+
+    def test_coordinates_are_rounded(self):
+        """Coordinate float noise is rounded away."""
+        a = BirthDataInput(birth_date=date(1990, 5, 15), birth_location=(40.712800001, -74.00600004))
+        b = BirthDataInput(birth_date=date(1990, 5, 15), birth_location=(40.7128, -74.006))
+        assert canonicalize(a) == canonicalize(b)
+
+    def test_volatile_fields_dropped(self):
+        """Request timestamps and session ids never reach the hash."""
+        assert canonicalize({"timestamp": "now", "session_id": "abc", "question": "Why?"}) == {"question": "Why?"}
+
+
+class TestContentHash:
+    """Test the shared content hash."""
+
+    def test_equivalent_inputs_share_hash(self):
+        """Formatting differences do not change the hash."""
+        a = {"birth_data": {"name": "John Doe", "date": "1990-1-5", "time": "9:05"}, "style": "balanced"}
+        b = {"style": "balanced", "birth_data": {"time": "09:05:00", "date": "1990-01-05", "name": " john  doe"}}
+        assert content_hash("numerology", a) == content_hash("numerology", b)
+
+    def test_engine_and_version_are_part_of_hash(self):
+        """Different engines or engine versions never collide."""
+        payload = {"date": "1990-01-05"}
+        assert content_hash("numerology", payload) != content_hash("biorhythm", payload)
+        assert content_hash("numerology", payload, "1.0.0") != content_hash("numerology", payload, "1.1.0")
+        assert len(content_hash("numerology", payload)) == 32
+
+    def test_field_signature_is_stable(self):
+        """Field signatures depend on input only, not on the request time."""
+        first = create_field_signature("numerology", "1.0.0", BirthDataInput(birth_date=date(1990, 5, 15)))
+        second = create_field_signature("numerology", "1.0.0", BirthDataInput(birth_date=date(1990, 5, 15)))
+        assert first == second
+        assert len(first) == 12
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Cohort field analytics tests for WitnessOS Divination Engines
+
+Tests the people x features cohort matrix and chunked, grouped field metrics.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from ENGINES.base.data_models import BaseEngineOutput
+from ENGINES.integration.cohort import COHORT_COLUMNS, CohortMatrix, build_cohort_matrix, coherence_scores
+from ENGINES.integration.field_analyzer import FieldAnalyzer
+
+
+def stored_reading(hd_type: str, life_path: int) -> dict:
+    """A reading as stored: comprehensive reading with serialized engine outputs."""
+    return {'results': {
+        'human_design': {'raw_data': {'type_info': {'type_name': hd_type}, 'profile': 'line_1'}},
+        'numerology': {'raw_data': {'core_numbers': {'life_path': life_path, 'expression': 7},
+                                    'ruler': 'Mars' if life_path == 1 else 'Saturn'}},
+    }}
+
+
+COHORT = [
+    stored_reading('Manifestor', 1),   # leadership in both engines
+    stored_reading('Generator', 7),
+    stored_reading('Generator', 7),
+    stored_reading('Projector', 11),
+    {'tarot': BaseEngineOutput(engine_name='tarot', calculation_time=0.0,
+                               raw_data={'card': 'The Emperor', 'position': 3}, formatted_output='')},
+]
+
+
+class TestCohortMatrix:
+    """Test building and storing cohort feature matrices."""
+
+    def test_rows_and_group_labels(self):
+        """Each reading becomes one row; group labels come from the results."""
+        cohort = build_cohort_matrix(COHORT)
+
+        assert cohort.matrix.shape == (5, len(COHORT_COLUMNS))
+        assert list(cohort.groups['hd_type']) == ['Manifestor', 'Generator', 'Generator', 'Projector', 'unknown']
+        assert list(cohort.groups['life_path']) == ['1', '7', '7', '11', 'unknown']
+
+        engines = cohort.matrix[:, COHORT_COLUMNS.index('engines')]
+        assert list(engines) == [2, 2, 2, 2, 1]
+        assert list(coherence_scores(cohort.matrix)) == [1.0, 0.5, 0.5, 0.5, 1.0]
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Saved matrices reload with their group labels."""
+        path = tmp_path / 'cohort.npz'
+        build_cohort_matrix(COHORT).save(path)
+
+        loaded = CohortMatrix.load(path)
+        assert loaded.matrix.shape == (5, len(COHORT_COLUMNS))
+        assert list(loaded.groups['life_path'])[:2] == ['1', '7']
+
+
+class TestCohortAnalysis:
+    """Test chunked, grouped field metrics."""
+
+    def test_chunked_matches_single_pass(self):
+        """Chunk size does not change the aggregated metrics."""
+        analyzer = FieldAnalyzer()
+        cohort = build_cohort_matrix(COHORT * 7)
+
+        whole = analyzer.analyze_cohort(cohort, group_by='hd_type', chunk_size=len(cohort))
+        chunked = analyzer.analyze_cohort(cohort, group_by='hd_type', chunk_size=3)
+
+        for key in ('cohort', 'groups'):
+            assert json.dumps(whole[key], sort_keys=True) == json.dumps(chunked[key], sort_keys=True)
+
+    def test_group_metrics(self):
+        """Groups report people, coherence, stability and dominant frequencies."""
+        analysis = FieldAnalyzer().analyze_cohort(COHORT, group_by='hd_type', chunk_size=2)
+
+        assert analysis['people'] == 5
+        assert analysis['cohort']['people'] == 5
+        generators = analysis['groups']['Generator']
+        assert generators['people'] == 2
+        assert generators['field_coherence'] == {'mean': 0.5, 'std': 0.0}
+        assert generators['field_stability'] == 1.0
+        assert generators['dominant_frequencies'][0]['frequency'] == 7
+        assert analysis['groups']['Manifestor']['archetype_prevalence']['leadership'] == 1.0
+
+        overall = analysis['cohort']['field_coherence']
+        scores = np.array([1.0, 0.5, 0.5, 0.5, 1.0])
+        assert overall['mean'] == pytest.approx(scores.mean())
+        assert overall['std'] == pytest.approx(scores.std())
+
+    def test_stored_readings_to_disk(self, tmp_path):
+        """JSON Lines readings are streamed and results written as JSON."""
+        readings_path = tmp_path / 'readings.jsonl'
+        readings_path.write_text('\n'.join(json.dumps(reading) for reading in COHORT[:4]))
+        output_path = tmp_path / 'cohort.json'
+
+        analysis = FieldAnalyzer().analyze_cohort(readings_path, group_by='life_path',
+                                                  chunk_size=3, output_path=output_path)
+
+        written = json.loads(output_path.read_text())
+        assert written['groups'] == analysis['groups']
+        assert set(written['groups']) == {'1', '7', '11'}
+
+    def test_unknown_grouping(self):
+        """Unknown groupings fail before any reading is processed."""
+        with pytest.raises(ValueError):
+            FieldAnalyzer().analyze_cohort(COHORT, group_by='sun_sign')
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
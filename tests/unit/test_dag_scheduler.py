@@ -0,0 +1,116 @@
+"""
+DAG scheduler tests for WitnessOS Divination Engines
+
+Tests dependency-aware execution of engines over shared intermediate
+products in the EngineOrchestrator.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+
+from ENGINES.base.data_models import EngineError
+from ENGINES.integration.dag import DAGNode, DAGScheduler
+from ENGINES.integration.orchestrator import EngineOrchestrator
+from ENGINES.engines.numerology import NumerologyEngine
+from ENGINES.engines.numerology_models import NumerologyInput
+
+
+class TestDAGScheduler:
+    """Test the generic scheduler."""
+
+    def test_dependents_start_after_requirements(self):
+        """A node starts only after every node it requires has finished."""
+        nodes = {
+            "a": DAGNode("a", "product", lambda: 1),
+            "b": DAGNode("b", "product", lambda: 2, {"a"}),
+            "c": DAGNode("c", "engine", lambda: 3, {"a", "b"}),
+        }
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            values, errors, timings = DAGScheduler(executor).run(nodes)
+
+        assert values == {"a": 1, "b": 2, "c": 3}
+        assert not errors
+        assert timings["b"].started_at >= timings["a"].finished_at
+        assert timings["c"].started_at >= timings["b"].finished_at
+
+    def test_failed_node_does_not_block_dependents(self):
+        """Product failures are recorded and dependents still run."""
+        def fail():
+            raise ValueError("ephemeris unavailable")
+
+        nodes = {
+            "product": DAGNode("product", "product", fail),
+            "engine": DAGNode("engine", "engine", lambda: "ok", {"product"}),
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            values, errors, timings = DAGScheduler(executor).run(nodes)
+
+        assert values == {"engine": "ok"}
+        assert isinstance(errors["product"], ValueError)
+        assert timings["product"].status == "failed"
+
+    def test_cycle_is_rejected(self):
+        """Cyclic graphs raise instead of hanging."""
+        nodes = {
+            "a": DAGNode("a", "product", lambda: 1, {"b"}),
+            "b": DAGNode("b", "product", lambda: 2, {"a"}),
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(EngineError):
+                DAGScheduler(executor).run(nodes)
+
+
+class TestOrchestratorDAG:
+    """Test DAG execution mode in the orchestrator."""
+
+    def test_numerology_core_is_a_product_node(self):
+        """Engines declaring shared products depend on them in the graph."""
+        orchestrator = EngineOrchestrator()
+        orchestrator.active_engines["numerology"] = NumerologyEngine()
+
+        execution = orchestrator.run_dag_engines([{
+            "name": "numerology",
+            "input": NumerologyInput(full_name="Alexandra Marie Chen", birth_date=date(1990, 5, 15))
+        }])
+
+        assert execution.results["numerology"].engine_name == "numerology"
+        assert "numerology_core" in execution.products
+        assert execution.timings["numerology"].requires == ["numerology_core"]
+        assert (execution.timings["numerology"].started_at
+                >= execution.timings["numerology_core"].finished_at)
+
+    def test_shared_ephemeris_computed_once(self):
+        """Human Design and Gene Keys share one natal and one design ephemeris node."""
+        from ENGINES.engines.human_design import HumanDesignScanner
+        from ENGINES.engines.human_design_models import HumanDesignInput
+        from ENGINES.engines.gene_keys import GeneKeysCompass
+        from ENGINES.engines.gene_keys_models import GeneKeysInput
+
+        birth = dict(birth_date=date(1985, 6, 15), birth_time=time(8, 45),
+                     birth_location=(51.5074, -0.1278), timezone="Europe/London")
+        orchestrator = EngineOrchestrator()
+        orchestrator.active_engines["human_design"] = HumanDesignScanner()
+        orchestrator.active_engines["gene_keys"] = GeneKeysCompass()
+
+        execution = orchestrator.run_dag_engines([
+            {"name": "human_design", "input": HumanDesignInput(**birth)},
+            {"name": "gene_keys", "input": GeneKeysInput(**birth)},
+        ])
+
+        product_nodes = [node for node, timing in execution.timings.items() if timing.kind == "product"]
+        assert sorted(product_nodes) == ["design_ephemeris", "natal_ephemeris"]
+        assert (execution.timings["design_ephemeris"].started_at
+                >= execution.timings["natal_ephemeris"].finished_at)
+        assert not isinstance(execution.results["human_design"], EngineError)
+        assert not isinstance(execution.results["gene_keys"], EngineError)
+
+    def test_unknown_execution_mode(self):
+        """Unknown execution modes are rejected."""
+        with pytest.raises(EngineError):
+            EngineOrchestrator().create_comprehensive_reading({}, engines=[], execution_mode="eager")
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
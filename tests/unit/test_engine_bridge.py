@@ -0,0 +1,70 @@
+"""
+Engine bridge tests for WitnessOS
+
+Tests that the agent's in-process engine transport returns what the production
+API's /v1/engines/run endpoint returns, through the same engine packages.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the agent modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src" / "api" / "agent"))
+
+import engine_bridge
+from engine_bridge import InProcessEngineBridge, build_engine_request
+from fastapi.testclient import TestClient
+
+import production_api
+
+BIRTH_DATA = {"name": "Alexandra Marie Chen", "date": "15.05.1990", "time": "14:30",
+              "location": "New York", "timezone": "America/New_York"}
+
+
+def shape(value):
+    """Structure of a JSON value: keys and value types, not the values themselves"""
+    if isinstance(value, dict):
+        return {key: shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [shape(item) for item in value]
+    return type(value).__name__
+
+
+class TestInProcessEngineBridge:
+    """The bridge reuses the production API pipeline instead of its own engine imports."""
+
+    def test_single_base_package(self):
+        assert "engines.base" not in sys.modules
+        assert engine_bridge.EngineError is sys.modules["base.data_models"].EngineError
+
+    @pytest.mark.parametrize("engine_name", list(production_api.AVAILABLE_ENGINES))
+    def test_matches_http_response_shape(self, engine_name):
+        client = TestClient(production_api.app)
+        response = client.post("/v1/engines/run", json={
+            "engine_name": engine_name, "input_data": BIRTH_DATA, "format": "standard", "use_cache": False
+        })
+        assert response.status_code == 200
+
+        bridged = asyncio.run(InProcessEngineBridge().calculate(engine_name, {"birth_data": BIRTH_DATA}))
+
+        assert shape(bridged) == shape(response.json())
+        assert bridged["engine"] == engine_name
+        assert bridged["status"] == "success"
+
+    def test_agent_dates_are_converted(self):
+        request = build_engine_request("numerology", {"birth_data": {**BIRTH_DATA, "date": "1990-05-15"}})
+        assert request.input_data.date == "15.05.1990"
+
+    def test_invalid_input_is_an_engine_error(self):
+        bridge = InProcessEngineBridge()
+        with pytest.raises(engine_bridge.EngineError):
+            asyncio.run(bridge.calculate("numerology", {"birth_data": {**BIRTH_DATA, "time": None}}))
+        with pytest.raises(engine_bridge.EngineError):
+            asyncio.run(bridge.calculate("astrology", {"birth_data": BIRTH_DATA}))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
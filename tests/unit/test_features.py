@@ -0,0 +1,82 @@
+"""
+Feature vector tests for WitnessOS Divination Engines
+
+Tests extraction of typed feature vectors and their use in synthesis.
+"""
+
+import pytest
+from datetime import date, datetime
+
+from ENGINES.base import BaseEngineOutput, extract_features, features_of, keyword_mask
+from ENGINES.engines.numerology import NumerologyEngine
+from ENGINES.engines.numerology_models import NumerologyInput
+from ENGINES.integration.synthesis import ResultSynthesizer
+
+
+def make_output(engine_name: str, raw_data: dict) -> BaseEngineOutput:
+    return BaseEngineOutput(engine_name=engine_name, calculation_time=0.0,
+                            raw_data=raw_data, formatted_output="")
+
+
+class TestExtraction:
+    """Test feature extraction from raw data."""
+
+    def test_numbers_keywords_and_dates(self):
+        """One pass collects counted numbers, keyword bits and dates."""
+        features = extract_features({
+            "life_path": 7,
+            "cycles": [7, 3.5, True],
+            "moon_nakshatra": {"ruler": "Jupiter"},
+            "next_peak": datetime(2024, 3, 1, 12, 0)
+        })
+
+        assert features.numbers == {7: 2, 3.5: 1}
+        assert features.archetypes == {"reflection", "wisdom"}
+        assert features.temporal_markers == {date(2024, 3, 1)}
+
+    def test_unknown_keywords_are_ignored(self):
+        """Keywords outside the vocabulary contribute no bits."""
+        assert keyword_mask(["not_a_keyword"]) == 0
+        assert keyword_mask(["Moon"]) == keyword_mask(["moon"]) != 0
+
+    def test_engines_export_features(self):
+        """Engines attach the vector at calculation time; it is never serialized."""
+        output = NumerologyEngine().calculate(
+            NumerologyInput(full_name="Alexandra Marie Chen", birth_date=date(1990, 5, 15))
+        )
+
+        assert output.features is not None
+        assert output.features.numbers
+        assert "features" not in output.model_dump()
+
+    def test_lazy_features_for_plain_outputs(self):
+        """Outputs built without an engine get their vector on first use."""
+        output = make_output("tarot", {"card": "The Emperor"})
+        assert features_of(output) is features_of(output)
+        assert features_of({"no": "raw data"}).keyword_mask == 0
+
+
+class TestSynthesisCorrelations:
+    """Test correlations computed over feature vectors."""
+
+    def test_numerical_and_archetypal_correlations(self):
+        """Shared numbers and archetype keywords correlate across engines."""
+        results = {
+            "numerology": make_output("numerology", {"life_path": 11, "personal_year": 11}),
+            "human_design": make_output("human_design", {"type": "Manifestor", "gate": 11}),
+            "tarot": make_output("tarot", {"card": "The Emperor", "position": 3})
+        }
+
+        correlations = ResultSynthesizer().synthesize_reading(results)["correlations"]
+
+        eleven = next(p for p in correlations["numerical_patterns"] if p["number"] == 11)
+        assert eleven["frequency"] == 3
+        assert eleven["sources"] == ["numerology", "numerology", "human_design"]
+
+        leadership = next(a for a in correlations["archetypal_resonance"] if a["archetype"] == "leadership")
+        assert leadership["engines"] == ["human_design", "tarot"]
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
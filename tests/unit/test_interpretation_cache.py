@@ -0,0 +1,154 @@
+"""
+Interpretation cache tests for WitnessOS
+
+Tests the placeholder tokens standing in for subject details in prompts and
+cached generations, and the prompt fingerprints generations are shared by.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Make the agent modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src" / "api" / "agent"))
+
+from agent_service import WitnessOSAgent
+from interpretation_cache import (
+    InterpretationCache, StreamPersonalizer, personalize, prompt_fingerprint, subject_placeholders
+)
+
+ALICE = {"name": "Alice Moreau", "date": "15.05.1990", "time": "14:30", "location": "Paris"}
+BOB = {"name": "Bob Stone", "date": "15.05.1990", "time": "09:10", "location": "London"}
+
+NUMEROLOGY = {"status": "success", "personal_year": 9,
+              "core_numbers": {"life_path": 3, "expression": 5, "soul_urge": 7}}
+
+
+class TestPersonalize:
+    """Only placeholder tokens are replaced, never text that happens to match a detail."""
+
+    def test_fills_tokens(self):
+        text = "{{name}}, born {{birth_date}} at {{birth_time}} in {{location}}."
+        assert personalize(text, ALICE) == "Alice Moreau, born 15.05.1990 at 14:30 in Paris."
+
+    def test_leaves_other_text_alone(self):
+        eve = {"name": "Eve", "location": "Will"}
+        text = "Every evening, Eve's will grows. {{name}} trusts it."
+        assert personalize(text, eve) == "Every evening, Eve's will grows. Eve trusts it."
+
+    def test_details_are_not_searched_for_tokens(self):
+        odd = {"name": "{{location}}", "location": "Paris"}
+        assert personalize("{{name}} in {{location}}", odd) == "{{location}} in Paris"
+
+    def test_missing_details_have_fallbacks(self):
+        assert personalize("{{name}} was born in {{location}}", {}) == "you was born in your birthplace"
+
+    def test_subject_placeholders_replace_details(self):
+        placeholders = subject_placeholders({**ALICE, "timezone": "Europe/Paris"})
+        assert placeholders["name"] == "{{name}}"
+        assert placeholders["date"] == "{{birth_date}}"
+        assert placeholders["timezone"] == "Europe/Paris"
+        assert "Alice" not in str(placeholders)
+
+
+class TestStreamPersonalizer:
+    """Tokens split across streamed chunks are personalized once complete."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+    def test_split_tokens(self, chunk_size):
+        text = "Dear {{name}}, {{location}} holds {a} brace and {{unknown}} text."
+        personalizer = StreamPersonalizer(ALICE)
+        streamed = "".join(personalizer.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size))
+        streamed += personalizer.finish()
+        assert streamed == personalize(text, ALICE)
+
+    def test_incomplete_token_at_end_is_flushed(self):
+        personalizer = StreamPersonalizer(ALICE)
+        assert personalizer.feed("Hello {{na") == "Hello "
+        assert personalizer.finish() == "{{na"
+
+
+class TestInterpretationCache:
+    """Stored generations keep their tokens; subjects are filled in when served."""
+
+    def test_round_trip_keeps_tokens(self, tmp_path):
+        cache = InterpretationCache(cache_dir=str(tmp_path))
+        cache.set("fingerprint", "Dear {{name}}, trust the process.")
+        assert cache.get("fingerprint") == "Dear {{name}}, trust the process."
+        assert InterpretationCache(cache_dir=str(tmp_path)).get("fingerprint") == "Dear {{name}}, trust the process."
+
+    def test_disk_entries_keep_their_expiry_in_memory(self, tmp_path):
+        InterpretationCache(ttl=0.5, cache_dir=str(tmp_path)).set("fingerprint", "Dear {{name}}")
+        time.sleep(0.35)
+        cache = InterpretationCache(ttl=0.5, cache_dir=str(tmp_path))
+        assert cache.get("fingerprint") == "Dear {{name}}"
+
+        # Expired with the disk entry rather than a full TTL after promotion
+        time.sleep(0.25)
+        assert cache.get("fingerprint") is None
+
+    def test_served_personalized_stored_anonymous(self, tmp_path):
+        agent = WitnessOSAgent(openrouter_api_key="test-key", engine_transport="http",
+                               interpretation_cache_options={"cache_dir": str(tmp_path)})
+        will = {"name": "Will Smith", "date": "15.05.1990", "time": "14:30", "location": "Paris"}
+
+        async def calculate(endpoint, data):
+            return NUMEROLOGY
+
+        async def generate_response(messages, model_type="primary", **kwargs):
+            return {"choices": [{"message": {"content": "{{name}}, your will is strong in {{location}}."}}]}
+
+        agent._call_production_api = calculate
+        agent.openrouter_client.generate_response = generate_response
+        response = asyncio.run(agent.interpret_single_engine("numerology", will))
+
+        assert "Will Smith, your will is strong in Paris." in str(response)
+        stored = b"".join(path.read_bytes() for path in tmp_path.rglob("*") if path.is_file())
+        assert b"{{name}}" in stored
+        for detail in (b"Will Smith", b"Paris"):
+            assert detail not in stored
+
+
+class TestPromptFingerprints:
+    """Prompts carry no subject details; fingerprints cover the whole rendered prompt."""
+
+    @pytest.fixture
+    def agent(self, tmp_path):
+        return WitnessOSAgent(openrouter_api_key="test-key", engine_transport="http",
+                              interpretation_cache_options={"cache_dir": str(tmp_path)})
+
+    def fingerprint(self, agent, birth_data):
+        messages, aletheos_context = agent._interpretation_prompt("numerology", NUMEROLOGY, birth_data, "balanced")
+        return agent._interpretation_fingerprint("numerology", messages, aletheos_context, "primary")
+
+    def test_prompts_carry_placeholders(self, agent):
+        messages, _ = agent._interpretation_prompt("numerology", NUMEROLOGY, ALICE, "balanced")
+        prompt = " ".join(message["content"] for message in messages)
+        assert "{{name}}" in prompt
+        for detail in ("Alice", "Paris", "15.05.1990", "14:30"):
+            assert detail not in prompt
+
+    def test_subjects_share_identical_prompts(self, agent):
+        assert self.fingerprint(agent, ALICE) == self.fingerprint(agent, BOB)
+
+    def test_aletheos_context_is_fingerprinted(self, agent):
+        timed = {**BOB, "date": "8.12.1990"}
+        _, aletheos_context = agent._interpretation_prompt("numerology", NUMEROLOGY, timed, "balanced")
+        assert "Powerful birth timing" in aletheos_context
+        assert self.fingerprint(agent, timed) != self.fingerprint(agent, BOB)
+
+    def test_fingerprint_covers_model_and_template(self):
+        messages = [{"role": "user", "content": "Interpret this for {{name}}"}]
+        assert prompt_fingerprint("numerology", "model-a", messages) != prompt_fingerprint(
+            "numerology", "model-b", messages)
+        assert prompt_fingerprint("numerology", "model-a", messages) != prompt_fingerprint(
+            "synthesis", "model-a", messages)
+        assert prompt_fingerprint("numerology", "model-a", messages, "Powerful birth timing: 8/12") != \
+            prompt_fingerprint("numerology", "model-a", messages, "Powerful birth timing: 9/12")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+"""
+Keyword index tests for WitnessOS Divination Engines
+
+Tests tokenization and inverted-index lookups shared by synthesis, the
+Aletheos Muses and the agent response formatter.
+"""
+
+import pytest
+
+from ENGINES.base import BaseEngineOutput, FeatureVector, KeywordIndex, index_terms
+
+
+def make_output(engine_name: str, raw_data: dict) -> BaseEngineOutput:
+    return BaseEngineOutput(engine_name=engine_name, calculation_time=0.0,
+                            raw_data=raw_data, formatted_output="")
+
+
+class TestTokenization:
+    """Test index term extraction."""
+
+    def test_snake_case_parts_and_pairs(self):
+        """Identifiers are found by their parts and adjacent part pairs."""
+        terms = index_terms("Profile_Line_1 of the Moon")
+        assert {"profile_line_1", "profile", "line_1", "line", "1", "moon"} <= terms
+        assert "profile_1" not in terms
+
+    def test_words_only_match_whole_terms(self):
+        """Substrings of unrelated words are not terms."""
+        assert "sage" not in index_terms("A message arrives")
+
+
+class TestKeywordIndex:
+    """Test inverted-index lookups."""
+
+    def setup_method(self):
+        self.index = KeywordIndex.build({
+            "human_design": make_output("human_design", {"type": "Manifestor", "profile": "1/3"}),
+            "tarot": {"cards": ["The Star", "The Emperor"], "position": {"moon_phase": 3}},
+            "iching": {"primary_hexagram": {"name": "Gradual Progress"}},
+        })
+
+    def test_fields_in_document_order(self):
+        """Lookups return each source's matching field paths in order."""
+        assert self.index.fields(["emperor", "star"]) == {"tarot": ["cards[0]", "cards[1]"]}
+        assert self.index.texts("tarot", ["cards[1]"]) == ["The Emperor"]
+
+    def test_keys_are_indexed_at_their_field(self):
+        """Field names are searchable; key-only fields carry no text."""
+        assert self.index.fields(["moon"]) == {"tarot": ["position.moon_phase"]}
+        assert self.index.texts("tarot", ["position"]) == []
+
+    def test_multi_word_keywords_share_a_field(self):
+        """Every word of a multi-word keyword must occur in the same field."""
+        assert self.index.sources_with(["gradual progress"]) == ["iching"]
+        assert self.index.sources_with(["star emperor"]) == []
+
+    def test_prefix_lookups_and_matches(self):
+        """Prefix lookups stem; matches reports present keywords in order."""
+        assert "manifest" not in self.index
+        assert self.index.sources_with(["manifest"], prefix=True) == ["human_design"]
+        assert self.index.matches(["star", "sun", "emperor"], source="tarot") == ["star", "emperor"]
+
+    def test_engine_outputs_reuse_feature_terms(self):
+        """Engine outputs are indexed from the terms of their feature vector."""
+        output = make_output("human_design", {"type": "Manifestor"})
+        output.features = FeatureVector(terms=frozenset({"manifestor", "precomputed"}))
+        index = KeywordIndex.build({"human_design": output})
+
+        assert index.sources_with(["precomputed"]) == ["human_design"]
+        assert index.fields(["manifestor"]) == {"human_design": ["type"]}
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,248 @@
+"""
+Model router tests for WitnessOS
+
+Tests circuit breaker transitions, model ranking and hedged requests, with an
+injectable clock and a fake OpenRouter transport.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Make the agent modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src" / "api" / "agent"))
+
+from http_pool import AsyncClientPool
+from model_router import CLOSED, ERROR, HALF_OPEN, OPEN, RATE_LIMITED, SUCCESS, CircuitBreaker, ModelRouter
+from openrouter_client import OpenRouterClient
+
+MODELS = ["primary", "fallback1", "fallback2", "fallback3"]
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeOpenRouter:
+    """Transport answering /chat/completions per model, after a per-model delay"""
+
+    def __init__(self, delays=None, failing=()):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.requests = []
+        self.cancelled = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        self.requests.append(model)
+        try:
+            await asyncio.sleep(self.delays.get(model, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        if model in self.failing:
+            return httpx.Response(500, json={"error": "upstream unavailable"})
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": model}}]})
+
+
+def make_client(fake: FakeOpenRouter, router: ModelRouter) -> OpenRouterClient:
+    pool = AsyncClientPool(transport=httpx.MockTransport(fake))
+    return OpenRouterClient(api_key="test-key", http_pool=pool, router=router, base_url="http://openrouter.test")
+
+
+def trip(router: ModelRouter, model_type: str):
+    for _ in range(router.failure_threshold):
+        router.record(model_type, 0.1, ERROR)
+
+
+class TestCircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe -> closed or open."""
+
+    def test_opens_after_threshold(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, timer=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED and breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.ready() and not breaker.allow()
+
+    def test_single_probe_after_reset(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, timer=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.ready()
+        assert breaker.state == OPEN
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.ready() and not breaker.allow()
+
+    def test_probe_outcome(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, timer=clock)
+        breaker.trip(30)
+        clock.now += 30
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.ready()
+
+        clock.now += 30
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.failures == 0
+
+    def test_rate_limit_opens_for_retry_after(self):
+        clock = FakeClock()
+        router = ModelRouter(timer=clock)
+        router.record("primary", 0.1, RATE_LIMITED, retry_after=60)
+        assert router.breakers["primary"].state == OPEN
+        clock.now += 45
+        assert router.rank(MODELS)[0] != "primary"
+        clock.now += 15
+        assert router.rank(MODELS)[0] == "primary"
+
+
+class TestModelRouter:
+    """Ranking orders models without claiming probes; calls claim them."""
+
+    def test_rank_does_not_claim_probes(self):
+        clock = FakeClock()
+        router = ModelRouter(timer=clock)
+        trip(router, "primary")
+        trip(router, "fallback1")
+        clock.now += router.reset_timeout
+
+        for _ in range(3):
+            assert router.rank(MODELS)[:2] == ["primary", "fallback1"]
+        assert router.breakers["primary"].state == OPEN
+        assert router.breakers["fallback1"].state == OPEN
+
+        assert router.acquire("primary")
+        assert not router.acquire("primary")
+        assert router.rank(MODELS)[0] == "fallback1"
+
+    def test_open_models_are_skipped(self):
+        router = ModelRouter(timer=FakeClock())
+        trip(router, "primary")
+        assert router.rank(MODELS) == ["fallback1", "fallback2", "fallback3"]
+        assert not router.acquire("primary")
+
+    def test_fails_open_when_every_breaker_is_open(self):
+        clock = FakeClock()
+        router = ModelRouter(timer=clock)
+        for model in ["fallback2", "primary", "fallback1", "fallback3"]:
+            trip(router, model)
+            clock.now += 1
+        assert router.rank(MODELS) == ["fallback2"]
+        assert router.acquire("fallback2")
+
+    def test_measured_models_ordered_by_latency(self):
+        router = ModelRouter(min_samples=2, timer=FakeClock())
+        for _ in range(2):
+            router.record("fallback1", 2.0, SUCCESS)
+            router.record("fallback2", 0.5, SUCCESS)
+            router.record("fallback3", 0.5, ERROR)
+        # Preferred model keeps its place; unhealthy models go last
+        assert router.rank(MODELS) == ["primary", "fallback2", "fallback1", "fallback3"]
+
+    def test_unhealthy_preferred_model_is_demoted(self):
+        router = ModelRouter(min_samples=2, timer=FakeClock())
+        for _ in range(2):
+            router.record("primary", 0.1, SUCCESS)
+            router.record("primary", 0.1, ERROR)
+        assert router.rank(MODELS)[-1] == "primary"
+
+    def test_hedge_delay(self):
+        router = ModelRouter(min_samples=2, hedge_after=8.0, min_hedge_delay=1.0, timer=FakeClock())
+        assert router.hedge_delay("primary") == 8.0
+        router.record("primary", 3.0, SUCCESS)
+        router.record("primary", 4.0, SUCCESS)
+        assert router.hedge_delay("primary") == 4.0
+        assert ModelRouter(hedge_after=None).hedge_delay("primary") is None
+
+
+class TestOpenRouterClientRouting:
+    """Requests through a fake OpenRouter transport."""
+
+    def test_slow_model_is_hedged_and_cancelled(self):
+        fake = FakeOpenRouter(delays={"microsoft/phi-4-reasoning-plus:free": 5.0})
+        router = ModelRouter(hedge_after=0.05, timer=FakeClock())
+
+        async def run():
+            client = make_client(fake, router)
+            try:
+                return await client.generate_response([{"role": "user", "content": "hello"}])
+            finally:
+                await client.aclose()
+
+        result = asyncio.run(run())
+
+        assert result["_model_used"] == "fallback1"
+        assert result["_hedged"] is True
+        assert fake.cancelled == ["microsoft/phi-4-reasoning-plus:free"]
+        # The cancelled loser reports no outcome
+        assert len(router.stats["primary"].samples) == 0
+        assert len(router.stats["fallback1"].samples) == 1
+
+    def test_only_called_models_claim_probes(self):
+        clock = FakeClock()
+        router = ModelRouter(hedge_after=None, timer=clock)
+        trip(router, "primary")
+        trip(router, "fallback1")
+        clock.now += router.reset_timeout
+        fake = FakeOpenRouter()
+
+        async def run():
+            client = make_client(fake, router)
+            try:
+                return await client.generate_response([{"role": "user", "content": "hello"}])
+            finally:
+                await client.aclose()
+
+        result = asyncio.run(run())
+
+        assert result["_model_used"] == "primary"
+        assert router.breakers["primary"].state == CLOSED
+        # fallback1 was ranked but never called: its probe is still available
+        assert router.breakers["fallback1"].state == OPEN
+        assert router.breakers["fallback1"].ready()
+
+    def test_failed_probe_reopens_and_falls_back(self):
+        clock = FakeClock()
+        router = ModelRouter(hedge_after=None, timer=clock)
+        trip(router, "primary")
+        clock.now += router.reset_timeout
+        fake = FakeOpenRouter(failing={"microsoft/phi-4-reasoning-plus:free"})
+
+        async def run():
+            client = make_client(fake, router)
+            try:
+                response = await client.generate_response([{"role": "user", "content": "hello"}])
+                async for _ in client.stream_response([{"role": "user", "content": "hi"}]):
+                    pass
+                return response
+            finally:
+                await client.aclose()
+
+        result = asyncio.run(run())
+
+        assert result["_model_used"] == "fallback1"
+        assert router.breakers["primary"].state == OPEN
+        # The reopened breaker keeps the stream from calling primary again
+        assert fake.requests.count("microsoft/phi-4-reasoning-plus:free") == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,100 @@
+"""
+Serialization tests for WitnessOS Divination Engines
+
+Tests the pluggable serializers, per-model encoders and canonical hashing
+used for API responses and cache keys.
+"""
+
+import pytest
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+
+from ENGINES.base import (
+    BaseEngineOutput,
+    get_serializer,
+    get_model_encoder,
+    canonical_dumps,
+    hash_payload,
+    loads
+)
+from ENGINES.base.serialization import orjson
+
+
+class Phase(Enum):
+    RISING = "rising"
+
+
+@dataclass
+class CycleSnapshot:
+    """Dataclass shaped like the calculation snapshots engines return."""
+    target_date: date
+    phase: Phase
+    values: tuple
+
+
+def make_output() -> BaseEngineOutput:
+    return BaseEngineOutput(
+        engine_name="test_engine",
+        calculation_time=0.01,
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+        raw_data={
+            "snapshot": CycleSnapshot(date(2024, 1, 1), Phase.RISING, (1, 2)),
+            "gates": {1: "creative", 2: "receptive"},
+            "tags": {"seeker"}
+        },
+        formatted_output="Test output"
+    )
+
+
+class TestSerializers:
+    """Test serializer backends."""
+
+    def test_engine_output_round_trip(self):
+        """Engine outputs with nested dataclasses, enums and dates serialize."""
+        data = loads(get_serializer("json").dumps(make_output()))
+
+        assert data["timestamp"] == "2024-01-01T12:00:00"
+        assert data["raw_data"]["snapshot"] == {
+            "target_date": "2024-01-01", "phase": "rising", "values": [1, 2]
+        }
+        assert data["raw_data"]["gates"] == {"1": "creative", "2": "receptive"}
+        assert data["raw_data"]["tags"] == ["seeker"]
+
+    @pytest.mark.skipif(orjson is None, reason="orjson not installed")
+    def test_backends_agree(self):
+        """The orjson fast path produces the same document as the stdlib path."""
+        output = make_output()
+        assert loads(get_serializer("orjson").dumps(output)) == loads(get_serializer("json").dumps(output))
+
+    def test_unknown_serializer(self):
+        """Unknown serializer names are rejected."""
+        with pytest.raises(ValueError):
+            get_serializer("yaml")
+
+    def test_model_encoders_are_cached(self):
+        """Encoders are built once per class."""
+        assert get_model_encoder(CycleSnapshot) is get_model_encoder(CycleSnapshot)
+        assert get_model_encoder(BaseEngineOutput) is not None
+        assert get_model_encoder(str) is None
+
+
+class TestCanonicalHashing:
+    """Test canonical dumps and cache-key hashing."""
+
+    def test_key_order_does_not_change_hash(self):
+        """Hashes depend on content, not dict ordering."""
+        assert hash_payload({"b": 1, "a": date(2000, 1, 1)}) == hash_payload({"a": date(2000, 1, 1), "b": 1})
+
+    def test_hash_is_128_bit(self):
+        """Hashes are 128-bit hex digests."""
+        assert len(hash_payload({"engine": "numerology"})) == 32
+
+    def test_canonical_dumps_is_compact_and_sorted(self):
+        """Canonical form has sorted keys and no whitespace."""
+        assert canonical_dumps({"b": [1, 2], "a": "x"}) == b'{"a":"x","b":[1,2]}'
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
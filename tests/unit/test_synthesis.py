@@ -0,0 +1,153 @@
+"""
+Incremental synthesis tests for WitnessOS Divination Engines
+
+Tests that re-synthesizing a reading only recomputes the contributions and
+pairwise relationships of engines whose results changed.
+"""
+
+from datetime import date
+
+import pytest
+
+from ENGINES.base.data_models import BaseEngineOutput
+from ENGINES.integration import field_analyzer as field_analyzer_module
+from ENGINES.integration.field_analyzer import FieldAnalyzer
+from ENGINES.integration.synthesis import ResultSynthesizer
+
+
+def make_output(engine_name: str, raw_data: dict) -> BaseEngineOutput:
+    return BaseEngineOutput(engine_name=engine_name, calculation_time=0.0,
+                            raw_data=raw_data, formatted_output="")
+
+
+def reading(card: str) -> dict:
+    return {
+        "numerology": make_output("numerology", {"life_path": 11, "ruler": "Mars"}),
+        "human_design": make_output("human_design", {"type": "Manifestor", "gate": 11}),
+        "tarot": make_output("tarot", {"card": card, "position": 11}),
+    }
+
+
+class FakeDate(date):
+    """date whose today() is set by the test."""
+
+    current = date(2026, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+def strip_timestamps(value):
+    return {key: item for key, item in value.items() if key != "timestamp"}
+
+
+class TestIncrementalSynthesis:
+    """Test per-engine contribution caching in the result synthesizer."""
+
+    def test_only_changed_engines_are_recomputed(self, monkeypatch):
+        """A refreshed result recomputes its own contribution only."""
+        synthesizer = ResultSynthesizer()
+        computed = []
+        original = synthesizer._engine_contribution
+        monkeypatch.setattr(synthesizer, "_engine_contribution",
+                            lambda name, result: computed.append(name) or original(name, result))
+
+        results = reading("The Emperor")
+        synthesizer.synthesize_reading(results)
+        assert computed == ["numerology", "human_design", "tarot"]
+
+        refreshed = {**results, "tarot": make_output("tarot", {"card": "The Star", "position": 11})}
+        synthesis = synthesizer.synthesize_reading(refreshed)
+        assert computed[3:] == ["tarot"]
+
+        leadership = [a["archetype"] for a in synthesis["correlations"]["archetypal_resonance"]]
+        assert leadership == ["leadership"]
+        assert synthesis["correlations"]["archetypal_resonance"][0]["engines"] == ["numerology", "human_design"]
+
+    def test_incremental_matches_fresh_synthesis(self):
+        """Cached contributions combine to the same synthesis as a fresh run."""
+        synthesizer = ResultSynthesizer()
+        synthesizer.synthesize_reading(reading("The Emperor"))
+
+        refreshed = reading("Death")
+        incremental = synthesizer.synthesize_reading(refreshed)
+        fresh = ResultSynthesizer().synthesize_reading(refreshed)
+
+        assert strip_timestamps(incremental) == strip_timestamps(fresh)
+
+
+class TestIncrementalFieldAnalysis:
+    """Test per-engine and pairwise term caching in the field analyzer."""
+
+    def test_only_pairs_with_changed_engine_are_recomputed(self, monkeypatch):
+        """Harmonic relationships are recomputed for pairs involving the changed engine."""
+        analyzer = FieldAnalyzer()
+        pairs = []
+        original = analyzer._calculate_harmonic_relationship
+        monkeypatch.setattr(analyzer, "_calculate_harmonic_relationship",
+                            lambda r1, r2, e1, e2: pairs.append((e1, e2)) or original(r1, r2, e1, e2))
+
+        results = reading("The Emperor")
+        first = analyzer.analyze_field_signature(results)
+        assert len(pairs) == 3
+
+        refreshed = {**results, "tarot": make_output("tarot", {"card": "The Star"})}
+        second = analyzer.analyze_field_signature(refreshed)
+        assert pairs[3:] == [("numerology", "tarot"), ("human_design", "tarot")]
+        assert second["harmonic_patterns"] == first["harmonic_patterns"]
+
+    def test_natal_pairs_cached_per_subject_and_versions(self, monkeypatch):
+        """Returning subjects reuse natal pair relationships for fresh results."""
+        analyzer = FieldAnalyzer()
+        pairs = []
+        original = analyzer._calculate_harmonic_relationship
+        monkeypatch.setattr(analyzer, "_calculate_harmonic_relationship",
+                            lambda r1, r2, e1, e2: pairs.append((e1, e2)) or original(r1, r2, e1, e2))
+        birth_data = {"name": "Ada", "birth_date": "1990-01-01"}
+        versions = {"numerology": "1.0.0", "human_design": "1.0.0", "tarot": "1.0.0"}
+
+        analyzer.analyze_field_signature(reading("The Emperor"), subject=birth_data, engine_versions=versions)
+        assert len(pairs) == 3
+
+        # New result objects: only pairs involving the non-natal tarot draw are recomputed
+        analyzer.analyze_field_signature(reading("The Star"), subject=birth_data, engine_versions=versions)
+        assert pairs[3:] == [("numerology", "tarot"), ("human_design", "tarot")]
+
+        # A new engine version invalidates the natal pair
+        analyzer.analyze_field_signature(reading("The Star"), subject=birth_data,
+                                         engine_versions={**versions, "numerology": "2.0.0"})
+        assert ("numerology", "human_design") in pairs[5:]
+        assert analyzer.get_cache_stats()["hits"] >= 1
+
+    def test_natal_pairs_not_cached_without_versions(self):
+        """Relationships of engines with unknown versions are never reused across results."""
+        analyzer = FieldAnalyzer()
+        birth_data = {"name": "Ada", "birth_date": "1990-01-01"}
+
+        analyzer.analyze_field_signature(reading("The Emperor"), subject=birth_data)
+        analyzer.analyze_field_signature(reading("The Star"), subject=birth_data)
+
+        assert analyzer.get_cache_stats()["size"] == 0
+
+    def test_natal_pairs_expire_daily(self, monkeypatch):
+        """Natal pair relationships are recomputed on a new day."""
+        analyzer = FieldAnalyzer()
+        pairs = []
+        original = analyzer._calculate_harmonic_relationship
+        monkeypatch.setattr(analyzer, "_calculate_harmonic_relationship",
+                            lambda r1, r2, e1, e2: pairs.append((e1, e2)) or original(r1, r2, e1, e2))
+        birth_data = {"name": "Ada", "birth_date": "1990-01-01"}
+        versions = {"numerology": "1.0.0", "human_design": "1.0.0", "tarot": "1.0.0"}
+
+        monkeypatch.setattr(field_analyzer_module, "date", FakeDate)
+        analyzer.analyze_field_signature(reading("The Emperor"), subject=birth_data, engine_versions=versions)
+        monkeypatch.setattr(FakeDate, "current", date(2026, 1, 2))
+        analyzer.analyze_field_signature(reading("The Emperor"), subject=birth_data, engine_versions=versions)
+
+        assert pairs.count(("numerology", "human_design")) == 2
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])
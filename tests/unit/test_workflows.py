@@ -0,0 +1,152 @@
+"""
+Workflow tests for WitnessOS Divination Engines
+
+Tests engine result reuse across workflows and batch runs in the WorkflowManager.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from ENGINES.base.data_models import BaseEngineOutput
+from ENGINES.integration import orchestrator as orchestrator_module
+from ENGINES.integration.orchestrator import EngineOrchestrator
+from ENGINES.integration.workflows import WorkflowManager
+
+NATAL_ENGINES = ['numerology', 'biorhythm', 'human_design', 'vimshottari', 'gene_keys', 'tarot', 'iching']
+
+
+class RecordingOrchestrator(EngineOrchestrator):
+    """Orchestrator stub recording which engines each reading computes."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.readings = []
+
+    def create_comprehensive_reading(self, birth_data, engines=None, execution_mode="parallel"):
+        self.readings.append(list(engines))
+        return {'results': {
+            name: BaseEngineOutput(engine_name=name, calculation_time=0.0, raw_data={},
+                                   formatted_output=f"{name} reading")
+            for name in engines
+        }}
+
+    def get_available_engines(self):
+        return ['numerology', 'human_design', 'gene_keys', 'vimshottari', 'tarot', 'iching']
+
+
+class CountingEngine:
+    """Engine stub counting its calculations."""
+
+    _version = "1.0.0"
+    shared_products = ()
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def calculate(self, input_data):
+        self.calls += 1
+        return BaseEngineOutput(engine_name=self.name, calculation_time=0.0, raw_data={},
+                                formatted_output=f"{self.name} reading {self.calls}")
+
+
+class FakeDate(date):
+    """date whose today() is set by the test."""
+
+    current = date(2026, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+BIRTH_DATA = {'name': 'Jane Doe', 'date': '1990-05-15', 'time': '14:30', 'location': 'New York'}
+
+
+class TestWorkflowReuse:
+    """Test reuse of engine results across workflows through the orchestrator cache."""
+
+    def setup_method(self):
+        self.orchestrator = EngineOrchestrator(max_workers=2)
+        self.engines = {name: CountingEngine(name) for name in NATAL_ENGINES}
+        self.orchestrator.active_engines.update(self.engines)
+        self.manager = WorkflowManager(orchestrator=self.orchestrator)
+
+    def teardown_method(self):
+        self.manager.shutdown()
+
+    def calls(self):
+        return {name: engine.calls for name, engine in self.engines.items() if engine.calls}
+
+    def test_results_reused_across_workflows(self):
+        """A second workflow only computes engines the first did not."""
+        self.manager.run_workflow('career_guidance', BIRTH_DATA)
+        self.manager.run_workflow('spiritual_development', BIRTH_DATA)
+
+        assert self.calls() == {'numerology': 1, 'human_design': 1, 'gene_keys': 1, 'vimshottari': 1, 'iching': 1}
+
+    def test_randomized_engines_are_redrawn(self):
+        """Tarot and I-Ching are drawn afresh on every workflow run."""
+        self.manager.run_workflow('life_transition', BIRTH_DATA)
+        self.manager.run_workflow('life_transition', BIRTH_DATA)
+
+        assert self.calls() == {'biorhythm': 1, 'vimshottari': 1, 'tarot': 2, 'iching': 2}
+
+    def test_daily_engines_roll_over_at_midnight(self, monkeypatch):
+        """Biorhythm and dashas computed yesterday are not reused after midnight."""
+        monkeypatch.setattr(orchestrator_module, 'date', FakeDate)
+        self.manager.run_workflow('manifestation_timing', BIRTH_DATA)
+        self.manager.run_workflow('manifestation_timing', BIRTH_DATA)
+        assert self.engines['biorhythm'].calls == 1
+
+        monkeypatch.setattr(FakeDate, 'current', date(2026, 1, 2))
+        self.manager.run_workflow('manifestation_timing', BIRTH_DATA)
+
+        assert self.engines['biorhythm'].calls == 2
+        assert self.engines['vimshottari'].calls == 2
+
+    def test_async_workflow_reuses_sync_results(self):
+        """Async runs reuse results computed by sync runs."""
+        self.manager.run_workflow('career_guidance', BIRTH_DATA)
+
+        result = asyncio.run(self.manager.run_workflow_async('manifestation_timing', BIRTH_DATA))
+
+        assert self.calls() == {'numerology': 1, 'human_design': 1, 'gene_keys': 1, 'vimshottari': 1, 'biorhythm': 1}
+        assert list(result['engine_results']) == ['biorhythm', 'vimshottari', 'numerology']
+
+
+class TestWorkflowBatch:
+    """Test batch runs fanning one reading out to several workflows."""
+
+    def setup_method(self):
+        self.orchestrator = RecordingOrchestrator()
+        self.manager = WorkflowManager(orchestrator=self.orchestrator)
+
+    def teardown_method(self):
+        self.manager.shutdown()
+
+    def test_batch_computes_engine_union_once(self):
+        """A batch runs one reading and fans results out to each workflow."""
+        batch = self.manager.run_workflows(
+            ['career_guidance', 'shadow_work', 'daily_guidance'], BIRTH_DATA,
+            workflow_options={'daily_guidance': {'include_divination': False}}
+        )
+
+        assert len(self.orchestrator.readings) == 1
+        assert set(self.orchestrator.readings[0]) == set(batch['engines_used'])
+        shadow = batch['workflows']['shadow_work']['engine_results']
+        assert list(shadow) == ['gene_keys', 'human_design', 'enneagram', 'tarot', 'iching']
+        assert list(batch['workflows']['daily_guidance']['engine_results']) == ['biorhythm', 'numerology']
+
+    def test_batch_rejects_unknown_workflow(self):
+        """Unknown workflow names fail before any engine runs."""
+        with pytest.raises(ValueError):
+            self.manager.run_workflows(['career_guidance', 'astral_travel'], BIRTH_DATA)
+        assert self.orchestrator.readings == []
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])